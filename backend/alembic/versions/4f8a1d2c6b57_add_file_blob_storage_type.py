@@ -0,0 +1,30 @@
+"""add_file_blob_storage_type
+
+Revision ID: 4f8a1d2c6b57
+Revises: 7b2e4c91a0d3
+Create Date: 2026-10-18 11:40:05.517230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f8a1d2c6b57'
+down_revision: Union[str, Sequence[str], None] = '7b2e4c91a0d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Reuses the storagetype enum created with uploaded_files
+    op.add_column('file_blobs', sa.Column('storage_type', sa.Enum('LOCAL', 'S3', 'GCS', name='storagetype'), nullable=False, server_default='LOCAL'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('file_blobs') as batch_op:
+        batch_op.drop_column('storage_type')
@@ -0,0 +1,52 @@
+"""add_file_blobs
+
+Revision ID: 7b2e4c91a0d3
+Revises: dc033d6e22d7
+Create Date: 2026-10-18 09:12:41.208113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b2e4c91a0d3'
+down_revision: Union[str, Sequence[str], None] = 'dc033d6e22d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('file_blobs',
+    sa.Column('file_hash', sa.String(length=64), nullable=False),
+    sa.Column('file_path', sa.String(length=500), nullable=False),
+    sa.Column('size', sa.Integer(), nullable=False),
+    sa.Column('ref_count', sa.Integer(), nullable=False, server_default='0'),
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_file_blobs_file_hash'), 'file_blobs', ['file_hash'], unique=True)
+    op.create_index(op.f('ix_file_blobs_id'), 'file_blobs', ['id'], unique=False)
+
+    # Batch mode so the foreign key can be added on SQLite too
+    with op.batch_alter_table('uploaded_files') as batch_op:
+        batch_op.add_column(sa.Column('blob_id', sa.String(length=36), nullable=True))
+        batch_op.create_index(batch_op.f('ix_uploaded_files_blob_id'), ['blob_id'], unique=False)
+        batch_op.create_foreign_key('fk_uploaded_files_blob_id_file_blobs', 'file_blobs', ['blob_id'], ['id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('uploaded_files') as batch_op:
+        batch_op.drop_constraint('fk_uploaded_files_blob_id_file_blobs', type_='foreignkey')
+        batch_op.drop_index(batch_op.f('ix_uploaded_files_blob_id'))
+        batch_op.drop_column('blob_id')
+
+    op.drop_index(op.f('ix_file_blobs_id'), table_name='file_blobs')
+    op.drop_index(op.f('ix_file_blobs_file_hash'), table_name='file_blobs')
+    op.drop_table('file_blobs')
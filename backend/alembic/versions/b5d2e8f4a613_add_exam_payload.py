@@ -0,0 +1,32 @@
+"""add_exam_payload
+
+Revision ID: b5d2e8f4a613
+Revises: 9c4e7a2b5d18
+Create Date: 2026-10-18 15:22:47.190364
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d2e8f4a613'
+down_revision: Union[str, Sequence[str], None] = '9c4e7a2b5d18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing exams keep NULL and get their payload built on first read
+    op.add_column('exams', sa.Column('payload', sa.JSON(), nullable=True))
+    op.add_column('exams', sa.Column('payload_version', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('exams') as batch_op:
+        batch_op.drop_column('payload_version')
+        batch_op.drop_column('payload')
@@ -0,0 +1,34 @@
+"""add_exam_attempt_user
+
+Revision ID: d1a7c3e9f052
+Revises: b5d2e8f4a613
+Create Date: 2026-10-18 16:41:09.527318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd1a7c3e9f052'
+down_revision: Union[str, Sequence[str], None] = 'b5d2e8f4a613'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('exam_attempts') as batch_op:
+        batch_op.add_column(sa.Column('user_id', sa.String(length=36), nullable=True))
+        batch_op.create_index(batch_op.f('ix_exam_attempts_user_id'), ['user_id'], unique=False)
+        batch_op.create_foreign_key('fk_exam_attempts_user_id_users', 'users', ['user_id'], ['id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('exam_attempts') as batch_op:
+        batch_op.drop_constraint('fk_exam_attempts_user_id_users', type_='foreignkey')
+        batch_op.drop_index(batch_op.f('ix_exam_attempts_user_id'))
+        batch_op.drop_column('user_id')
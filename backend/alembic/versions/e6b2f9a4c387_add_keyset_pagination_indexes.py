@@ -0,0 +1,34 @@
+"""add_keyset_pagination_indexes
+
+Revision ID: e6b2f9a4c387
+Revises: d1a7c3e9f052
+Create Date: 2026-10-18 17:20:44.083615
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6b2f9a4c387'
+down_revision: Union[str, Sequence[str], None] = 'd1a7c3e9f052'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_exams_creator_created_id', 'exams', ['creator_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_exams_created_id', 'exams', ['created_at', 'id'], unique=False)
+    op.create_index('ix_uploaded_files_owner_created_id', 'uploaded_files', ['owner_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_uploaded_files_created_id', 'uploaded_files', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_uploaded_files_created_id', table_name='uploaded_files')
+    op.drop_index('ix_uploaded_files_owner_created_id', table_name='uploaded_files')
+    op.drop_index('ix_exams_created_id', table_name='exams')
+    op.drop_index('ix_exams_creator_created_id', table_name='exams')
@@ -1,20 +1,31 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import json
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 
 from ..database.connection import get_db_session
 from ..services.exam_service import ExamService
+from ..services.exam_cache import get_exam_cache
+from ..services.grading_service import GradingService, get_submission_batcher
 from ..schemas.exam_schemas import (
-    ExamGenerationRequest, SaveExamRequest,
+    BatchGenerationRequest, ExamGenerationRequest, SaveExamRequest,
     QuestionResponse, ExamGenerationResponse,
-    SaveExamResponse
+    SaveExamResponse, SubmitAttemptRequest
 )
 from app.core.rate_limit import (
     rate_limit_exam_generation,
+    rate_limit_exam_generation_batch,
     rate_limit_general,
     rate_limit_read_only,
 )
 from ..auth import CurrentUser, require_exam_access, AdminUser  
+from ..genai.cache import get_generation_cache
+from ..genai.dispatcher import get_dispatcher
+from ..genai.routing import get_router
+from ..workers import get_generation_worker
 from ..models.user import User
 import logging
 
@@ -24,6 +35,8 @@ router = APIRouter(prefix="/exam", tags=["exam"])
 @router.post("/generate", response_model=ExamGenerationResponse, status_code=status.HTTP_201_CREATED)
 async def generate_exam(
     request: ExamGenerationRequest,
+    async_job: bool = Query(False, alias="async"),
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", max_length=255),
     current_user: User = CurrentUser, 
     db: AsyncSession = Depends(get_db_session),
     _rate_limit: None = Depends(rate_limit_exam_generation()),
@@ -31,6 +44,16 @@ async def generate_exam(
     """
     Generate exam questions from document content
     🔒 REQUIRES AUTHENTICATION
+
+    Send either the text as content or the id of an uploaded file as file_id;
+    a file's extracted text is loaded server-side (extracted on demand if the
+    background worker has not got to it yet).
+
+    With ?async=true the request is queued and 202 is returned immediately
+    with a job id; poll GET /exam/jobs/{job_id} or follow
+    GET /exam/jobs/{job_id}/events (SSE) for the result. Retries carrying the
+    same Idempotency-Key header return the original job instead of
+    generating again.
     """
     try:
         logger.info(f"User {current_user.email} generating exam for subject: {request.subject}")
@@ -38,16 +61,30 @@ async def generate_exam(
         # initialize exam service
         exam_service = ExamService(db)
 
+        if async_job:
+            job, _created = await exam_service.create_generation_job(
+                request,
+                user_id=str(current_user.id),
+                idempotency_key=idempotency_key,
+            )
+            return JSONResponse(
+                status_code=status.HTTP_202_ACCEPTED,
+                content=jsonable_encoder({"success": True, "data": job}),
+                headers={"Location": f"/exam/jobs/{job['job_id']}"},
+            )
+
         # generate exam via GenAI pipeline
         result = await exam_service.generate_exam_from_text(
             file_content=request.content,
             num_questions=request.question_count,
             subject=request.subject,
+            file_id=request.file_id,
             ai_provider=request.ai_provider,
             temperature=request.temperature,
             max_tokens=request.max_tokens,
             language=request.language,
             difficulty=request.difficulty,
+            user_id=str(current_user.id),
         )
 
         # Extract exam data 
@@ -89,6 +126,190 @@ async def generate_exam(
             detail=str(e)
         )
 
+@router.post("/generate/stream", status_code=status.HTTP_200_OK)
+async def generate_exam_stream(
+    request: ExamGenerationRequest,
+    current_user: User = CurrentUser,
+    db: AsyncSession = Depends(get_db_session),
+    _rate_limit: None = Depends(rate_limit_exam_generation()),
+):
+    """
+    Generate exam questions, streaming each question as soon as it is ready
+    🔒 REQUIRES AUTHENTICATION
+
+    Response is NDJSON (application/x-ndjson), one event per line:
+    - {"type": "question", "index": 0, "question": {...}}
+    - {"type": "done", "metadata": {...}}
+    - {"type": "error", "error": "..."}
+    """
+    try:
+        logger.info(f"User {current_user.email} streaming exam for subject: {request.subject}")
+
+        exam_service = ExamService(db)
+        events = await exam_service.stream_exam_from_text(request, user_id=str(current_user.id))
+
+        async def ndjson():
+            async for event in events:
+                yield json.dumps(event, ensure_ascii=False, default=str) + "\n"
+
+        return StreamingResponse(
+            ndjson(),
+            media_type="application/x-ndjson",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    except Exception as e:
+        logger.error(f"Error streaming exam for user {current_user.id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+@router.post("/generate/batch", status_code=status.HTTP_200_OK)
+async def generate_exam_batch(
+    request: BatchGenerationRequest,
+    current_user: User = CurrentUser,
+    db: AsyncSession = Depends(get_db_session),
+    charge_rate_limit = Depends(rate_limit_exam_generation_batch()),
+):
+    """
+    Generate several exams at once (inline content or uploaded file_id per item)
+    🔒 REQUIRES AUTHENTICATION
+
+    Every item counts against the generation rate limit, so a batch cannot
+    exceed the quota of the equivalent single /generate calls.
+
+    Items are generated concurrently under provider limits with one auth
+    check and one database session for the whole batch. Response is NDJSON
+    (application/x-ndjson), one event per line as each item completes:
+    - {"type": "item", "index": 0, "success": true, "questions": [...], "metadata": {...}}
+    - {"type": "item", "index": 1, "success": false, "error": "..."}
+    - {"type": "done", "total": 2, "succeeded": 1, "failed": 1}
+    """
+    await charge_rate_limit(len(request.items))
+
+    try:
+        logger.info(f"User {current_user.email} generating batch of {len(request.items)} exams")
+
+        exam_service = ExamService(db)
+        events = await exam_service.generate_exams_batch(request.items, user_id=str(current_user.id))
+
+        async def ndjson():
+            async for event in events:
+                yield json.dumps(event, ensure_ascii=False, default=str) + "\n"
+
+        return StreamingResponse(
+            ndjson(),
+            media_type="application/x-ndjson",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    except Exception as e:
+        logger.error(f"Error generating exam batch for user {current_user.id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+@router.get("/jobs/{job_id}", status_code=status.HTTP_200_OK)
+async def get_generation_job(
+    job_id: str,
+    current_user: User = CurrentUser,
+    db: AsyncSession = Depends(get_db_session),
+    _rate_limit: None = Depends(rate_limit_read_only()),
+):
+    """
+    Get asynchronous generation job status and result
+    🔒 REQUIRES AUTHENTICATION - Users can only see their own jobs
+
+    status is queued, running, completed (with result) or failed (with error).
+    """
+    try:
+        exam_service = ExamService(db)
+        job = await exam_service.get_generation_job(job_id, str(current_user.id))
+
+        if not job:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Generation job not found"
+            )
+
+        return {
+            "success": True,
+            "data": job
+        }
+
+    except HTTPException as e:
+        raise e
+
+    except Exception as e:
+        logger.error(f"Error getting generation job {job_id} for user {current_user.id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+@router.get("/jobs/{job_id}/events", status_code=status.HTTP_200_OK)
+async def stream_generation_job_events(
+    job_id: str,
+    current_user: User = CurrentUser,
+    db: AsyncSession = Depends(get_db_session),
+    _rate_limit: None = Depends(rate_limit_read_only()),
+):
+    """
+    Follow an asynchronous generation job as Server-Sent Events
+    🔒 REQUIRES AUTHENTICATION - Users can only follow their own jobs
+
+    One "job" event is sent per status / progress change, with the same data
+    as GET /exam/jobs/{job_id}; the stream ends after the completed or failed
+    event. Comment lines are sent as keep-alives while nothing changes.
+    """
+    try:
+        exam_service = ExamService(db)
+        updates = await exam_service.watch_generation_job(job_id, str(current_user.id))
+
+        if updates is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Generation job not found"
+            )
+
+        async def sse():
+            async for job in updates:
+                if job is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                data = json.dumps(jsonable_encoder(job), ensure_ascii=False)
+                yield f"event: job\ndata: {data}\n\n"
+
+        return StreamingResponse(
+            sse(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    except HTTPException as e:
+        raise e
+
+    except Exception as e:
+        logger.error(f"Error streaming generation job {job_id} for user {current_user.id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
 @router.post("/save", response_model=SaveExamResponse, status_code=status.HTTP_201_CREATED)
 async def save_exam(
     request: SaveExamRequest,
@@ -153,8 +374,8 @@ async def get_exam(
         # initialize exam service
         exam_service = ExamService(db) 
 
-        # get exam (ownership already checked by dependency)
-        result = await exam_service.get_exam_by_id(exam_id)
+        # get exam (ownership already checked by dependency; students get the cached view without answers)
+        result = await exam_service.get_exam_for_user(exam_id, current_user)
 
         if not result:
             raise HTTPException(
@@ -189,8 +410,101 @@ async def get_exam(
             detail=str(e)
         )
 
+@router.post("/{exam_id}/attempts", status_code=status.HTTP_201_CREATED)
+async def start_exam_attempt(
+    exam_id: str,
+    current_user: User = Depends(require_exam_access),  # ← OWNERSHIP CHECK
+    db: AsyncSession = Depends(get_db_session),
+    _rate_limit: None = Depends(rate_limit_general()),
+):
+    """
+    Start an attempt at an exam
+    🔒 REQUIRES AUTHENTICATION + OWNERSHIP CHECK (own or public exams)
+    """
+    try:
+        logger.info(f"User {current_user.email} starting attempt on exam: {exam_id}")
+
+        return await GradingService(db).start_attempt(exam_id, current_user.id)
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    except Exception as e:
+        logger.error(f"Error starting attempt on exam {exam_id} for user {current_user.id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+@router.get("/{exam_id}/attempts", status_code=status.HTTP_200_OK)
+async def list_exam_attempts(
+    exam_id: str,
+    current_user: User = CurrentUser,
+    db: AsyncSession = Depends(get_db_session),
+    _rate_limit: None = Depends(rate_limit_read_only()),
+):
+    """
+    List the current user's attempts at an exam
+    🔒 REQUIRES AUTHENTICATION - Users only see their own attempts
+    """
+    try:
+        attempts = await GradingService(db).list_attempts(exam_id, current_user.id)
+
+        return {
+            'attempts': attempts,
+            'total': len(attempts)
+        }
+
+    except Exception as e:
+        logger.error(f"Error listing attempts on exam {exam_id} for user {current_user.id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+@router.post("/{exam_id}/attempts/{attempt_id}/submit", status_code=status.HTTP_200_OK)
+async def submit_exam_attempt(
+    exam_id: str,
+    attempt_id: str,
+    request: SubmitAttemptRequest,
+    current_user: User = CurrentUser,
+    db: AsyncSession = Depends(get_db_session),
+    _rate_limit: None = Depends(rate_limit_general()),
+):
+    """
+    Submit answers for an attempt and get the graded result
+    🔒 REQUIRES AUTHENTICATION - Users can only submit their own attempts
+
+    Submissions for the same exam arriving together are graded in one pass
+    and saved with a single UPDATE.
+    """
+    try:
+        logger.info(f"User {current_user.email} submitting attempt {attempt_id} on exam {exam_id}")
+
+        return await GradingService(db).submit_attempt(
+            exam_id, attempt_id, current_user.id, request.answers
+        )
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    except Exception as e:
+        logger.error(f"Error submitting attempt {attempt_id} for user {current_user.id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
 @router.get("/", status_code=status.HTTP_200_OK)
 async def list_user_exams(
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of exams to return"),
     current_user: User = CurrentUser,
     db: AsyncSession = Depends(get_db_session),
     _rate_limit: None = Depends(rate_limit_read_only()),
@@ -203,14 +517,23 @@ async def list_user_exams(
         logger.info(f"User {current_user.email} listing their own exams")
         
         exam_service = ExamService(db)
-        exams = await exam_service.list_user_exams(current_user.id)  # ALWAYS user-scoped
+        result = await exam_service.list_user_exams(current_user.id, cursor, limit)  # ALWAYS user-scoped
         
         return {
-            "exams": exams,
-            "count": len(exams),
+            "exams": result["exams"],
+            "count": len(result["exams"]),
+            "total_count": result["total_count"],
+            "next_cursor": result["next_cursor"],
+            "has_more": result["has_more"],
             "user_id": current_user.id
         }
         
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
     except Exception as e:
         logger.error(f"Error listing exams for user {current_user.id}: {e}")
         raise HTTPException(
@@ -220,8 +543,8 @@ async def list_user_exams(
 
 @router.get("/admin/all", status_code=status.HTTP_200_OK)
 async def list_all_exams_admin(
-    skip: int = 0,
-    limit: int = 100,
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of exams to return"),
     admin_user: User = AdminUser,  # ADMIN only
     db: AsyncSession = Depends(get_db_session),
     _rate_limit: None = Depends(rate_limit_read_only()),
@@ -234,18 +557,197 @@ async def list_all_exams_admin(
         logger.info(f"Admin {admin_user.email} listing all exams")
         
         exam_service = ExamService(db)
-        exams = await exam_service.list_all_exams_admin(skip, limit)
+        result = await exam_service.list_all_exams_admin(cursor, limit)
         
         return {
-            "exams": exams,
-            "count": len(exams),
-            "total_available": len(exams),
+            "exams": result["exams"],
+            "count": len(result["exams"]),
+            "total_available": result["total_count"],
+            "next_cursor": result["next_cursor"],
+            "has_more": result["has_more"],
             "admin_access": True
         }
         
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
     except Exception as e:
         logger.error(f"Error listing all exams for admin {admin_user.email}: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e)
-        )
\ No newline at end of file
+        )
+
+@router.get("/admin/generation-cache", status_code=status.HTTP_200_OK)
+async def get_generation_cache_admin(
+    admin_user: User = AdminUser,  # ADMIN only
+    _rate_limit: None = Depends(rate_limit_read_only()),
+):
+    """
+    Get generation result cache statistics (ADMIN ONLY)
+    🔒 REQUIRES ADMIN ROLE
+
+    Features:
+    - Per-provider L1 / Redis hits, misses and hit ratio
+    - In-process entry count and evictions
+    """
+    try:
+        logger.info(f"Admin {admin_user.email} requesting generation cache stats")
+
+        return {
+            "success": True,
+            "data": get_generation_cache().stats()
+        }
+
+    except Exception as e:
+        logger.error(f"Error getting generation cache stats for admin {admin_user.email}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+@router.get("/admin/generation-queue", status_code=status.HTTP_200_OK)
+async def get_generation_queue_admin(
+    admin_user: User = AdminUser,  # ADMIN only
+    _rate_limit: None = Depends(rate_limit_read_only()),
+):
+    """
+    Get LLM dispatcher queue statistics (ADMIN ONLY)
+    🔒 REQUIRES ADMIN ROLE
+
+    Features:
+    - Per-provider in-flight calls, queued calls and queued users
+    - Token budget remaining
+    - Average / max queue wait and queue timeouts
+    """
+    try:
+        logger.info(f"Admin {admin_user.email} requesting generation queue stats")
+
+        return {
+            "success": True,
+            "data": get_dispatcher().stats()
+        }
+
+    except Exception as e:
+        logger.error(f"Error getting generation queue stats for admin {admin_user.email}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+@router.get("/admin/grading", status_code=status.HTTP_200_OK)
+async def get_grading_stats_admin(
+    admin_user: User = AdminUser,  # ADMIN only
+    _rate_limit: None = Depends(rate_limit_read_only()),
+):
+    """
+    Get attempt grading statistics (ADMIN ONLY)
+    🔒 REQUIRES ADMIN ROLE
+
+    Features:
+    - Submissions waiting in a batch window
+    - Batches flushed and submissions graded
+    """
+    try:
+        logger.info(f"Admin {admin_user.email} requesting grading stats")
+
+        return {
+            "success": True,
+            "data": get_submission_batcher().stats()
+        }
+
+    except Exception as e:
+        logger.error(f"Error getting grading stats for admin {admin_user.email}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+@router.get("/admin/exam-cache", status_code=status.HTTP_200_OK)
+async def get_exam_cache_admin(
+    admin_user: User = AdminUser,  # ADMIN only
+    _rate_limit: None = Depends(rate_limit_read_only()),
+):
+    """
+    Get exam read cache statistics (ADMIN ONLY)
+    🔒 REQUIRES ADMIN ROLE
+
+    Features:
+    - Cached exams, hits, misses and hit ratio
+    - Invalidations and whether the Redis pub/sub listener is running
+    """
+    try:
+        logger.info(f"Admin {admin_user.email} requesting exam cache stats")
+
+        return {
+            "success": True,
+            "data": get_exam_cache().stats()
+        }
+
+    except Exception as e:
+        logger.error(f"Error getting exam cache stats for admin {admin_user.email}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+@router.get("/admin/provider-routing", status_code=status.HTTP_200_OK)
+async def get_provider_routing_admin(
+    admin_user: User = AdminUser,  # ADMIN only
+    _rate_limit: None = Depends(rate_limit_read_only()),
+):
+    """
+    Get provider routing statistics (ADMIN ONLY)
+    🔒 REQUIRES ADMIN ROLE
+
+    Features:
+    - Per-provider rolling p50 / p95 latency and error rate
+    - Current hedge deadline and degraded flag
+    - Hedged requests won by each provider
+    """
+    try:
+        logger.info(f"Admin {admin_user.email} requesting provider routing stats")
+
+        return {
+            "success": True,
+            "data": get_router().stats()
+        }
+
+    except Exception as e:
+        logger.error(f"Error getting provider routing stats for admin {admin_user.email}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+@router.get("/admin/generation-jobs", status_code=status.HTTP_200_OK)
+async def get_generation_jobs_admin(
+    admin_user: User = AdminUser,  # ADMIN only
+    _rate_limit: None = Depends(rate_limit_read_only()),
+):
+    """
+    Get asynchronous generation job queue statistics (ADMIN ONLY)
+    🔒 REQUIRES ADMIN ROLE
+
+    Features:
+    - Job counts per status
+    - Jobs currently in flight on this worker
+    - Completed / failed counters
+    """
+    try:
+        logger.info(f"Admin {admin_user.email} requesting generation job stats")
+
+        return {
+            "success": True,
+            "data": await get_generation_worker().queue_depth()
+        }
+
+    except Exception as e:
+        logger.error(f"Error getting generation job stats for admin {admin_user.email}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
@@ -1,8 +1,9 @@
 import logging
 import os
-from typing import Optional
-from fastapi import APIRouter, UploadFile, File, HTTPException, status, Depends, Query
-from fastapi.responses import FileResponse
+import re
+from typing import Optional, Tuple
+from fastapi import APIRouter, UploadFile, File, HTTPException, status, Depends, Query, Request
+from fastapi.responses import FileResponse, RedirectResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..services.upload_service import UploadService
@@ -16,6 +17,8 @@ from app.models.user import User
 from app.auth.dependencies import CurrentUser
 from app.auth import require_admin
 from app.core.config import get_settings
+from app.processors import get_extraction_cache
+from app.workers import get_extraction_worker
 
 router = APIRouter(prefix="/upload", tags=["upload"])
 logger = logging.getLogger(__name__)
@@ -74,7 +77,7 @@ async def upload_file(
 
 @router.get("/", status_code=status.HTTP_200_OK, response_model=FileListResponse)
 async def list_files(
-    skip: int = Query(0, ge=0, description="Number of files to skip"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of files to return"),
     current_user: User = CurrentUser,
     db: AsyncSession = Depends(get_db_session)
@@ -90,10 +93,10 @@ async def list_files(
     - Upload status tracking
     """
     try:
-        logger.info(f"User {current_user.email} listing files (skip={skip}, limit={limit})")
+        logger.info(f"User {current_user.email} listing files (limit={limit})")
         
         upload_service = UploadService(db)
-        result = await upload_service.list_user_files(current_user.id, skip, limit)
+        result = await upload_service.list_user_files(current_user.id, cursor, limit)
         
         return FileListResponse(
             success=True,
@@ -102,15 +105,17 @@ async def list_files(
                 "pagination": {
                     "count": result["count"],
                     "total_count": result["total_count"],
-                    "skip": result["skip"],
                     "limit": result["limit"],
-                    "has_more": result["count"] == limit
+                    "next_cursor": result["next_cursor"],
+                    "has_more": result["has_more"]
                 },
                 "user_id": result["user_id"],
                 "user_scoped": True
             }
         )
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error listing files for user {current_user.id}: {e}")
         raise HTTPException(status_code=500, detail="Failed to list files")
@@ -150,9 +155,34 @@ async def get_file_info(
         logger.error(f"Error getting file info for user {current_user.id}: {e}")
         raise HTTPException(status_code=500, detail="Failed to get file information")
 
+def parse_range_header(range_header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range HTTP Range header
+
+    Returns:
+        (start, end) inclusive byte offsets, or None if unsatisfiable
+    """
+    match = re.fullmatch(r"bytes=(\d*)-(\d*)", range_header.strip())
+    if not match or match.group(1) == match.group(2) == "":
+        return None
+
+    if match.group(1) == "":
+        # Suffix range: last N bytes
+        length = int(match.group(2))
+        if length == 0:
+            return None
+        return max(0, size - length), size - 1
+
+    start = int(match.group(1))
+    end = int(match.group(2)) if match.group(2) else size - 1
+    if start >= size or end < start:
+        return None
+    return start, min(end, size - 1)
+
 @router.get("/{file_id}/download")
 async def download_file(
     file_id: str,
+    request: Request,
     current_user: User = CurrentUser,
     db: AsyncSession = Depends(get_db_session)
 ):
@@ -163,6 +193,8 @@ async def download_file(
     Features:
     - Secure file serving
     - Ownership validation
+    - Redirect to presigned object storage URL (bytes bypass API workers)
+    - HTTP Range requests (206 Partial Content)
     - Proper HTTP headers
     - Access logging
     """
@@ -170,23 +202,59 @@ async def download_file(
         logger.info(f"User {current_user.email} downloading file: {file_id}")
         
         upload_service = UploadService(db)
-        file_info = await upload_service.get_file_info(file_id, current_user.id)
-        
-        if not file_info["filesystem_exists"]:
-            logger.error(f"File not found on filesystem: {file_info['file_path']}")
-            raise HTTPException(status_code=404, detail="File not found on server")
-        
-        return FileResponse(
-            path=file_info["file_path"],
-            filename=file_info["original_filename"],
-            media_type=file_info.get("content_type", "application/octet-stream"),
-            headers={
-                "Content-Disposition": f"attachment; filename=\"{file_info['original_filename']}\"",
-                "X-File-ID": file_id,
-                "X-File-Size": str(file_info["size"])
-            }
+        target = await upload_service.get_download_target(file_id, current_user.id)
+        storage = target["storage"]
+        filename = target["original_filename"]
+        
+        headers = {
+            "Content-Disposition": f"attachment; filename=\"{filename}\"",
+            "Accept-Ranges": "bytes",
+            "X-File-ID": file_id,
+            "X-File-Size": str(target["size"])
+        }
+        
+        # Object storage: hand the client a short-lived direct URL
+        redirect_url = await storage.presigned_url(target["location"], filename, target["content_type"])
+        if redirect_url:
+            return RedirectResponse(redirect_url, status_code=status.HTTP_307_TEMPORARY_REDIRECT)
+        
+        range_header = request.headers.get("range")
+        if range_header:
+            byte_range = parse_range_header(range_header, target["size"])
+            if byte_range is None:
+                raise HTTPException(
+                    status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                    detail="Requested range not satisfiable",
+                    headers={"Content-Range": f"bytes */{target['size']}"}
+                )
+            start, end = byte_range
+            headers["Content-Range"] = f"bytes {start}-{end}/{target['size']}"
+            headers["Content-Length"] = str(end - start + 1)
+            return StreamingResponse(
+                storage.iter_range(target["location"], start, end),
+                status_code=status.HTTP_206_PARTIAL_CONTENT,
+                media_type=target["content_type"],
+                headers=headers
+            )
+        
+        local_path = storage.local_path(target["location"])
+        if local_path:
+            return FileResponse(
+                path=local_path,
+                filename=filename,
+                media_type=target["content_type"],
+                headers=headers
+            )
+        
+        headers["Content-Length"] = str(target["size"])
+        return StreamingResponse(
+            storage.iter_range(target["location"]),
+            media_type=target["content_type"],
+            headers=headers
         )
         
+    except HTTPException:
+        raise
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="File not found")
     except PermissionError:
@@ -240,7 +308,7 @@ async def delete_file(
 
 @router.get("/admin/files", status_code=status.HTTP_200_OK, response_model=AdminFileListResponse)
 async def list_all_files_admin(
-    skip: int = Query(0, ge=0, description="Number of files to skip"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of files to return"),
     current_user: User = Depends(require_admin()),
     db: AsyncSession = Depends(get_db_session)
@@ -256,10 +324,10 @@ async def list_all_files_admin(
     - System-wide file statistics
     """
     try:
-        logger.info(f"Admin {current_user.email} listing all files (skip={skip}, limit={limit})")
+        logger.info(f"Admin {current_user.email} listing all files (limit={limit})")
         
         upload_service = UploadService(db)
-        result = await upload_service.list_all_files_admin(skip, limit)
+        result = await upload_service.list_all_files_admin(cursor, limit)
         
         return AdminFileListResponse(
             success=True,
@@ -268,15 +336,17 @@ async def list_all_files_admin(
                 "pagination": {
                     "count": result["count"],
                     "total_count": result["total_count"],
-                    "skip": result["skip"],
                     "limit": result["limit"],
-                    "has_more": result["count"] == limit
+                    "next_cursor": result["next_cursor"],
+                    "has_more": result["has_more"]
                 },
                 "admin_access": True,
                 "requested_by": current_user.email
             }
         )
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error listing all files for admin {current_user.id}: {e}")
         raise HTTPException(status_code=500, detail="Failed to list files")
@@ -299,7 +369,7 @@ async def get_upload_stats_admin(
         logger.info(f"Admin {current_user.email} requesting upload statistics")
         
         upload_service = UploadService(db)
-        all_files = await upload_service.list_all_files_admin(0, 10000)  # Get all files
+        all_files = await upload_service.list_all_files_admin(limit=10000)  # Get all files
         
         # Calculate statistics
         total_files = all_files["total_count"]
@@ -333,6 +403,35 @@ async def get_upload_stats_admin(
         logger.error(f"Error getting upload stats for admin {current_user.id}: {e}")
         raise HTTPException(status_code=500, detail="Failed to get upload statistics")
 
+@router.get("/admin/processing-queue", status_code=status.HTTP_200_OK)
+async def get_processing_queue_admin(
+    current_user: User = Depends(require_admin())
+):
+    """
+    Get background extraction queue depth (Admin only)
+    🔒 REQUIRES ADMIN ROLE
+    
+    Features:
+    - Pending files waiting for extraction
+    - Jobs currently in flight
+    - Processed / failed / retried counters
+    - Extraction cache hit/miss counters
+    """
+    try:
+        logger.info(f"Admin {current_user.email} requesting processing queue stats")
+        
+        queue = await get_extraction_worker().queue_depth()
+        queue["cache"] = get_extraction_cache().stats()
+        
+        return {
+            "success": True,
+            "data": queue
+        }
+        
+    except Exception as e:
+        logger.error(f"Error getting processing queue for admin {current_user.id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to get processing queue")
+
 # HEALTH CHECK ENDPOINT
 
 @router.get("/health", status_code=status.HTTP_200_OK, response_model=HealthCheckResponse)
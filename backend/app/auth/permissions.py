@@ -74,10 +74,10 @@ async def check_exam_ownership(
     """
     try:
         # Import here to avoid circular imports
-        from app.repositories.exam_repository import ExamRepository
+        from app.services.exam_cache import get_exam_cache
         
-        exam_repo = ExamRepository(db)
-        exam = await exam_repo.get_by_id(exam_id)
+        # Served from the exam cache; the database is only read on a miss
+        exam = await get_exam_cache().get(exam_id, db)
         
         if not exam:
             logger.warning(f"Exam not found: {exam_id}")
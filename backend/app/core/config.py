@@ -62,6 +62,120 @@ class Settings:
         self.upload_folder = "uploads"
         self.allowed_extensions = {'pdf', 'docx', 'txt'}
         self.max_upload_size = 16 * 1024 * 1024  # 16MB
+        self.upload_chunk_size = int(os.getenv('UPLOAD_CHUNK_SIZE', str(1024 * 1024)))  # 1MB
+        
+        # File storage backend (local, s3, gcs)
+        self.storage_backend = os.getenv('STORAGE_BACKEND', 'local')
+        self.storage_presign_expiry = int(os.getenv('STORAGE_PRESIGN_EXPIRY', '300'))  # seconds
+        self.s3_bucket = os.getenv('S3_BUCKET', '')
+        self.s3_prefix = os.getenv('S3_PREFIX', '')
+        self.s3_endpoint_url = os.getenv('S3_ENDPOINT_URL') or None  # MinIO / GCS interop
+        self.s3_region = os.getenv('S3_REGION') or None
+        self.s3_access_key_id = os.getenv('S3_ACCESS_KEY_ID') or None
+        self.s3_secret_access_key = os.getenv('S3_SECRET_ACCESS_KEY') or None
+        self.s3_multipart_threshold = int(os.getenv('S3_MULTIPART_THRESHOLD', str(8 * 1024 * 1024)))
+        self.s3_part_size = int(os.getenv('S3_PART_SIZE', str(8 * 1024 * 1024)))
+
+        # Background document extraction worker
+        self.extraction_worker_enabled = os.getenv('EXTRACTION_WORKER_ENABLED', 'false').lower() == 'true'
+        self.extraction_worker_concurrency = int(os.getenv('EXTRACTION_WORKER_CONCURRENCY', '2'))
+        self.extraction_poll_interval = float(os.getenv('EXTRACTION_POLL_INTERVAL', '5'))
+        self.extraction_max_retries = int(os.getenv('EXTRACTION_MAX_RETRIES', '3'))
+        self.extraction_retry_delay = float(os.getenv('EXTRACTION_RETRY_DELAY', '2'))
+        self.extraction_stale_after = int(os.getenv('EXTRACTION_STALE_AFTER', '900'))  # seconds
+        self.extraction_wait_timeout = float(os.getenv('EXTRACTION_WAIT_TIMEOUT', '60'))  # generation waiting on the worker, seconds
+        self.extraction_wait_poll_interval = float(os.getenv('EXTRACTION_WAIT_POLL_INTERVAL', '1'))  # seconds
+
+        # Process pool for CPU-bound extraction (PDF/DOCX)
+        self.extraction_process_workers = int(
+            os.getenv('EXTRACTION_PROCESS_WORKERS', str(min(4, os.cpu_count() or 1)))
+        )
+        self.extraction_timeout = float(os.getenv('EXTRACTION_TIMEOUT', '120'))  # seconds per job
+        self.pdf_shard_min_pages = int(os.getenv('PDF_SHARD_MIN_PAGES', '50'))  # pages per parallel shard
+
+        # Extraction cache (keyed by file hash + processor version)
+        self.extraction_cache_enabled = os.getenv('EXTRACTION_CACHE_ENABLED', 'true').lower() == 'true'
+        self.extraction_cache_dir = os.getenv('EXTRACTION_CACHE_DIR', os.path.join('cache', 'extraction'))
+        self.extraction_cache_max_entries = int(os.getenv('EXTRACTION_CACHE_MAX_ENTRIES', '10000'))  # Redis
+        self.extraction_cache_max_bytes = int(os.getenv('EXTRACTION_CACHE_MAX_BYTES', str(512 * 1024 * 1024)))  # disk
+        self.extraction_cache_ttl = int(os.getenv('EXTRACTION_CACHE_TTL', str(7 * 24 * 3600)))  # seconds
+
+        # Prompt templates (compiled once; reloaded on file change when debug is on)
+        self.prompt_bytecode_cache_dir = os.getenv('PROMPT_BYTECODE_CACHE_DIR', os.path.join('cache', 'prompts'))  # empty = off
+
+        # Generation result cache (deterministic requests only, keyed by prompt fingerprint)
+        self.genai_cache_enabled = os.getenv('GENAI_CACHE_ENABLED', 'true').lower() == 'true'
+        self.genai_cache_max_entries = int(os.getenv('GENAI_CACHE_MAX_ENTRIES', '5000'))  # Redis
+        self.genai_cache_l1_max_entries = int(os.getenv('GENAI_CACHE_L1_MAX_ENTRIES', '256'))  # in-process
+        self.genai_cache_ttl = int(os.getenv('GENAI_CACHE_TTL', str(24 * 3600)))  # seconds
+
+        # Long-document generation (content split into chunks generated concurrently)
+        self.genai_long_document_enabled = os.getenv('GENAI_LONG_DOCUMENT_ENABLED', 'true').lower() == 'true'
+
+        # Batch generation (items fan out concurrently, bounded by the dispatcher)
+        self.exam_batch_max_items = int(os.getenv('EXAM_BATCH_MAX_ITEMS', '20'))
+
+        # Asynchronous generation jobs (POST /exam/generate?async=true)
+        self.generation_worker_enabled = os.getenv('GENERATION_WORKER_ENABLED', 'true').lower() == 'true'
+        self.generation_worker_concurrency = int(os.getenv('GENERATION_WORKER_CONCURRENCY', '4'))
+        self.generation_poll_interval = float(os.getenv('GENERATION_POLL_INTERVAL', '2'))  # seconds
+        self.generation_job_stale_after = int(os.getenv('GENERATION_JOB_STALE_AFTER', '900'))  # seconds
+        self.generation_job_max_attempts = int(os.getenv('GENERATION_JOB_MAX_ATTEMPTS', '2'))
+        self.generation_events_poll_interval = float(os.getenv('GENERATION_EVENTS_POLL_INTERVAL', '1'))  # SSE, seconds
+
+        # Attempt grading (concurrent submissions for one exam are graded and saved together)
+        self.grading_batch_window = float(os.getenv('GRADING_BATCH_WINDOW', '0.05'))  # seconds
+        self.grading_batch_max_size = int(os.getenv('GRADING_BATCH_MAX_SIZE', '500'))
+
+        # Exam read cache (student view + answer key per exam, invalidated over Redis pub/sub)
+        self.exam_cache_enabled = os.getenv('EXAM_CACHE_ENABLED', 'true').lower() == 'true'
+        self.exam_cache_max_entries = int(os.getenv('EXAM_CACHE_MAX_ENTRIES', '1000'))
+        self.exam_cache_ttl = int(os.getenv('EXAM_CACHE_TTL', '600'))  # seconds, safety net without Redis
+
+        # List pagination (keyset cursors; totals are cached instead of counted per page)
+        self.pagination_count_ttl = float(os.getenv('PAGINATION_COUNT_TTL', '30'))  # seconds
+
+        # LLM dispatcher (per-provider in-flight calls and tokens-per-minute, 0 = no budget)
+        self.genai_provider_concurrency = int(os.getenv('GENAI_PROVIDER_CONCURRENCY', '4'))  # default per provider
+        self.genai_queue_timeout = float(os.getenv('GENAI_QUEUE_TIMEOUT', '60'))  # seconds waiting for a slot
+
+        # Provider routing (hedge a slow primary with the next-ranked provider)
+        self.genai_hedging_enabled = os.getenv('GENAI_HEDGING_ENABLED', 'false').lower() == 'true'
+        self.genai_hedge_providers = [
+            p.strip().lower() for p in os.getenv('GENAI_HEDGE_PROVIDERS', 'openai,gemini').split(',') if p.strip()
+        ]
+        self.genai_hedge_min_delay = float(os.getenv('GENAI_HEDGE_MIN_DELAY', '2'))  # seconds
+        self.genai_hedge_max_delay = float(os.getenv('GENAI_HEDGE_MAX_DELAY', '30'))  # seconds
+        self.genai_hedge_default_delay = float(os.getenv('GENAI_HEDGE_DEFAULT_DELAY', '10'))  # until p95 is known
+        self.genai_routing_window = int(os.getenv('GENAI_ROUTING_WINDOW', '100'))  # calls per provider
+        self.genai_routing_max_error_rate = float(os.getenv('GENAI_ROUTING_MAX_ERROR_RATE', '0.5'))
+
+        # Provider circuit breakers (fail fast during outages instead of retrying every request)
+        self.genai_breaker_window = float(os.getenv('GENAI_BREAKER_WINDOW', '60'))  # seconds of outcomes kept
+        self.genai_breaker_min_calls = int(os.getenv('GENAI_BREAKER_MIN_CALLS', '10'))
+        self.genai_breaker_failure_rate = float(os.getenv('GENAI_BREAKER_FAILURE_RATE', '0.5'))
+        self.genai_breaker_timeout_threshold = int(os.getenv('GENAI_BREAKER_TIMEOUT_THRESHOLD', '5'))  # per window
+        self.genai_breaker_open_seconds = float(os.getenv('GENAI_BREAKER_OPEN_SECONDS', '30'))
+        self.genai_breaker_shared = os.getenv('GENAI_BREAKER_SHARED', 'true').lower() == 'true'  # via Redis
+
+        # Provider HTTP pool (native async clients, shared keep-alive connections)
+        self.genai_http_max_connections = int(os.getenv('GENAI_HTTP_MAX_CONNECTIONS', '20'))
+        self.genai_http_max_keepalive = int(os.getenv('GENAI_HTTP_MAX_KEEPALIVE', '10'))
+        self.genai_http_keepalive_expiry = float(os.getenv('GENAI_HTTP_KEEPALIVE_EXPIRY', '30'))  # seconds
+        self.genai_http_connect_timeout = float(os.getenv('GENAI_HTTP_CONNECT_TIMEOUT', '5'))  # seconds
+        self.genai_http2 = os.getenv('GENAI_HTTP2', 'true').lower() == 'true'  # needs the h2 package
+        self.openai_base_url = os.getenv('OPENAI_BASE_URL')  # e.g. proxy or local stub
+        self.openai_request_timeout = float(os.getenv('OPENAI_REQUEST_TIMEOUT', '55'))  # seconds per attempt
+        self.genai_provider_limits = {
+            'openai': {
+                'concurrency': int(os.getenv('GENAI_OPENAI_CONCURRENCY', str(self.genai_provider_concurrency))),
+                'tpm': int(os.getenv('GENAI_OPENAI_TPM', '0')),
+            },
+            'gemini': {
+                'concurrency': int(os.getenv('GENAI_GEMINI_CONCURRENCY', str(self.genai_provider_concurrency))),
+                'tpm': int(os.getenv('GENAI_GEMINI_TPM', '0')),
+            },
+        }
         
         # Database
         self.database_url = self._get_database_url()
@@ -132,6 +246,7 @@ class Settings:
             "upload_folder": self.upload_folder,
             "allowed_extensions": self.allowed_extensions,
             "max_upload_size": self.max_upload_size,
+            "upload_chunk_size": self.upload_chunk_size,
             "questions_dir": self.questions_dir,
             "log_level": self.log_level
         }
@@ -1,5 +1,6 @@
 import logging
-from fastapi import Request, HTTPException
+from typing import Awaitable, Callable
+from fastapi import Request, Response, HTTPException
 from fastapi_limiter.depends import RateLimiter
 
 logger = logging.getLogger(__name__)
@@ -90,6 +91,32 @@ def rate_limit_exam_generation():
     return RateLimiter(times=10, seconds=60)
 
 
+class ItemRateLimiter(RateLimiter):
+    """
+    RateLimiter charged once per item of a batch request
+
+    The item count is only known after the body is parsed, so the
+    dependency returns a charge(items) callable for the endpoint to await.
+    Each item spends one slot of the same window; the callback (429) fires
+    as soon as the budget runs out.
+    """
+
+    async def __call__(self, request: Request, response: Response) -> Callable[[int], Awaitable[None]]:
+        async def charge(items: int) -> None:
+            for _ in range(max(items, 1)):
+                await super(ItemRateLimiter, self).__call__(request, response)
+
+        return charge
+
+
+def rate_limit_exam_generation_batch():
+    """
+    Rate limit for batch exam generation
+    10 generated exams per minute per user (each batch item counts)
+    """
+    return ItemRateLimiter(times=10, seconds=60)
+
+
 def rate_limit_exam_upload():
     """
     Rate limit for file upload
@@ -138,6 +165,8 @@ __all__ = [
     "rate_limit_auth_reset_password",
     "rate_limit_auth_verify_email",
     "rate_limit_exam_generation",
+    "rate_limit_exam_generation_batch",
+    "ItemRateLimiter",
     "rate_limit_exam_upload",
     "rate_limit_general",
     "rate_limit_read_only",
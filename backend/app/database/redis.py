@@ -4,6 +4,7 @@ Handles Redis connection lifecycle with graceful fallback
 """
 
 import os
+import time
 import logging
 from redis import asyncio as aioredis
 from typing import Optional
@@ -79,6 +80,16 @@ class RedisManager:
             logger.warning("Rate limiting will be disabled")
             cls._redis_client = None
 
+    @classmethod
+    def get_connected_client(cls) -> Optional[aioredis.Redis]:
+        """
+        Get current Redis client without attempting to (re)connect.
+
+        Returns:
+            Redis client, or None if Redis is unavailable
+        """
+        return cls._redis_client
+
     @classmethod
     async def disconnect(cls) -> None:
         """Close Redis connection."""
@@ -117,3 +128,50 @@ async def get_redis_client() -> Optional[aioredis.Redis]:
         return await RedisManager.get_redis()
     except Exception:
         return None
+
+
+# Entry-count-bounded LRU over plain Redis keys, shared by the result caches.
+# Values live in their own keys with a TTL; a sorted set (lru_key) holds each
+# key's last access time and is trimmed from the oldest end.
+
+async def lru_get(redis: aioredis.Redis, lru_key: str, key: str) -> Optional[str]:
+    """
+    Get a value and mark it as recently used
+
+    Returns:
+        Stored value, or None if missing (expired keys are dropped from the LRU set)
+    """
+    raw = await redis.get(key)
+    if raw is None:
+        await redis.zrem(lru_key, key)
+        return None
+    await redis.zadd(lru_key, {key: time.time()})
+    return raw
+
+
+async def lru_put(redis: aioredis.Redis, lru_key: str, key: str, raw: str, ttl: int, max_entries: int) -> int:
+    """
+    Store a value and evict least recently used keys beyond max_entries
+
+    Returns:
+        Number of evicted entries
+    """
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.set(key, raw, ex=ttl)
+        pipe.zadd(lru_key, {key: time.time()})
+        pipe.zcard(lru_key)
+        results = await pipe.execute()
+
+    overflow = results[-1] - max_entries
+    if overflow <= 0:
+        return 0
+    evicted = await redis.zpopmin(lru_key, overflow)
+    if evicted:
+        await redis.delete(*[member for member, _ in evicted])
+    return len(evicted)
+
+
+async def lru_delete(redis: aioredis.Redis, lru_key: str, key: str) -> None:
+    """Remove a value and its LRU entry"""
+    await redis.delete(key)
+    await redis.zrem(lru_key, key)
@@ -12,6 +12,9 @@ from .clients import (
     create_default_client,
     create_best_available_client
 )
+from .cache import GenerationCache, get_generation_cache
+from .dispatcher import LLMDispatcher, DispatchTimeoutError, get_dispatcher
+from .routing import ProviderRouter, get_router
 
 __all__ = [
     # Factory and clients
@@ -21,4 +24,17 @@ __all__ = [
     "AIProvider",
     "create_default_client",
     "create_best_available_client",
+
+    # Result cache
+    "GenerationCache",
+    "get_generation_cache",
+
+    # Dispatcher
+    "LLMDispatcher",
+    "DispatchTimeoutError",
+    "get_dispatcher",
+
+    # Provider routing
+    "ProviderRouter",
+    "get_router",
 ]
\ No newline at end of file
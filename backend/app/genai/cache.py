@@ -0,0 +1,208 @@
+"""
+Generation result cache
+Maps a prompt fingerprint to normalized questions so identical deterministic requests skip the LLM
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.database.redis import RedisManager, lru_delete, lru_get, lru_put
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "genai:result:"
+LRU_KEY = "genai:lru"
+
+
+def is_cacheable(temperature: Optional[float]) -> bool:
+    """Only greedy (temperature == 0) sampling is reproducible enough to cache"""
+    return temperature is not None and float(temperature) == 0.0
+
+
+def make_fingerprint(prompt: str, provider: str, model: str, params: Dict[str, Any]) -> str:
+    """
+    Hash everything that determines the model output
+
+    Args:
+        prompt: Fully rendered prompt
+        provider: Provider name
+        model: Model name used by the client
+        params: Sampling params sent to the client (temperature, max_tokens, ...)
+    """
+    payload = json.dumps(
+        {"prompt": prompt, "provider": provider, "model": model, "params": params},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class GenerationCache:
+    """
+    Two-tier cache for generate_exam results
+
+    - L1: in-process LRU dict with TTL, checked first (no network hop)
+    - L2: Redis (shared between app instances) when RedisManager is connected,
+      bounded by entry count with a sorted set of last-access times
+
+    Entries hold the normalized question list and provider metadata.
+    Hit/miss counters are kept per provider for monitoring.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        l1_max_entries: Optional[int] = None,
+        ttl: Optional[int] = None,
+        enabled: Optional[bool] = None,
+    ):
+        self.max_entries = max_entries or settings.genai_cache_max_entries
+        self.l1_max_entries = l1_max_entries or settings.genai_cache_l1_max_entries
+        self.ttl = ttl or settings.genai_cache_ttl
+        self.enabled = settings.genai_cache_enabled if enabled is None else enabled
+
+        self._l1: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._counters: Dict[str, Dict[str, int]] = {}
+        self.evictions = 0
+        self.errors = 0
+
+    def _count(self, provider: str, name: str) -> None:
+        counters = self._counters.setdefault(
+            provider, {"l1_hits": 0, "redis_hits": 0, "misses": 0, "stores": 0}
+        )
+        counters[name] += 1
+
+    async def get(self, fingerprint: str, provider: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached generation
+
+        Returns:
+            Copy of {"questions": [...], "metadata": {...}} or None on miss
+        """
+        if not self.enabled:
+            return None
+
+        entry = self._l1_get(fingerprint)
+        if entry is not None:
+            self._count(provider, "l1_hits")
+            return copy.deepcopy(entry)
+
+        key = f"{KEY_PREFIX}{fingerprint}"
+        try:
+            redis = RedisManager.get_connected_client()
+            raw = await lru_get(redis, LRU_KEY, key) if redis is not None else None
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Generation cache lookup failed: {e}")
+            raw = None
+
+        if raw is None:
+            self._count(provider, "misses")
+            return None
+
+        entry = json.loads(raw)
+        self._l1_put(fingerprint, entry)
+        self._count(provider, "redis_hits")
+        return copy.deepcopy(entry)
+
+    async def put(
+        self,
+        fingerprint: str,
+        provider: str,
+        questions: List[Dict[str, Any]],
+        metadata: Dict[str, Any],
+    ) -> bool:
+        """
+        Store normalized questions for a fingerprint
+
+        Returns:
+            True if stored, False otherwise
+        """
+        if not self.enabled or not questions:
+            return False
+
+        entry = {"questions": questions, "metadata": metadata}
+        self._l1_put(fingerprint, copy.deepcopy(entry))
+        self._count(provider, "stores")
+
+        try:
+            redis = RedisManager.get_connected_client()
+            if redis is not None:
+                self.evictions += await lru_put(
+                    redis, LRU_KEY, f"{KEY_PREFIX}{fingerprint}", json.dumps(entry, default=str),
+                    self.ttl, self.max_entries
+                )
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Generation cache store failed: {e}")
+        return True
+
+    async def invalidate(self, fingerprint: str) -> None:
+        """Remove one entry from both tiers"""
+        self._l1.pop(fingerprint, None)
+        redis = RedisManager.get_connected_client()
+        if redis is not None:
+            await lru_delete(redis, LRU_KEY, f"{KEY_PREFIX}{fingerprint}")
+
+    def clear_local(self) -> None:
+        """Drop the in-process tier"""
+        self._l1.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics with per-provider hit ratio"""
+        providers = {}
+        for provider, counters in self._counters.items():
+            hits = counters["l1_hits"] + counters["redis_hits"]
+            lookups = hits + counters["misses"]
+            providers[provider] = {
+                **counters,
+                "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+            }
+
+        return {
+            "enabled": self.enabled,
+            "backend": "redis" if RedisManager.get_connected_client() is not None else "memory",
+            "l1_entries": len(self._l1),
+            "evictions": self.evictions,
+            "errors": self.errors,
+            "providers": providers,
+        }
+
+    # In-process tier
+
+    def _l1_get(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        item = self._l1.get(fingerprint)
+        if item is None:
+            return None
+        expires_at, entry = item
+        if expires_at < time.monotonic():
+            del self._l1[fingerprint]
+            return None
+        self._l1.move_to_end(fingerprint)
+        return entry
+
+    def _l1_put(self, fingerprint: str, entry: Dict[str, Any]) -> None:
+        self._l1[fingerprint] = (time.monotonic() + self.ttl, entry)
+        self._l1.move_to_end(fingerprint)
+        while len(self._l1) > self.l1_max_entries:
+            self._l1.popitem(last=False)
+            self.evictions += 1
+
+
+# Shared cache instance
+_generation_cache: Optional[GenerationCache] = None
+
+
+def get_generation_cache() -> GenerationCache:
+    """Get (or lazily create) the shared generation cache"""
+    global _generation_cache
+    if _generation_cache is None:
+        _generation_cache = GenerationCache()
+    return _generation_cache
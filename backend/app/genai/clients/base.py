@@ -1,6 +1,6 @@
 # import
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import AsyncIterator, Dict, Any
 from enum import Enum
 
 from app.schemas.exam_schemas import AIProvider
@@ -14,6 +14,13 @@ class BaseAIClient(ABC):
     async def generate_exam(self, prompt: str, **kwargs) -> Dict[str, Any]:
         pass
     
+    async def stream_exam(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """Yield raw response text as it arrives (default: whole response at once)."""
+        result = await self.generate_exam(prompt, **kwargs)
+        if not result.get("success"):
+            raise RuntimeError(result.get("error") or "Generation failed")
+        yield result.get("raw_response", "")
+
     @abstractmethod
     def is_configured(self) -> bool:
         pass
@@ -4,6 +4,7 @@ from .base import BaseAIClient
 from .mock_client import MockClient
 from .openai_client import OpenAIClient
 from .gemini_client import GeminiClient
+from app.genai.utils.circuit_breaker import get_circuit_breaker
 from app.schemas.exam_schemas import AIProvider
 
 logger = logging.getLogger(__name__)
@@ -236,12 +237,20 @@ class AIClientFactory:
         logger.info(f"Registered new client: {provider.value} -> {client_class.__name__}")
     
     @classmethod
-    async def health_check_all(cls) -> Dict[str, bool]:
+    async def health_check_all(cls) -> Dict[str, Dict[str, Any]]:
         """
         Quick health check for all configured clients (uses cached instances).
 
         Returns:
-            Dict[str, bool]: Provider name -> health status
+            Dict[str, Dict]: Provider name -> {"is_healthy": bool, "circuit": breaker state}
+
+        Example response:
+        {
+            "openai": {
+                "is_healthy": True,
+                "circuit": {"state": "closed", "failure_rate": 0.0, ...}
+            }
+        }
         """
         health_status = {}
 
@@ -250,10 +259,14 @@ class AIClientFactory:
                 # Use cache to avoid creating new instances each time
                 client = cls.create_client(provider, use_cache=True)
                 is_healthy = await client.health_check()
-                health_status[provider.value] = is_healthy
             except Exception as e:
                 logger.debug(f"Health check failed for {provider.value}: {e}")
-                health_status[provider.value] = False
+                is_healthy = False
+
+            health_status[provider.value] = {
+                "is_healthy": is_healthy,
+                "circuit": get_circuit_breaker(provider.value).stats(),
+            }
 
         return health_status
 
@@ -1,7 +1,8 @@
+import asyncio
 import os
 import logging
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
 from .base import BaseAIClient
 
@@ -12,6 +13,19 @@ except ImportError:
     ChatGoogleGenerativeAI = None  # type: ignore
     HumanMessage = None  # type: ignore
 
+try:
+    from google.api_core import exceptions as google_exceptions  # type: ignore
+    # Errors worth retrying / counting against the provider's circuit
+    TRANSIENT_ERRORS: tuple = (
+        google_exceptions.ServiceUnavailable,
+        google_exceptions.TooManyRequests,
+        google_exceptions.InternalServerError,
+    )
+    TIMEOUT_ERRORS: tuple = (google_exceptions.DeadlineExceeded,)
+except ImportError:
+    TRANSIENT_ERRORS = ()
+    TIMEOUT_ERRORS = ()
+
 
 logger = logging.getLogger(__name__)
 
@@ -85,6 +99,43 @@ class GeminiClient(BaseAIClient):
                 "error": str(e)
             }
 
+    async def stream_exam(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """Stream response text chunks from Gemini via LangChain."""
+        if not self.is_configured():
+            raise RuntimeError("Gemini API key not configured")
+
+        llm = self._get_llm()
+        messages = [HumanMessage(content=prompt)] if HumanMessage else [prompt]
+        temperature = float(kwargs.get("temperature", self.default_temperature))
+        timeout: Optional[float] = kwargs.get("timeout")
+
+        try:
+            if not hasattr(llm, "astream"):
+                yield await asyncio.wait_for(self._call_api(prompt, temperature), timeout)
+                return
+
+            # Timeout applies per received chunk, not to the whole stream
+            chunks = llm.astream(messages).__aiter__()
+            try:
+                while True:
+                    try:
+                        chunk = await asyncio.wait_for(chunks.__anext__(), timeout)
+                    except StopAsyncIteration:
+                        break
+                    content = getattr(chunk, "content", "")
+                    if content:
+                        yield content if isinstance(content, str) else str(content)
+            finally:
+                aclose = getattr(chunks, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+        except (asyncio.TimeoutError, *TIMEOUT_ERRORS) as e:
+            if timeout is None:
+                raise TimeoutError(f"Gemini stream timed out: {e}") from e
+            raise TimeoutError(f"Gemini stream stalled for {timeout:.1f}s") from e
+        except TRANSIENT_ERRORS as e:
+            raise ConnectionError(f"Gemini transient error: {e}") from e
+
     def is_configured(self) -> bool:
         return bool(self.api_key) and ChatGoogleGenerativeAI is not None
 
@@ -93,7 +144,7 @@ class GeminiClient(BaseAIClient):
             "provider": "gemini",
             "model": self.model_name,
             "supports_json": True,
-            "supports_streaming": False,
+            "supports_streaming": True,
             "max_tokens": 8192,
         }
 
@@ -0,0 +1,71 @@
+"""
+Shared async HTTP connection pool for provider clients
+
+One keep-alive httpx.AsyncClient per event loop, so concurrent generations
+reuse TLS connections instead of occupying executor threads.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401  (httpx needs it for HTTP/2)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def build_http_client(
+    max_connections: Optional[int] = None,
+    max_keepalive_connections: Optional[int] = None,
+    http2: Optional[bool] = None,
+) -> httpx.AsyncClient:
+    """
+    Create a pooled AsyncClient from settings
+
+    HTTP/2 is enabled only when requested and the h2 package is installed.
+    Read timeout is left to each request (see OpenAIClient), connect timeout
+    comes from settings.
+    """
+    limits = httpx.Limits(
+        max_connections=max_connections or settings.genai_http_max_connections,
+        max_keepalive_connections=max_keepalive_connections or settings.genai_http_max_keepalive,
+        keepalive_expiry=settings.genai_http_keepalive_expiry,
+    )
+    use_http2 = (settings.genai_http2 if http2 is None else http2) and HTTP2_AVAILABLE
+    timeout = httpx.Timeout(settings.openai_request_timeout, connect=settings.genai_http_connect_timeout)
+    return httpx.AsyncClient(limits=limits, http2=use_http2, timeout=timeout)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get (or lazily create) the pool for the running event loop"""
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = build_http_client()
+        _client_loop = loop
+        logger.info(
+            f"Created provider HTTP pool (max_connections={settings.genai_http_max_connections}, "
+            f"http2={settings.genai_http2 and HTTP2_AVAILABLE})"
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared pool (called on application shutdown)"""
+    global _client, _client_loop
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
@@ -1,28 +1,54 @@
 import os
 import logging
-import asyncio
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
+from app.core.config import settings
 from .base import BaseAIClient
+from .http_pool import get_http_client
 
 try:
-    from openai import OpenAI  # type: ignore
-    from openai import OpenAIError  # type: ignore
+    from openai import AsyncOpenAI  # type: ignore
+    from openai import (  # type: ignore
+        OpenAIError,
+        APIConnectionError,
+        APITimeoutError,
+        InternalServerError,
+        RateLimitError,
+    )
 except ImportError:
-    OpenAI = None  # type: ignore
+    AsyncOpenAI = None  # type: ignore
 
-    # Custom fallback exception if openai package is not installed
+    # Custom fallback exceptions if openai package is not installed
     class OpenAIError(Exception):
         """Custom OpenAIError fallback when openai package is unavailable."""
         pass
 
+    class APIConnectionError(OpenAIError):
+        pass
+
+    class APITimeoutError(APIConnectionError):
+        pass
+
+    class InternalServerError(OpenAIError):
+        pass
+
+    class RateLimitError(OpenAIError):
+        pass
+
 
 logger = logging.getLogger(__name__)
 
 
 class OpenAIClient(BaseAIClient):
-    """Simple OpenAI API wrapper. Just calls API, no retry/parsing logic."""
+    """
+    Simple OpenAI API wrapper. Just calls API, no retry/parsing logic.
+
+    Uses the native async SDK over the shared provider HTTP pool, so
+    concurrent calls share keep-alive connections instead of each holding
+    an executor thread. SDK-level retries are disabled; transient errors
+    are raised as ConnectionError/TimeoutError for retry_with_backoff.
+    """
 
     def __init__(
         self,
@@ -35,7 +61,10 @@ class OpenAIClient(BaseAIClient):
             temperature if temperature is not None
             else float(os.getenv("OPENAI_TEMPERATURE", "0.3"))
         )
-        self._client: Optional["OpenAI"] = None
+        self.base_url: Optional[str] = settings.openai_base_url
+        self.request_timeout: float = settings.openai_request_timeout
+        self._client: Optional["AsyncOpenAI"] = None
+        self._http_client: Optional[Any] = None
 
     async def health_check(self) -> bool:
         if not self.is_configured():
@@ -62,9 +91,10 @@ class OpenAIClient(BaseAIClient):
 
         temperature = float(kwargs.get("temperature", self.default_temperature))
         max_tokens = kwargs.get("max_tokens")
+        timeout = self._request_timeout(kwargs.get("timeout"))
 
         try:
-            response_text = await self._call_api(prompt, temperature, max_tokens)
+            response_text = await self._call_api(prompt, temperature, max_tokens, timeout)
 
             return {
                 "success": True,
@@ -78,6 +108,16 @@ class OpenAIClient(BaseAIClient):
                 "error": None
             }
 
+        # Transient failures propagate so retry_with_backoff can retry them
+        except APITimeoutError as e:
+            raise TimeoutError(f"OpenAI request timed out after {timeout:.1f}s") from e
+
+        except APIConnectionError as e:
+            raise ConnectionError(f"OpenAI connection error: {e}") from e
+
+        except (RateLimitError, InternalServerError) as e:
+            raise ConnectionError(f"OpenAI transient error: {e}") from e
+
         except OpenAIError as e:
             logger.error(f"OpenAI API error: {e}")
             return {
@@ -104,45 +144,80 @@ class OpenAIClient(BaseAIClient):
                 "error": str(e)
             }
 
+    async def stream_exam(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """Stream response text deltas from OpenAI."""
+        if not self.is_configured():
+            raise RuntimeError("OpenAI API key not configured")
+
+        temperature = float(kwargs.get("temperature", self.default_temperature))
+        max_tokens = kwargs.get("max_tokens")
+        timeout = self._request_timeout(kwargs.get("timeout"))
+
+        params: Dict[str, Any] = {
+            "model": self.model_name,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": temperature,
+            "stream": True,
+        }
+        if max_tokens:
+            params["max_tokens"] = int(max_tokens)
+
+        try:
+            # Read timeout applies per received chunk, not to the whole stream
+            stream = await self._get_client().chat.completions.create(**params, timeout=timeout)
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except APITimeoutError as e:
+            raise TimeoutError(f"OpenAI stream stalled for {timeout:.1f}s") from e
+        except APIConnectionError as e:
+            raise ConnectionError(f"OpenAI connection error: {e}") from e
+        except (RateLimitError, InternalServerError) as e:
+            raise ConnectionError(f"OpenAI transient error: {e}") from e
+
     def is_configured(self) -> bool:
-        return bool(self.api_key) and OpenAI is not None
+        return bool(self.api_key) and AsyncOpenAI is not None
 
     def get_capabilities(self) -> Dict[str, Any]:
         return {
             "provider": "openai",
             "model": self.model_name,
             "supports_json": True,
-            "supports_streaming": False,
+            "supports_streaming": True,
             "max_tokens": 4096,
         }
 
     # Private methods
-    def _get_client(self) -> "OpenAI":
-        """Lazy init OpenAI SDK client."""
-        if self._client is None:
-            if OpenAI is None:
+    def _get_client(self) -> "AsyncOpenAI":
+        """Lazy init async OpenAI SDK client on the shared HTTP pool."""
+        http_client = get_http_client()
+        # Rebind when the pool was recreated (new event loop or closed on shutdown)
+        if self._client is None or self._http_client is not http_client:
+            if AsyncOpenAI is None:
                 raise RuntimeError("OpenAI SDK not installed")
-            self._client = OpenAI(api_key=self.api_key)
+            self._http_client = http_client
+            self._client = AsyncOpenAI(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                http_client=http_client,
+                max_retries=0,
+            )
         return self._client
 
-    async def _call_api(
-        self,
-        prompt: str,
-        temperature: float,
-        max_tokens: Optional[int]
-    ) -> str:
-        """Run OpenAI API call in thread pool (SDK is sync)."""
-        return await asyncio.to_thread(
-            self._sync_call_api, prompt, temperature, max_tokens
-        )
+    def _request_timeout(self, retry_timeout: Optional[float]) -> float:
+        """Per-attempt HTTP timeout, kept inside the retry attempt timeout so the SDK reports it first."""
+        if retry_timeout:
+            return min(self.request_timeout, float(retry_timeout) * 0.9)
+        return self.request_timeout
 
-    def _sync_call_api(
+    async def _call_api(
         self,
         prompt: str,
         temperature: float,
-        max_tokens: Optional[int]
+        max_tokens: Optional[int],
+        timeout: float
     ) -> str:
-        """Actual sync API call."""
+        """Actual async API call."""
         client = self._get_client()
 
         params: Dict[str, Any] = {
@@ -154,7 +229,7 @@ class OpenAIClient(BaseAIClient):
         if max_tokens:
             params["max_tokens"] = int(max_tokens)
 
-        response = client.chat.completions.create(**params)
+        response = await client.chat.completions.create(**params, timeout=timeout)
         content = response.choices[0].message.content if response.choices else ""
 
-        return content or ""
\ No newline at end of file
+        return content or ""
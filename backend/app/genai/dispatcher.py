@@ -0,0 +1,263 @@
+"""
+LLM call dispatcher
+Bounds in-flight provider calls and token throughput, queueing fairly across users
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Rough prompt size estimate used for the token budget (no tokenizer dependency)
+CHARS_PER_TOKEN = 4
+DEFAULT_COMPLETION_TOKENS = 1000
+
+
+class DispatchTimeoutError(Exception):
+    """Raised when a call waited longer than the queue timeout for a provider slot"""
+
+
+def estimate_tokens(prompt: str, max_tokens: Optional[int] = None) -> int:
+    """Estimate tokens a call consumes (prompt + completion budget)"""
+    return len(prompt) // CHARS_PER_TOKEN + 1 + int(max_tokens or DEFAULT_COMPLETION_TOKENS)
+
+
+class _Waiter:
+    __slots__ = ("future", "tokens", "user_key", "enqueued_at")
+
+    def __init__(self, future: asyncio.Future, tokens: int, user_key: str):
+        self.future = future
+        self.tokens = tokens
+        self.user_key = user_key
+        self.enqueued_at = time.monotonic()
+
+
+class ProviderQueue:
+    """
+    Admission control for one provider
+
+    - At most max_concurrency calls in flight
+    - Token bucket holding tokens_per_minute, refilled continuously
+      (0 disables the budget)
+    - One FIFO per user, served round-robin so a user submitting many
+      chunks cannot starve others
+    """
+
+    def __init__(self, name: str, max_concurrency: int, tokens_per_minute: int = 0):
+        self.name = name
+        self.max_concurrency = max(1, max_concurrency)
+        self.tokens_per_minute = max(0, tokens_per_minute)
+
+        self.in_flight = 0
+        self._tokens = float(self.tokens_per_minute)
+        self._refilled_at = time.monotonic()
+        self._queues: Dict[str, Deque[_Waiter]] = {}
+        self._turns: Deque[str] = deque()
+        self._wakeup: Optional[asyncio.TimerHandle] = None
+
+        # Counters for monitoring
+        self.dispatched = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @property
+    def queued(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    async def acquire(self, tokens: int, user_key: str, timeout: Optional[float]) -> float:
+        """
+        Wait for a slot and token budget
+
+        Returns:
+            Seconds spent queued
+        """
+        waiter = _Waiter(asyncio.get_running_loop().create_future(), tokens, user_key)
+        if user_key not in self._queues:
+            self._queues[user_key] = deque()
+            self._turns.append(user_key)
+        self._queues[user_key].append(waiter)
+        self._dispatch()
+
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), timeout)
+        except asyncio.TimeoutError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Granted while timing out - keep the slot
+                return self._record_wait(waiter)
+            self._remove(waiter)
+            self.timeouts += 1
+            raise DispatchTimeoutError(
+                f"{self.name} queue wait exceeded {timeout}s ({self.queued} calls queued)"
+            )
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                self.release()
+            else:
+                self._remove(waiter)
+            raise
+
+        return self._record_wait(waiter)
+
+    def release(self) -> None:
+        """Return a concurrency slot and admit the next waiter"""
+        self.in_flight = max(0, self.in_flight - 1)
+        self._dispatch()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "tokens_per_minute": self.tokens_per_minute,
+            "tokens_available": int(self._refill()) if self.tokens_per_minute else None,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "queued_users": len(self._turns),
+            "dispatched": self.dispatched,
+            "timeouts": self.timeouts,
+            "avg_wait_seconds": round(self.total_wait / self.dispatched, 4) if self.dispatched else 0.0,
+            "max_wait_seconds": round(self.max_wait, 4),
+        }
+
+    def _record_wait(self, waiter: _Waiter) -> float:
+        waited = time.monotonic() - waiter.enqueued_at
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        return waited
+
+    def _remove(self, waiter: _Waiter) -> None:
+        queue = self._queues.get(waiter.user_key)
+        if queue is not None and waiter in queue:
+            queue.remove(waiter)
+            if not queue:
+                del self._queues[waiter.user_key]
+                self._turns.remove(waiter.user_key)
+        waiter.future.cancel()
+        # A removed head-of-line waiter may have been blocking others
+        self._dispatch()
+
+    def _refill(self) -> float:
+        now = time.monotonic()
+        rate = self.tokens_per_minute / 60.0
+        self._tokens = min(float(self.tokens_per_minute), self._tokens + (now - self._refilled_at) * rate)
+        self._refilled_at = now
+        return self._tokens
+
+    def _dispatch(self) -> None:
+        """Grant slots to waiters round-robin across users while capacity allows"""
+        while self.in_flight < self.max_concurrency and self._turns:
+            user_key = self._turns[0]
+            waiter = self._queues[user_key][0]
+
+            if self.tokens_per_minute:
+                available = self._refill()
+                # Calls larger than the whole budget run once the bucket is full
+                needed = min(waiter.tokens, self.tokens_per_minute)
+                if available < needed:
+                    self._schedule_wakeup((needed - available) * 60.0 / self.tokens_per_minute)
+                    return
+                self._tokens -= needed
+
+            self._queues[user_key].popleft()
+            self._turns.rotate(-1)
+            if not self._queues[user_key]:
+                del self._queues[user_key]
+                self._turns.remove(user_key)
+
+            self.in_flight += 1
+            self.dispatched += 1
+            waiter.future.set_result(None)
+
+    def _schedule_wakeup(self, delay: float) -> None:
+        if self._wakeup is not None and not self._wakeup.cancelled():
+            self._wakeup.cancel()
+        self._wakeup = asyncio.get_running_loop().call_later(delay, self._on_wakeup)
+
+    def _on_wakeup(self) -> None:
+        self._wakeup = None
+        self._dispatch()
+
+
+class LLMDispatcher:
+    """
+    Gate between GenAIService and provider clients
+
+    Every provider call runs inside dispatcher.slot(), which waits locally
+    for a concurrency slot and token budget instead of letting bursts turn
+    into provider 429s and retry storms.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, Dict[str, int]]] = None,
+        queue_timeout: Optional[float] = None,
+    ):
+        self.limits = limits if limits is not None else settings.genai_provider_limits
+        self.queue_timeout = settings.genai_queue_timeout if queue_timeout is None else queue_timeout
+        self._providers: Dict[str, ProviderQueue] = {}
+
+    def get_queue(self, provider: str) -> ProviderQueue:
+        if provider not in self._providers:
+            limit = self.limits.get(provider, {})
+            self._providers[provider] = ProviderQueue(
+                provider,
+                max_concurrency=limit.get("concurrency", settings.genai_provider_concurrency),
+                tokens_per_minute=limit.get("tpm", 0),
+            )
+        return self._providers[provider]
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        provider: str,
+        prompt: str,
+        *,
+        max_tokens: Optional[int] = None,
+        user_id: Optional[str] = None,
+    ) -> AsyncIterator[float]:
+        """
+        Hold a provider slot for the duration of the block
+
+        Args:
+            provider: Provider name
+            prompt: Rendered prompt (sizes the token budget)
+            max_tokens: Completion budget of the call
+            user_id: Caller for fair queueing (anonymous callers share one queue)
+
+        Yields:
+            Seconds spent queued
+
+        Raises:
+            DispatchTimeoutError: If no slot frees up within queue_timeout
+        """
+        queue = self.get_queue(provider)
+        waited = await queue.acquire(
+            estimate_tokens(prompt, max_tokens), user_id or "anonymous", self.queue_timeout
+        )
+        if waited > 1:
+            logger.info(f"{provider} call queued {waited:.2f}s locally ({queue.queued} still waiting)")
+        try:
+            yield waited
+        finally:
+            queue.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get per-provider queue statistics"""
+        return {name: queue.stats() for name, queue in self._providers.items()}
+
+
+# Shared dispatcher instance
+_dispatcher: Optional[LLMDispatcher] = None
+
+
+def get_dispatcher() -> LLMDispatcher:
+    """Get (or lazily create) the shared dispatcher"""
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = LLMDispatcher()
+    return _dispatcher
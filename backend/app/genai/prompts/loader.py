@@ -1,9 +1,15 @@
+import logging
 import os
-from typing import Any, Dict, Tuple
+import threading
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
-from jinja2 import Template
+from jinja2 import Environment, FileSystemBytecodeCache, FunctionLoader, Template
 
+from app.core.config import settings
+
+
+logger = logging.getLogger(__name__)
 
 PROVIDERS_DIR = os.path.join(os.path.dirname(__file__), "providers")
 BASE_FILE = os.path.join(PROVIDERS_DIR, "base.yaml")
@@ -19,15 +25,181 @@ def _read_yaml(path: str) -> Dict[str, Any]:
     return data
 
 
+class PromptRegistry:
+    """
+    Parsed YAML configs and compiled Jinja2 templates, loaded once.
+
+    - YAML files are parsed on first use and kept in memory
+    - Templates are compiled once per (template_key, locale) through one
+      Environment; compiled bytecode is cached on disk so restarts skip
+      compilation too
+    - Per-provider static variables are merged once, so a render is a dict
+      update plus template substitution
+    - With auto_reload (development), files are re-read when their mtime
+      changes and affected templates are recompiled
+    """
+
+    def __init__(
+        self,
+        providers_dir: str = PROVIDERS_DIR,
+        *,
+        auto_reload: Optional[bool] = None,
+        bytecode_cache_dir: Optional[str] = None,
+    ):
+        self.providers_dir = providers_dir
+        self.base_file = os.path.join(providers_dir, "base.yaml")
+        self.auto_reload = settings.debug if auto_reload is None else auto_reload
+
+        self._lock = threading.RLock()
+        self._files: Dict[str, Tuple[float, Dict[str, Any]]] = {}  # path -> (mtime, data)
+        self._providers: Dict[str, Dict[str, Any]] = {}
+        self._templates: Dict[Tuple[str, str], Template] = {}
+        self.compiled = 0
+
+        cache_dir = bytecode_cache_dir or settings.prompt_bytecode_cache_dir
+        bytecode_cache = None
+        if cache_dir:
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                bytecode_cache = FileSystemBytecodeCache(cache_dir)
+            except OSError as e:
+                logger.warning(f"Prompt bytecode cache disabled ({cache_dir}): {e}")
+        # Templates are cached here, not in the Environment (cache_size=0)
+        self._env = Environment(
+            loader=FunctionLoader(self._template_source),
+            bytecode_cache=bytecode_cache,
+            cache_size=0,
+            auto_reload=False,
+        )
+
+    def warm_up(self) -> None:
+        """Load every provider YAML and compile every template (called at startup)"""
+        base = self.base()
+        for template_key, tpl_cfg in (base.get("templates") or {}).items():
+            for locale in (tpl_cfg.get("locales") or {}):
+                self.template(template_key, locale)
+
+        for filename in sorted(os.listdir(self.providers_dir)):
+            name, ext = os.path.splitext(filename)
+            if ext == ".yaml" and name != "base":
+                try:
+                    self.provider(name)
+                except (KeyError, ValueError) as e:
+                    logger.error(f"Invalid prompt provider config {filename}: {e}")
+
+        logger.info(f"Prompt registry ready: {len(self._templates)} templates, {len(self._providers)} providers")
+
+    def base(self) -> Dict[str, Any]:
+        return self._yaml(self.base_file)
+
+    def provider_yaml(self, name: str) -> Dict[str, Any]:
+        return self._yaml(os.path.join(self.providers_dir, f"{name}.yaml"))
+
+    def provider(self, name: str) -> Dict[str, Any]:
+        """
+        Validated provider entry with base and provider variables merged.
+
+        Raises:
+            FileNotFoundError: If the provider YAML does not exist
+            KeyError: If provider.name / provider.model are missing
+        """
+        base = self.base()
+        prv_cfg = self.provider_yaml(name)
+        entry = self._providers.get(name)
+        if entry is not None and entry["base"] is base and entry["yaml"] is prv_cfg:
+            return entry
+
+        prv = prv_cfg.get("provider") or {}
+        if not prv.get("name") or not prv.get("model"):
+            raise KeyError("provider.name and provider.model are required in provider YAML")
+
+        base_vars = base.get("variables") or {}
+        static_vars: Dict[str, Any] = {}
+        static_vars.update(base_vars)
+        static_vars.update(prv_cfg.get("variables") or {})
+
+        entry = {
+            "base": base,
+            "yaml": prv_cfg,
+            "name": prv["name"],
+            "model": prv["model"],
+            "params": prv_cfg.get("params") or {},
+            "template_mapping": prv_cfg.get("template_mapping") or {},
+            "variables": static_vars,
+        }
+        with self._lock:
+            self._providers[name] = entry
+        return entry
+
+    def template(self, template_key: str, locale: str) -> Template:
+        """Compiled template for a base template key and locale"""
+        if self.auto_reload:
+            self.base()  # drops compiled templates if base.yaml changed
+        key = (template_key, locale)
+        template = self._templates.get(key)
+        if template is None:
+            with self._lock:
+                template = self._templates.get(key)
+                if template is None:
+                    template = self._env.get_template(f"{template_key}/{locale}")
+                    self._templates[key] = template
+                    self.compiled += 1
+        return template
+
+    def _template_source(self, name: str) -> str:
+        template_key, locale = name.split("/", 1)
+        return self.base()["templates"][template_key]["locales"][locale]
+
+    def _yaml(self, path: str) -> Dict[str, Any]:
+        cached = self._files.get(path)
+        if cached is not None and not self.auto_reload:
+            return cached[1]
+
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            raise FileNotFoundError(f"YAML not found: {path}")
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        with self._lock:
+            data = _read_yaml(path)
+            if cached is not None:
+                logger.info(f"Reloaded prompt config {os.path.basename(path)}")
+                if path == self.base_file:
+                    # Template sources live in base.yaml
+                    self._templates.clear()
+            self._files[path] = (mtime, data)
+        return data
+
+
+# Shared registry instance
+_registry: Optional[PromptRegistry] = None
+
+
+def get_registry() -> PromptRegistry:
+    """Get (or lazily create) the shared prompt registry"""
+    global _registry
+    if _registry is None:
+        _registry = PromptRegistry()
+    return _registry
+
+
 def load_base() -> Dict[str, Any]:
     """Load base prompt configuration (templates, defaults)."""
-    return _read_yaml(BASE_FILE)
+    return get_registry().base()
 
 
 def load_provider(name: str) -> Dict[str, Any]:
     """Load provider-specific configuration (model, params, overrides)."""
-    path = os.path.join(PROVIDERS_DIR, f"{name}.yaml")
-    return _read_yaml(path)
+    return get_registry().provider_yaml(name)
+
+
+def get_max_content_length(provider: str) -> int:
+    """Characters of content that fit in one prompt for provider (provider overrides base)."""
+    base_vars = load_base().get("variables") or {}
+    provider_vars = load_provider(provider).get("variables") or {}
+    return int(provider_vars.get("max_content_length", base_vars.get("max_content_length", 10000)))
 
 
 def render(
@@ -41,8 +213,8 @@ def render(
 
     Returns: (rendered_prompt, provider_config, required_fields)
     """
-    base_cfg = load_base()
-    prv_cfg = load_provider(provider)
+    registry = get_registry()
+    base_cfg = registry.base()
 
     # Validate minimal structure
     templates = (base_cfg.get("templates") or {})
@@ -65,23 +237,18 @@ def render(
         if use_locale not in locales:
             raise KeyError(f"Locale '{use_locale}' not available and no valid default in base.yaml")
 
-    # Provider validations
-    prv = prv_cfg.get("provider") or {}
-    if not prv.get("name") or not prv.get("model"):
-        raise KeyError("provider.name and provider.model are required in provider YAML")
+    # Provider validations (done once per provider config)
+    prv = registry.provider(provider)
 
-    mapping = prv_cfg.get("template_mapping") or {}
-    mapped_key = mapping.get(template_key) or template_key
+    mapped_key = prv["template_mapping"].get(template_key) or template_key
     # Ensure template exists in base
     if mapped_key not in templates:
         raise KeyError(
             f"Mapped template key '{mapped_key}' not found in base templates."
         )
 
-    # Merge variables: base.defaults <- provider.variables <- runtime
-    merged_vars: Dict[str, Any] = {}
-    merged_vars.update(base_vars)
-    merged_vars.update(prv_cfg.get("variables") or {})
+    # Merge variables: base.defaults <- provider.variables (premerged) <- runtime
+    merged_vars: Dict[str, Any] = dict(prv["variables"])
     merged_vars.update(variables or {})
 
     # Ensure common placeholders
@@ -91,18 +258,15 @@ def render(
         merged_vars["max_content_length"] = base_vars.get("max_content_length", 10000)
     merged_vars.setdefault("required_fields", required_fields)
 
-    # Render via Jinja2
-    template_str: str = locales[use_locale]
-    prompt = Template(template_str).render(**merged_vars)
+    # Render precompiled template
+    prompt = registry.template(template_key, use_locale).render(**merged_vars)
 
     provider_config = {
         "name": prv["name"],
         "model": prv["model"],
-        "params": prv_cfg.get("params") or {},
+        "params": prv["params"],
         "resolved_locale": use_locale,
         "resolved_variables": merged_vars,
     }
 
     return prompt.strip(), provider_config, required_fields
-
-
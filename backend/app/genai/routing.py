@@ -0,0 +1,183 @@
+"""
+Latency-aware provider routing
+Ranks providers by rolling latency and error rate and derives hedge deadlines
+"""
+
+import logging
+import math
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.genai.clients.factory import AIClientFactory
+from app.genai.utils.circuit_breaker import get_circuit_breaker
+from app.schemas.exam_schemas import AIProvider
+
+logger = logging.getLogger(__name__)
+
+# Samples needed before a provider's p95 is trusted over the default delay
+MIN_SAMPLES = 5
+
+# Never hedged to or away from: its answers are canned, and a failing mock
+# call must not spill over to a paid provider
+MOCK_PROVIDER = "mock"
+
+
+def is_provider_available(provider: str) -> bool:
+    """True if the provider has a configured client and its circuit is not open (no network calls)"""
+    try:
+        AIClientFactory.create_client(AIProvider(provider))
+    except ValueError:
+        return False
+    return not get_circuit_breaker(provider).is_open()
+
+
+class ProviderStats:
+    """Rolling window of (latency, success) samples for one provider"""
+
+    def __init__(self, window: int):
+        self._samples: Deque[Tuple[float, bool]] = deque(maxlen=max(1, window))
+        self.calls = 0
+        self.errors = 0
+        self.hedge_wins = 0
+
+    def record(self, latency: float, success: bool) -> None:
+        self._samples.append((latency, success))
+        self.calls += 1
+        if not success:
+            self.errors += 1
+
+    @property
+    def samples(self) -> int:
+        return len(self._samples)
+
+    def error_rate(self) -> float:
+        if not self._samples:
+            return 0.0
+        return sum(1 for _, ok in self._samples if not ok) / len(self._samples)
+
+    def latency_quantile(self, q: float = 0.95) -> Optional[float]:
+        """Nearest-rank quantile of successful call latencies"""
+        latencies = sorted(latency for latency, ok in self._samples if ok)
+        if len(latencies) < MIN_SAMPLES:
+            return None
+        return latencies[min(len(latencies) - 1, math.ceil(q * len(latencies)) - 1)]
+
+    def stats(self) -> Dict[str, Any]:
+        p50 = self.latency_quantile(0.5)
+        p95 = self.latency_quantile(0.95)
+        return {
+            "samples": self.samples,
+            "calls": self.calls,
+            "errors": self.errors,
+            "error_rate": round(self.error_rate(), 4),
+            "p50_seconds": round(p50, 3) if p50 is not None else None,
+            "p95_seconds": round(p95, 3) if p95 is not None else None,
+            "hedge_wins": self.hedge_wins,
+        }
+
+
+class ProviderRouter:
+    """
+    Chooses primary and hedge providers for a generation
+
+    - The requested provider stays primary unless its rolling error rate
+      exceeds max_error_rate, then the best-ranked healthy provider is used
+    - Hedge candidates are the configured providers whose circuit is not
+      open, ranked by (degraded, p95 latency); mock is never hedged
+    - The hedge fires at the primary's p95 latency, clamped to
+      [min_delay, max_delay]; default_delay is used until enough samples exist
+    """
+
+    def __init__(
+        self,
+        enabled: Optional[bool] = None,
+        providers: Optional[List[str]] = None,
+        window: Optional[int] = None,
+        min_delay: Optional[float] = None,
+        max_delay: Optional[float] = None,
+        default_delay: Optional[float] = None,
+        max_error_rate: Optional[float] = None,
+        is_available: Optional[Callable[[str], bool]] = None,
+    ):
+        self.enabled = settings.genai_hedging_enabled if enabled is None else enabled
+        self.providers = list(settings.genai_hedge_providers if providers is None else providers)
+        self.window = window or settings.genai_routing_window
+        self.min_delay = settings.genai_hedge_min_delay if min_delay is None else min_delay
+        self.max_delay = settings.genai_hedge_max_delay if max_delay is None else max_delay
+        self.default_delay = settings.genai_hedge_default_delay if default_delay is None else default_delay
+        self.max_error_rate = settings.genai_routing_max_error_rate if max_error_rate is None else max_error_rate
+        self.is_available = is_available or is_provider_available
+        self._stats: Dict[str, ProviderStats] = {}
+
+    def get_stats(self, provider: str) -> ProviderStats:
+        if provider not in self._stats:
+            self._stats[provider] = ProviderStats(self.window)
+        return self._stats[provider]
+
+    def record(self, provider: str, latency: float, success: bool) -> None:
+        """Record the outcome of one provider call"""
+        self.get_stats(provider).record(latency, success)
+
+    def is_degraded(self, provider: str) -> bool:
+        stats = self.get_stats(provider)
+        return stats.samples >= MIN_SAMPLES and stats.error_rate() > self.max_error_rate
+
+    def rank(self, providers: List[str]) -> List[str]:
+        """Order providers healthy-first, then by p95 latency (unknown last among equals)"""
+        def key(provider: str) -> Tuple[bool, float]:
+            p95 = self.get_stats(provider).latency_quantile()
+            return self.is_degraded(provider), p95 if p95 is not None else math.inf
+
+        return sorted(providers, key=key)
+
+    def plan(self, requested: str) -> List[str]:
+        """
+        Providers to try for a request, primary first
+
+        Returns:
+            [requested] when hedging is disabled or requested is mock,
+            otherwise the primary followed by ranked hedge candidates
+        """
+        if not self.enabled or requested == MOCK_PROVIDER:
+            return [requested]
+
+        others = self.rank([
+            p for p in self.providers
+            if p not in (requested, MOCK_PROVIDER) and self.is_available(p)
+        ])
+        if self.is_degraded(requested) and others and not self.is_degraded(others[0]):
+            logger.warning(
+                f"{requested} error rate {self.get_stats(requested).error_rate():.0%} "
+                f"over {self.max_error_rate:.0%}, routing to {others[0]}"
+            )
+            return [others[0], requested] + others[1:]
+        return [requested] + others
+
+    def hedge_delay(self, provider: str) -> float:
+        """Seconds to wait on provider before firing a hedged request"""
+        p95 = self.get_stats(provider).latency_quantile()
+        delay = self.default_delay if p95 is None else p95
+        return min(self.max_delay, max(self.min_delay, delay))
+
+    def stats(self) -> Dict[str, Any]:
+        """Get per-provider rolling statistics"""
+        return {
+            "enabled": self.enabled,
+            "providers": {
+                name: {**stats.stats(), "degraded": self.is_degraded(name), "hedge_delay_seconds": round(self.hedge_delay(name), 3)}
+                for name, stats in self._stats.items()
+            },
+        }
+
+
+# Shared router instance
+_router: Optional[ProviderRouter] = None
+
+
+def get_router() -> ProviderRouter:
+    """Get (or lazily create) the shared provider router"""
+    global _router
+    if _router is None:
+        _router = ProviderRouter()
+    return _router
@@ -1,10 +1,24 @@
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+import time
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 
-from app.genai.prompts.loader import render as render_prompt
+from app.genai.cache import GenerationCache, get_generation_cache, is_cacheable, make_fingerprint
+from app.genai.dispatcher import LLMDispatcher, get_dispatcher
+from app.genai.routing import ProviderRouter, get_router
+from app.core.config import settings
+from app.genai.prompts.loader import get_max_content_length, render as render_prompt
 from app.genai.clients.factory import AIClientFactory
+from app.genai.utils.chunking import (
+    QuestionDeduplicator,
+    allocate_questions,
+    merge_questions,
+    split_into_chunks,
+)
+from app.genai.utils.circuit_breaker import CircuitOpenError, get_circuit_breaker
 from app.genai.utils.response_parser import ResponseParser
+from app.genai.utils.stream_parser import IncrementalJSONArrayParser
 from app.genai.utils.retry import retry_with_backoff, OPENAI_RETRY_CONFIG, GEMINI_RETRY_CONFIG
 from app.schemas.exam_schemas import ExamGenerationRequest, AIProvider
 
@@ -21,32 +35,52 @@ class GenAIService:
     - Get/cache AI clients from factory
     - Execute API calls with retry logic
     - Parse and normalize responses
+    - Cache deterministic (temperature == 0) results by prompt fingerprint
+    - Map-reduce long documents over concurrently generated chunks
+    - Queue provider calls through the dispatcher (concurrency, token budget, fairness)
+    - Stream questions to callers as soon as each one is complete
+    - Hedge slow providers and fail over, ranked by rolling latency / error rate
+    - Fail fast while a provider's circuit breaker is open
     - Handle errors and validation
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        cache: Optional[GenerationCache] = None,
+        dispatcher: Optional[LLMDispatcher] = None,
+        router: Optional[ProviderRouter] = None
+    ) -> None:
         self.parser = ResponseParser()
+        self.cache = cache or get_generation_cache()
+        self.dispatcher = dispatcher or get_dispatcher()
+        self.router = router or get_router()
         logger.info("GenAIService initialized")
 
     async def generate_exam(
         self,
         request: ExamGenerationRequest,
         *,
-        language: Optional[str] = None
+        language: Optional[str] = None,
+        user_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Generate exam questions from content.
 
-        This method orchestrates the entire generation flow:
+        Content longer than the provider's prompt budget is routed to
+        generate_exam_long. With hedging enabled the call may be hedged or
+        failed over to another provider (see _generate_hedged). Each provider
+        call orchestrates the flow:
         1. Render prompt from YAML
         2. Get cached client from factory
-        3. Call API with retry logic
-        4. Parse and normalize response
-        5. Return structured result
+        3. Return cached questions for identical deterministic requests
+        4. Wait for a dispatcher slot, call API with retry logic
+        5. Parse and normalize response
+        6. Return structured result
 
         Args:
             request: ExamGenerationRequest with content, settings, etc.
             language: Optional locale override
+            user_id: Caller, for fair queueing between users
 
         Returns:
             {
@@ -58,44 +92,80 @@ class GenAIService:
         """
         provider_name = (request.ai_provider or "gemini").lower()
 
-        try:
-            # Step 1: Render prompt from YAML templates
-            prompt, provider_cfg, required_fields = render_prompt(
-                template_key="exam_generation",
-                provider=provider_name,
-                locale=(language or request.language or ""),
-                variables={
-                    "content": request.content,
-                    "question_count": int(request.question_count),
-                },
-            )
+        if settings.genai_long_document_enabled:
+            max_chars = self._get_max_content_length(provider_name)
+            if max_chars and len(request.content) > max_chars:
+                return await self.generate_exam_long(
+                    request, language=language, user_id=user_id, max_chars=max_chars
+                )
+
+        plan = self.router.plan(provider_name)
+        if len(plan) > 1:
+            return await self._generate_hedged(request, provider_name, plan, language=language, user_id=user_id)
+        return await self._generate_single(request, provider_name, language=language, user_id=user_id)
 
-            # Step 2: Get cached client from factory
-            provider_enum = AIProvider(provider_name)
-            client = AIClientFactory.create_client(provider_enum, use_cache=True)
+    async def _generate_single(
+        self,
+        request: ExamGenerationRequest,
+        provider_name: str,
+        *,
+        language: Optional[str] = None,
+        user_id: Optional[str] = None,
+        on_attempt: Optional[Callable[[int], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate exam questions with one provider (cache, dispatcher slot, retries).
 
-            # Step 3: Prepare call parameters
-            call_params: Dict[str, Any] = {}
-            yaml_params = provider_cfg.get("params") or {}
-            call_params.update(yaml_params)
+        on_attempt is called with the attempt number (0 first) right before
+        each request is sent to the provider, i.e. only while the dispatcher
+        slot is held.
+        """
+        try:
+            # Steps 1-3: Render prompt, get cached client, prepare call parameters
+            prompt, client, call_params, fingerprint = self._prepare_call(request, provider_name, language)
 
-            if request.temperature is not None:
-                call_params["temperature"] = float(request.temperature)
-            if request.max_tokens is not None:
-                call_params["max_tokens"] = int(request.max_tokens)
+            # Step 4: Serve identical deterministic requests from cache (no retry/API call)
+            if fingerprint is not None:
+                cached = await self.cache.get(fingerprint, provider_name)
+                if cached is not None:
+                    logger.info(f"Generation cache hit for {provider_name} ({fingerprint[:12]})")
+                    metadata = cached["metadata"]
+                    metadata["cache_hit"] = True
+                    return self._build_success(request, provider_name, cached["questions"], metadata)
 
-            # Step 4: Call API with retry logic (handled here, not in client)
+            # Step 5: Queue for provider slot, then call API with retry logic (handled here, not in client)
             retry_config = self._get_retry_config(provider_name)
-            raw_result = await retry_with_backoff(
-                client.generate_exam,
-                prompt,
-                config=retry_config,
-                context=f"{provider_name} generation",
-                **call_params
-            )
-
-            # Step 5: Check if API call succeeded
+            async with self.dispatcher.slot(
+                provider_name, prompt, max_tokens=call_params.get("max_tokens"), user_id=user_id
+            ) as queue_wait:
+                attempts = 0
+
+                async def send(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+                    nonlocal attempts
+                    if on_attempt is not None:
+                        on_attempt(attempts)
+                    attempts += 1
+                    return await client.generate_exam(*args, **kwargs)
+
+                call_started = time.monotonic()
+                try:
+                    raw_result = await retry_with_backoff(
+                        send,
+                        prompt,
+                        config=retry_config,
+                        context=f"{provider_name} generation",
+                        breaker=get_circuit_breaker(provider_name),
+                        timeout=retry_config.timeout,  # clients fit their HTTP timeout inside the attempt
+                        **call_params
+                    )
+                except Exception:
+                    self.router.record(provider_name, time.monotonic() - call_started, success=False)
+                    raise
+                call_latency = time.monotonic() - call_started
+
+            # Step 6: Check if API call succeeded
             if not raw_result.get("success"):
+                self.router.record(provider_name, call_latency, success=False)
                 return {
                     "success": False,
                     "questions": [],
@@ -103,9 +173,10 @@ class GenAIService:
                     "error": raw_result.get("error", "Unknown error from AI provider")
                 }
 
-            # Step 6: Parse and normalize raw response
+            # Step 7: Parse and normalize raw response
             raw_response = raw_result.get("raw_response", "")
-            questions = self._parse_and_normalize(raw_response, provider_name)
+            questions, dropped = self._parse_and_normalize(raw_response, provider_name)
+            self.router.record(provider_name, call_latency, success=bool(questions))
 
             if not questions:
                 return {
@@ -115,22 +186,15 @@ class GenAIService:
                     "error": "Failed to parse valid questions from AI response"
                 }
 
-            # Step 7: Build final response with enriched metadata
             metadata = raw_result.get("metadata", {}) or {}
-            metadata.update({
-                "subject": request.subject,
-                "requested_questions": request.question_count,
-                "total_questions": len(questions),
-                "requested_provider": provider_name,
-                "generated_at": metadata.get("generated_at") or datetime.now().isoformat(),
-            })
+            metadata["dropped_objects"] = dropped
+            if fingerprint is not None:
+                await self.cache.put(fingerprint, provider_name, questions, dict(metadata))
+            metadata["cache_hit"] = False
+            metadata["queue_wait_seconds"] = round(queue_wait, 3)
 
-            return {
-                "success": True,
-                "questions": questions,
-                "metadata": metadata,
-                "error": None
-            }
+            # Step 8: Build final response with enriched metadata
+            return self._build_success(request, provider_name, questions, metadata)
 
         except Exception as exc:
             logger.error(f"GenAIService error: {exc}", exc_info=True)
@@ -144,6 +208,446 @@ class GenAIService:
                 "error": str(exc),
             }
 
+    async def _generate_hedged(
+        self,
+        request: ExamGenerationRequest,
+        requested: str,
+        plan: List[str],
+        *,
+        language: Optional[str] = None,
+        user_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate with the first provider in plan, hedging and failing over.
+
+        If the primary has not answered within its hedge delay (rolling p95),
+        the next provider is called as well and the first valid result wins;
+        the other call is cancelled. A provider that fails outright is
+        replaced by the next one immediately.
+
+        The hedge delay counts from when the primary's request is sent, so
+        time spent queued never triggers a hedge, and no hedge is sent while
+        either provider has calls queued in the dispatcher. A call cancelled
+        because another provider won is recorded as a success lower bound
+        (latency since it was sent) only if it had been sent and had not
+        failed an attempt; cancelled calls are not recorded otherwise.
+        """
+        primary = plan[0]
+        candidates = iter(plan[1:])
+        tasks: Dict[asyncio.Task, Tuple[str, Dict[str, Any]]] = {}
+        tried: List[str] = []
+        errors: List[str] = []
+        hedge_at: Optional[float] = None
+        primary_sent = asyncio.Event()
+        dispatch_wait: Optional[asyncio.Task] = asyncio.create_task(primary_sent.wait())
+
+        won = False
+
+        def launch(provider: str, on_sent: Optional[Callable[[], None]] = None) -> None:
+            call: Dict[str, Any] = {"sent_at": None, "retried": False}
+
+            def on_attempt(attempt: int) -> None:
+                if attempt > 0:
+                    call["retried"] = True
+                elif call["sent_at"] is None:
+                    call["sent_at"] = time.monotonic()
+                    if on_sent is not None:
+                        on_sent()
+
+            task = asyncio.create_task(self._generate_single(
+                request, provider, language=language, user_id=user_id, on_attempt=on_attempt
+            ))
+            tasks[task] = (provider, call)
+            tried.append(provider)
+
+        def stop_hedging() -> None:
+            nonlocal hedge_at, dispatch_wait
+            hedge_at = None
+            if dispatch_wait is not None:
+                dispatch_wait.cancel()
+                dispatch_wait = None
+
+        launch(primary, on_sent=primary_sent.set)
+        try:
+            while tasks:
+                if dispatch_wait is not None and dispatch_wait.done():
+                    # Primary's request is sent: start the hedge timer now
+                    dispatch_wait = None
+                    hedge_at = time.monotonic() + self.router.hedge_delay(primary)
+
+                waitables = set(tasks) | ({dispatch_wait} if dispatch_wait is not None else set())
+                timeout = max(0.0, hedge_at - time.monotonic()) if hedge_at is not None else None
+                done, _ = await asyncio.wait(waitables, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                done.discard(dispatch_wait)
+
+                if hedge_at is not None and not done and time.monotonic() >= hedge_at:
+                    # Primary is slower than its p95 - fire one hedged request
+                    stop_hedging()
+                    provider = next(candidates, None)
+                    if provider is None:
+                        continue
+                    if self._dispatcher_busy(primary, provider):
+                        logger.info(f"{primary} slower than hedge deadline, not hedging: dispatcher queue busy")
+                        candidates = iter([provider, *candidates])  # keep it for failover
+                        continue
+                    logger.info(f"{primary} slower than hedge deadline, hedging with {provider}")
+                    launch(provider)
+                    continue
+
+                for task in done:
+                    provider, _ = tasks.pop(task)
+                    result = task.result()
+                    if result.get("success"):
+                        if provider != primary:
+                            self.router.get_stats(provider).hedge_wins += 1
+                        result["metadata"].update({
+                            "requested_provider": requested,
+                            "served_by": provider,
+                            "hedged": len(tried) > 1,
+                            "providers_tried": tried,
+                        })
+                        won = True
+                        return result
+                    errors.append(f"{provider}: {result.get('error')}")
+
+                if done and not tasks:
+                    # Everything in flight failed - fail over to the next provider
+                    stop_hedging()
+                    provider = next(candidates, None)
+                    if provider is not None:
+                        logger.warning(f"Failing over to {provider} after: {errors[-1]}")
+                        launch(provider)
+        finally:
+            stop_hedging()
+            for task, (provider, call) in tasks.items():
+                task.cancel()
+                if won and call["sent_at"] is not None and not call["retried"]:
+                    # Lower bound of the loser's latency keeps its p95 honest
+                    self.router.record(provider, time.monotonic() - call["sent_at"], success=True)
+            if tasks:
+                # Let losers unwind (release dispatcher slots) before returning
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+        return {
+            "success": False,
+            "questions": [],
+            "metadata": {
+                "ai_provider": requested,
+                "providers_tried": tried,
+                "generated_at": datetime.now().isoformat(),
+            },
+            "error": "; ".join(errors) or "No provider available",
+        }
+
+    def _dispatcher_busy(self, *providers: str) -> bool:
+        """True if any of the providers has calls waiting for a dispatcher slot"""
+        return any(self.dispatcher.get_queue(provider).queued for provider in providers)
+
+    async def generate_exam_long(
+        self,
+        request: ExamGenerationRequest,
+        *,
+        language: Optional[str] = None,
+        user_id: Optional[str] = None,
+        max_chars: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate exam questions from a document longer than one prompt.
+
+        The content is split into chunks on paragraph/sentence boundaries,
+        question_count is spread over chunks in proportion to their length,
+        chunks are generated concurrently (bounded by the dispatcher) and the
+        results are merged in document order with near-duplicates removed.
+        Latency is that of the slowest chunk batch, not the sum of chunks.
+
+        Args:
+            request: ExamGenerationRequest with the full document content
+            language: Optional locale override
+            user_id: Caller, for fair queueing between users
+            max_chars: Chunk size (defaults to provider's max_content_length)
+
+        Returns:
+            Same shape as generate_exam
+        """
+        provider_name = (request.ai_provider or "gemini").lower()
+        max_chars = max_chars or self._get_max_content_length(provider_name)
+
+        chunks = split_into_chunks(request.content, max_chars)
+        allocation = allocate_questions([len(chunk) for chunk in chunks], int(request.question_count))
+        jobs = [(chunk, count) for chunk, count in zip(chunks, allocation) if count > 0]
+        logger.info(
+            f"Long-document generation: {len(request.content)} chars -> "
+            f"{len(chunks)} chunks, {len(jobs)} generated ({provider_name})"
+        )
+
+        async def generate_chunk(chunk: str, count: int) -> Dict[str, Any]:
+            chunk_request = request.model_copy(update={"content": chunk, "question_count": count})
+            return await self.generate_exam(chunk_request, language=language, user_id=user_id)
+
+        results = await asyncio.gather(*(generate_chunk(chunk, count) for chunk, count in jobs))
+
+        groups: List[list] = []
+        errors: List[str] = []
+        for result, (_, count) in zip(results, jobs):
+            if result.get("success"):
+                groups.append(result["questions"][:count])
+            else:
+                errors.append(result.get("error") or "Unknown error")
+
+        if not groups:
+            return {
+                "success": False,
+                "questions": [],
+                "metadata": {
+                    "ai_provider": provider_name,
+                    "generated_at": datetime.now().isoformat(),
+                },
+                "error": errors[0] if errors else "No content to generate questions from"
+            }
+
+        questions = merge_questions(groups)
+        first_metadata = next(r["metadata"] for r in results if r.get("success"))
+        metadata = {
+            "ai_provider": first_metadata.get("ai_provider", provider_name),
+            "model": first_metadata.get("model"),
+            "long_document": True,
+            "chunks": len(chunks),
+            "chunks_generated": len(jobs),
+            "chunks_failed": len(errors),
+            "cache_hits": sum(1 for r in results if (r.get("metadata") or {}).get("cache_hit")),
+            "duplicates_removed": sum(len(g) for g in groups) - len(questions),
+        }
+        return self._build_success(request, provider_name, questions, metadata)
+
+    async def stream_exam(
+        self,
+        request: ExamGenerationRequest,
+        *,
+        language: Optional[str] = None,
+        user_id: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Generate exam questions, yielding each one as soon as it is available.
+
+        The provider token stream is fed through an incremental JSON array
+        parser, so a question is normalized and yielded when its object
+        closes instead of after the whole response. Streams are not retried
+        once started. Long documents stream per chunk as chunks finish.
+
+        Yields events:
+            {"type": "question", "index": int, "question": Dict}
+            {"type": "done", "metadata": Dict}
+            {"type": "error", "error": str}
+        """
+        provider_name = (request.ai_provider or "gemini").lower()
+
+        if settings.genai_long_document_enabled:
+            max_chars = self._get_max_content_length(provider_name)
+            if max_chars and len(request.content) > max_chars:
+                async for event in self._stream_long(request, provider_name, language, user_id, max_chars):
+                    yield event
+                return
+
+        try:
+            prompt, client, call_params, fingerprint = self._prepare_call(request, provider_name, language)
+
+            if fingerprint is not None:
+                cached = await self.cache.get(fingerprint, provider_name)
+                if cached is not None:
+                    for index, question in enumerate(cached["questions"]):
+                        yield {"type": "question", "index": index, "question": question}
+                    metadata = cached["metadata"]
+                    metadata["cache_hit"] = True
+                    result = self._build_success(request, provider_name, cached["questions"], metadata)
+                    yield {"type": "done", "metadata": result["metadata"]}
+                    return
+
+            questions: List[Dict[str, Any]] = []
+            stream_parser = IncrementalJSONArrayParser()
+            retry_config = self._get_retry_config(provider_name)
+            started = time.monotonic()
+            first_question_at: Optional[float] = None
+
+            async with self.dispatcher.slot(
+                provider_name, prompt, max_tokens=call_params.get("max_tokens"), user_id=user_id
+            ) as queue_wait:
+                breaker = get_circuit_breaker(provider_name)
+                await breaker.before_call()
+                try:
+                    pieces = client.stream_exam(prompt, timeout=retry_config.timeout, **call_params)
+                    async for piece in pieces:
+                        for raw_question in stream_parser.feed(piece):
+                            for question in self.parser.normalize_questions([raw_question], provider=provider_name):
+                                if first_question_at is None:
+                                    first_question_at = time.monotonic() - started
+                                questions.append(question)
+                                yield {"type": "question", "index": len(questions) - 1, "question": question}
+                except (asyncio.CancelledError, GeneratorExit, CircuitOpenError):
+                    # Caller went away (or no call was admitted): says nothing about the provider
+                    breaker.release_probe()
+                    raise
+                except Exception as exc:
+                    await breaker.record_failure(timeout=isinstance(exc, (TimeoutError, asyncio.TimeoutError)))
+                    raise
+                await breaker.record_success()
+
+            stream_parser.close()
+
+            if not questions:
+                yield {"type": "error", "error": "Failed to parse valid questions from AI response"}
+                return
+
+            metadata = {
+                "ai_provider": provider_name,
+                "model": getattr(client, "model_name", None),
+                "streamed": True,
+                "dropped_objects": len(stream_parser.dropped),
+            }
+            if fingerprint is not None:
+                await self.cache.put(fingerprint, provider_name, questions, dict(metadata))
+            metadata.update({
+                "cache_hit": False,
+                "queue_wait_seconds": round(queue_wait, 3),
+                "time_to_first_question": round(first_question_at or time.monotonic() - started, 3),
+            })
+            result = self._build_success(request, provider_name, questions, metadata)
+            yield {"type": "done", "metadata": result["metadata"]}
+
+        except Exception as exc:
+            logger.error(f"GenAIService stream error: {exc}", exc_info=True)
+            yield {"type": "error", "error": str(exc)}
+
+    async def _stream_long(
+        self,
+        request: ExamGenerationRequest,
+        provider_name: str,
+        language: Optional[str],
+        user_id: Optional[str],
+        max_chars: int
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream long-document questions chunk by chunk in completion order."""
+        chunks = split_into_chunks(request.content, max_chars)
+        allocation = allocate_questions([len(chunk) for chunk in chunks], int(request.question_count))
+
+        async def generate_chunk(chunk: str, count: int) -> Tuple[int, Dict[str, Any]]:
+            chunk_request = request.model_copy(update={"content": chunk, "question_count": count})
+            return count, await self.generate_exam(chunk_request, language=language, user_id=user_id)
+
+        tasks = [
+            asyncio.create_task(generate_chunk(chunk, count))
+            for chunk, count in zip(chunks, allocation) if count > 0
+        ]
+        deduplicator = QuestionDeduplicator()
+        questions: List[Dict[str, Any]] = []
+        errors: List[str] = []
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                count, result = await next_done
+                if not result.get("success"):
+                    errors.append(result.get("error") or "Unknown error")
+                    continue
+                for question in result["questions"][:count]:
+                    if deduplicator.add(question):
+                        questions.append(question)
+                        yield {"type": "question", "index": len(questions) - 1, "question": question}
+        finally:
+            # Client went away or stream finished - stop outstanding chunk calls
+            for task in tasks:
+                task.cancel()
+
+        if not questions:
+            yield {"type": "error", "error": errors[0] if errors else "No content to generate questions from"}
+            return
+
+        metadata = {
+            "ai_provider": provider_name,
+            "long_document": True,
+            "streamed": True,
+            "chunks": len(chunks),
+            "chunks_generated": len(tasks),
+            "chunks_failed": len(errors),
+        }
+        result = self._build_success(request, provider_name, questions, metadata)
+        yield {"type": "done", "metadata": result["metadata"]}
+
+    def _prepare_call(
+        self,
+        request: ExamGenerationRequest,
+        provider_name: str,
+        language: Optional[str]
+    ) -> Tuple[str, Any, Dict[str, Any], Optional[str]]:
+        """
+        Render prompt, get client and build call parameters.
+
+        Returns:
+            (prompt, client, call_params, fingerprint) - fingerprint is None
+            when the request is not deterministic enough to cache
+        """
+        # Render prompt from YAML templates
+        prompt, provider_cfg, _ = render_prompt(
+            template_key="exam_generation",
+            provider=provider_name,
+            locale=(language or request.language or ""),
+            variables={
+                "content": request.content,
+                "question_count": int(request.question_count),
+            },
+        )
+
+        # Get cached client from factory
+        provider_enum = AIProvider(provider_name)
+        client = AIClientFactory.create_client(provider_enum, use_cache=True)
+
+        # Prepare call parameters
+        call_params: Dict[str, Any] = {}
+        yaml_params = provider_cfg.get("params") or {}
+        call_params.update(yaml_params)
+
+        if request.temperature is not None:
+            call_params["temperature"] = float(request.temperature)
+        if request.max_tokens is not None:
+            call_params["max_tokens"] = int(request.max_tokens)
+
+        fingerprint = None
+        temperature = call_params.get("temperature", getattr(client, "default_temperature", None))
+        if is_cacheable(temperature):
+            model = getattr(client, "model_name", None) or provider_cfg.get("model")
+            fingerprint = make_fingerprint(prompt, provider_name, model, call_params)
+
+        return prompt, client, call_params, fingerprint
+
+    @staticmethod
+    def _get_max_content_length(provider: str) -> Optional[int]:
+        """Get provider prompt budget, None if provider config is missing."""
+        try:
+            return get_max_content_length(provider)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _build_success(
+        self,
+        request: ExamGenerationRequest,
+        provider_name: str,
+        questions: list,
+        metadata: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build successful result with request-specific metadata."""
+        metadata.update({
+            "subject": request.subject,
+            "requested_questions": request.question_count,
+            "total_questions": len(questions),
+            "requested_provider": provider_name,
+            "generated_at": metadata.get("generated_at") or datetime.now().isoformat(),
+        })
+
+        return {
+            "success": True,
+            "questions": questions,
+            "metadata": metadata,
+            "error": None
+        }
+
     def _get_retry_config(self, provider: str):
         """Get retry config based on provider."""
         if provider == "openai":
@@ -154,17 +658,21 @@ class GenAIService:
             from app.genai.utils.retry import DEFAULT_RETRY_CONFIG
             return DEFAULT_RETRY_CONFIG
 
-    def _parse_and_normalize(self, raw_response: str, provider: str) -> list:
-        """Parse raw JSON response and normalize to unified schema."""
+    def _parse_and_normalize(self, raw_response: str, provider: str) -> Tuple[list, int]:
+        """Parse raw JSON response and normalize to unified schema.
+
+        Returns:
+            Tuple of (normalized questions, number of array elements dropped)
+        """
         try:
-            # Parse JSON from response (handles markdown wrappers, etc.)
-            raw_questions = self.parser.parse_json_response(raw_response)
+            # Parse JSON from response (handles markdown wrappers, truncation, etc.)
+            raw_questions, dropped = self.parser.parse_json_response_with_report(raw_response)
 
             # Normalize to unified schema
             normalized = self.parser.normalize_questions(raw_questions, provider=provider)
 
-            return normalized
+            return normalized, len(dropped)
 
         except Exception as e:
             logger.error(f"Error parsing response from {provider}: {e}")
-            return []
\ No newline at end of file
+            return [], 0
\ No newline at end of file
@@ -5,6 +5,9 @@ Shared utilities for AI client implementations
 """
 
 from .response_parser import ResponseParser
+from .chunking import split_into_chunks, allocate_questions, merge_questions, QuestionDeduplicator
+from .stream_parser import DroppedObject, IncrementalJSONArrayParser
+from .circuit_breaker import CircuitBreaker, CircuitOpenError, get_circuit_breaker
 from .retry import (
     RetryConfig,
     retry_with_backoff,
@@ -16,6 +19,15 @@ from .retry import (
 
 __all__ = [
     "ResponseParser",
+    "split_into_chunks",
+    "allocate_questions",
+    "merge_questions",
+    "QuestionDeduplicator",
+    "IncrementalJSONArrayParser",
+    "DroppedObject",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "get_circuit_breaker",
     "RetryConfig",
     "retry_with_backoff",
     "with_retry",
@@ -0,0 +1,142 @@
+"""
+Chunking utilities for long-document generation.
+
+Splits extracted text into prompt-sized chunks at natural boundaries,
+spreads the requested question count over them and merges the results.
+"""
+
+import re
+from typing import Any, Dict, List
+
+# Boundaries tried in order when a block is still too long
+PARAGRAPH_SPLIT = re.compile(r"\n\s*\n")
+SENTENCE_SPLIT = re.compile(r"(?<=[.!?。])\s+")
+WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _split_block(block: str, max_chars: int) -> List[str]:
+    """Split an oversized block by sentences, then hard-wrap anything still too long."""
+    if len(block) <= max_chars:
+        return [block]
+
+    pieces: List[str] = []
+    for sentence in SENTENCE_SPLIT.split(block):
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(" ", 0, max_chars)
+            cut = cut if cut > 0 else max_chars
+            pieces.append(sentence[:cut])
+            sentence = sentence[cut:].lstrip()
+        if sentence:
+            pieces.append(sentence)
+    return pieces
+
+
+def split_into_chunks(text: str, max_chars: int) -> List[str]:
+    """
+    Split text into chunks of at most max_chars.
+
+    Paragraphs are packed greedily so chunks end on paragraph boundaries;
+    paragraphs longer than max_chars are split on sentences.
+
+    Args:
+        text: Extracted document text
+        max_chars: Maximum characters per chunk (provider prompt budget)
+
+    Returns:
+        List of non-empty chunks in document order
+    """
+    if max_chars <= 0:
+        raise ValueError("max_chars must be positive")
+
+    chunks: List[str] = []
+    current = ""
+
+    for paragraph in PARAGRAPH_SPLIT.split(text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+
+        # Pieces of one paragraph rejoin with a space, paragraphs with a blank line
+        separator = "\n\n"
+        for piece in _split_block(paragraph, max_chars):
+            if current and len(current) + len(separator) + len(piece) > max_chars:
+                chunks.append(current)
+                current = ""
+            current = f"{current}{separator}{piece}" if current else piece
+            separator = " "
+
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def allocate_questions(chunk_sizes: List[int], total: int) -> List[int]:
+    """
+    Spread total questions over chunks in proportion to their size.
+
+    Uses cumulative rounding, so when there are more chunks than questions
+    the questions are spread evenly through the document instead of
+    piling onto the first chunks.
+
+    Args:
+        chunk_sizes: Character count of each chunk
+        total: Requested question count
+
+    Returns:
+        Questions per chunk (sums to total)
+    """
+    content = sum(chunk_sizes)
+    if content == 0 or total <= 0:
+        return [0] * len(chunk_sizes)
+
+    allocation = []
+    consumed = 0
+    previous = 0
+    for size in chunk_sizes:
+        consumed += size
+        boundary = (total * consumed + content // 2) // content
+        allocation.append(boundary - previous)
+        previous = boundary
+    return allocation
+
+
+class QuestionDeduplicator:
+    """
+    Track questions already accepted and reject near-duplicates.
+
+    Questions whose word sets overlap by at least similarity_threshold
+    (Jaccard) are treated as the same question; the first one wins.
+    """
+
+    def __init__(self, similarity_threshold: float = 0.85):
+        self.similarity_threshold = similarity_threshold
+        self._seen: List[frozenset] = []
+
+    def add(self, question: Dict[str, Any]) -> bool:
+        """Accept question if it is not a duplicate; returns True if accepted."""
+        tokens = frozenset(WORD_RE.findall(str(question.get("question_text", "")).lower()))
+        if not tokens:
+            return False
+        for other in self._seen:
+            if len(tokens & other) / len(tokens | other) >= self.similarity_threshold:
+                return False
+        self._seen.append(tokens)
+        return True
+
+
+def merge_questions(
+    groups: List[List[Dict[str, Any]]],
+    similarity_threshold: float = 0.85
+) -> List[Dict[str, Any]]:
+    """
+    Concatenate per-chunk questions in document order and drop duplicates.
+
+    Args:
+        groups: Questions generated for each chunk
+        similarity_threshold: Jaccard similarity treated as duplicate
+
+    Returns:
+        Merged question list
+    """
+    deduplicator = QuestionDeduplicator(similarity_threshold)
+    return [question for questions in groups for question in questions if deduplicator.add(question)]
@@ -0,0 +1,228 @@
+"""
+Circuit breaker for AI provider calls.
+
+Trips on a rolling error rate or timeout count so that, during a provider
+outage, requests fail fast instead of each spending its full retry budget.
+State is kept in-process and optionally shared between workers via Redis.
+"""
+
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.database.redis import RedisManager
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+KEY_PREFIX = "genai:breaker:"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a provider whose circuit is open"""
+
+    def __init__(self, name: str, retry_after: float):
+        self.name = name
+        self.retry_after = retry_after
+        super().__init__(f"{name} circuit open, retry in {retry_after:.1f}s")
+
+
+class CircuitBreaker:
+    """
+    Per-provider circuit breaker.
+
+    - closed: calls pass; outcomes are kept for window_seconds. The circuit
+      opens when at least min_calls were made and the failure rate reaches
+      failure_rate, or when timeouts reach timeout_threshold
+    - open: calls raise CircuitOpenError until open_seconds have passed
+    - half_open: a single probe call is let through; success closes the
+      circuit, failure re-opens it, other calls keep failing fast
+
+    With shared=True an opening is published to Redis (key with TTL), so
+    other workers fail fast too; Redis is read at most every sync_interval.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        window_seconds: Optional[float] = None,
+        min_calls: Optional[int] = None,
+        failure_rate: Optional[float] = None,
+        timeout_threshold: Optional[int] = None,
+        open_seconds: Optional[float] = None,
+        shared: Optional[bool] = None,
+        sync_interval: float = 1.0,
+    ):
+        self.name = name
+        self.window_seconds = window_seconds or settings.genai_breaker_window
+        self.min_calls = min_calls or settings.genai_breaker_min_calls
+        self.failure_rate = failure_rate or settings.genai_breaker_failure_rate
+        self.timeout_threshold = timeout_threshold or settings.genai_breaker_timeout_threshold
+        self.open_seconds = open_seconds or settings.genai_breaker_open_seconds
+        self.shared = settings.genai_breaker_shared if shared is None else shared
+        self.sync_interval = sync_interval
+
+        self.state = CLOSED
+        self._outcomes: Deque[Tuple[float, str]] = deque()  # (time, "ok" | "error" | "timeout")
+        self._opened_until = 0.0
+        self._probe_in_flight = False
+        self._synced_at = 0.0
+
+        # Counters for monitoring
+        self.opened = 0
+        self.rejected = 0
+
+    async def before_call(self) -> None:
+        """
+        Admit a call or fail fast.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a probe in flight
+        """
+        now = time.monotonic()
+        if self.state == CLOSED:
+            await self._sync_shared(now)
+
+        if self.state == OPEN:
+            if now < self._opened_until:
+                self.rejected += 1
+                raise CircuitOpenError(self.name, self._opened_until - now)
+            self.state = HALF_OPEN
+            self._probe_in_flight = False
+            logger.info(f"{self.name} circuit half-open, probing")
+
+        if self.state == HALF_OPEN:
+            if self._probe_in_flight:
+                self.rejected += 1
+                raise CircuitOpenError(self.name, 0.0)
+            self._probe_in_flight = True
+
+    async def record_success(self) -> None:
+        if self.state == HALF_OPEN:
+            logger.info(f"{self.name} circuit closed after successful probe")
+            self.state = CLOSED
+            self._probe_in_flight = False
+            self._outcomes.clear()
+            await self._publish(None)
+            return
+        self._add("ok")
+
+    async def record_failure(self, timeout: bool = False) -> None:
+        if self.state == HALF_OPEN:
+            await self._open("probe failed")
+            return
+        self._add("timeout" if timeout else "error")
+        if self.state == CLOSED:
+            reason = self._trip_reason()
+            if reason:
+                await self._open(reason)
+
+    def is_open(self) -> bool:
+        """True while calls are being rejected outright (open, not yet due for a probe)"""
+        return self.state == OPEN and time.monotonic() < self._opened_until
+
+    def release_probe(self) -> None:
+        """Give up a half-open probe slot without an outcome (non-provider error)"""
+        self._probe_in_flight = False
+
+    def stats(self) -> Dict[str, Any]:
+        self._prune(time.monotonic())
+        calls = len(self._outcomes)
+        failures = sum(1 for _, kind in self._outcomes if kind != "ok")
+        return {
+            "state": self.state,
+            "calls_in_window": calls,
+            "failure_rate": round(failures / calls, 4) if calls else 0.0,
+            "timeouts_in_window": sum(1 for _, kind in self._outcomes if kind == "timeout"),
+            "retry_after_seconds": round(max(0.0, self._opened_until - time.monotonic()), 1) if self.state == OPEN else 0.0,
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
+
+    # Internals
+
+    def _add(self, kind: str) -> None:
+        now = time.monotonic()
+        self._outcomes.append((now, kind))
+        self._prune(now)
+
+    def _prune(self, now: float) -> None:
+        while self._outcomes and self._outcomes[0][0] < now - self.window_seconds:
+            self._outcomes.popleft()
+
+    def _trip_reason(self) -> Optional[str]:
+        calls = len(self._outcomes)
+        timeouts = sum(1 for _, kind in self._outcomes if kind == "timeout")
+        if timeouts >= self.timeout_threshold:
+            return f"{timeouts} timeouts in {self.window_seconds:.0f}s"
+        failures = sum(1 for _, kind in self._outcomes if kind != "ok")
+        if calls >= self.min_calls and failures / calls >= self.failure_rate:
+            return f"failure rate {failures}/{calls} in {self.window_seconds:.0f}s"
+        return None
+
+    async def _open(self, reason: str) -> None:
+        self.state = OPEN
+        self._opened_until = time.monotonic() + self.open_seconds
+        self._probe_in_flight = False
+        self._outcomes.clear()
+        self.opened += 1
+        logger.warning(f"{self.name} circuit opened for {self.open_seconds:.0f}s ({reason})")
+        await self._publish(self.open_seconds)
+
+    async def _publish(self, open_seconds: Optional[float]) -> None:
+        """Share opening / closing with other workers (best effort)"""
+        if not self.shared:
+            return
+        redis = RedisManager.get_connected_client()
+        if redis is None:
+            return
+        key = f"{KEY_PREFIX}{self.name}"
+        try:
+            if open_seconds:
+                await redis.set(key, str(time.time() + open_seconds), ex=max(1, int(open_seconds)))
+            else:
+                await redis.delete(key)
+        except Exception as e:
+            logger.warning(f"Could not share {self.name} circuit state: {e}")
+
+    async def _sync_shared(self, now: float) -> None:
+        """Adopt an opening published by another worker"""
+        if not self.shared or now - self._synced_at < self.sync_interval:
+            return
+        redis = RedisManager.get_connected_client()
+        if redis is None:
+            return
+        self._synced_at = now
+        try:
+            raw = await redis.get(f"{KEY_PREFIX}{self.name}")
+        except Exception as e:
+            logger.warning(f"Could not read shared {self.name} circuit state: {e}")
+            return
+        remaining = float(raw) - time.time() if raw else 0.0
+        if remaining > 0:
+            self.state = OPEN
+            self._opened_until = now + remaining
+            self._outcomes.clear()
+            logger.warning(f"{self.name} circuit opened by another worker ({remaining:.0f}s left)")
+
+
+# Shared breakers, one per provider
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(provider: str) -> CircuitBreaker:
+    """Get (or lazily create) the shared breaker for a provider"""
+    if provider not in _breakers:
+        _breakers[provider] = CircuitBreaker(provider)
+    return _breakers[provider]
+
+
+def get_circuit_breaker_states() -> Dict[str, Dict[str, Any]]:
+    """Get state of every breaker created so far"""
+    return {name: breaker.stats() for name, breaker in _breakers.items()}
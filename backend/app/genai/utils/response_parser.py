@@ -5,10 +5,10 @@ This module extracts common JSON parsing logic used across multiple AI clients
 to eliminate code duplication and maintain consistency.
 """
 
-import json
 import logging
-import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.genai.utils.stream_parser import DroppedObject, IncrementalJSONArrayParser
 
 logger = logging.getLogger(__name__)
 
@@ -18,8 +18,8 @@ class ResponseParser:
     Unified response parser for AI-generated exam questions.
 
     Handles:
-    - JSON extraction from markdown-wrapped responses
-    - JSON escape sequence fixing
+    - Single-pass JSON array extraction (markdown, prose, bad escapes,
+      truncated output)
     - Question normalization to unified schema
     """
 
@@ -28,124 +28,52 @@ class ResponseParser:
         """
         Extract and parse JSON array from AI response text.
 
-        Handles common issues:
+        Handles common issues in a single scan:
         - Markdown code fences (```json ... ```)
         - Extra whitespace and text around JSON
         - Malformed escape sequences
+        - Malformed or truncated elements (dropped, the rest are kept)
 
         Args:
             response_text: Raw text response from AI provider
 
         Returns:
-            List of parsed question dictionaries
-
-        Raises:
-            ValueError: If JSON cannot be parsed after all attempts
+            List of parsed question dictionaries (empty if none recovered)
         """
-        if not response_text or not response_text.strip():
-            logger.warning("Empty response text provided")
-            return []
-
-        # First attempt: direct JSON parsing
-        try:
-            data = ResponseParser._extract_json_array(response_text)
-            if data:
-                return data
-        except json.JSONDecodeError:
-            pass
-
-        # Second attempt: clean markdown and try again
-        try:
-            cleaned = ResponseParser._clean_markdown(response_text)
-            cleaned = ResponseParser._fix_json_escapes(cleaned)
-            data = ResponseParser._extract_json_array(cleaned)
-            if data:
-                return data
-        except json.JSONDecodeError as e:
-            logger.error(f"Unable to parse JSON from response: {e}")
-            logger.debug(f"Problematic response text: {response_text[:500]}...")
-            return []
-
-        logger.error("All JSON parsing attempts failed")
-        return []
+        objects, _ = ResponseParser.parse_json_response_with_report(response_text)
+        return objects
 
     @staticmethod
-    def _extract_json_array(text: str) -> List[Dict[str, Any]]:
+    def parse_json_response_with_report(
+        response_text: str
+    ) -> Tuple[List[Dict[str, Any]], List[DroppedObject]]:
         """
-        Extract JSON array from text, handling both standalone and embedded JSON.
+        Parse JSON array from AI response text, reporting dropped elements.
 
         Args:
-            text: Text potentially containing JSON array
-
-        Returns:
-            Parsed list of dictionaries
-
-        Raises:
-            json.JSONDecodeError: If parsing fails
-        """
-        # Try to find array bounds
-        json_start = text.find("[")
-        json_end = text.rfind("]") + 1
-
-        if json_start >= 0 and json_end > json_start:
-            json_str = text[json_start:json_end]
-            data = json.loads(json_str)
-        else:
-            # Assume entire text is JSON
-            data = json.loads(text)
-
-        # Ensure we have a list
-        if not isinstance(data, list):
-            logger.warning(f"Expected JSON array, got {type(data).__name__}")
-            return []
-
-        return data
-
-    @staticmethod
-    def _clean_markdown(text: str) -> str:
-        """
-        Remove markdown code fences and extra formatting.
-
-        Args:
-            text: Raw response text
+            response_text: Raw text response from AI provider
 
         Returns:
-            Cleaned text without markdown
+            Tuple of (parsed question dictionaries, dropped elements)
         """
-        # Remove markdown code blocks
-        text = re.sub(r'```json\s*', '', text)
-        text = re.sub(r'```\s*', '', text)
-        return text.strip()
+        if not response_text or not response_text.strip():
+            logger.warning("Empty response text provided")
+            return [], []
 
-    @staticmethod
-    def _fix_json_escapes(text: str) -> str:
-        """
-        Fix common JSON escape sequence issues in AI responses.
+        parser = IncrementalJSONArrayParser()
+        objects = parser.feed(response_text)
+        parser.close()
 
-        Args:
-            text: JSON text with potentially malformed escapes
+        if parser.dropped:
+            logger.warning(
+                f"Recovered {len(objects)} objects, dropped {len(parser.dropped)}: "
+                + "; ".join(f"#{d.index} {d.reason}" for d in parser.dropped)
+            )
+        if not objects:
+            logger.error("No JSON objects could be parsed from response")
+            logger.debug(f"Problematic response text: {response_text[:500]}...")
 
-        Returns:
-            Text with corrected escape sequences
-        """
-        try:
-            fixes = {
-                '\\"': '"',
-                "\\n": " ",
-                "\\r": " ",
-                "\\t": " ",
-                "\\\\": "\\",
-                "\\/": "/",
-            }
-            for old, new in fixes.items():
-                text = text.replace(old, new)
-
-            # Remove invalid escape sequences (keep only valid JSON escapes)
-            text = re.sub(r'\\(?![\"\\/bfnrtu])', '', text)
-            return text
-        except Exception as e:
-            logger.warning(f"Error fixing JSON escapes: {e}")
-            return text
+        return objects, parser.dropped
 
     @staticmethod
     def normalize_questions(
@@ -11,6 +11,8 @@ from functools import wraps
 from http.client import RemoteDisconnected
 from urllib.error import URLError
 
+from app.genai.utils.circuit_breaker import CircuitBreaker
+
 logger = logging.getLogger(__name__)
 
 
@@ -95,6 +97,7 @@ async def retry_with_backoff(
     config: Optional[RetryConfig] = None,
     retryable_exceptions: Tuple[Type[Exception], ...] = TRANSIENT_EXCEPTIONS,
     context: Optional[str] = None,
+    breaker: Optional[CircuitBreaker] = None,
     **kwargs: Any,
 ) -> Any:
     """
@@ -106,6 +109,9 @@ async def retry_with_backoff(
         config: Retry configuration (uses default if None)
         retryable_exceptions: Tuple of exception types to retry on
         context: Context string for logging (e.g., "OpenAI API call")
+        breaker: Circuit breaker consulted before every attempt and fed
+            each attempt's outcome (transient errors and results with
+            success=False count as failures)
         **kwargs: Keyword arguments for func
 
     Returns:
@@ -114,24 +120,38 @@ async def retry_with_backoff(
     Raises:
         Last exception if all retries exhausted
         asyncio.TimeoutError: If operation exceeds timeout
+        CircuitOpenError: If the breaker is open (no attempt is made)
     """
     config = config or DEFAULT_RETRY_CONFIG
     context_str = f" ({context})" if context else ""
     last_exception: Optional[Exception] = None
 
     for attempt in range(config.max_attempts):
+        if breaker is not None:
+            # Fail fast while the provider's circuit is open
+            await breaker.before_call()
+
         try:
             # Apply timeout if configured
             if config.timeout:
-                return await asyncio.wait_for(
+                result = await asyncio.wait_for(
                     func(*args, **kwargs),
                     timeout=config.timeout
                 )
             else:
-                return await func(*args, **kwargs)
+                result = await func(*args, **kwargs)
+            if breaker is not None:
+                # Provider clients report most errors as {"success": False} instead of raising
+                if isinstance(result, dict) and result.get("success") is False:
+                    await breaker.record_failure()
+                else:
+                    await breaker.record_success()
+            return result
 
         except asyncio.TimeoutError as e:
             last_exception = e
+            if breaker is not None:
+                await breaker.record_failure(timeout=True)
             logger.warning(
                 f"Timeout{context_str} on attempt {attempt + 1}/{config.max_attempts} "
                 f"(timeout={config.timeout}s)"
@@ -142,6 +162,8 @@ async def retry_with_backoff(
 
         except retryable_exceptions as e:
             last_exception = e
+            if breaker is not None:
+                await breaker.record_failure()
             is_last_attempt = (attempt + 1 >= config.max_attempts)
 
             if is_last_attempt:
@@ -157,8 +179,15 @@ async def retry_with_backoff(
                 )
                 await asyncio.sleep(delay)
 
+        except asyncio.CancelledError:
+            if breaker is not None:
+                breaker.release_probe()
+            raise
+
         except Exception as e:
-            # Non-retryable exception - fail immediately
+            # Non-retryable exception - fail immediately (says nothing about provider health)
+            if breaker is not None:
+                breaker.release_probe()
             logger.error(
                 f"Non-retryable error{context_str}: {type(e).__name__}: {e}"
             )
@@ -0,0 +1,201 @@
+"""
+Single-pass tolerant JSON array parser for AI responses.
+
+Scans a response once, skipping prose and markdown fences, and emits each
+object of the question array as soon as its closing brace arrives. Objects
+that are malformed or cut off (e.g. by max_tokens) are reported as dropped
+without losing the well-formed ones around them. Works on a complete
+response or incrementally on a token stream.
+"""
+
+import json
+import logging
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
+
+# Next character that matters inside a string / outside a string
+STRING_SPECIAL = re.compile(r'["\\]')
+STRUCTURE_SPECIAL = re.compile(r'["{}\[\]]')
+VALID_ESCAPES = '"\\/bfnrtu'
+
+# Scanner states
+_SEEK, _ARRAY, _OBJECT, _DONE = range(4)
+
+
+@dataclass
+class DroppedObject:
+    """Array element that could not be recovered"""
+    index: int
+    reason: str
+    snippet: str
+
+
+class IncrementalJSONArrayParser:
+    """
+    Feed text pieces in, get completed array elements out.
+
+    - The array starts at the first '[' followed by '{' (so "[1]" or
+      "[Note]" in prose is ignored); text before it and after the closing
+      ']' is skipped
+    - String literals are tracked so braces inside question text do not
+      confuse depth counting; invalid backslash escapes are repaired and raw
+      control characters are tolerated in the same pass
+    - Each element is decoded on its own, so one bad element only drops
+      itself; an element still open at close() is reported as truncated
+    """
+
+    def __init__(self) -> None:
+        self._state = _SEEK
+        self._pending_bracket = False
+        self._buffer: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._element = -1
+        self.emitted = 0
+        self.dropped: List[DroppedObject] = []
+
+    @property
+    def finished(self) -> bool:
+        return self._state == _DONE
+
+    def feed(self, piece: str) -> List[Dict[str, Any]]:
+        """
+        Consume the next piece of response text.
+
+        Returns:
+            Objects completed by this piece (possibly empty)
+        """
+        completed: List[Dict[str, Any]] = []
+        i, n = 0, len(piece)
+
+        while i < n and self._state != _DONE:
+            if self._state == _SEEK:
+                i = self._seek(piece, i)
+            elif self._state == _ARRAY:
+                ch = piece[i]
+                if ch == "{":
+                    self._start_object()
+                elif ch == "]":
+                    self._state = _DONE
+                i += 1
+            elif self._in_string:
+                i = self._scan_string(piece, i)
+            else:
+                match = STRUCTURE_SPECIAL.search(piece, i)
+                if match is None:
+                    self._buffer.append(piece[i:])
+                    break
+                j = match.start()
+                ch = piece[j]
+                self._buffer.append(piece[i:j + 1])
+                i = j + 1
+                if ch == '"':
+                    self._in_string = True
+                elif ch in "{[":
+                    self._depth += 1
+                else:
+                    self._depth -= 1
+                    if self._depth == 0:
+                        obj = self._finish_object()
+                        if obj is not None:
+                            completed.append(obj)
+
+        self.emitted += len(completed)
+        return completed
+
+    def close(self) -> List[Dict[str, Any]]:
+        """
+        Finish parsing; an unterminated element is reported as truncated.
+
+        Returns:
+            Always empty (kept symmetric with feed for stream consumers)
+        """
+        if self._state == _OBJECT:
+            self._drop("truncated before closing brace", "".join(self._buffer))
+            self._buffer = []
+        self._state = _DONE
+        return []
+
+    # Scanner steps
+
+    def _seek(self, piece: str, i: int) -> int:
+        """Find '[' immediately followed (ignoring whitespace) by '{' or ']'"""
+        n = len(piece)
+        while i < n:
+            if self._pending_bracket:
+                ch = piece[i]
+                if ch.isspace():
+                    i += 1
+                    continue
+                self._pending_bracket = False
+                if ch == "{":
+                    self._state = _ARRAY
+                    return i
+                if ch == "]":
+                    self._state = _DONE
+                    return i + 1
+                if ch == "[":
+                    self._pending_bracket = True
+                    i += 1
+                continue
+
+            j = piece.find("[", i)
+            if j < 0:
+                return n
+            self._pending_bracket = True
+            i = j + 1
+        return i
+
+    def _scan_string(self, piece: str, i: int) -> int:
+        if self._escape:
+            ch = piece[i]
+            # Drop the backslash of escapes JSON does not allow (e.g. "\e", "\(")
+            self._buffer.append("\\" + ch if ch in VALID_ESCAPES else ch)
+            self._escape = False
+            return i + 1
+
+        match = STRING_SPECIAL.search(piece, i)
+        if match is None:
+            self._buffer.append(piece[i:])
+            return len(piece)
+
+        j = match.start()
+        self._buffer.append(piece[i:j])
+        if piece[j] == "\\":
+            self._escape = True
+        else:
+            self._buffer.append('"')
+            self._in_string = False
+        return j + 1
+
+    def _start_object(self) -> None:
+        self._element += 1
+        self._state = _OBJECT
+        self._buffer = ["{"]
+        self._depth = 1
+        self._in_string = False
+        self._escape = False
+
+    def _finish_object(self) -> Any:
+        text = "".join(self._buffer)
+        self._buffer = []
+        self._state = _ARRAY
+        try:
+            # strict=False accepts raw newlines/tabs inside strings
+            obj = json.loads(text, strict=False)
+        except json.JSONDecodeError as e:
+            self._drop(f"invalid JSON: {e.msg}", text)
+            return None
+        if not isinstance(obj, dict):
+            self._drop("element is not an object", text)
+            return None
+        return obj
+
+    def _drop(self, reason: str, text: str) -> None:
+        dropped = DroppedObject(index=self._element, reason=reason, snippet=text[:80])
+        self.dropped.append(dropped)
+        logger.warning(f"Dropped array element {dropped.index}: {reason}")
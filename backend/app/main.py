@@ -10,6 +10,7 @@ from app.api.exam import router as exam_router
 from app.api.upload import router as upload_router
 from app.database.redis import RedisManager
 from app.core.config import settings
+from app.workers import get_extraction_worker, get_generation_worker
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -63,6 +64,42 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"❌ Redis startup error: {e}")
         logger.warning("Rate limiting will be disabled")
+
+    # Subscribe to exam cache invalidations from other instances
+    try:
+        from app.services.exam_cache import get_exam_cache
+        await get_exam_cache().start()
+    except Exception as e:
+        logger.error(f"❌ Exam cache listener startup error: {e}")
+
+    # Load and compile prompt templates
+    try:
+        from app.genai.prompts.loader import get_registry
+        get_registry().warm_up()
+    except Exception as e:
+        logger.error(f"❌ Prompt template loading failed: {e}")
+
+    # Start background extraction worker
+    try:
+        if settings.extraction_worker_enabled:
+            logger.info("Starting extraction worker...")
+            await get_extraction_worker().start()
+            logger.info("✅ Extraction worker started")
+        else:
+            logger.info("Extraction worker is disabled in settings")
+    except Exception as e:
+        logger.error(f"❌ Extraction worker startup error: {e}")
+
+    # Start background generation worker
+    try:
+        if settings.generation_worker_enabled:
+            logger.info("Starting generation worker...")
+            await get_generation_worker().start()
+            logger.info("✅ Generation worker started")
+        else:
+            logger.info("Generation worker is disabled in settings")
+    except Exception as e:
+        logger.error(f"❌ Generation worker startup error: {e}")
              
     # App is running
     logger.info("🎯 Exam Hub API is ready!")
@@ -71,6 +108,52 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("🔄 Shutting down Exam Hub API...")
 
+    # Stop extraction worker
+    try:
+        if settings.extraction_worker_enabled:
+            logger.info("Stopping extraction worker...")
+            await get_extraction_worker().stop()
+            logger.info("✅ Extraction worker stopped")
+    except Exception as e:
+        logger.error(f"❌ Extraction worker shutdown error: {e}")
+
+    # Stop generation worker (in-flight jobs finish and are saved)
+    try:
+        if settings.generation_worker_enabled:
+            logger.info("Stopping generation worker...")
+            await get_generation_worker().stop()
+            logger.info("✅ Generation worker stopped")
+    except Exception as e:
+        logger.error(f"❌ Generation worker shutdown error: {e}")
+
+    # Grade and save submissions still waiting in a batch window
+    try:
+        from app.services.grading_service import get_submission_batcher
+        await get_submission_batcher().close()
+    except Exception as e:
+        logger.error(f"❌ Submission batcher shutdown error: {e}")
+
+    # Stop exam cache invalidation listener
+    try:
+        from app.services.exam_cache import get_exam_cache
+        await get_exam_cache().stop()
+    except Exception as e:
+        logger.error(f"❌ Exam cache listener shutdown error: {e}")
+
+    # Release extraction process pool
+    try:
+        from app.processors import shutdown_extraction_executor
+        shutdown_extraction_executor()
+    except Exception as e:
+        logger.error(f"❌ Extraction executor shutdown error: {e}")
+
+    # Close provider HTTP connection pool
+    try:
+        from app.genai.clients.http_pool import close_http_client
+        await close_http_client()
+    except Exception as e:
+        logger.error(f"❌ Provider HTTP pool shutdown error: {e}")
+
     # Close Redis connection
     try:
         if settings.rate_limit_enabled:
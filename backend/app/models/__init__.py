@@ -1,8 +1,9 @@
 from .base import Base, BaseModel
 from .user import User, UserRole
-from .exam import Exam, Question, ExamAttempt, DifficultyLevel, ExamStatus
+from .exam import Exam, Question, ExamAttempt, AttemptStatus, DifficultyLevel, ExamStatus
 from .auth import RefreshToken, EmailVerificationToken
-from .file import UploadedFile, FileStatus, StorageType, ProcessingStatus
+from .file import UploadedFile, FileBlob, FileStatus, StorageType, ProcessingStatus
+from .generation_job import GenerationJob, JobStatus
 
 __all__ = [
     "Base",
@@ -12,12 +13,16 @@ __all__ = [
     "Exam",
     "Question", 
     "ExamAttempt",
+    "AttemptStatus",
     "DifficultyLevel",
     "ExamStatus",
     "RefreshToken",
     "EmailVerificationToken",
     "UploadedFile",
+    "FileBlob",
     "FileStatus", 
     "StorageType",
-    "ProcessingStatus"
+    "ProcessingStatus",
+    "GenerationJob",
+    "JobStatus"
 ]
\ No newline at end of file
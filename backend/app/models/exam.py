@@ -3,14 +3,17 @@ Exam-related database models
 Defines the structure for exams, questions, and related entities
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
-from sqlalchemy import String, Text, Integer, Boolean, ForeignKey, JSON, Enum as SQLEnum, DateTime
+from sqlalchemy import String, Text, Integer, Boolean, ForeignKey, JSON, Enum as SQLEnum, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import enum
 
 from .base import BaseModel
 
+# Format of Exam.payload; exams stored with another version are rebuilt on read
+EXAM_PAYLOAD_VERSION = 1
+
 
 class DifficultyLevel(str, enum.Enum):
     """Enum for question difficulty levels"""
@@ -19,6 +22,12 @@ class DifficultyLevel(str, enum.Enum):
     HARD = "hard"
 
 
+class AttemptStatus(str, enum.Enum):
+    """Enum for exam attempt status"""
+    IN_PROGRESS = "in_progress"
+    SUBMITTED = "submitted"
+
+
 class ExamStatus(str, enum.Enum):
     """Enum for exam status"""
     DRAFT = "draft"
@@ -32,6 +41,11 @@ class Exam(BaseModel):
     Represents a complete exam with metadata
     """
     __tablename__ = "exams"
+    __table_args__ = (
+        # Keyset pagination: newest-first per creator and across all exams
+        Index("ix_exams_creator_created_id", "creator_id", "created_at", "id"),
+        Index("ix_exams_created_id", "created_at", "id"),
+    )
     
     # Basic info
     title: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
@@ -56,6 +70,11 @@ class Exam(BaseModel):
     source_file_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     generation_method: Mapped[str] = mapped_column(String(50), default="manual")
     
+    # Denormalized read model (questions + answer key), written at save time
+    # and served as-is; see build_exam_payload
+    payload: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    payload_version: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    
     # Legacy compatibility
     legacy_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, unique=True)
     legacy_file_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
@@ -115,17 +134,46 @@ class Question(BaseModel):
     def __repr__(self) -> str:
         return f"<Question(id={self.id}, exam_id={self.exam_id}, text='{self.question_text[:50]}...')>"
 
+    def to_payload(self) -> Dict[str, Any]:
+        """Serialized form stored in Exam.payload (column defaults applied before flush)"""
+        difficulty = self.difficulty or DifficultyLevel.MEDIUM
+        return {
+            'id': self.id,
+            'order_index': self.order_index,
+            'question_text': self.question_text,
+            'question_type': self.question_type or "multiple_choice",
+            'options': self.options,
+            'correct_answer': self.correct_answer,
+            'explanation': self.explanation,
+            'difficulty': difficulty.value if isinstance(difficulty, DifficultyLevel) else difficulty,
+            'points': self.points if self.points is not None else 1,
+        }
+
+
+def build_exam_payload(questions: List[Question]) -> Dict[str, Any]:
+    """
+    Build the denormalized exam payload from its questions
+
+    Questions are stored in order with their options; answer_key repeats the
+    correct answers as one list so grading needs no per-question lookups.
+    """
+    ordered = sorted(questions, key=lambda q: q.order_index or 0)
+    return {
+        'questions': [q.to_payload() for q in ordered],
+        'answer_key': [q.correct_answer for q in ordered],
+    }
+
 
 class ExamAttempt(BaseModel):
     """
     Exam attempt model
-    Tracks when users attempt exams (for future user system)
+    Tracks a user's attempt at an exam and its graded result
     """
     __tablename__ = "exam_attempts"
     
     # Foreign keys
     exam_id: Mapped[str] = mapped_column(String(36), ForeignKey("exams.id"), nullable=False)
-    # user_id will be added in Phase 5 when we add authentication
+    user_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("users.id"), nullable=True, index=True)
     
     # Attempt data
     start_time: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -141,7 +189,7 @@ class ExamAttempt(BaseModel):
     answers: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
     
     # Status
-    status: Mapped[str] = mapped_column(String(50), default="in_progress")
+    status: Mapped[str] = mapped_column(String(50), default=AttemptStatus.IN_PROGRESS.value)
     
     # Relationships
     exam: Mapped["Exam"] = relationship("Exam")
@@ -1,6 +1,6 @@
 from typing import Optional, List
 from datetime import datetime
-from sqlalchemy import String, Text, Integer, Boolean, ForeignKey, JSON, Enum as SQLEnum, DateTime
+from sqlalchemy import String, Text, Integer, Boolean, ForeignKey, JSON, Enum as SQLEnum, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import enum
 
@@ -29,12 +29,41 @@ class ProcessingStatus(str, enum.Enum):
     COMPLETED = "completed"
     FAILED = "failed"
 
+class FileBlob(BaseModel):
+    """
+    Content-addressed file blob
+    Stores each unique file content once; UploadedFile rows reference it
+    """
+    __tablename__ = "file_blobs"
+    
+    file_hash: Mapped[str] = mapped_column(String(64), nullable=False, unique=True, index=True)  # SHA-256
+    file_path: Mapped[str] = mapped_column(String(500), nullable=False)  # Backend location (path or object key)
+    size: Mapped[int] = mapped_column(Integer, nullable=False)
+    storage_type: Mapped[StorageType] = mapped_column(
+        SQLEnum(StorageType),
+        default=StorageType.LOCAL,
+        nullable=False
+    )
+    ref_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    
+    # Relationships
+    files: Mapped[List["UploadedFile"]] = relationship("UploadedFile", back_populates="blob")
+    
+    def __repr__(self) -> str:
+        return f"<FileBlob(hash={self.file_hash[:12]}, refs={self.ref_count})>"
+
+
 class UploadedFile(BaseModel):
     """
     Uploaded File model
     Tracks file metadata and storage information
     """
     __tablename__ = "uploaded_files"
+    __table_args__ = (
+        # Keyset pagination: newest-first per owner and across all files
+        Index("ix_uploaded_files_owner_created_id", "owner_id", "created_at", "id"),
+        Index("ix_uploaded_files_created_id", "created_at", "id"),
+    )
     
     # Basic file info
     original_filename: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -45,6 +74,7 @@ class UploadedFile(BaseModel):
     size: Mapped[int] = mapped_column(Integer, nullable=False)
     content_type: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     file_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True, index=True)  # SHA-256
+    blob_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("file_blobs.id"), nullable=True, index=True)
     
     # Ownership & permissions
     owner_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False, index=True)
@@ -70,7 +100,8 @@ class UploadedFile(BaseModel):
     processing_result: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
     error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
-    extracted_content: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Can be megabytes: deferred, so only queries that ask for it load it
+    extracted_content: Mapped[Optional[str]] = mapped_column(Text, nullable=True, deferred=True)
     content_length: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     processing_status: Mapped[ProcessingStatus] = mapped_column(
         SQLEnum(ProcessingStatus),
@@ -82,6 +113,7 @@ class UploadedFile(BaseModel):
     
     # Relationships
     owner: Mapped["User"] = relationship("User", back_populates="uploaded_files")
+    blob: Mapped[Optional["FileBlob"]] = relationship("FileBlob", back_populates="files")
     
     def __repr__(self) -> str:
         return f"<UploadedFile(id={self.id}, filename='{self.original_filename}', owner={self.owner_id})>"
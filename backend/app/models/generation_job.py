@@ -0,0 +1,58 @@
+from typing import Optional
+from datetime import datetime
+from sqlalchemy import String, Text, Integer, ForeignKey, JSON, Enum as SQLEnum, DateTime, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+import enum
+
+from .base import BaseModel
+
+
+class JobStatus(str, enum.Enum):
+    """Enum for generation job status"""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class GenerationJob(BaseModel):
+    """
+    Asynchronous exam generation job
+    Queued by POST /exam/generate?async=true and executed by GenerationWorker
+    """
+    __tablename__ = "generation_jobs"
+    __table_args__ = (
+        # Retries with the same client-supplied key return the existing job
+        UniqueConstraint("user_id", "idempotency_key", name="uq_generation_jobs_user_idempotency_key"),
+    )
+
+    user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False, index=True)
+    idempotency_key: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+
+    # ExamGenerationRequest as submitted; hash detects key reuse with another body
+    request: Mapped[dict] = mapped_column(JSON, nullable=False)
+    request_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+
+    # Status tracking
+    status: Mapped[JobStatus] = mapped_column(
+        SQLEnum(JobStatus),
+        default=JobStatus.QUEUED,
+        nullable=False,
+        index=True
+    )
+    progress: Mapped[int] = mapped_column(Integer, nullable=False, default=0)  # 0-100
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Outcome
+    result: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)  # exam_data + metadata
+    error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<GenerationJob(id={self.id}, status={self.status}, user={self.user_id})>"
+
+    @property
+    def is_finished(self) -> bool:
+        """Check if the job reached a terminal status"""
+        return self.status in (JobStatus.COMPLETED, JobStatus.FAILED)
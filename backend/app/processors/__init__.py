@@ -1,4 +1,15 @@
 from .base import ProcessingResult
 from .document_processor import DocumentProcessor
+from .cache import ExtractionCache, get_extraction_cache
+from .executor import ExtractionExecutor, ExtractionTimeoutError, get_extraction_executor, shutdown_extraction_executor
 
-__all__ = ['ProcessingResult', 'DocumentProcessor']
\ No newline at end of file
+__all__ = [
+    'ProcessingResult',
+    'DocumentProcessor',
+    'ExtractionCache',
+    'get_extraction_cache',
+    'ExtractionExecutor',
+    'ExtractionTimeoutError',
+    'get_extraction_executor',
+    'shutdown_extraction_executor',
+]
\ No newline at end of file
@@ -1,6 +1,7 @@
 # app/processors/base.py
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 from dataclasses import dataclass
 
 
@@ -10,21 +11,34 @@ class ProcessingResult:
     success: bool
     content: str
     error_message: Optional[str] = None
+    # Start offset of each page within content (paged formats only)
+    page_offsets: Optional[List[int]] = None
 
 
 class BaseProcessor(ABC):
     """Simple base processor interface"""
     
+    # CPU-bound processors are sent to the process pool by DocumentProcessor
+    cpu_bound: bool = False
+    
+    # Bump when extraction output changes - invalidates cached results
+    version: str = "1"
+    
     def __init__(self):
         self.supported_extensions: set = set()
     
+    @staticmethod
     @abstractmethod
-    async def extract_text(self, file_path: str) -> ProcessingResult:
-        """Extract text from file - that's it!"""
+    def extract_text_sync(file_path: str) -> ProcessingResult:
+        """Extract text from file - blocking, takes a path and returns text only"""
         pass
     
+    async def extract_text(self, file_path: str) -> ProcessingResult:
+        """Extract text from file without blocking the event loop"""
+        return await asyncio.to_thread(self.extract_text_sync, file_path)
+    
     def supports_file(self, file_path: str) -> bool:
         """Check if processor supports this file type"""
         import os
         extension = os.path.splitext(file_path)[1].lower()
-        return extension in self.supported_extensions
\ No newline at end of file
+        return extension in self.supported_extensions
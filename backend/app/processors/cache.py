@@ -0,0 +1,243 @@
+"""
+Content-addressed extraction cache
+Maps (file hash, processor version) to extracted text so identical uploads skip extraction
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from app.core.config import settings
+from app.database.redis import RedisManager, lru_delete, lru_get, lru_put
+from .base import ProcessingResult
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "extraction:"
+LRU_KEY = "extraction:lru"
+
+
+class ExtractionCache:
+    """
+    Two-tier cache for extraction results
+
+    - Redis (shared between app instances) when RedisManager is connected,
+      bounded by entry count with a sorted set of last-access times
+    - Local disk fallback when Redis is unavailable, bounded by total bytes
+      using file modification time as last access
+
+    Keys include the processor version, so bumping a processor's version
+    makes old entries unreachable; they age out through normal eviction.
+    Only successful results are cached.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[int] = None,
+        enabled: Optional[bool] = None,
+    ):
+        self.cache_dir = cache_dir or settings.extraction_cache_dir
+        self.max_entries = max_entries or settings.extraction_cache_max_entries
+        self.max_bytes = max_bytes or settings.extraction_cache_max_bytes
+        self.ttl = ttl or settings.extraction_cache_ttl
+        self.enabled = settings.extraction_cache_enabled if enabled is None else enabled
+
+        # Counters for monitoring
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.errors = 0
+
+    @staticmethod
+    def make_key(file_hash: str, processor_version: str) -> str:
+        return f"{KEY_PREFIX}{processor_version}:{file_hash}"
+
+    @staticmethod
+    def _encode(result: ProcessingResult) -> str:
+        return json.dumps({"content": result.content, "page_offsets": result.page_offsets})
+
+    @staticmethod
+    def _decode(raw: str) -> ProcessingResult:
+        data = json.loads(raw)
+        return ProcessingResult(success=True, content=data["content"], page_offsets=data.get("page_offsets"))
+
+    async def get(self, file_hash: Optional[str], processor_version: Optional[str]) -> Optional[ProcessingResult]:
+        """
+        Look up a cached extraction result
+
+        Returns:
+            Cached ProcessingResult or None on miss
+        """
+        if not self.enabled or not file_hash or not processor_version:
+            return None
+
+        key = self.make_key(file_hash, processor_version)
+        try:
+            redis = RedisManager.get_connected_client()
+            if redis is not None:
+                raw = await lru_get(redis, LRU_KEY, key)
+            else:
+                raw = await asyncio.to_thread(self._disk_get, key)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Extraction cache lookup failed: {e}")
+            raw = None
+
+        if raw is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return self._decode(raw)
+
+    async def put(self, file_hash: Optional[str], processor_version: Optional[str], result: ProcessingResult) -> bool:
+        """
+        Store a successful extraction result
+
+        Returns:
+            True if stored, False otherwise
+        """
+        if not self.enabled or not file_hash or not processor_version or not result.success:
+            return False
+
+        key = self.make_key(file_hash, processor_version)
+        raw = self._encode(result)
+        try:
+            redis = RedisManager.get_connected_client()
+            if redis is not None:
+                self.evictions += await lru_put(redis, LRU_KEY, key, raw, self.ttl, self.max_entries)
+            else:
+                await asyncio.to_thread(self._disk_put, key, raw)
+            self.stores += 1
+            return True
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Extraction cache store failed: {e}")
+            return False
+
+    async def get_or_extract(
+        self,
+        file_hash: Optional[str],
+        processor_version: Optional[str],
+        extract: Callable[[], Awaitable[ProcessingResult]],
+    ) -> ProcessingResult:
+        """
+        Return cached result for file_hash or run extract() and cache its result
+
+        Args:
+            file_hash: SHA-256 of file content (no caching if missing)
+            processor_version: Version tag of processor handling the file (no caching if missing)
+            extract: Coroutine factory performing the real extraction
+        """
+        cached = await self.get(file_hash, processor_version)
+        if cached is not None:
+            logger.info(f"Extraction cache hit for {file_hash[:12]} ({processor_version})")
+            return cached
+
+        result = await extract()
+        if result.success:
+            await self.put(file_hash, processor_version, result)
+        return result
+
+    async def invalidate(self, file_hash: str, processor_version: str) -> None:
+        """Remove one cached entry from both tiers"""
+        key = self.make_key(file_hash, processor_version)
+        redis = RedisManager.get_connected_client()
+        if redis is not None:
+            await lru_delete(redis, LRU_KEY, key)
+        await asyncio.to_thread(self._disk_remove, key)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics for monitoring"""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "backend": "redis" if RedisManager.get_connected_client() is not None else "disk",
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "errors": self.errors,
+        }
+
+    # Disk tier
+
+    def _disk_path(self, key: str) -> str:
+        name = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{name}.json")
+
+    def _disk_get(self, key: str) -> Optional[str]:
+        path = self._disk_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return None
+        # Touch to mark as recently used
+        os.utime(path, None)
+        return raw
+
+    def _disk_put(self, key: str, raw: str) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".part")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(raw)
+            os.replace(temp_path, self._disk_path(key))
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        self._disk_evict()
+
+    def _disk_remove(self, key: str) -> None:
+        try:
+            os.remove(self._disk_path(key))
+        except FileNotFoundError:
+            pass
+
+    def _disk_evict(self) -> None:
+        """Delete least recently used entries until total size fits max_bytes"""
+        entries = []
+        total = 0
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".json"):
+                    continue
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+
+        if total <= self.max_bytes:
+            return
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+                self.evictions += 1
+            except FileNotFoundError:
+                pass
+
+
+# Shared cache instance
+_extraction_cache: Optional[ExtractionCache] = None
+
+
+def get_extraction_cache() -> ExtractionCache:
+    """Get (or lazily create) the shared extraction cache"""
+    global _extraction_cache
+    if _extraction_cache is None:
+        _extraction_cache = ExtractionCache()
+    return _extraction_cache
@@ -1,8 +1,11 @@
 import os
+import asyncio
 import logging
-from typing import Dict
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Optional
 
 from .base import ProcessingResult
+from .executor import ExtractionExecutor, ExtractionTimeoutError, get_extraction_executor
 from .pdf_processor import PDFProcessor
 from .docx_processor import DOCXProcessor
 from .txt_processor import TXTProcessor
@@ -11,17 +14,35 @@ logger = logging.getLogger(__name__)
 
 
 class DocumentProcessor:
-    """Simple document processor - route to right processor"""
+    """
+    Simple document processor - route to right processor
     
-    def __init__(self):
+    CPU-bound processors (PDF, DOCX) run in the shared process pool so a large
+    document never blocks the event loop; cheap TXT reads stay on a thread.
+    Large PDFs are split into page ranges extracted by several workers.
+    """
+    
+    def __init__(self, executor: Optional[ExtractionExecutor] = None):
         self.processors = {
             '.pdf': PDFProcessor(),
             '.docx': DOCXProcessor(), 
             '.txt': TXTProcessor()
         }
+        self._executor = executor
+    
+    @property
+    def executor(self) -> ExtractionExecutor:
+        if self._executor is None:
+            self._executor = get_extraction_executor()
+        return self._executor
     
-    async def extract_text(self, file_path: str) -> ProcessingResult:
-        """Extract text from any supported document"""
+    async def extract_text(self, file_path: str, timeout: Optional[float] = None) -> ProcessingResult:
+        """
+        Extract text from any supported document
+        
+        Raises:
+            BrokenProcessPool: If extraction workers keep crashing (caller may retry)
+        """
         try:
             # Get file extension
             _, ext = os.path.splitext(file_path)
@@ -38,10 +59,24 @@ class DocumentProcessor:
             
             # Process file
             logger.info(f"Processing {ext} file: {file_path}")
-            result = await processor.extract_text(file_path)
+            if isinstance(processor, PDFProcessor) and self.executor.max_workers > 1:
+                result = await processor.extract_text_sharded(file_path, self.executor, timeout=timeout)
+            elif processor.cpu_bound:
+                result = await self.executor.run(processor.extract_text_sync, file_path, timeout=timeout)
+            else:
+                result = await asyncio.to_thread(processor.extract_text_sync, file_path)
             
             return result
             
+        except ExtractionTimeoutError as e:
+            logger.error(f"Document processing timed out: {file_path}")
+            return ProcessingResult(
+                success=False,
+                content="",
+                error_message=f"Processing error: {str(e)}"
+            )
+        except BrokenProcessPool:
+            raise
         except Exception as e:
             logger.error(f"Document processing failed: {e}")
             return ProcessingResult(
@@ -50,6 +85,14 @@ class DocumentProcessor:
                 error_message=f"Processing error: {str(e)}"
             )
     
+    def get_processor_version(self, file_path: str) -> Optional[str]:
+        """Get version tag of the processor handling file_path (None if unsupported)"""
+        ext = os.path.splitext(file_path)[1].lower()
+        processor = self.processors.get(ext)
+        if not processor:
+            return None
+        return f"{ext.lstrip('.')}-v{processor.version}"
+    
     def get_supported_extensions(self) -> set:
         """Get all supported file extensions"""
-        return set(self.processors.keys())
\ No newline at end of file
+        return set(self.processors.keys())
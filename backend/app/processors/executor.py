@@ -0,0 +1,132 @@
+"""
+Process pool shared by DocumentProcessor for PDF/DOCX parsing
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionTimeoutError(Exception):
+    """Extraction job exceeded its time budget"""
+    pass
+
+
+class ExtractionExecutor:
+    """
+    Bounded process pool for CPU-bound document extraction
+
+    Jobs receive only picklable arguments (file paths) and return plain results.
+    A job that exceeds its timeout is assumed to be stuck on a malformed
+    document: the pool's workers are killed and the pool is replaced. Jobs that
+    were running on the killed pool are resubmitted once to the new pool.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, timeout: Optional[float] = None):
+        self.max_workers = max(1, max_workers or settings.extraction_process_workers)
+        self.timeout = timeout if timeout is not None else settings.extraction_timeout
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._generation = 0
+        self._lock = threading.Lock()
+
+        # Counters for monitoring
+        self.timeouts = 0
+        self.pool_replacements = 0
+
+    def _get_pool(self) -> Tuple[ProcessPoolExecutor, int]:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+                logger.info(f"Started extraction process pool (workers={self.max_workers})")
+            return self._pool, self._generation
+
+    def _replace_pool(self, generation: int) -> None:
+        """Kill workers of the given pool generation and drop it (no-op if already replaced)"""
+        with self._lock:
+            if generation != self._generation or self._pool is None:
+                return
+            old_pool = self._pool
+            self._pool = None
+            self._generation += 1
+            self.pool_replacements += 1
+
+        # Private attribute, but the only way to stop a hung worker process
+        for process in list((getattr(old_pool, "_processes", None) or {}).values()):
+            try:
+                process.kill()
+            except Exception as e:
+                logger.debug(f"Failed to kill extraction worker {process.pid}: {e}")
+
+        old_pool.shutdown(wait=False, cancel_futures=True)
+        logger.warning("Extraction process pool replaced")
+
+    async def run(self, fn: Callable[..., Any], *args: Any, timeout: Optional[float] = None) -> Any:
+        """
+        Run fn(*args) in a worker process
+
+        Args:
+            fn: Module-level (picklable) function
+            *args: Picklable arguments (e.g. file path)
+            timeout: Per-job timeout in seconds (defaults to executor timeout)
+
+        Returns:
+            Result of fn
+
+        Raises:
+            ExtractionTimeoutError: If job exceeded timeout (workers are replaced)
+            BrokenProcessPool: If the pool broke twice in a row
+        """
+        job_timeout = timeout if timeout is not None else self.timeout
+        loop = asyncio.get_running_loop()
+
+        for attempt in range(2):
+            pool, generation = self._get_pool()
+            try:
+                future = loop.run_in_executor(pool, fn, *args)
+                return await asyncio.wait_for(future, timeout=job_timeout)
+
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+                logger.error(f"Extraction job timed out after {job_timeout}s, replacing workers")
+                self._replace_pool(generation)
+                raise ExtractionTimeoutError(f"Extraction timed out after {job_timeout}s")
+
+            except BrokenProcessPool:
+                # Worker died (or pool was replaced by another job's timeout)
+                self._replace_pool(generation)
+                if attempt == 1:
+                    raise
+                logger.warning("Extraction process pool broken, resubmitting job")
+
+    def shutdown(self) -> None:
+        """Shut down the pool, killing any running workers"""
+        with self._lock:
+            generation = self._generation
+        self._replace_pool(generation)
+
+
+# Shared executor instance (DocumentProcessor is created per request)
+_executor: Optional[ExtractionExecutor] = None
+
+
+def get_extraction_executor() -> ExtractionExecutor:
+    """Get (or lazily create) the shared extraction executor"""
+    global _executor
+    if _executor is None:
+        _executor = ExtractionExecutor()
+    return _executor
+
+
+def shutdown_extraction_executor() -> None:
+    """Shut down the shared extraction executor (application shutdown)"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
@@ -1,56 +1,191 @@
 import os
+import asyncio
 import logging
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional, Tuple
 
 try:
     import fitz  # PyMuPDF
 except ImportError:
     fitz = None
 
+from app.core.config import settings
 from .base import BaseProcessor, ProcessingResult
+from .executor import ExtractionExecutor, ExtractionTimeoutError
 
 logger = logging.getLogger(__name__)
 
 
+def extract_pdf_pages(file_path: str, start: int, stop: int) -> List[str]:
+    """
+    Extract text of pages [start, stop) - runs inside a worker process
+
+    Each worker opens the document itself so only the path and page range
+    cross the process boundary.
+    """
+    with fitz.open(file_path) as pdf:
+        return [pdf[number].get_text() for number in range(start, min(stop, pdf.page_count))]
+
+
+def extract_pdf_head(file_path: str, min_pages_per_shard: int) -> Tuple[int, List[str]]:
+    """
+    Count pages and extract the first shard - runs inside a worker process
+
+    PDFs too small to shard (fewer than 2 shards' worth of pages) are
+    extracted completely, so they are opened only once.
+
+    Returns:
+        (page_count, texts of the leading pages)
+    """
+    with fitz.open(file_path) as pdf:
+        page_count = pdf.page_count
+        stop = page_count if page_count < 2 * min_pages_per_shard else min_pages_per_shard
+        return page_count, [pdf[number].get_text() for number in range(stop)]
+
+
+def assemble_pages(pages: List[str]) -> Tuple[str, List[int]]:
+    """
+    Join page texts once and compute page start offsets
+
+    Offsets refer to the stripped text, matching ProcessingResult.content.
+    """
+    offsets = []
+    position = 0
+    for page_text in pages:
+        offsets.append(position)
+        position += len(page_text)
+
+    text = "".join(pages)
+    stripped = text.strip()
+    leading = len(text) - len(text.lstrip())
+    offsets = [min(max(0, offset - leading), len(stripped)) for offset in offsets]
+    return stripped, offsets
+
+
+def split_page_ranges(page_count: int, shards: int) -> List[Tuple[int, int]]:
+    """Split pages into contiguous ranges of near-equal size"""
+    shards = max(1, min(shards, page_count))
+    size, extra = divmod(page_count, shards)
+    ranges = []
+    start = 0
+    for index in range(shards):
+        stop = start + size + (1 if index < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def _build_result(pages: List[str]) -> ProcessingResult:
+    text, offsets = assemble_pages(pages)
+    if not text:
+        return ProcessingResult(
+            success=False,
+            content="",
+            error_message="No text content found in PDF"
+        )
+
+    logger.info(f"Extracted {len(text)} chars from {len(pages)} PDF pages")
+    return ProcessingResult(success=True, content=text, page_offsets=offsets)
+
+
+def extract_pdf_text(file_path: str) -> ProcessingResult:
+    """Extract text from PDF - runs inside a worker process"""
+    try:
+        if not os.path.exists(file_path):
+            return ProcessingResult(
+                success=False,
+                content="",
+                error_message=f"File not found: {file_path}"
+            )
+
+        with fitz.open(file_path) as pdf:
+            return _build_result([page.get_text() for page in pdf])
+
+    except Exception as e:
+        logger.error(f"PDF extraction failed: {e}")
+        return ProcessingResult(
+            success=False,
+            content="",
+            error_message=f"PDF processing error: {str(e)}"
+        )
+
+
 class PDFProcessor(BaseProcessor):
     """Simple PDF text extractor"""
-    
+
+    cpu_bound = True
+    version = "2"  # page offsets
+    extract_text_sync = staticmethod(extract_pdf_text)
+
     def __init__(self):
         super().__init__()
         self.supported_extensions = {'.pdf'}
-        
+
         if fitz is None:
             raise ImportError("PyMuPDF required: pip install PyMuPDF")
-    
-    async def extract_text(self, file_path: str) -> ProcessingResult:
-        """Extract text from PDF - simple and clean"""
+
+    async def extract_text_sharded(
+        self,
+        file_path: str,
+        executor: ExtractionExecutor,
+        timeout: Optional[float] = None,
+        min_pages_per_shard: Optional[int] = None,
+    ) -> ProcessingResult:
+        """
+        Extract large PDFs by splitting page ranges across pool workers
+
+        Args:
+            file_path: Path to PDF
+            executor: ExtractionExecutor running the shards
+            timeout: Per-shard timeout in seconds
+            min_pages_per_shard: Smallest page range worth a separate job
+
+        Returns:
+            ProcessingResult with per-page offsets
+
+        Raises:
+            ExtractionTimeoutError / BrokenProcessPool: Propagated from executor
+        """
+        min_pages = max(1, min_pages_per_shard or settings.pdf_shard_min_pages)
+
+        if not os.path.exists(file_path):
+            return ProcessingResult(
+                success=False,
+                content="",
+                error_message=f"File not found: {file_path}"
+            )
+
+        # Page counting runs in the pool too, under the same timeout and kill
+        # guarantees; the job also extracts the first shard
+        tasks = []
         try:
-            if not os.path.exists(file_path):
-                return ProcessingResult(
-                    success=False,
-                    content="",
-                    error_message=f"File not found: {file_path}"
-                )
-            
-            text = ""
-            with fitz.open(file_path) as pdf:
-                for page in pdf:
-                    text += page.get_text()
-            
-            text = text.strip()
-            if not text:
-                return ProcessingResult(
-                    success=False,
-                    content="",
-                    error_message="No text content found in PDF"
-                )
-            
-            logger.info(f"Extracted {len(text)} chars from PDF")
-            return ProcessingResult(success=True, content=text)
-            
+            page_count, head = await executor.run(extract_pdf_head, file_path, min_pages, timeout=timeout)
+            if len(head) == page_count:
+                return _build_result(head)
+
+            shards = max(1, min(executor.max_workers, (page_count - len(head)) // min_pages))
+            ranges = [(start + len(head), stop + len(head))
+                      for start, stop in split_page_ranges(page_count - len(head), shards)]
+            logger.info(f"Extracting {page_count} PDF pages in {len(ranges) + 1} shards")
+
+            tasks = [
+                asyncio.ensure_future(executor.run(extract_pdf_pages, file_path, start, stop, timeout=timeout))
+                for start, stop in ranges
+            ]
+            shard_pages = [head] + list(await asyncio.gather(*tasks))
+        except (asyncio.CancelledError, ExtractionTimeoutError, BrokenProcessPool):
+            for task in tasks:
+                task.cancel()
+            raise
         except Exception as e:
+            for task in tasks:
+                task.cancel()
             logger.error(f"PDF extraction failed: {e}")
             return ProcessingResult(
                 success=False,
                 content="",
                 error_message=f"PDF processing error: {str(e)}"
-            )
\ No newline at end of file
+            )
+
+        return _build_result([page for pages in shard_pages for page in pages])
+
@@ -0,0 +1,162 @@
+import logging
+from typing import Any, Awaitable, Callable, Optional, Tuple
+from sqlalchemy import select, update, delete, and_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.file import FileBlob, StorageType
+from .base import BaseRepository
+
+logger = logging.getLogger(__name__)
+
+
+class BlobRepository(BaseRepository[FileBlob]):
+    """Repository for content-addressed blobs and their reference counts"""
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(FileBlob, session)
+
+    async def get_by_hash(self, file_hash: str) -> Optional[FileBlob]:
+        """
+        Get blob by content hash
+
+        Args:
+            file_hash: SHA-256 hash of file content
+
+        Returns:
+            Blob if stored
+        """
+        try:
+            result = await self.session.execute(
+                select(FileBlob).where(FileBlob.file_hash == file_hash)
+            )
+            return result.scalar_one_or_none()
+
+        except Exception as e:
+            self.logger.error(f"Error getting blob by hash {file_hash}: {e}")
+            raise
+
+    async def acquire(
+        self,
+        file_hash: str,
+        file_path: str,
+        size: int,
+        storage_type: StorageType = StorageType.LOCAL
+    ) -> Tuple[FileBlob, bool]:
+        """
+        Add a reference to the blob for file_hash, creating it if needed
+
+        The increment is a single UPDATE so concurrent uploads of the same
+        content never lose a reference; a concurrent insert of the same hash
+        is caught by the unique index and turned into an increment.
+
+        Args:
+            file_hash: SHA-256 hash of file content
+            file_path: Storage location to use if the blob is new
+            size: Content size in bytes
+            storage_type: Backend that will hold the bytes if the blob is new
+
+        Returns:
+            Tuple of (blob, created) - created is True if caller must write the bytes
+        """
+        for _ in range(2):
+            try:
+                result = await self.session.execute(
+                    update(FileBlob)
+                    .where(FileBlob.file_hash == file_hash)
+                    .values(ref_count=FileBlob.ref_count + 1)
+                    .execution_options(synchronize_session=False)
+                )
+                if result.rowcount == 1:
+                    await self.session.commit()
+                    blob = await self._reload(FileBlob.file_hash == file_hash)
+                    self.logger.debug(f"Added reference to blob {file_hash[:12]}: {blob.ref_count}")
+                    return blob, False
+
+                blob = FileBlob(
+                    file_hash=file_hash,
+                    file_path=file_path,
+                    size=size,
+                    storage_type=storage_type,
+                    ref_count=1
+                )
+                self.session.add(blob)
+                await self.session.commit()
+                await self.session.refresh(blob)
+                self.logger.info(f"Created blob {file_hash[:12]} at {file_path}")
+                return blob, True
+
+            except IntegrityError:
+                # Another upload created the same blob first - increment instead
+                await self.session.rollback()
+                continue
+            except Exception as e:
+                await self.session.rollback()
+                self.logger.error(f"Failed to acquire blob {file_hash}: {e}")
+                raise
+
+        raise RuntimeError(f"Could not acquire blob {file_hash}")
+
+    async def release(
+        self,
+        blob_id: str,
+        unlink: Optional[Callable[[FileBlob], Awaitable[Any]]] = None
+    ) -> Optional[FileBlob]:
+        """
+        Drop one reference to a blob
+
+        The row is deleted only when no references remain, using a conditional
+        DELETE so a concurrent acquire either keeps the row alive or recreates it.
+        unlink runs after that DELETE but before the commit: the deleting
+        transaction holds the row (or database) write lock, so a concurrent
+        acquire of the same hash waits and then writes fresh bytes after the
+        old ones are gone, instead of having them deleted from under it.
+
+        Args:
+            blob_id: ID of blob
+            unlink: Called with the blob to remove its bytes if this was the last reference
+
+        Returns:
+            The deleted blob if this was the last reference (caller unlinks the bytes), else None
+        """
+        try:
+            await self.session.execute(
+                update(FileBlob)
+                .where(and_(FileBlob.id == blob_id, FileBlob.ref_count > 0))
+                .values(ref_count=FileBlob.ref_count - 1)
+                .execution_options(synchronize_session=False)
+            )
+
+            blob = await self._reload(FileBlob.id == blob_id)
+            if blob is None or blob.ref_count > 0:
+                await self.session.commit()
+                return None
+
+            result = await self.session.execute(
+                delete(FileBlob)
+                .where(and_(FileBlob.id == blob_id, FileBlob.ref_count == 0))
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount == 1 and unlink is not None:
+                await unlink(blob)
+            await self.session.commit()
+
+            self.session.expunge(blob)
+            if result.rowcount == 1:
+                self.logger.info(f"Released last reference to blob {blob.file_hash[:12]}")
+                return blob
+            return None
+
+        except Exception as e:
+            await self.session.rollback()
+            self.logger.error(f"Failed to release blob {blob_id}: {e}")
+            raise
+
+    async def _reload(self, criterion) -> Optional[FileBlob]:
+        """Select blob bypassing stale identity-map state (counts change via UPDATE)"""
+        result = await self.session.execute(
+            select(FileBlob)
+            .where(criterion)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
@@ -1,15 +1,27 @@
 import logging
-from typing import List, Optional, Dict, Any
+from datetime import datetime, timezone
+from typing import List, Optional, Dict, Any, Set
+from uuid import uuid4
 
-from sqlalchemy import select, func
+from sqlalchemy import bindparam, inspect, select, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
-from app.models.exam import Exam, Question, ExamAttempt
+from app.models.exam import (
+    AttemptStatus, Exam, Question, ExamAttempt, EXAM_PAYLOAD_VERSION, build_exam_payload
+)
 from .base import BaseRepository
+from .pagination import Page, keyset_page
 
 logger = logging.getLogger(__name__)
 
+# Columns returned by exam list views; list queries load nothing else
+EXAM_SUMMARY_COLUMNS = (
+    Exam.id, Exam.title, Exam.description, Exam.creator_id, Exam.duration_minutes,
+    Exam.total_questions, Exam.is_public, Exam.status, Exam.created_at, Exam.updated_at,
+)
+
 
 class ExamRepository(BaseRepository[Exam]):
     """Repository for exam operations with clean architecture"""
@@ -41,6 +53,97 @@ class ExamRepository(BaseRepository[Exam]):
             self.logger.error(f"Error getting exam by ID {id}: {e}")
             raise
     
+    async def get_exam_row(self, exam_id: str) -> Optional[Exam]:
+        """
+        Get exam row without its questions
+        
+        A primary-key lookup through the session identity map, so repeated
+        calls in one request (access check, then read) hit the database once.
+        """
+        try:
+            return await self.session.get(Exam, exam_id)
+        
+        except Exception as e:
+            self.logger.error(f"Error getting exam row {exam_id}: {e}")
+            raise
+    
+    async def get_with_payload(self, exam_id: str) -> Optional[Exam]:
+        """
+        Get exam with an up-to-date read payload
+        
+        Served from the exam row alone; question rows are only loaded (and the
+        payload rebuilt) for exams saved before the payload existed or with an
+        older payload format. The rebuilt payload is saved in a transaction of
+        its own, so read paths never commit the caller's session.
+        
+        Args:
+            exam_id: Exam ID
+            
+        Returns:
+            Exam with payload, or None if not found
+        """
+        exam = await self.get_exam_row(exam_id)
+        if exam is None:
+            return None
+        
+        if exam.payload_version != EXAM_PAYLOAD_VERSION:
+            await self._backfill_payload(exam)
+        
+        # Rows updated earlier in this session have server-side updated_at expired
+        if inspect(exam).expired_attributes:
+            await self.session.refresh(exam)
+        return exam
+    
+    async def _backfill_payload(self, exam: Exam) -> None:
+        """
+        Build a missing/outdated payload and save it outside the caller's transaction
+        
+        The values are applied to exam as committed state, so the caller's
+        session has nothing new to flush. A failed save is logged and the
+        payload is still served; the next read retries it.
+        """
+        questions = await QuestionRepository(self.session).get_by_exam_id(exam.id)
+        values = {
+            'payload': build_exam_payload(questions),
+            'payload_version': EXAM_PAYLOAD_VERSION,
+            'total_questions': len(questions),
+        }
+        
+        try:
+            async with AsyncSession(self.session.bind) as session:
+                await session.execute(
+                    update(Exam)
+                    .where(Exam.id == exam.id)
+                    .values(**values)
+                    .execution_options(synchronize_session=False)
+                )
+                await session.commit()
+            self.logger.info(f"Rebuilt payload for exam {exam.id} ({len(questions)} questions)")
+        
+        except Exception as e:
+            self.logger.warning(f"Failed to save rebuilt payload for exam {exam.id}: {e}")
+        
+        for key, value in values.items():
+            set_committed_value(exam, key, value)
+    
+    async def rebuild_payload(self, exam: Exam) -> None:
+        """
+        Rebuild an exam's read payload from its question rows
+        
+        Call after editing questions through the ORM. The change is flushed
+        with the caller's other edits; committing is left to the caller.
+        """
+        try:
+            questions = await QuestionRepository(self.session).get_by_exam_id(exam.id)
+            exam.payload = build_exam_payload(questions)
+            exam.payload_version = EXAM_PAYLOAD_VERSION
+            exam.total_questions = len(questions)
+            await self.session.flush()
+            
+        except Exception as e:
+            self.logger.error(f"Failed to rebuild payload for exam {exam.id}: {e}")
+            raise
+    
     async def create_exam_with_questions(
         self, 
         exam_data: Dict[str, Any], 
@@ -49,101 +152,116 @@ class ExamRepository(BaseRepository[Exam]):
         """
         Create exam with questions in a single transaction
         
+        All rows are built in memory and flushed together: one INSERT for the
+        exam and one multi-row INSERT for its questions (primary keys are
+        generated client-side, so the unit of work batches them), then a
+        single commit. Round trips stay constant regardless of question count,
+        and a failing question rolls back the whole exam.
+        
         Args:
             exam_data: Exam fields
             questions_data: List of question fields
             
         Returns:
-            Created exam with questions loaded
+            Created exam with questions attached (no reload query) and its
+            read payload already built
         """
         try:
-            # Create exam
-            exam = await self.create(**exam_data)
-            
-            # Create questions
-            question_repo = QuestionRepository(self.session)
-            for i, question_data in enumerate(questions_data):
-                question_data.update({
-                    'exam_id': exam.id,
-                    'order_index': i + 1
-                })
-                await question_repo.create(**question_data)
-            
-            # Update total questions count
-            exam.total_questions = len(questions_data)
+            exam = Exam(**{'id': str(uuid4()), **exam_data, 'total_questions': len(questions_data)})
+            exam.questions = [
+                Question(**{'id': str(uuid4()), **question_data, 'order_index': i + 1})
+                for i, question_data in enumerate(questions_data)
+            ]
+            exam.payload = build_exam_payload(exam.questions)
+            exam.payload_version = EXAM_PAYLOAD_VERSION
+            self.session.add(exam)
             await self.session.commit()
             
-            # Return exam with questions loaded
-            return await self.get_by_id(exam.id)
+            self.logger.info(f"Created exam {exam.id} with {len(questions_data)} questions")
+            return exam
             
         except Exception as e:
             await self.session.rollback()
             self.logger.error(f"Failed to create exam with questions: {e}")
             raise
     
-    async def get_exams_by_creator(self, creator_id: str) -> List[Exam]:
+    async def get_exams_by_creator(
+        self, creator_id: str, cursor: Optional[str] = None, limit: int = 100
+    ) -> Page[Exam]:
         """
-        Get exams created by specific user (SECURE - user-scoped)
+        Get exams created by specific user (SECURE - user-scoped), newest first
         
         Args:
             creator_id: ID of the exam creator (REQUIRED)
+            cursor: next_cursor of the previous page
+            limit: Maximum number of records
             
         Returns:
-            List of exams created by the user ONLY
+            Page of exams created by the user ONLY, with only
+            EXAM_SUMMARY_COLUMNS loaded (other attributes raise on access)
         """
         try:
-            result = await self.session.execute(
+            page = await keyset_page(
+                self.session,
                 select(Exam)
-                .where(Exam.creator_id == creator_id)  # ALWAYS filter by user
-                .order_by(Exam.created_at.desc())
+                .options(load_only(*EXAM_SUMMARY_COLUMNS, raiseload=True))
+                .where(Exam.creator_id == creator_id),  # ALWAYS filter by user
+                Exam,
+                cursor,
+                limit,
             )
-            exams = result.scalars().all()
             
-            self.logger.debug(f"Found {len(exams)} exams for creator: {creator_id}")
-            return list(exams)
+            self.logger.debug(f"Found {len(page)} exams for creator: {creator_id}")
+            return page
             
         except Exception as e:
             self.logger.error(f"Failed to get exams for creator {creator_id}: {e}")
             raise
     
-    async def get_all_exams(self, skip: int = 0, limit: int = 100) -> List[Exam]:
+    async def get_all_exams(self, cursor: Optional[str] = None, limit: int = 100) -> Page[Exam]:
         """
-        Get ALL exams (ADMIN ONLY - no user filtering)
+        Get ALL exams (ADMIN ONLY - no user filtering), newest first
         
         Args:
-            skip: Number of records to skip
+            cursor: next_cursor of the previous page
             limit: Maximum number of records
             
         Returns:
-            List of ALL exams (admin access)
+            Page of ALL exams (admin access), with only EXAM_SUMMARY_COLUMNS
+            loaded (other attributes raise on access)
         """
         try:
-            result = await self.session.execute(
-                select(Exam)
-                .offset(skip)
-                .limit(limit)
-                .order_by(Exam.created_at.desc())
+            page = await keyset_page(
+                self.session,
+                select(Exam).options(load_only(*EXAM_SUMMARY_COLUMNS, raiseload=True)),
+                Exam,
+                cursor,
+                limit,
             )
-            exams = result.scalars().all()
             
-            self.logger.debug(f"Retrieved {len(exams)} exams for admin (skip={skip}, limit={limit})")
-            return list(exams)
+            self.logger.debug(f"Retrieved {len(page)} exams for admin (limit={limit})")
+            return page
             
         except Exception as e:
             self.logger.error(f"Failed to list all exams: {e}")
             raise
     
-    async def count_exams(self) -> int:
+    async def count_exams(self, creator_id: Optional[str] = None) -> int:
         """
         Count total number of exams
         
+        Args:
+            creator_id: Only count this user's exams
+            
         Returns:
             Total exam count
         """
         try:
-            result = await self.session.execute(
-                select(func.count(Exam.id))
-            )
+            query = select(func.count(Exam.id))
+            if creator_id is not None:
+                query = query.where(Exam.creator_id == creator_id)
+            
+            result = await self.session.execute(query)
             count = result.scalar() or 0
             
             self.logger.debug(f"Total exam count: {count}")
@@ -241,4 +359,122 @@ class ExamAttemptRepository(BaseRepository[ExamAttempt]):
             
         except Exception as e:
             self.logger.error(f"Failed to get attempts for exam {exam_id}: {e}")
-            raise
\ No newline at end of file
+            raise
+    
+    async def start_attempt(self, exam_id: str, user_id: str, max_score: int) -> ExamAttempt:
+        """
+        Create an in-progress attempt
+        
+        Args:
+            exam_id: Exam ID
+            user_id: User taking the exam
+            max_score: Points available on the exam
+            
+        Returns:
+            Created attempt
+        """
+        return await self.create(
+            exam_id=exam_id,
+            user_id=user_id,
+            start_time=datetime.now(timezone.utc),
+            max_score=max_score,
+            status=AttemptStatus.IN_PROGRESS.value,
+        )
+    
+    async def get_user_attempts(self, exam_id: str, user_id: str) -> List[ExamAttempt]:
+        """
+        Get one user's attempts for an exam, newest first
+        """
+        try:
+            result = await self.session.execute(
+                select(ExamAttempt)
+                .where(ExamAttempt.exam_id == exam_id, ExamAttempt.user_id == user_id)
+                .order_by(ExamAttempt.created_at.desc())
+            )
+            return list(result.scalars().all())
+            
+        except Exception as e:
+            self.logger.error(f"Failed to get attempts for exam {exam_id} and user {user_id}: {e}")
+            raise
+    
+    async def get_attempt_states(self, attempt_ids: List[str]) -> Dict[str, Any]:
+        """
+        Get exam, owner and status of many attempts in one query
+        
+        Args:
+            attempt_ids: Attempt IDs
+            
+        Returns:
+            Dict of attempt ID -> row with exam_id, user_id and status
+        """
+        try:
+            result = await self.session.execute(
+                select(ExamAttempt.id, ExamAttempt.exam_id, ExamAttempt.user_id, ExamAttempt.status)
+                .where(ExamAttempt.id.in_(attempt_ids))
+            )
+            return {row.id: row for row in result}
+            
+        except Exception as e:
+            self.logger.error(f"Failed to get state of {len(attempt_ids)} attempts: {e}")
+            raise
+    
+    async def save_results(self, results: List[Dict[str, Any]]) -> Set[str]:
+        """
+        Store graded results for many in-progress attempts
+        
+        Each row is claimed by a conditional UPDATE (status still in
+        progress), so an attempt submitted concurrently elsewhere is left
+        untouched and reported as not saved. When the dialect reports
+        executemany row counts, the batch runs as one executemany UPDATE
+        and, if every row matched, one commit; otherwise (or on a lost
+        claim) rows are updated one by one in a single transaction.
+        
+        Args:
+            results: Dicts with attempt_id, answers, score, max_score,
+                percentage, passed and end_time
+            
+        Returns:
+            IDs of the attempts this call submitted
+        """
+        if not results:
+            return set()
+        
+        table = ExamAttempt.__table__
+        statement = (
+            update(table)
+            .where(table.c.id == bindparam('attempt_id'))
+            .where(table.c.status == AttemptStatus.IN_PROGRESS.value)
+            .values(
+                answers=bindparam('answers'),
+                score=bindparam('score'),
+                max_score=bindparam('max_score'),
+                percentage=bindparam('percentage'),
+                passed=bindparam('passed'),
+                end_time=bindparam('end_time'),
+                status=AttemptStatus.SUBMITTED.value,
+            )
+        )
+        
+        try:
+            saved: Set[str] = set()
+            if self.session.bind.dialect.supports_sane_multi_rowcount:
+                result = await self.session.execute(statement, results)
+                if result.rowcount == len(results):
+                    saved = {row['attempt_id'] for row in results}
+                else:
+                    await self.session.rollback()
+            
+            if not saved:
+                for row in results:
+                    result = await self.session.execute(statement, row)
+                    if result.rowcount == 1:
+                        saved.add(row['attempt_id'])
+            
+            await self.session.commit()
+            self.logger.info(f"Saved {len(saved)} of {len(results)} graded attempts")
+            return saved
+            
+        except Exception as e:
+            await self.session.rollback()
+            self.logger.error(f"Failed to save {len(results)} graded attempts: {e}")
+            raise
@@ -1,14 +1,24 @@
 import logging
 from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, update, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from app.models.file import UploadedFile, FileStatus, StorageType, ProcessingStatus
 from .base import BaseRepository
+from .pagination import Page, keyset_page
 
 logger = logging.getLogger(__name__)
 
+# Columns returned by file list views; list queries load nothing else
+FILE_SUMMARY_COLUMNS = (
+    UploadedFile.id, UploadedFile.stored_filename, UploadedFile.original_filename,
+    UploadedFile.file_path, UploadedFile.size, UploadedFile.content_type,
+    UploadedFile.owner_id, UploadedFile.is_public, UploadedFile.storage_type,
+    UploadedFile.upload_status, UploadedFile.created_at,
+)
+
 
 class FileRepository(BaseRepository[UploadedFile]):
     """Repository for file operations"""
@@ -69,40 +79,74 @@ class FileRepository(BaseRepository[UploadedFile]):
     async def get_user_files(
         self, 
         owner_id: str, 
-        skip: int = 0, 
+        cursor: Optional[str] = None, 
         limit: int = 100,
         status_filter: Optional[FileStatus] = None
-    ) -> List[UploadedFile]:
+    ) -> Page[UploadedFile]:
         """
-        Get files owned by specific user
+        Get files owned by specific user, newest first
         
         Args:
             owner_id: ID of file owner
-            skip: Number of records to skip
+            cursor: next_cursor of the previous page
             limit: Maximum number of records
-            status_filter: Optional status filter
+            status_filter: Optional status filter (deleted files are excluded otherwise)
             
         Returns:
-            List of user's files
+            Page of user's files, with only FILE_SUMMARY_COLUMNS loaded
+            (other attributes raise on access)
         """
         try:
-            query = select(UploadedFile).where(UploadedFile.owner_id == owner_id)
+            query = (
+                select(UploadedFile)
+                .options(load_only(*FILE_SUMMARY_COLUMNS, raiseload=True))
+                .where(UploadedFile.owner_id == owner_id)
+            )
             
             if status_filter:
                 query = query.where(UploadedFile.upload_status == status_filter)
+            else:
+                query = query.where(UploadedFile.upload_status != FileStatus.DELETED)
             
-            query = query.offset(skip).limit(limit).order_by(UploadedFile.created_at.desc())
-            
-            result = await self.session.execute(query)
-            files = result.scalars().all()
+            page = await keyset_page(self.session, query, UploadedFile, cursor, limit)
             
-            self.logger.debug(f"Retrieved {len(files)} files for user {owner_id}")
-            return list(files)
+            self.logger.debug(f"Retrieved {len(page)} files for user {owner_id}")
+            return page
             
         except Exception as e:
             self.logger.error(f"Failed to get files for user {owner_id}: {e}")
             raise
     
+    async def get_all_files(self, cursor: Optional[str] = None, limit: int = 100) -> Page[UploadedFile]:
+        """
+        Get ALL non-deleted files (ADMIN ONLY), newest first
+        
+        Args:
+            cursor: next_cursor of the previous page
+            limit: Maximum number of records
+            
+        Returns:
+            Page of files, with only FILE_SUMMARY_COLUMNS loaded (other
+            attributes raise on access)
+        """
+        try:
+            page = await keyset_page(
+                self.session,
+                select(UploadedFile)
+                .options(load_only(*FILE_SUMMARY_COLUMNS, raiseload=True))
+                .where(UploadedFile.upload_status != FileStatus.DELETED),
+                UploadedFile,
+                cursor,
+                limit,
+            )
+            
+            self.logger.debug(f"Retrieved {len(page)} files for admin (limit={limit})")
+            return page
+            
+        except Exception as e:
+            self.logger.error(f"Failed to list all files: {e}")
+            raise
+    
     async def get_by_stored_filename(self, stored_filename: str) -> Optional[UploadedFile]:
         """
         Get file by stored filename
@@ -130,26 +174,34 @@ class FileRepository(BaseRepository[UploadedFile]):
             self.logger.error(f"Error getting file by stored filename {stored_filename}: {e}")
             raise
     
-    async def get_by_hash(self, file_hash: str) -> Optional[UploadedFile]:
+    async def get_by_hash(self, file_hash: str, owner_id: Optional[str] = None) -> Optional[UploadedFile]:
         """
         Get file by hash (for duplicate detection)
         
+        Several users may upload the same content, so pass owner_id to find
+        the caller's own copy.
+        
         Args:
             file_hash: SHA-256 hash of file content
+            owner_id: Optional owner filter
             
         Returns:
-            Existing file with same hash
+            Existing file with same hash (oldest first)
         """
         try:
-            result = await self.session.execute(
-                select(UploadedFile).where(
-                    and_(
-                        UploadedFile.file_hash == file_hash,
-                        UploadedFile.upload_status == FileStatus.COMPLETED
-                    )
+            query = select(UploadedFile).where(
+                and_(
+                    UploadedFile.file_hash == file_hash,
+                    UploadedFile.upload_status == FileStatus.COMPLETED
                 )
             )
-            file_record = result.scalar_one_or_none()
+            if owner_id:
+                query = query.where(UploadedFile.owner_id == owner_id)
+            
+            result = await self.session.execute(
+                query.order_by(UploadedFile.created_at.asc()).limit(1)
+            )
+            file_record = result.scalars().first()
             
             if file_record:
                 self.logger.debug(f"Found duplicate file with hash: {file_hash}")
@@ -253,8 +305,9 @@ class FileRepository(BaseRepository[UploadedFile]):
                 self.logger.warning(f"File not found or access denied: {file_id}")
                 return False
             
-            # Soft delete - mark as deleted
+            # Soft delete - mark as deleted and drop blob reference
             file_record.upload_status = FileStatus.DELETED
+            file_record.blob_id = None
             await self.session.commit()
             
             self.logger.info(f"Deleted file record: {file_id}")
@@ -265,6 +318,76 @@ class FileRepository(BaseRepository[UploadedFile]):
             self.logger.error(f"Failed to delete file record {file_id}: {e}")
             raise
     
+    async def get_files_without_blob(
+        self,
+        limit: int = 100,
+        exclude_ids: Optional[List[str]] = None
+    ) -> List[UploadedFile]:
+        """
+        Get live files still stored at a per-upload path (pre blob store)
+        
+        Args:
+            limit: Maximum number of records
+            exclude_ids: File IDs to skip (e.g. ones that failed to migrate)
+            
+        Returns:
+            List of file records without blob
+        """
+        try:
+            query = select(UploadedFile).where(
+                and_(
+                    UploadedFile.blob_id.is_(None),
+                    UploadedFile.upload_status != FileStatus.DELETED
+                )
+            )
+            if exclude_ids:
+                query = query.where(UploadedFile.id.notin_(exclude_ids))
+            
+            result = await self.session.execute(
+                query.order_by(UploadedFile.created_at.asc()).limit(limit)
+            )
+            return list(result.scalars().all())
+            
+        except Exception as e:
+            self.logger.error(f"Failed to get files without blob: {e}")
+            raise
+    
+    async def attach_blob(
+        self,
+        file_id: str,
+        blob_id: Optional[str],
+        file_path: str,
+        file_hash: str,
+        storage_type: StorageType = StorageType.LOCAL
+    ) -> bool:
+        """
+        Point file record at a content-addressed blob (blob_id=None detaches)
+        
+        Args:
+            file_id: ID of file
+            blob_id: ID of blob holding the content
+            file_path: Blob storage location
+            file_hash: SHA-256 hash of content
+            storage_type: Backend holding the bytes
+            
+        Returns:
+            True if updated
+        """
+        try:
+            result = await self.session.execute(
+                update(UploadedFile)
+                .where(UploadedFile.id == file_id)
+                .values(blob_id=blob_id, file_path=file_path, file_hash=file_hash, storage_type=storage_type)
+                .execution_options(synchronize_session=False)
+            )
+            await self.session.commit()
+            return result.rowcount == 1
+            
+        except Exception as e:
+            await self.session.rollback()
+            self.logger.error(f"Failed to attach blob to file {file_id}: {e}")
+            raise
+    
     async def count_user_files(self, owner_id: str) -> int:
         """
         Count total files for user
@@ -293,6 +416,23 @@ class FileRepository(BaseRepository[UploadedFile]):
             self.logger.error(f"Failed to count files for user {owner_id}: {e}")
             raise
     
+    async def count_files(self) -> int:
+        """
+        Count all non-deleted files
+        
+        Returns:
+            Total file count
+        """
+        try:
+            result = await self.session.execute(
+                select(func.count(UploadedFile.id)).where(UploadedFile.upload_status != FileStatus.DELETED)
+            )
+            return result.scalar() or 0
+            
+        except Exception as e:
+            self.logger.error(f"Failed to count files: {e}")
+            raise
+    
     async def update_processing_status(self, file_id: str, status: ProcessingStatus, error_message: Optional[str] = None) -> bool:
         try:
             # Get file and ensure it exists
@@ -379,6 +519,180 @@ class FileRepository(BaseRepository[UploadedFile]):
             self.logger.error(f"Failed to get files pending processing: {e}")
             return []
     
+    async def claim_files_pending_processing(
+        self,
+        limit: int = 10
+    ) -> List[UploadedFile]:
+        """
+        Atomically claim PENDING files for background processing
+        
+        Claimed rows are moved to PROCESSING so no other worker picks them up.
+        PostgreSQL uses SELECT ... FOR UPDATE SKIP LOCKED; other dialects (SQLite)
+        fall back to a conditional UPDATE per row and keep only rows whose
+        status actually changed.
+        
+        Args:
+            limit: Maximum number of files to claim
+            
+        Returns:
+            List of claimed file records (status PROCESSING)
+        """
+        if limit <= 0:
+            return []
+        
+        pending_filter = and_(
+            UploadedFile.processing_status == ProcessingStatus.PENDING,
+            UploadedFile.upload_status == FileStatus.COMPLETED
+        )
+        
+        try:
+            if self.session.bind.dialect.name == "postgresql":
+                result = await self.session.execute(
+                    select(UploadedFile)
+                    .where(pending_filter)
+                    .order_by(UploadedFile.created_at.asc())
+                    .limit(limit)
+                    .with_for_update(skip_locked=True)
+                )
+                claimed = list(result.scalars().all())
+                for file_record in claimed:
+                    file_record.processing_status = ProcessingStatus.PROCESSING
+                    file_record.processing_error = None
+            else:
+                result = await self.session.execute(
+                    select(UploadedFile.id)
+                    .where(pending_filter)
+                    .order_by(UploadedFile.created_at.asc())
+                    .limit(limit)
+                )
+                candidate_ids = list(result.scalars().all())
+                
+                claimed_ids = []
+                for file_id in candidate_ids:
+                    update_result = await self.session.execute(
+                        update(UploadedFile)
+                        .where(
+                            and_(
+                                UploadedFile.id == file_id,
+                                UploadedFile.processing_status == ProcessingStatus.PENDING
+                            )
+                        )
+                        .values(
+                            processing_status=ProcessingStatus.PROCESSING,
+                            processing_error=None
+                        )
+                        .execution_options(synchronize_session=False)
+                    )
+                    if update_result.rowcount == 1:
+                        claimed_ids.append(file_id)
+                
+                claimed = []
+                if claimed_ids:
+                    result = await self.session.execute(
+                        select(UploadedFile)
+                        .where(UploadedFile.id.in_(claimed_ids))
+                        .order_by(UploadedFile.created_at.asc())
+                        .execution_options(populate_existing=True)
+                    )
+                    claimed = list(result.scalars().all())
+            
+            await self.session.commit()
+            
+            if claimed:
+                self.logger.info(f"Claimed {len(claimed)} files for processing")
+            return claimed
+            
+        except Exception as e:
+            await self.session.rollback()
+            self.logger.error(f"Failed to claim files for processing: {e}")
+            return []
+    
+    async def claim_file_for_processing(self, file_id: str, user_id: str) -> bool:
+        """
+        Atomically claim one PENDING file for on-demand processing (user-scoped)
+
+        Uses the same conditional PENDING -> PROCESSING update as
+        claim_files_pending_processing, so exactly one of a request and the
+        extraction worker wins the file.
+
+        Returns:
+            True if this call moved the file to PROCESSING
+        """
+        try:
+            result = await self.session.execute(
+                update(UploadedFile)
+                .where(
+                    and_(
+                        UploadedFile.id == file_id,
+                        UploadedFile.owner_id == user_id,
+                        UploadedFile.processing_status == ProcessingStatus.PENDING
+                    )
+                )
+                .values(
+                    processing_status=ProcessingStatus.PROCESSING,
+                    processing_error=None
+                )
+            )
+            await self.session.commit()
+            return result.rowcount == 1
+
+        except Exception as e:
+            await self.session.rollback()
+            self.logger.error(f"Failed to claim file {file_id} for processing: {e}")
+            return False
+
+    async def count_files_pending_processing(self) -> int:
+        """Count files waiting for background processing"""
+        try:
+            result = await self.session.execute(
+                select(func.count(UploadedFile.id)).where(
+                    and_(
+                        UploadedFile.processing_status == ProcessingStatus.PENDING,
+                        UploadedFile.upload_status == FileStatus.COMPLETED
+                    )
+                )
+            )
+            return result.scalar() or 0
+            
+        except Exception as e:
+            self.logger.error(f"Failed to count files pending processing: {e}")
+            return 0
+    
+    async def requeue_stale_processing(self, older_than: datetime) -> int:
+        """
+        Move files stuck in PROCESSING back to PENDING
+        
+        Used on worker startup to recover jobs claimed by a worker that died.
+        
+        Args:
+            older_than: Files not updated since this time are requeued
+            
+        Returns:
+            Number of requeued files
+        """
+        try:
+            result = await self.session.execute(
+                update(UploadedFile)
+                .where(
+                    and_(
+                        UploadedFile.processing_status == ProcessingStatus.PROCESSING,
+                        UploadedFile.updated_at < older_than
+                    )
+                )
+                .values(processing_status=ProcessingStatus.PENDING)
+                .execution_options(synchronize_session=False)
+            )
+            await self.session.commit()
+            
+            if result.rowcount:
+                self.logger.warning(f"Requeued {result.rowcount} stale processing files")
+            return result.rowcount or 0
+            
+        except Exception as e:
+            await self.session.rollback()
+            self.logger.error(f"Failed to requeue stale processing files: {e}")
+            return 0
+    
     async def get_file_content(
         self, 
         file_id: str, 
@@ -386,8 +700,18 @@ class FileRepository(BaseRepository[UploadedFile]):
     ) -> Optional[str]:
         """Get extracted content for a file (user-scoped)"""
         try:
-            # Get file and validate ownership
-            file_record = await self.get_file_by_id(file_id, user_id)
+            # Ownership is checked in the query; only the two needed columns are read
+            result = await self.session.execute(
+                select(UploadedFile.processing_status, UploadedFile.extracted_content)
+                .where(
+                    and_(
+                        UploadedFile.id == file_id,
+                        UploadedFile.owner_id == user_id,
+                        UploadedFile.upload_status != FileStatus.DELETED
+                    )
+                )
+            )
+            file_record = result.one_or_none()
             if not file_record:
                 self.logger.warning(f"File not found or access denied: {file_id} for user {user_id}")
                 return None
@@ -403,6 +727,115 @@ class FileRepository(BaseRepository[UploadedFile]):
             self.logger.error(f"Failed to get file content for {file_id}: {e}")
             return None
     
+    async def get_content_source(
+        self,
+        file_id: str,
+        user_id: str
+    ) -> Optional[Any]:
+        """
+        Get what is needed to locate a file's extracted content, without loading it (user-scoped)
+
+        Returns:
+            Row with id, processing_status, processing_error, file_hash and
+            file_path, or None if not found / not owned by the user
+        """
+        try:
+            result = await self.session.execute(
+                select(
+                    UploadedFile.id,
+                    UploadedFile.processing_status,
+                    UploadedFile.processing_error,
+                    UploadedFile.file_hash,
+                    UploadedFile.file_path
+                )
+                .where(
+                    and_(
+                        UploadedFile.id == file_id,
+                        UploadedFile.owner_id == user_id,
+                        UploadedFile.upload_status != FileStatus.DELETED
+                    )
+                )
+            )
+            return result.one_or_none()
+
+        except Exception as e:
+            self.logger.error(f"Failed to get content source for {file_id}: {e}")
+            return None
+
+    async def get_content_sources(
+        self,
+        file_ids: List[str],
+        user_id: str
+    ) -> Dict[str, Any]:
+        """
+        get_content_source for several files in one query (user-scoped)
+
+        Returns:
+            file_id -> row; files not found or not owned by the user are omitted
+        """
+        if not file_ids:
+            return {}
+        try:
+            result = await self.session.execute(
+                select(
+                    UploadedFile.id,
+                    UploadedFile.processing_status,
+                    UploadedFile.processing_error,
+                    UploadedFile.file_hash,
+                    UploadedFile.file_path
+                )
+                .where(
+                    and_(
+                        UploadedFile.id.in_(set(file_ids)),
+                        UploadedFile.owner_id == user_id,
+                        UploadedFile.upload_status != FileStatus.DELETED
+                    )
+                )
+            )
+            return {row.id: row for row in result}
+
+        except Exception as e:
+            self.logger.error(f"Failed to get content sources for user {user_id}: {e}")
+            return {}
+
+    async def get_file_contents(
+        self,
+        file_ids: List[str],
+        user_id: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get processing status and extracted content for several files in one query (user-scoped)
+
+        Returns:
+            file_id -> {"processing_status": ProcessingStatus, "extracted_content": str | None};
+            files not found or not owned by the user are omitted
+        """
+        if not file_ids:
+            return {}
+        try:
+            stmt = (
+                select(UploadedFile.id, UploadedFile.processing_status, UploadedFile.extracted_content)
+                .where(
+                    and_(
+                        UploadedFile.id.in_(set(file_ids)),
+                        UploadedFile.owner_id == user_id,
+                        UploadedFile.upload_status != FileStatus.DELETED
+                    )
+                )
+            )
+            result = await self.session.execute(stmt)
+            return {
+                row.id: {
+                    "processing_status": row.processing_status,
+                    "extracted_content": row.extracted_content,
+                }
+                for row in result
+            }
+
+        except Exception as e:
+            self.logger.error(f"Failed to get file contents for user {user_id}: {e}")
+            return {}
+
     async def get_processing_status(
         self, 
         file_id: str, 
@@ -422,7 +855,7 @@ class FileRepository(BaseRepository[UploadedFile]):
                 "content_length": file_record.content_length,
                 "processing_error": file_record.processing_error,
                 "processed_at": file_record.processed_at.isoformat() if file_record.processed_at else None,
-                "has_content": bool(file_record.extracted_content)
+                "has_content": bool(file_record.content_length)  # extracted_content is deferred
             }
             
         except Exception as e:
@@ -0,0 +1,300 @@
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import select, update, func, and_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.generation_job import GenerationJob, JobStatus
+from .base import BaseRepository
+
+logger = logging.getLogger(__name__)
+
+
+class GenerationJobRepository(BaseRepository[GenerationJob]):
+    """Repository for asynchronous generation jobs"""
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(GenerationJob, session)
+
+    async def create_or_get_job(
+        self,
+        user_id: str,
+        request: Dict[str, Any],
+        request_hash: str,
+        idempotency_key: Optional[str] = None
+    ) -> Tuple[GenerationJob, bool]:
+        """
+        Queue a generation job, or return the job already queued under the same key
+
+        The unique (user_id, idempotency_key) constraint settles concurrent
+        retries: the losing insert rolls back and returns the winner's job.
+
+        Args:
+            user_id: Owner of the job
+            request: ExamGenerationRequest as a dict
+            request_hash: SHA-256 of the canonical request
+            idempotency_key: Client-supplied key (None = always create)
+
+        Returns:
+            Tuple of (job, created) - created is False for a replayed key
+        """
+        if idempotency_key:
+            existing = await self.get_job_by_idempotency_key(user_id, idempotency_key)
+            if existing:
+                return existing, False
+
+        job = GenerationJob(
+            user_id=user_id,
+            idempotency_key=idempotency_key,
+            request=request,
+            request_hash=request_hash,
+            status=JobStatus.QUEUED,
+            progress=0,
+            attempts=0
+        )
+        self.session.add(job)
+        try:
+            await self.session.commit()
+            await self.session.refresh(job)
+            self.logger.info(f"Queued generation job {job.id} for user {user_id}")
+            return job, True
+
+        except IntegrityError:
+            # A concurrent retry with the same key inserted first
+            await self.session.rollback()
+            existing = await self.get_job_by_idempotency_key(user_id, idempotency_key)
+            if existing is None:
+                raise
+            return existing, False
+        except Exception as e:
+            await self.session.rollback()
+            self.logger.error(f"Failed to queue generation job for user {user_id}: {e}")
+            raise
+
+    async def get_job_by_idempotency_key(self, user_id: str, idempotency_key: str) -> Optional[GenerationJob]:
+        """Get a user's job by idempotency key"""
+        result = await self.session.execute(
+            select(GenerationJob).where(
+                and_(
+                    GenerationJob.user_id == user_id,
+                    GenerationJob.idempotency_key == idempotency_key
+                )
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def get_job_for_user(self, job_id: str, user_id: str) -> Optional[GenerationJob]:
+        """
+        Get job by ID (user-scoped)
+
+        Always reads the current row, so pollers see updates made by the worker.
+        """
+        try:
+            result = await self.session.execute(
+                select(GenerationJob)
+                .where(
+                    and_(
+                        GenerationJob.id == job_id,
+                        GenerationJob.user_id == user_id
+                    )
+                )
+                .execution_options(populate_existing=True)
+            )
+            return result.scalar_one_or_none()
+
+        except Exception as e:
+            self.logger.error(f"Failed to get generation job {job_id}: {e}")
+            return None
+
+    async def claim_queued_jobs(self, limit: int = 10) -> List[GenerationJob]:
+        """
+        Atomically claim QUEUED jobs for execution
+
+        Claimed rows are moved to RUNNING so no other worker picks them up.
+        PostgreSQL uses SELECT ... FOR UPDATE SKIP LOCKED; other dialects (SQLite)
+        fall back to a conditional UPDATE per row and keep only rows whose
+        status actually changed.
+
+        Args:
+            limit: Maximum number of jobs to claim
+
+        Returns:
+            List of claimed jobs (status RUNNING)
+        """
+        if limit <= 0:
+            return []
+
+        now = datetime.now(timezone.utc)
+        claim_values = {
+            "status": JobStatus.RUNNING,
+            "progress": 10,
+            "attempts": GenerationJob.attempts + 1,
+            "started_at": now,
+        }
+
+        try:
+            if self.session.bind.dialect.name == "postgresql":
+                result = await self.session.execute(
+                    select(GenerationJob.id)
+                    .where(GenerationJob.status == JobStatus.QUEUED)
+                    .order_by(GenerationJob.created_at.asc())
+                    .limit(limit)
+                    .with_for_update(skip_locked=True)
+                )
+                claimed_ids = list(result.scalars().all())
+                if claimed_ids:
+                    await self.session.execute(
+                        update(GenerationJob)
+                        .where(GenerationJob.id.in_(claimed_ids))
+                        .values(**claim_values)
+                        .execution_options(synchronize_session=False)
+                    )
+            else:
+                result = await self.session.execute(
+                    select(GenerationJob.id)
+                    .where(GenerationJob.status == JobStatus.QUEUED)
+                    .order_by(GenerationJob.created_at.asc())
+                    .limit(limit)
+                )
+                candidate_ids = list(result.scalars().all())
+
+                claimed_ids = []
+                for job_id in candidate_ids:
+                    update_result = await self.session.execute(
+                        update(GenerationJob)
+                        .where(
+                            and_(
+                                GenerationJob.id == job_id,
+                                GenerationJob.status == JobStatus.QUEUED
+                            )
+                        )
+                        .values(**claim_values)
+                        .execution_options(synchronize_session=False)
+                    )
+                    if update_result.rowcount == 1:
+                        claimed_ids.append(job_id)
+
+            claimed = []
+            if claimed_ids:
+                result = await self.session.execute(
+                    select(GenerationJob)
+                    .where(GenerationJob.id.in_(claimed_ids))
+                    .order_by(GenerationJob.created_at.asc())
+                    .execution_options(populate_existing=True)
+                )
+                claimed = list(result.scalars().all())
+
+            await self.session.commit()
+
+            if claimed:
+                self.logger.info(f"Claimed {len(claimed)} generation jobs")
+            return claimed
+
+        except Exception as e:
+            await self.session.rollback()
+            self.logger.error(f"Failed to claim generation jobs: {e}")
+            return []
+
+    async def complete_job(self, job_id: str, result: Dict[str, Any]) -> bool:
+        """Store the generated exam and mark the job COMPLETED"""
+        return await self._finish(
+            job_id,
+            status=JobStatus.COMPLETED,
+            result=result,
+            error_message=None
+        )
+
+    async def fail_job(self, job_id: str, error_message: str) -> bool:
+        """Mark the job FAILED with an error message"""
+        return await self._finish(
+            job_id,
+            status=JobStatus.FAILED,
+            error_message=error_message
+        )
+
+    async def _finish(self, job_id: str, **values) -> bool:
+        try:
+            result = await self.session.execute(
+                update(GenerationJob)
+                .where(
+                    and_(
+                        GenerationJob.id == job_id,
+                        GenerationJob.status == JobStatus.RUNNING
+                    )
+                )
+                .values(progress=100, completed_at=datetime.now(timezone.utc), **values)
+                .execution_options(synchronize_session=False)
+            )
+            await self.session.commit()
+            return result.rowcount == 1
+
+        except Exception as e:
+            await self.session.rollback()
+            self.logger.error(f"Failed to finish generation job {job_id}: {e}")
+            return False
+
+    async def count_jobs_by_status(self) -> Dict[str, int]:
+        """Count jobs per status for monitoring"""
+        try:
+            result = await self.session.execute(
+                select(GenerationJob.status, func.count(GenerationJob.id))
+                .group_by(GenerationJob.status)
+            )
+            counts = {status.value: 0 for status in JobStatus}
+            for status, count in result.all():
+                counts[status.value] = count
+            return counts
+
+        except Exception as e:
+            self.logger.error(f"Failed to count generation jobs: {e}")
+            return {}
+
+    async def requeue_stale_running(self, older_than: datetime, max_attempts: int) -> int:
+        """
+        Recover jobs stuck in RUNNING after a worker died
+
+        Jobs with attempts left go back to QUEUED; the rest are marked FAILED
+        so a job that keeps crashing workers is not billed forever.
+
+        Args:
+            older_than: Jobs started before this time are recovered
+            max_attempts: Attempts after which a stale job is failed
+
+        Returns:
+            Number of requeued jobs
+        """
+        stale = and_(
+            GenerationJob.status == JobStatus.RUNNING,
+            GenerationJob.started_at < older_than
+        )
+        try:
+            result = await self.session.execute(
+                update(GenerationJob)
+                .where(and_(stale, GenerationJob.attempts < max_attempts))
+                .values(status=JobStatus.QUEUED, progress=0)
+                .execution_options(synchronize_session=False)
+            )
+            requeued = result.rowcount or 0
+
+            result = await self.session.execute(
+                update(GenerationJob)
+                .where(stale)
+                .values(
+                    status=JobStatus.FAILED,
+                    error_message="Generation interrupted too many times",
+                    completed_at=datetime.now(timezone.utc)
+                )
+                .execution_options(synchronize_session=False)
+            )
+            failed = result.rowcount or 0
+            await self.session.commit()
+
+            if requeued or failed:
+                self.logger.warning(f"Recovered stale generation jobs: {requeued} requeued, {failed} failed")
+            return requeued
+
+        except Exception as e:
+            await self.session.rollback()
+            self.logger.error(f"Failed to requeue stale generation jobs: {e}")
+            return 0
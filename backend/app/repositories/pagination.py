@@ -0,0 +1,149 @@
+"""
+Keyset pagination helpers
+Newest-first pages ordered by (created_at, id) with opaque cursors, plus cached totals
+"""
+
+import base64
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, Iterator, List, Optional, Tuple, TypeVar
+
+from sqlalchemy import Select, and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class Page(Generic[T]):
+    """
+    One page of rows and the cursor for the next one
+
+    Iterates and indexes like the list of items.
+    """
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __getitem__(self, index):
+        return self.items[index]
+
+
+def encode_cursor(created_at: datetime, id: str) -> str:
+    """Opaque cursor pointing just after (created_at, id)"""
+    raw = json.dumps([created_at.isoformat(), id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    Raises:
+        ValueError: If the cursor was not produced by encode_cursor
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, id = json.loads(raw)
+        return datetime.fromisoformat(created_at), str(id)
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+
+async def keyset_page(
+    session: AsyncSession,
+    query: Select,
+    model: Any,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+) -> Page:
+    """
+    Run query as one newest-first keyset page
+
+    Rows are ordered by (created_at DESC, id DESC). The boundary is read from
+    the cursor's own row inside the same statement, so it compares in the
+    database's stored representation; the timestamp encoded in the cursor is
+    only used if that row no longer exists. Every page is an index range scan
+    of limit + 1 rows, however deep it is.
+
+    Args:
+        session: Database session
+        query: select() of model with any filters applied
+        model: Mapped class with created_at and id columns
+        cursor: next_cursor of the previous page, or None for the first page
+        limit: Maximum rows per page
+
+    Raises:
+        ValueError: If the cursor is invalid
+    """
+    if cursor:
+        created_at, id = decode_cursor(cursor)
+        anchor = select(model.created_at).where(model.id == id).scalar_subquery()
+        boundary = func.coalesce(anchor, created_at)
+        query = query.where(or_(
+            model.created_at < boundary,
+            and_(model.created_at == boundary, model.id < id),
+        ))
+
+    result = await session.execute(
+        query.order_by(model.created_at.desc(), model.id.desc()).limit(limit + 1)
+    )
+    rows = list(result.scalars().all())
+
+    if len(rows) <= limit:
+        return Page(rows)
+    last = rows[limit - 1]
+    return Page(rows[:limit], encode_cursor(last.created_at, last.id))
+
+
+class CountCache:
+    """
+    Short-lived cache of COUNT(*) totals for list views
+
+    Totals are served for up to ttl seconds instead of counting on every
+    page. Writers that change a count they know about invalidate it.
+    """
+
+    def __init__(self, ttl: Optional[float] = None):
+        self.ttl = ttl if ttl is not None else settings.pagination_count_ttl
+        self._counts: Dict[Hashable, Tuple[float, int]] = {}
+
+    async def get_or_count(self, key: Hashable, count: Callable[[], Awaitable[int]]) -> int:
+        item = self._counts.get(key)
+        now = time.monotonic()
+        if item is not None and item[0] > now:
+            return item[1]
+
+        total = await count()
+        self._counts[key] = (now + self.ttl, total)
+        return total
+
+    def invalidate(self, *keys: Hashable) -> None:
+        for key in keys:
+            self._counts.pop(key, None)
+
+
+# Shared cache instance
+_count_cache: Optional[CountCache] = None
+
+
+def get_count_cache() -> CountCache:
+    """Get (or lazily create) the shared count cache"""
+    global _count_cache
+    if _count_cache is None:
+        _count_cache = CountCache()
+    return _count_cache
@@ -1,11 +1,12 @@
-from pydantic import BaseModel, field_validator
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, field_validator, model_validator
+from typing import Optional, List, Dict, Any, Union
 from datetime import datetime
 from enum import Enum
 
 class ExamGenerationRequest(BaseModel):
     # Core fields (existing)
-    content: str  # Renamed from file_content
+    content: Optional[str] = None  # Renamed from file_content
+    file_id: Optional[str] = None  # Uploaded file; extracted text is loaded server-side
     question_count: int = 10  # Renamed from num_questions
     subject: Optional[str] = None
     language: Optional[str] = "vi"
@@ -34,12 +35,28 @@ class ExamGenerationRequest(BaseModel):
             raise ValueError("AI provider must be openai, gemini, or mock")
         return v
 
+    @model_validator(mode='after')
+    def validate_source(self):
+        if bool(self.content) == bool(self.file_id):
+            raise ValueError("Provide exactly one of content or file_id")
+        return self
+
+class BatchGenerationItem(ExamGenerationRequest):
+    """One exam of a batch: inline content or an uploaded file's extracted text"""
+
+class BatchGenerationRequest(BaseModel):
+    items: List[BatchGenerationItem]
+
 class SaveExamRequest(BaseModel):
     title: str
     questions: List[dict]
     description: Optional[str] = None
     duration_minutes: Optional[int] = 30
 
+class SubmitAttemptRequest(BaseModel):
+    """Answers by question ID, or a list in question order (None = unanswered)"""
+    answers: Union[Dict[str, Optional[str]], List[Optional[str]]]
+
 class QuestionResponse(BaseModel):
     """Single question response for 4-choice multiple choice"""
     question_text: str
@@ -67,9 +67,9 @@ class FileListItem(BaseModel):
 class PaginationInfo(BaseModel):
     """Pagination information"""
     count: int = Field(..., description="Number of items in current page")
-    total_count: int = Field(..., description="Total number of items")
-    skip: int = Field(..., description="Number of items skipped")
+    total_count: int = Field(..., description="Total number of items (cached briefly, may lag recent uploads)")
     limit: int = Field(..., description="Maximum items per page")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page")
     has_more: bool = Field(..., description="Whether more items are available")
 
 
@@ -2,10 +2,14 @@ from .email_service import EmailService
 from .exam_service import ExamService
 from .upload_service import UploadService
 from .document_service import DocumentService
+from .blob_service import BlobService
+from .grading_service import GradingService
 
 __all__ = [
     "EmailService",
     "ExamService", 
     "UploadService",
-    "DocumentService"
+    "DocumentService",
+    "BlobService",
+    "GradingService"
 ]
\ No newline at end of file
@@ -0,0 +1,107 @@
+"""
+Exam answer key
+Compact array form of an exam's correct answers, used to grade submissions
+"""
+
+from array import array
+from dataclasses import dataclass, field
+from itertools import compress
+from operator import eq
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from app.models.exam import Exam
+
+# Answers by question ID, or positionally in question order
+Answers = Union[Mapping[str, Optional[str]], Sequence[Optional[str]]]
+
+# Code for a missing or unknown answer; never matches the key
+NO_ANSWER = 0
+
+
+def _normalize(answer: Any) -> Optional[str]:
+    return answer.strip().upper() if isinstance(answer, str) else None
+
+
+@dataclass(frozen=True)
+class GradeResult:
+    """Graded outcome of one submission"""
+    score: int
+    max_score: int
+    percentage: float
+    passed: Optional[bool]
+    results: List[bool]  # correctness per question, in order
+
+    @property
+    def correct_count(self) -> int:
+        return self.results.count(True)
+
+
+@dataclass(frozen=True)
+class AnswerKey:
+    """
+    An exam's correct answers in compact array form
+
+    Each distinct answer string gets a small integer code, so the key and every
+    encoded submission are flat uint16 arrays of the same length. Grading is
+    then a single C-level map(eq) over the two arrays instead of a per-question
+    Python loop, and one key grades any number of submissions.
+    """
+    exam_id: str
+    question_ids: Tuple[str, ...]
+    answers: array
+    points: Tuple[int, ...]
+    max_score: int
+    passing_score: Optional[int] = None  # percentage needed to pass
+    codes: Dict[str, int] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_payload(
+        cls, exam_id: str, payload: Dict[str, Any], passing_score: Optional[int] = None
+    ) -> "AnswerKey":
+        """Build the key from an exam payload (see build_exam_payload)"""
+        codes: Dict[str, int] = {}
+        answers = array('H', (
+            codes.setdefault(_normalize(answer) or "", len(codes) + 1)
+            for answer in payload['answer_key']
+        ))
+        points = tuple(q['points'] for q in payload['questions'])
+        return cls(
+            exam_id=exam_id,
+            question_ids=tuple(q['id'] for q in payload['questions']),
+            answers=answers,
+            points=points,
+            max_score=sum(points),
+            passing_score=passing_score,
+            codes=codes,
+        )
+
+    @classmethod
+    def from_exam(cls, exam: Exam) -> "AnswerKey":
+        return cls.from_payload(exam.id, exam.payload, exam.passing_score)
+
+    def __len__(self) -> int:
+        return len(self.answers)
+
+    def encode(self, answers: Answers) -> array:
+        """Encode a submission into the key's compact form"""
+        codes = self.codes
+        if isinstance(answers, Mapping):
+            values = [answers.get(question_id) for question_id in self.question_ids]
+        else:
+            values = list(answers[:len(self.answers)])
+            values.extend([None] * (len(self.answers) - len(values)))
+
+        return array('H', [codes.get(_normalize(value), NO_ANSWER) for value in values])
+
+    def grade(self, answers: Answers) -> GradeResult:
+        """Grade one submission"""
+        results = list(map(eq, self.answers, self.encode(answers)))
+        score = sum(compress(self.points, results))
+
+        percentage = round(score * 100 / self.max_score, 2) if self.max_score else 0.0
+        passed = percentage >= self.passing_score if self.passing_score is not None else None
+        return GradeResult(score, self.max_score, percentage, passed, results)
+
+    def grade_many(self, submissions: Sequence[Answers]) -> List[GradeResult]:
+        """Grade a batch of submissions against this key"""
+        return [self.grade(answers) for answers in submissions]
@@ -0,0 +1,213 @@
+import os
+import asyncio
+import logging
+import hashlib
+from typing import Dict, Any, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.file import FileBlob, StorageType
+from app.repositories.blob_repository import BlobRepository
+from app.repositories.file_repository import FileRepository
+from app.storage import StorageBackend, get_storage_backend
+
+logger = logging.getLogger(__name__)
+
+# Read size used when hashing legacy files during migration
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class BlobService:
+    """
+    Content-addressed storage for uploaded file bytes
+
+    Each unique content is stored once under its SHA-256 at key
+    blobs/ab/cd/<hash><ext> of the configured storage backend; UploadedFile
+    rows keep per-user metadata and point at the blob. Blobs are reference
+    counted and unlinked when the last file referencing them is deleted.
+    """
+
+    def __init__(self, db: AsyncSession, storage: Optional[StorageBackend] = None):
+        self.db = db
+        self.blob_repo = BlobRepository(db)
+        self.file_repo = FileRepository(db)
+        self.storage = storage or get_storage_backend()
+
+    def blob_path(self, file_hash: str, extension: str = "") -> str:
+        """
+        Get storage location for content hash in the configured backend
+
+        Args:
+            file_hash: SHA-256 hash of content
+            extension: File extension (kept so processors can detect type)
+
+        Returns:
+            Sharded blob location (filesystem path or object key)
+        """
+        key = f"blobs/{file_hash[:2]}/{file_hash[2:4]}/{file_hash}{extension.lower()}"
+        return self.storage.location_for(key)
+
+    def backend_for(self, storage_type: StorageType) -> StorageBackend:
+        """Get backend holding blobs of storage_type (blobs outlive backend switches)"""
+        if storage_type == self.storage.storage_type:
+            return self.storage
+        return get_storage_backend(storage_type)
+
+    @staticmethod
+    def _hash_file(file_path: str) -> str:
+        hasher = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    async def store(
+        self,
+        temp_path: str,
+        file_hash: str,
+        size: int,
+        extension: str = "",
+        content_type: Optional[str] = None
+    ) -> FileBlob:
+        """
+        Take a reference to the blob for file_hash, writing bytes only if new
+
+        Args:
+            temp_path: Fully written temp file (consumed if the blob is new)
+            file_hash: SHA-256 hash of content
+            size: Content size in bytes
+            extension: Original file extension
+            content_type: MIME type stored with the object
+
+        Returns:
+            Blob holding the content (caller owns one reference)
+        """
+        blob, created = await self.blob_repo.acquire(
+            file_hash, self.blob_path(file_hash, extension), size, self.storage.storage_type
+        )
+        storage = self.backend_for(blob.storage_type)
+
+        # Also heal blobs whose bytes went missing or were stored truncated
+        stored_size = None if created else await storage.size(blob.file_path)
+        if created or stored_size != size:
+            if stored_size is not None:
+                logger.warning(f"Rewriting blob {file_hash[:12]}: stored {stored_size} bytes, expected {size}")
+            try:
+                await storage.save_file(temp_path, blob.file_path, content_type)
+                logger.info(f"Stored new blob: {blob.file_path}")
+            except Exception:
+                await self.blob_repo.release(blob.id)
+                raise
+        else:
+            logger.info(f"Reusing stored blob {file_hash[:12]} (refs={blob.ref_count})")
+
+        return blob
+
+    async def release(self, blob_id: str) -> bool:
+        """
+        Drop one reference and unlink the bytes if it was the last one
+
+        Args:
+            blob_id: ID of blob
+
+        Returns:
+            True if blob bytes were removed from storage
+        """
+        removed = False
+
+        async def unlink(blob: FileBlob) -> None:
+            # Runs inside the transaction deleting the row (see BlobRepository.release);
+            # a failure leaves orphaned bytes, which a later upload simply overwrites
+            nonlocal removed
+            try:
+                removed = await self.backend_for(blob.storage_type).delete(blob.file_path)
+            except Exception as e:
+                logger.error(f"Failed to remove blob from storage: {blob.file_path}: {e}")
+                return
+            if removed:
+                logger.info(f"Blob removed from storage: {blob.file_path}")
+            else:
+                logger.warning(f"Blob already missing from storage: {blob.file_path}")
+
+        await self.blob_repo.release(blob_id, unlink=unlink)
+        return removed
+
+    async def migrate_legacy_files(self, batch_size: int = 100, dry_run: bool = False) -> Dict[str, Any]:
+        """
+        Move files stored at per-upload paths into the blob store
+
+        The first copy of each content is moved to its blob location in the
+        configured backend (a rename for local storage); later copies are
+        attached to the same blob and their per-upload file is deleted once
+        the record points at the blob.
+
+        Args:
+            batch_size: Records fetched per query
+            dry_run: Only report what would happen
+
+        Returns:
+            Migration statistics
+        """
+        stats = {"migrated": 0, "deduplicated": 0, "missing": 0, "failed": 0, "bytes_reclaimed": 0}
+        seen_hashes = set()
+        skipped = []
+
+        while True:
+            files = await self.file_repo.get_files_without_blob(limit=batch_size, exclude_ids=skipped)
+            if not files:
+                break
+
+            for file_record in files:
+                legacy_path = file_record.file_path
+
+                if not os.path.exists(legacy_path):
+                    logger.warning(f"Skipping {file_record.id}: file missing at {legacy_path}")
+                    stats["missing"] += 1
+                    skipped.append(file_record.id)
+                    continue
+
+                try:
+                    file_hash = file_record.file_hash or await asyncio.to_thread(self._hash_file, legacy_path)
+                    extension = os.path.splitext(legacy_path)[1]
+
+                    if dry_run:
+                        is_duplicate = file_hash in seen_hashes or await self.blob_repo.get_by_hash(file_hash) is not None
+                        seen_hashes.add(file_hash)
+                        stats["deduplicated" if is_duplicate else "migrated"] += 1
+                        if is_duplicate:
+                            stats["bytes_reclaimed"] += file_record.size
+                        skipped.append(file_record.id)
+                        continue
+
+                    blob, created = await self.blob_repo.acquire(
+                        file_hash, self.blob_path(file_hash, extension), file_record.size, self.storage.storage_type
+                    )
+                    storage = self.backend_for(blob.storage_type)
+                    created = created or not await storage.exists(blob.file_path)
+
+                    # Point record at blob first so a failed copy can be rolled back
+                    await self.file_repo.attach_blob(
+                        file_record.id, blob.id, blob.file_path, file_hash, blob.storage_type
+                    )
+                    if created:
+                        try:
+                            await storage.save_file(legacy_path, blob.file_path, file_record.content_type)
+                        except Exception:
+                            await self.file_repo.attach_blob(
+                                file_record.id, None, legacy_path, file_hash, StorageType.LOCAL
+                            )
+                            await self.blob_repo.release(blob.id)
+                            raise
+                        stats["migrated"] += 1
+                    else:
+                        await asyncio.to_thread(os.remove, legacy_path)
+                        stats["deduplicated"] += 1
+                        stats["bytes_reclaimed"] += file_record.size
+
+                except Exception as e:
+                    logger.error(f"Failed to migrate file {file_record.id}: {e}")
+                    stats["failed"] += 1
+                    skipped.append(file_record.id)
+
+        logger.info(f"Blob store migration finished: {stats}")
+        return stats
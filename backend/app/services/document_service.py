@@ -1,12 +1,13 @@
+import asyncio
 import logging
-import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.processors import DocumentProcessor, ProcessingResult
+from app.processors import DocumentProcessor, ProcessingResult, get_extraction_cache
 from app.repositories.file_repository import FileRepository
 from app.models.file import ProcessingStatus
+from app.storage import get_storage_backend
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +18,7 @@ class DocumentService:
         self.db = db
         self.file_repo = FileRepository(db)
         self.document_processor = DocumentProcessor()
+        self.extraction_cache = get_extraction_cache()
         self.logger = logger
 
     async def process_uploaded_file(self, file_id: str, user_id: str) -> Dict[str, Any]:
@@ -33,91 +35,166 @@ class DocumentService:
         try:
             self.logger.info(f"Starting document processing for file: {file_id}")
             
-            # Get file record
-            file_record = await self.file_repo.get_file_by_id(file_id, user_id)
-            if not file_record:
-                error_msg = f"File not found: {file_id}"
-                self.logger.error(error_msg)
-                return {
-                    "success": False,
-                    "file_id": file_id,
-                    "error": error_msg
-                }
-            
-            # Check if file is ready for processing
-            if file_record.processing_status != ProcessingStatus.PENDING:
-                self.logger.info(f"File {file_id} already processed: {file_record.processing_status}")
-                return {
-                    "success": True,
-                    "file_id": file_id,
-                    "status": file_record.processing_status.value,
-                    "message": "File already processed"
-                }
-            
-            # Update status to PROCESSING
-            await self.file_repo.update_processing_status(
-                file_id, 
-                ProcessingStatus.PROCESSING
-            )
+            file_record, skipped = await self._claim_file(file_id, user_id)
+            if skipped is not None:
+                return skipped
             
             # Extract content using processors
             processing_result = await self._extract_file_content(file_record)
             
-            # Update database with results
-            if processing_result["success"]:
-                await self._save_processing_success(file_record, processing_result)
-                return {
-                    "success": True,
-                    "file_id": file_id,
-                    "content_length": len(processing_result["content"]),
-                    "processing_time": processing_result.get("processing_time", 0),
-                    "message": "Document processed successfully"
-                }
-            else:
-                await self._save_processing_failure(file_record, processing_result["error"])
-                return {
-                    "success": False,
-                    "file_id": file_id,
-                    "error": processing_result["error"],
-                    "message": "Document processing failed"
-                }
+            return await self._finish_processing(file_record, processing_result)
                 
         except Exception as e:
-            error_msg = f"Unexpected error processing file {file_id}: {str(e)}"
-            self.logger.error(error_msg)
+            return await self._processing_error(file_id, e)
+    
+    async def process_uploaded_files(self, file_ids: List[str], user_id: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Process several uploaded files, extracting them concurrently
+        
+        Files are claimed exactly like in process_uploaded_file. The session
+        is only used sequentially: every file is claimed before extraction
+        starts and results are saved one at a time once it finishes.
+        
+        Args:
+            file_ids: IDs of files to process
+            user_id: ID of user who owns the files
             
-            # Update status to FAILED
+        Returns:
+            file_id -> processing result as returned by process_uploaded_file
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        claimed = []
+        for file_id in dict.fromkeys(file_ids):
             try:
-                await self.file_repo.update_processing_status(
-                    file_id, 
-                    ProcessingStatus.FAILED, 
-                    error_msg
-                )
-            except:
-                pass  # Don't fail if we can't update status
-            
-            return {
+                file_record, skipped = await self._claim_file(file_id, user_id)
+            except Exception as e:
+                results[file_id] = await self._processing_error(file_id, e)
+                continue
+            if skipped is not None:
+                results[file_id] = skipped
+            else:
+                claimed.append(file_record)
+        
+        if claimed:
+            self.logger.info(f"Extracting {len(claimed)} files concurrently")
+        extractions = await asyncio.gather(*(self._extract_file_content(r) for r in claimed))
+        
+        for file_record, processing_result in zip(claimed, extractions):
+            try:
+                results[file_record.id] = await self._finish_processing(file_record, processing_result)
+            except Exception as e:
+                results[file_record.id] = await self._processing_error(file_record.id, e)
+        return results
+    
+    async def _claim_file(self, file_id: str, user_id: str) -> Tuple[Any, Optional[Dict[str, Any]]]:
+        """
+        Load and claim a file for processing
+        
+        Returns:
+            (file_record, None) if this call claimed it, else (None, result)
+            with the reason it is not processed here
+        """
+        # Get file record
+        file_record = await self.file_repo.get_file_by_id(file_id, user_id)
+        if not file_record:
+            error_msg = f"File not found: {file_id}"
+            self.logger.error(error_msg)
+            return None, {
                 "success": False,
                 "file_id": file_id,
                 "error": error_msg
             }
+        
+        # Check if file is ready for processing
+        if file_record.processing_status != ProcessingStatus.PENDING:
+            self.logger.info(f"File {file_id} already processed: {file_record.processing_status}")
+            return None, {
+                "success": True,
+                "file_id": file_id,
+                "status": file_record.processing_status.value,
+                "message": "File already processed"
+            }
+        
+        # Claim PENDING -> PROCESSING atomically; the extraction worker
+        # may have claimed the file since it was read
+        if not await self.file_repo.claim_file_for_processing(file_id, user_id):
+            self.logger.info(f"File {file_id} already claimed for processing")
+            return None, {
+                "success": True,
+                "file_id": file_id,
+                "status": ProcessingStatus.PROCESSING.value,
+                "message": "File is already being processed"
+            }
+        
+        return file_record, None
+    
+    async def _finish_processing(self, file_record, processing_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Save an extraction outcome and build the processing result"""
+        if processing_result["success"]:
+            await self._save_processing_success(file_record, processing_result)
+            return {
+                "success": True,
+                "file_id": file_record.id,
+                "content_length": len(processing_result["content"]),
+                "processing_time": processing_result.get("processing_time", 0),
+                "message": "Document processed successfully"
+            }
+        
+        await self._save_processing_failure(file_record, processing_result["error"])
+        return {
+            "success": False,
+            "file_id": file_record.id,
+            "error": processing_result["error"],
+            "message": "Document processing failed"
+        }
+    
+    async def _processing_error(self, file_id: str, exc: Exception) -> Dict[str, Any]:
+        """Mark a file FAILED after an unexpected error"""
+        error_msg = f"Unexpected error processing file {file_id}: {str(exc)}"
+        self.logger.error(error_msg)
+        
+        # Update status to FAILED
+        try:
+            await self.file_repo.update_processing_status(
+                file_id, 
+                ProcessingStatus.FAILED, 
+                error_msg
+            )
+        except:
+            pass  # Don't fail if we can't update status
+        
+        return {
+            "success": False,
+            "file_id": file_id,
+            "error": error_msg
+        }
     
     async def _extract_file_content(self, file_record) -> Dict[str, Any]:
         """Extract content from file using processors"""
         try:
             file_path = file_record.file_path
+            storage = get_storage_backend(file_record.storage_type)
             
-            # Check if file exists on filesystem
-            if not os.path.exists(file_path):
+            # Check if file exists in storage
+            if not await storage.exists(file_path):
                 return {
                     "success": False,
-                    "error": f"File not found on filesystem: {file_path}"
+                    "error": f"File not found in storage: {file_path}"
                 }
             
             self.logger.info(f"Extracting content from: {file_path}")
             
-            # Use document processor to extract content
-            result = await self.document_processor.extract_text(file_path)
+            async def extract():
+                # Processors need a filesystem path; remote blobs are fetched to a temp file
+                async with storage.local_copy(file_path) as local_path:
+                    return await self.document_processor.extract_text(local_path)
+            
+            # Identical bytes already extracted (by anyone) become a cache lookup
+            result = await self.extraction_cache.get_or_extract(
+                file_record.file_hash,
+                self.document_processor.get_processor_version(file_path),
+                extract
+            )
             
             if result.success:
                 self.logger.info(f"Successfully extracted {len(result.content)} characters")
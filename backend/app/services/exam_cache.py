@@ -0,0 +1,287 @@
+"""
+Exam read cache
+Serves an exam's student view, access fields and answer key without touching the database
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
+
+from app.core.config import settings
+from app.database.redis import RedisManager
+from app.models.exam import Exam
+from app.models.user import User, UserRole
+from app.repositories.exam_repository import ExamRepository
+from app.services.answer_key import AnswerKey
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "exam:invalidate"
+
+# Fields hidden from students taking the exam
+_ANSWER_FIELDS = ("correct_answer", "explanation")
+
+
+@dataclass(frozen=True)
+class CachedExam:
+    """
+    Everything high-fanout exam traffic needs from one exam
+
+    student_view is shared by every request that hits the entry and must be
+    treated as read-only.
+    """
+    exam_id: str
+    version: str  # updated_at of the row the entry was built from
+    creator_id: Optional[str]
+    is_public: bool
+    student_view: Dict[str, Any]
+    answer_key: AnswerKey
+
+    @classmethod
+    def from_exam(cls, exam: Exam) -> "CachedExam":
+        questions = [
+            {name: value for name, value in question.items() if name not in _ANSWER_FIELDS}
+            for question in exam.payload['questions']
+        ]
+        return cls(
+            exam_id=exam.id,
+            version=exam.updated_at.isoformat() if exam.updated_at else "",
+            creator_id=exam.creator_id,
+            is_public=bool(exam.is_public),
+            student_view={
+                'id': exam.id,
+                'title': exam.title,
+                'description': exam.description,
+                'questions': questions,
+                'duration_minutes': exam.duration_minutes,
+                'created_at': exam.created_at,
+                'is_public': exam.is_public,
+                'creator_id': exam.creator_id,
+            },
+            answer_key=AnswerKey.from_exam(exam),
+        )
+
+    def is_manager(self, user: User) -> bool:
+        """Owner or admin: sees answers and may edit"""
+        return user.role == UserRole.ADMIN or self.creator_id == user.id
+
+    def can_access(self, user: User) -> bool:
+        return self.is_public or self.is_manager(user)
+
+
+class ExamCache:
+    """
+    Read-through, in-process cache of CachedExam entries
+
+    - Misses load the exam row (with its payload) once and build the entry
+    - Hits need no database queries
+    - Any committed change to an Exam row drops its entry locally and is
+      published on Redis pub/sub so other app instances drop theirs
+    - Entries expire after a TTL, which bounds staleness if Redis is down
+
+    Entries record the updated_at version they were built from; fills that
+    raced with an invalidation are not stored.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl: Optional[int] = None,
+        enabled: Optional[bool] = None,
+    ):
+        self.max_entries = max_entries or settings.exam_cache_max_entries
+        self.ttl = ttl or settings.exam_cache_ttl
+        self.enabled = settings.exam_cache_enabled if enabled is None else enabled
+
+        self._entries: "OrderedDict[str, Tuple[float, CachedExam]]" = OrderedDict()
+        self._generation = 0  # bumped by every invalidation
+        self._listener: Optional[asyncio.Task] = None
+        self._publishes: Set[asyncio.Task] = set()
+
+        # Counters for monitoring
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+        self.errors = 0
+
+    async def get(self, exam_id: str, session: AsyncSession) -> Optional[CachedExam]:
+        """
+        Get an exam's cache entry, loading it through session on a miss
+
+        Returns:
+            CachedExam, or None if the exam does not exist
+        """
+        entry = self._lookup(exam_id)
+        if entry is not None:
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        generation = self._generation
+        exam = await ExamRepository(session).get_with_payload(exam_id)
+        if exam is None:
+            return None
+
+        entry = CachedExam.from_exam(exam)
+        if self.enabled and generation == self._generation:
+            self._store(entry)
+        return entry
+
+    def invalidate_local(self, exam_ids: Iterable[str]) -> None:
+        """Drop entries in this process only"""
+        self._generation += 1
+        for exam_id in exam_ids:
+            if self._entries.pop(exam_id, None) is not None:
+                self.invalidations += 1
+
+    async def invalidate(self, exam_ids: Iterable[str]) -> None:
+        """Drop entries here and in every instance subscribed over Redis"""
+        exam_ids = list(exam_ids)
+        self.invalidate_local(exam_ids)
+        await self._publish(exam_ids)
+
+    def invalidate_soon(self, exam_ids: Iterable[str]) -> None:
+        """Like invalidate, for sync callers: publishing runs in a background task"""
+        exam_ids = list(exam_ids)
+        self.invalidate_local(exam_ids)
+        try:
+            task = asyncio.get_running_loop().create_task(self._publish(exam_ids))
+        except RuntimeError:
+            return  # no event loop (scripts, migrations); nothing else to notify
+        self._publishes.add(task)
+        task.add_done_callback(self._publishes.discard)
+
+    def clear_local(self) -> None:
+        """Drop the whole in-process cache"""
+        self.invalidate_local(list(self._entries))
+
+    async def start(self) -> None:
+        """Subscribe to invalidations from other instances (needs Redis)"""
+        if self._listener is not None or RedisManager.get_connected_client() is None:
+            return
+        self._listener = asyncio.create_task(self._listen())
+        logger.info("Exam cache invalidation listener started")
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+        if self._publishes:
+            await asyncio.gather(*self._publishes, return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics with hit ratio"""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "evictions": self.evictions,
+            "errors": self.errors,
+            "subscribed": self._listener is not None and not self._listener.done(),
+        }
+
+    async def _publish(self, exam_ids: Iterable[str]) -> None:
+        try:
+            redis = RedisManager.get_connected_client()
+            if redis is not None:
+                for exam_id in exam_ids:
+                    await redis.publish(INVALIDATION_CHANNEL, exam_id)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Exam cache invalidation publish failed: {e}")
+
+    def _lookup(self, exam_id: str) -> Optional[CachedExam]:
+        item = self._entries.get(exam_id)
+        if item is None:
+            return None
+        expires_at, entry = item
+        if expires_at < time.monotonic():
+            del self._entries[exam_id]
+            return None
+        self._entries.move_to_end(exam_id)
+        return entry
+
+    def _store(self, entry: CachedExam) -> None:
+        self._entries[entry.exam_id] = (time.monotonic() + self.ttl, entry)
+        self._entries.move_to_end(entry.exam_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def _listen(self) -> None:
+        while True:
+            redis = RedisManager.get_connected_client()
+            if redis is None:
+                return
+            pubsub = redis.pubsub()
+            try:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self.invalidate_local([message["data"]])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.errors += 1
+                # Anything missed while disconnected may be stale
+                self.clear_local()
+                logger.warning(f"Exam cache invalidation listener failed, resubscribing: {e}")
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
+
+# Shared cache instance
+_exam_cache: Optional[ExamCache] = None
+
+
+def get_exam_cache() -> ExamCache:
+    """Get (or lazily create) the shared exam cache"""
+    global _exam_cache
+    if _exam_cache is None:
+        _exam_cache = ExamCache()
+    return _exam_cache
+
+
+# Invalidation: remember exams changed in a flush, drop them once the commit lands
+
+_CHANGED_EXAMS = "changed_exam_ids"
+
+
+def _remember_changed_exam(mapper, connection, exam: Exam) -> None:
+    session = object_session(exam)
+    if session is not None:
+        session.info.setdefault(_CHANGED_EXAMS, set()).add(exam.id)
+
+
+def _invalidate_committed_exams(session: Session) -> None:
+    exam_ids = session.info.pop(_CHANGED_EXAMS, None)
+    if exam_ids:
+        get_exam_cache().invalidate_soon(exam_ids)
+
+
+def _forget_changed_exams(session: Session, previous_transaction) -> None:
+    session.info.pop(_CHANGED_EXAMS, None)
+
+
+event.listen(Exam, "after_update", _remember_changed_exam)
+event.listen(Exam, "after_delete", _remember_changed_exam)
+event.listen(Session, "after_commit", _invalidate_committed_exams)
+event.listen(Session, "after_soft_rollback", _forget_changed_exams)
@@ -3,16 +3,44 @@ Exam Service
 Business logic for exam generation and management
 """
 
+import asyncio
+import hashlib
+import json
 import logging
-from typing import Dict, Any, Optional, List
+import time
+from typing import AsyncIterator, Dict, Any, Optional, List, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+from app.models.file import ProcessingStatus
+from app.models.generation_job import GenerationJob, JobStatus
+from app.models.user import User
 from app.processors.document_processor import DocumentProcessor
 from app.genai.service import GenAIService
 from app.repositories.exam_repository import ExamRepository
+from app.repositories.file_repository import FileRepository
+from app.repositories.generation_job_repository import GenerationJobRepository
+from app.repositories.pagination import get_count_cache
+from app.processors import get_extraction_cache
+from app.services.document_service import DocumentService
+from app.services.exam_cache import get_exam_cache
+from app.schemas.exam_schemas import BatchGenerationItem, ExamGenerationRequest
+from app.workers import get_generation_worker
 
 logger = logging.getLogger(__name__)
 
+MIN_CONTENT_LENGTH = 100  # characters, ignoring surrounding whitespace
+
+
+def _stripped_length(text: str) -> int:
+    """len(text.strip()) without copying the text (file contents can be megabytes)"""
+    start, end = 0, len(text)
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return end - start
+
 
 class ExamService:
     """Service for handling exam-related business logic"""
@@ -25,21 +53,27 @@ class ExamService:
         """Initialize service with required dependencies"""
         self.db_session = db_session
         self.exam_repository = ExamRepository(db_session)
+        self.file_repository = FileRepository(db_session)
+        self.job_repository = GenerationJobRepository(db_session)
         self.document_processor = DocumentProcessor()
+        self.extraction_cache = get_extraction_cache()
+        self.exam_cache = get_exam_cache()
         self.genai_service = genai_service or GenAIService()
         logger.info("ExamService initialized")
     
     async def generate_exam_from_text(
         self,
-        file_content: str,
+        file_content: Optional[str] = None,
         num_questions: int = 10,
         subject: Optional[str] = None,
         *,
+        file_id: Optional[str] = None,
         ai_provider: Optional[str] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
         language: Optional[str] = None,
         difficulty: Optional[str] = None,
+        user_id: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Generate exam questions directly from text content
@@ -48,19 +82,25 @@ class ExamService:
             file_content: Text content to generate exam from
             num_questions: Number of questions to generate
             subject: Optional subject/topic for better context
+            file_id: Uploaded file to generate from instead of file_content
+                (its extracted text is loaded server-side, see load_file_content)
+            user_id: Requesting user (file ownership, fair queueing of provider calls)
             
         Returns:
             Dict containing exam data and metadata
             
         Raises:
-            ValueError: If content is insufficient
+            ValueError: If content is insufficient or the file cannot be used
             Exception: For other generation errors
         """
         logger.info(f"Generate exam from text - questions: {num_questions}, subject: {subject}")
+
+        if file_id:
+            file_content = await self.load_file_content(file_id, user_id)
         
         # Validate content length
-        text_length = len(file_content.strip())
-        if text_length < 100:
+        text_length = _stripped_length(file_content or "")
+        if text_length < MIN_CONTENT_LENGTH:
             logger.warning(f"Text too short: {text_length} characters")
             raise ValueError("Insufficient content to generate questions")
         
@@ -68,7 +108,6 @@ class ExamService:
         
         # Generate exam via GenAIService (YAML + provider factory)
         logger.info("Starting exam generation with GenAIService...")
-        from app.schemas.exam_schemas import ExamGenerationRequest
         req = ExamGenerationRequest(
             content=file_content,
             question_count=num_questions,
@@ -79,7 +118,7 @@ class ExamService:
             language=language,
             difficulty=difficulty or 'medium',
         )
-        gen_result = await self.genai_service.generate_exam(req)
+        gen_result = await self.genai_service.generate_exam(req, user_id=user_id)
 
         if not gen_result.get('success'):
             error_msg = gen_result.get('error') or 'Generation failed'
@@ -97,7 +136,8 @@ class ExamService:
                 'questions': questions,
             },
             'metadata': {
-                'source_type': 'text_content',
+                'source_type': 'file' if file_id else 'text_content',
+                'file_id': file_id,
                 'text_length': text_length,
                 'questions_generated': questions_count,
                 'subject': subject,
@@ -107,6 +147,391 @@ class ExamService:
 
         return result
     
+    async def load_file_content(
+        self,
+        file_id: str,
+        user_id: Optional[str],
+        *,
+        wait_timeout: Optional[float] = None,
+        poll_interval: Optional[float] = None,
+    ) -> str:
+        """
+        Load an uploaded file's extracted text for generation (user-scoped)
+
+        - Served from the extraction cache when it has the file's content,
+          which skips reading the text column
+        - A PENDING file is claimed (PENDING -> PROCESSING, atomically) and
+          extracted now instead of waiting for the worker
+        - A file the worker has claimed is polled until its extraction ends,
+          for up to wait_timeout seconds
+
+        Raises:
+            ValueError: If the file is missing, not owned by the user, failed
+                extraction or is still being processed after wait_timeout
+        """
+        if not user_id:
+            raise ValueError("A user is required to generate from a file")
+
+        loaded = await self._load_file_contents(
+            [file_id], user_id, wait_timeout=wait_timeout, poll_interval=poll_interval
+        )
+        content, error = loaded[file_id]
+        if error is not None:
+            raise ValueError(error)
+        return content
+
+    async def _load_file_contents(
+        self,
+        file_ids: List[str],
+        user_id: str,
+        *,
+        wait_timeout: Optional[float] = None,
+        poll_interval: Optional[float] = None,
+    ) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        """
+        Resolve several files' extracted text (see load_file_content)
+
+        PENDING files are claimed and extracted concurrently through
+        DocumentService.process_uploaded_files; the session itself is only
+        used sequentially. wait_timeout bounds the wait for all files the
+        worker holds together.
+
+        Returns:
+            file_id -> (content, None) or (None, error message)
+        """
+        file_ids = list(dict.fromkeys(file_ids))
+        sources = await self.file_repository.get_content_sources(file_ids, user_id)
+
+        pending = [file_id for file_id, source in sources.items() if source.processing_status == ProcessingStatus.PENDING]
+        if pending:
+            logger.info(f"{len(pending)} files not extracted yet, extracting before generation")
+            await DocumentService(self.db_session).process_uploaded_files(pending, user_id)
+            sources.update(await self.file_repository.get_content_sources(pending, user_id))
+
+        timeout = wait_timeout if wait_timeout is not None else settings.extraction_wait_timeout
+        interval = poll_interval if poll_interval is not None else settings.extraction_wait_poll_interval
+        deadline = time.monotonic() + timeout
+
+        loaded: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        uncached: List[str] = []
+        for file_id in file_ids:
+            source = sources.get(file_id)
+            if source is not None and source.processing_status in (ProcessingStatus.PENDING, ProcessingStatus.PROCESSING):
+                source = await self._wait_for_extraction(
+                    file_id, user_id, source, max(deadline - time.monotonic(), 0.0), interval
+                )
+
+            if source is None:
+                loaded[file_id] = (None, f"File not found: {file_id}")
+            elif source.processing_status == ProcessingStatus.FAILED:
+                loaded[file_id] = (None, f"Content extraction failed for file {file_id}: {source.processing_error}")
+            elif source.processing_status != ProcessingStatus.COMPLETED:
+                loaded[file_id] = (None, f"File {file_id} is still being processed, retry shortly")
+            else:
+                cached = await self.extraction_cache.get(
+                    source.file_hash,
+                    self.document_processor.get_processor_version(source.file_path)
+                )
+                if cached is not None:
+                    loaded[file_id] = (cached.content, None)
+                else:
+                    uncached.append(file_id)
+
+        # Cache misses read the text column in one query
+        files = await self.file_repository.get_file_contents(uncached, user_id)
+        for file_id in uncached:
+            content = files.get(file_id, {}).get("extracted_content")
+            if content is None:
+                loaded[file_id] = (None, f"No extracted content for file {file_id}")
+            else:
+                loaded[file_id] = (content, None)
+        return loaded
+
+    async def _wait_for_extraction(
+        self,
+        file_id: str,
+        user_id: str,
+        source: Any,
+        timeout: float,
+        poll_interval: float,
+    ) -> Any:
+        """
+        Poll a file claimed by another extractor until it leaves PENDING/PROCESSING
+
+        Each transaction is ended after a read so the extractor's commit
+        becomes visible. Returns the last content source seen (None if the
+        file was deleted meanwhile).
+        """
+        deadline = time.monotonic() + timeout
+        while (
+            source is not None
+            and source.processing_status in (ProcessingStatus.PENDING, ProcessingStatus.PROCESSING)
+            and time.monotonic() < deadline
+        ):
+            await self.db_session.rollback()
+            await asyncio.sleep(min(poll_interval, max(deadline - time.monotonic(), 0)))
+            source = await self.file_repository.get_content_source(file_id, user_id)
+        return source
+
+    async def stream_exam_from_text(
+        self,
+        request: ExamGenerationRequest,
+        *,
+        user_id: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream exam questions from text content as they are generated
+
+        Args:
+            request: Generation request (content or file_id, provider, settings)
+            user_id: Requesting user (file ownership, fair queueing of provider calls)
+
+        Returns:
+            Async iterator of question/done/error events
+
+        Raises:
+            ValueError: If content is insufficient or the file cannot be used
+                (raised before streaming starts)
+        """
+        if request.file_id:
+            content = await self.load_file_content(request.file_id, user_id)
+            request = request.model_copy(update={"content": content, "file_id": None})
+
+        text_length = _stripped_length(request.content)
+        if text_length < MIN_CONTENT_LENGTH:
+            logger.warning(f"Text too short: {text_length} characters")
+            raise ValueError("Insufficient content to generate questions")
+
+        logger.info(f"Streaming exam generation for {text_length} characters of text content")
+        return self.genai_service.stream_exam(request, user_id=user_id)
+
+    async def generate_exams_batch(
+        self,
+        items: List[BatchGenerationItem],
+        *,
+        user_id: str,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Generate several exams concurrently, one result event per item
+
+        File contents are loaded up front like load_file_content does (PENDING
+        files extracted on demand, concurrently; extraction cache first) on
+        this service's session; generation then fans out without touching the
+        database, each provider call queued through the dispatcher under the
+        caller's user_id. A failing item only produces its own error event.
+
+        Args:
+            items: Batch items (inline content or file_id, plus settings)
+            user_id: Requesting user (file ownership, fair queueing)
+
+        Returns:
+            Async iterator of events, in completion order:
+            - {"type": "item", "index": int, "success": True, "questions": [...], "metadata": {...}}
+            - {"type": "item", "index": int, "success": False, "error": str}
+            - {"type": "done", "total": int, "succeeded": int, "failed": int}
+
+        Raises:
+            ValueError: If the batch is empty or too large (raised before streaming starts)
+        """
+        if not items:
+            raise ValueError("Batch must contain at least one item")
+        if len(items) > settings.exam_batch_max_items:
+            raise ValueError(f"Batch too large: {len(items)} items (max {settings.exam_batch_max_items})")
+
+        file_ids = [item.file_id for item in items if item.file_id]
+        files = await self._load_file_contents(file_ids, user_id) if file_ids else {}
+        logger.info(f"Batch generation: {len(items)} items ({len(file_ids)} from files) for user {user_id}")
+
+        sources = [self._batch_item_content(item, files) for item in items]
+        return self._run_batch(items, sources, user_id)
+
+    @staticmethod
+    def _batch_item_content(
+        item: BatchGenerationItem,
+        files: Dict[str, Tuple[Optional[str], Optional[str]]],
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Resolve (content, error) for one batch item"""
+        content = item.content
+        if item.file_id:
+            content, error = files[item.file_id]
+            if error is not None:
+                return None, error
+
+        if _stripped_length(content) < MIN_CONTENT_LENGTH:
+            return None, "Insufficient content to generate questions"
+        return content, None
+
+    async def _run_batch(
+        self,
+        items: List[BatchGenerationItem],
+        sources: List[Tuple[Optional[str], Optional[str]]],
+        user_id: str,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        async def run(index: int, item: BatchGenerationItem, content: Optional[str], error: Optional[str]) -> Dict[str, Any]:
+            event: Dict[str, Any] = {"type": "item", "index": index, "file_id": item.file_id}
+            if error is not None:
+                return {**event, "success": False, "error": error}
+            try:
+                request = ExamGenerationRequest(**item.model_dump(exclude={"content", "file_id"}), content=content)
+                result = await self.genai_service.generate_exam(request, user_id=user_id)
+            except Exception as e:
+                logger.error(f"Batch item {index} failed: {e}")
+                return {**event, "success": False, "error": str(e)}
+
+            if not result.get("success"):
+                return {**event, "success": False, "error": result.get("error") or "Generation failed"}
+            return {**event, "success": True, "questions": result["questions"], "metadata": result["metadata"]}
+
+        tasks = [
+            asyncio.create_task(run(index, item, content, error))
+            for index, (item, (content, error)) in enumerate(zip(items, sources))
+        ]
+        succeeded = 0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                event = await next_done
+                if event["success"]:
+                    succeeded += 1
+                yield event
+        finally:
+            # Client went away - stop outstanding generations
+            for task in tasks:
+                task.cancel()
+
+        logger.info(f"Batch generation finished: {succeeded}/{len(items)} succeeded")
+        yield {"type": "done", "total": len(items), "succeeded": succeeded, "failed": len(items) - succeeded}
+
+    async def create_generation_job(
+        self,
+        request: ExamGenerationRequest,
+        *,
+        user_id: str,
+        idempotency_key: Optional[str] = None,
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        Queue exam generation for the background worker
+
+        A retry with the same idempotency key returns the job created by the
+        first attempt instead of generating (and billing) again.
+
+        Args:
+            request: Generation request (content, provider, settings)
+            user_id: Requesting user (job owner, fair queueing)
+            idempotency_key: Client-supplied key identifying the logical request
+
+        Returns:
+            Tuple of (job dict, created) - created is False for a replayed key
+
+        Raises:
+            ValueError: If content is insufficient, async generation is disabled,
+                or the key was already used for a different request
+        """
+        if not settings.generation_worker_enabled:
+            raise ValueError("Asynchronous generation is disabled")
+
+        if request.content is not None:
+            text_length = _stripped_length(request.content)
+            if text_length < MIN_CONTENT_LENGTH:
+                logger.warning(f"Text too short: {text_length} characters")
+                raise ValueError("Insufficient content to generate questions")
+
+        payload = request.model_dump(mode="json")
+        request_hash = hashlib.sha256(
+            json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        ).hexdigest()
+
+        job, created = await self.job_repository.create_or_get_job(
+            user_id, payload, request_hash, idempotency_key
+        )
+        if not created and job.request_hash != request_hash:
+            raise ValueError("Idempotency key was already used for a different request")
+
+        if created:
+            # Let the background worker pick the job up right away
+            worker = get_generation_worker()
+            if worker.is_running:
+                worker.notify()
+        else:
+            logger.info(f"Replayed generation job {job.id} for idempotency key {idempotency_key}")
+
+        return self._job_to_dict(job), created
+
+    async def get_generation_job(self, job_id: str, user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get generation job status and, once completed, its result (user-scoped)
+
+        Returns:
+            Job data if found, None otherwise
+        """
+        job = await self.job_repository.get_job_for_user(job_id, user_id)
+        return self._job_to_dict(job) if job else None
+
+    async def watch_generation_job(
+        self,
+        job_id: str,
+        user_id: str,
+        *,
+        poll_interval: Optional[float] = None,
+        heartbeat_interval: float = 15.0,
+    ) -> Optional[AsyncIterator[Optional[Dict[str, Any]]]]:
+        """
+        Follow a generation job until it finishes
+
+        The job row is polled on this service's session; each transaction is
+        ended after a read so changes committed by the worker become visible.
+
+        Returns:
+            None if the job does not exist, else an async iterator yielding the
+            job dict whenever status or progress changes (last one is terminal),
+            and None as a heartbeat when nothing changed for heartbeat_interval
+        """
+        job = await self.job_repository.get_job_for_user(job_id, user_id)
+        if job is None:
+            return None
+        interval = poll_interval if poll_interval is not None else settings.generation_events_poll_interval
+        return self._watch_job(job, user_id, interval, heartbeat_interval)
+
+    async def _watch_job(
+        self,
+        job: GenerationJob,
+        user_id: str,
+        poll_interval: float,
+        heartbeat_interval: float,
+    ) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        job_id = job.id
+        last_seen = None
+        last_sent = time.monotonic()
+        while job is not None:
+            if (job.status, job.progress) != last_seen:
+                last_seen = (job.status, job.progress)
+                last_sent = time.monotonic()
+                yield self._job_to_dict(job)
+                if job.is_finished:
+                    return
+            elif time.monotonic() - last_sent >= heartbeat_interval:
+                last_sent = time.monotonic()
+                yield None
+
+            await self.db_session.rollback()
+            await asyncio.sleep(poll_interval)
+            job = await self.job_repository.get_job_for_user(job_id, user_id)
+
+    @staticmethod
+    def _job_to_dict(job: GenerationJob) -> Dict[str, Any]:
+        data = {
+            'job_id': job.id,
+            'status': job.status.value,
+            'progress': job.progress,
+            'created_at': job.created_at,
+            'started_at': job.started_at,
+            'completed_at': job.completed_at,
+        }
+        if job.status == JobStatus.COMPLETED:
+            data['result'] = job.result
+        elif job.status == JobStatus.FAILED:
+            data['error'] = job.error_message
+        return data
+
     async def save_exam(self, exam_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Save exam to database
@@ -156,6 +581,7 @@ class ExamService:
             )
             
             logger.info(f"Exam saved successfully with ID: {exam.id}")
+            get_count_cache().invalidate(("exams",), ("exams", creator_id))
             
             # Return save result
             result = {
@@ -188,7 +614,8 @@ class ExamService:
         logger.info(f"Getting exam by ID: {exam_id}")
         
         try:
-            exam = await self.exam_repository.get_by_id(exam_id)
+            # Questions come from the precomputed payload, not ORM objects
+            exam = await self.exam_repository.get_with_payload(exam_id)
             if not exam:
                 logger.warning(f"Exam not found: {exam_id}")
                 return None
@@ -198,44 +625,72 @@ class ExamService:
                 'id': exam.id,
                 'title': exam.title,
                 'description': exam.description,
-                'questions': exam.questions,
+                'questions': exam.payload['questions'],
                 'duration_minutes': exam.duration_minutes,
                 'created_at': exam.created_at,
-                'is_public': exam.is_public
+                'is_public': exam.is_public,
+                'creator_id': exam.creator_id
             }
             
         except Exception as e:
             logger.error(f"Error getting exam {exam_id}: {e}")
             raise Exception(f"Failed to retrieve exam: {str(e)}")
     
-    async def list_exams(self, skip: int = 0, limit: int = 100) -> Dict[str, Any]:
+    async def get_exam_for_user(self, exam_id: str, user: User) -> Optional[Dict[str, Any]]:
         """
-        List all available exams
+        Get exam as the given user should see it
+        
+        Owners and admins get the full exam with answers. Everyone else gets
+        the cached student view (no correct answers or explanations), which
+        needs no database queries once the exam is cached.
         
         Args:
-            skip: Number of exams to skip
+            exam_id: ID of exam to retrieve
+            user: User requesting the exam
+            
+        Returns:
+            Exam data if found, None otherwise
+        """
+        cached = await self.exam_cache.get(exam_id, self.db_session)
+        if cached is None:
+            logger.warning(f"Exam not found: {exam_id}")
+            return None
+        
+        if cached.is_manager(user):
+            return await self.get_exam_by_id(exam_id)
+        return cached.student_view
+    
+    async def list_exams(self, cursor: Optional[str] = None, limit: int = 100) -> Dict[str, Any]:
+        """
+        List all available exams, newest first
+        
+        Args:
+            cursor: next_cursor of the previous page
             limit: Maximum number of exams to return
             
         Returns:
             List of exam summaries with pagination info
+            
+        Raises:
+            ValueError: If the cursor is invalid
         """
-        logger.info(f"Listing exams - skip: {skip}, limit: {limit}")
+        logger.info(f"Listing exams - limit: {limit}")
         
         try:
-            exams = await self.exam_repository.list_exams(skip=skip, limit=limit)
-            total_count = await self.exam_repository.count_exams()
+            page = await self.exam_repository.get_all_exams(cursor, limit)
+            total_count = await get_count_cache().get_or_count(("exams",), self.exam_repository.count_exams)
             
             exam_summaries = [
                 {
                     'id': exam.id,
                     'title': exam.title,
                     'description': exam.description,
-                    'questions_count': len(exam.questions) if exam.questions else 0,
+                    'questions_count': exam.total_questions or 0,
                     'duration_minutes': exam.duration_minutes,
                     'created_at': exam.created_at,
                     'is_public': exam.is_public
                 }
-                for exam in exams
+                for exam in page
             ]
             
             logger.info(f"Successfully retrieved {len(exam_summaries)} exams")
@@ -243,34 +698,46 @@ class ExamService:
             return {
                 'exams': exam_summaries,
                 'total_count': total_count,
-                'skip': skip,
                 'limit': limit,
-                'has_more': skip + len(exam_summaries) < total_count
+                'next_cursor': page.next_cursor,
+                'has_more': page.has_more
             }
             
+        except ValueError:
+            raise
         except Exception as e:
             logger.error(f"Error listing exams: {e}")
             raise Exception(f"Failed to list exams: {str(e)}")
 
 
-    async def list_user_exams(self, user_id: str) -> List[Dict[str, Any]]:
+    async def list_user_exams(
+        self, user_id: str, cursor: Optional[str] = None, limit: int = 100
+    ) -> Dict[str, Any]:
         """
-        Get all exams created by specific user (SECURE)
+        Get exams created by specific user (SECURE), newest first
         
         Args:
             user_id: ID of the user (REQUIRED)
+            cursor: next_cursor of the previous page
+            limit: Maximum number of exams to return
             
         Returns:
-            List of user's exams ONLY
+            Page of user's exams ONLY with pagination info
+            
+        Raises:
+            ValueError: If the cursor is invalid or listing fails
         """
         logger.info(f"Listing exams for user: {user_id}")
         
         try:
             # ALWAYS filter by user - no optional logic
-            exams = await self.exam_repository.get_exams_by_creator(user_id)
+            page = await self.exam_repository.get_exams_by_creator(user_id, cursor, limit)
+            total_count = await get_count_cache().get_or_count(
+                ("exams", user_id), lambda: self.exam_repository.count_exams(creator_id=user_id)
+            )
             
             result = []
-            for exam in exams:
+            for exam in page:
                 result.append({
                     'id': exam.id,
                     'title': exam.title,
@@ -284,30 +751,41 @@ class ExamService:
                 })
             
             logger.info(f"Found {len(result)} exams for user: {user_id}")
-            return result
+            return {
+                'exams': result,
+                'total_count': total_count,
+                'next_cursor': page.next_cursor,
+                'has_more': page.has_more
+            }
             
+        except ValueError:
+            raise
         except Exception as e:
             logger.error(f"Error listing exams for user {user_id}: {e}")
             raise ValueError(f"Failed to list user exams: {str(e)}")
     
-    async def list_all_exams_admin(self, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+    async def list_all_exams_admin(self, cursor: Optional[str] = None, limit: int = 100) -> Dict[str, Any]:
         """
-        Get ALL exams (ADMIN ONLY)
+        Get ALL exams (ADMIN ONLY), newest first
         
         Args:
-            skip: Number of records to skip  
+            cursor: next_cursor of the previous page
             limit: Maximum number of records
             
         Returns:
-            List of ALL exams (admin access)
+            Page of ALL exams (admin access) with pagination info
+            
+        Raises:
+            ValueError: If the cursor is invalid or listing fails
         """
         logger.info("Admin listing all exams")
         
         try:
-            exams = await self.exam_repository.get_all_exams(skip, limit)
+            page = await self.exam_repository.get_all_exams(cursor, limit)
+            total_count = await get_count_cache().get_or_count(("exams",), self.exam_repository.count_exams)
             
             result = []
-            for exam in exams:
+            for exam in page:
                 result.append({
                     'id': exam.id,
                     'title': exam.title,
@@ -322,8 +800,15 @@ class ExamService:
                 })
             
             logger.info(f"Found {len(result)} total exams for admin")
-            return result
+            return {
+                'exams': result,
+                'total_count': total_count,
+                'next_cursor': page.next_cursor,
+                'has_more': page.has_more
+            }
             
+        except ValueError:
+            raise
         except Exception as e:
             logger.error(f"Error listing all exams for admin: {e}")
             raise ValueError(f"Failed to list all exams: {str(e)}")
\ No newline at end of file
@@ -0,0 +1,293 @@
+"""
+Exam Grading Service
+Grades attempt submissions against a compact answer key and saves them in bulk
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Mapping, Optional, Set
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.database import connection
+from app.models.exam import AttemptStatus, ExamAttempt
+from app.repositories.exam_repository import ExamAttemptRepository
+from app.services.answer_key import AnswerKey, Answers, GradeResult
+from app.services.exam_cache import get_exam_cache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Submission:
+    attempt_id: str
+    user_id: str
+    answers: Answers
+    future: asyncio.Future
+
+
+class SubmissionBatcher:
+    """
+    Coalesces concurrent attempt submissions per exam
+
+    Submissions for the same exam that arrive within the batch window are
+    handled together: one query checks every attempt, the answer key comes from
+    the exam cache, all answers are graded in one pass and the results are
+    saved with a single executemany UPDATE. Each caller still gets its own
+    result (or error); only attempts the UPDATE actually moved out of
+    in_progress count as submitted.
+    """
+
+    def __init__(
+        self,
+        session_maker: Optional[async_sessionmaker] = None,
+        *,
+        window: Optional[float] = None,
+        max_batch: Optional[int] = None,
+    ) -> None:
+        self._session_maker = session_maker
+        self.window = window if window is not None else settings.grading_batch_window
+        self.max_batch = max(1, max_batch or settings.grading_batch_max_size)
+
+        self._pending: Dict[str, List[_Submission]] = {}
+        self._timers: Dict[str, asyncio.Task] = {}
+        self._flushes: Set[asyncio.Task] = set()
+
+        # Counters for monitoring
+        self.batches_flushed = 0
+        self.submissions_graded = 0
+
+    def _get_session_maker(self) -> async_sessionmaker:
+        if self._session_maker is None:
+            self._session_maker = connection.async_session_maker or connection.create_session_maker()
+        return self._session_maker
+
+    async def submit(self, exam_id: str, attempt_id: str, user_id: str, answers: Answers) -> Dict[str, Any]:
+        """
+        Queue a submission and wait for its graded result
+
+        Raises:
+            ValueError: If the attempt is unknown, belongs to someone else or
+                was already submitted
+        """
+        future = asyncio.get_running_loop().create_future()
+        batch = self._pending.setdefault(exam_id, [])
+        batch.append(_Submission(attempt_id, user_id, answers, future))
+
+        if len(batch) >= self.max_batch:
+            self._spawn(self._flush(exam_id, self._pending.pop(exam_id)))
+        elif exam_id not in self._timers:
+            self._timers[exam_id] = self._spawn(self._flush_after_window(exam_id))
+
+        return await future
+
+    def stats(self) -> Dict[str, Any]:
+        """Get batching statistics for monitoring"""
+        return {
+            "pending": sum(len(batch) for batch in self._pending.values()),
+            "pending_exams": len(self._pending),
+            "batches_flushed": self.batches_flushed,
+            "submissions_graded": self.submissions_graded,
+            "window": self.window,
+            "max_batch": self.max_batch,
+        }
+
+    async def close(self) -> None:
+        """Flush everything still pending (called on shutdown)"""
+        for timer in list(self._timers.values()):
+            timer.cancel()
+        self._timers.clear()
+
+        for exam_id in list(self._pending):
+            self._spawn(self._flush(exam_id, self._pending.pop(exam_id)))
+
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+
+    def _spawn(self, coroutine) -> asyncio.Task:
+        task = asyncio.create_task(coroutine)
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+        return task
+
+    async def _flush_after_window(self, exam_id: str) -> None:
+        await asyncio.sleep(self.window)
+        self._timers.pop(exam_id, None)
+        batch = self._pending.pop(exam_id, None)
+        if batch:
+            await self._flush(exam_id, batch)
+
+    async def _flush(self, exam_id: str, batch: List[_Submission]) -> None:
+        try:
+            async with self._get_session_maker()() as session:
+                cached = await get_exam_cache().get(exam_id, session)
+                if cached is None:
+                    raise ValueError("Exam not found")
+                key = cached.answer_key
+
+                repository = ExamAttemptRepository(session)
+                states = await repository.get_attempt_states([s.attempt_id for s in batch])
+
+                accepted: List[_Submission] = []
+                seen: Set[str] = set()
+                for submission in batch:
+                    error = self._check(submission, exam_id, states.get(submission.attempt_id), seen)
+                    if error:
+                        self._resolve(submission.future, error=ValueError(error))
+                    else:
+                        seen.add(submission.attempt_id)
+                        accepted.append(submission)
+
+                grades = key.grade_many([s.answers for s in accepted])
+                submitted_at = datetime.now(timezone.utc)
+                saved = await repository.save_results([
+                    {
+                        'attempt_id': submission.attempt_id,
+                        'answers': self._stored_answers(key, submission.answers),
+                        'score': grade.score,
+                        'max_score': grade.max_score,
+                        'percentage': grade.percentage,
+                        'passed': grade.passed,
+                        'end_time': submitted_at,
+                    }
+                    for submission, grade in zip(accepted, grades)
+                ])
+
+            self.batches_flushed += 1
+            self.submissions_graded += len(saved)
+            logger.info(f"Graded {len(saved)} of {len(batch)} submissions for exam {exam_id}")
+
+            for submission, grade in zip(accepted, grades):
+                # Another process may have submitted the attempt since it was checked
+                if submission.attempt_id not in saved:
+                    self._resolve(submission.future, error=ValueError("Attempt has already been submitted"))
+                    continue
+                self._resolve(submission.future, result=_grade_to_dict(
+                    grade, exam_id=exam_id, attempt_id=submission.attempt_id, submitted_at=submitted_at
+                ))
+
+        except Exception as e:
+            if not isinstance(e, ValueError):
+                logger.error(f"Failed to grade {len(batch)} submissions for exam {exam_id}: {e}")
+            for submission in batch:
+                self._resolve(submission.future, error=e)
+
+    @staticmethod
+    def _check(submission: _Submission, exam_id: str, state: Any, seen: Set[str]) -> Optional[str]:
+        if state is None or state.exam_id != exam_id or state.user_id != submission.user_id:
+            return "Attempt not found"
+        if state.status != AttemptStatus.IN_PROGRESS.value or submission.attempt_id in seen:
+            return "Attempt has already been submitted"
+        return None
+
+    @staticmethod
+    def _stored_answers(key: AnswerKey, answers: Answers) -> Dict[str, Optional[str]]:
+        """Answers as saved on the attempt: keyed by question ID"""
+        if isinstance(answers, Mapping):
+            return {question_id: answers.get(question_id) for question_id in key.question_ids}
+        return dict(zip(key.question_ids, answers))
+
+    @staticmethod
+    def _resolve(future: asyncio.Future, result: Any = None, error: Optional[BaseException] = None) -> None:
+        # The caller may have gone away (request cancelled); its result is still saved
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+
+def _grade_to_dict(grade: GradeResult, **extra: Any) -> Dict[str, Any]:
+    return {
+        **extra,
+        'score': grade.score,
+        'max_score': grade.max_score,
+        'percentage': grade.percentage,
+        'passed': grade.passed,
+        'correct_count': grade.correct_count,
+        'total_questions': len(grade.results),
+        'results': grade.results,
+    }
+
+
+def _attempt_to_dict(attempt: ExamAttempt) -> Dict[str, Any]:
+    return {
+        'attempt_id': attempt.id,
+        'exam_id': attempt.exam_id,
+        'status': attempt.status,
+        'start_time': attempt.start_time.isoformat() if attempt.start_time else None,
+        'end_time': attempt.end_time.isoformat() if attempt.end_time else None,
+        'score': attempt.score,
+        'max_score': attempt.max_score,
+        'percentage': attempt.percentage,
+        'passed': attempt.passed,
+    }
+
+
+class GradingService:
+    """
+    Service for exam attempts
+
+    Responsibilities:
+    - Start attempts for users with access to an exam
+    - Hand submissions to the SubmissionBatcher for grading and bulk saving
+    - List a user's attempts
+    """
+
+    def __init__(self, db_session: AsyncSession, batcher: Optional[SubmissionBatcher] = None):
+        self.db_session = db_session
+        self.exam_cache = get_exam_cache()
+        self.attempt_repository = ExamAttemptRepository(db_session)
+        self.batcher = batcher or get_submission_batcher()
+
+    async def start_attempt(self, exam_id: str, user_id: str) -> Dict[str, Any]:
+        """
+        Start an attempt at an exam
+
+        Raises:
+            ValueError: If the exam does not exist or has no questions
+        """
+        cached = await self.exam_cache.get(exam_id, self.db_session)
+        if cached is None:
+            raise ValueError("Exam not found")
+
+        key = cached.answer_key
+        if not len(key):
+            raise ValueError("Exam has no questions")
+
+        attempt = await self.attempt_repository.start_attempt(exam_id, user_id, key.max_score)
+        logger.info(f"User {user_id} started attempt {attempt.id} on exam {exam_id}")
+        return _attempt_to_dict(attempt)
+
+    async def submit_attempt(
+        self, exam_id: str, attempt_id: str, user_id: str, answers: Answers
+    ) -> Dict[str, Any]:
+        """
+        Grade and save an attempt
+
+        Raises:
+            ValueError: If the attempt is unknown, belongs to someone else or
+                was already submitted
+        """
+        return await self.batcher.submit(exam_id, attempt_id, user_id, answers)
+
+    async def list_attempts(self, exam_id: str, user_id: str) -> List[Dict[str, Any]]:
+        """Get a user's attempts for an exam, newest first"""
+        attempts = await self.attempt_repository.get_user_attempts(exam_id, user_id)
+        return [_attempt_to_dict(attempt) for attempt in attempts]
+
+
+# Global batcher instance
+_submission_batcher: Optional[SubmissionBatcher] = None
+
+
+def get_submission_batcher() -> SubmissionBatcher:
+    """Get (or lazily create) the application-wide submission batcher"""
+    global _submission_batcher
+    if _submission_batcher is None:
+        _submission_batcher = SubmissionBatcher()
+    return _submission_batcher
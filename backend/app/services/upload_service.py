@@ -1,9 +1,11 @@
 import os
 import uuid
+import asyncio
 import logging
 import hashlib
 import re
-from typing import Dict, Any, List, Optional
+import tempfile
+from typing import Dict, Any, List, Optional, Tuple, BinaryIO
 from datetime import datetime
 
 from fastapi import UploadFile
@@ -11,11 +13,18 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
 from app.repositories.file_repository import FileRepository
-from app.models.file import UploadedFile, FileStatus
+from app.repositories.pagination import get_count_cache
+from app.models.file import UploadedFile, FileStatus, ProcessingStatus, StorageType
 from app.services.document_service import DocumentService
+from app.services.blob_service import BlobService
+from app.storage import get_storage_backend
+from app.workers import get_extraction_worker
 
 logger = logging.getLogger(__name__)
 
+# Number of leading bytes kept for magic-number sniffing
+MAGIC_HEADER_SIZE = 8
+
 
 class UploadService:
     """Service for handling file upload business logic with database integration"""
@@ -25,6 +34,7 @@ class UploadService:
         self.db = db
         self.file_repo = FileRepository(db)
         self.document_service = DocumentService(db)
+        self.blob_service = BlobService(db)
         logger.info("UploadService initialized with database session")
     
     def is_allowed_file(self, filename: str, allowed_extensions: set) -> bool:
@@ -128,9 +138,9 @@ class UploadService:
         """
         try:
             # Check for duplicate file (same hash, same user)
-            existing_file = await self.file_repo.get_by_hash(file_hash)
+            existing_file = await self.file_repo.get_by_hash(file_hash, owner_id=user_id)
             
-            if existing_file and existing_file.owner_id == user_id:
+            if existing_file:
                 logger.info(f"Duplicate file detected for user {user_id}: {existing_file.original_filename}")
                 return existing_file
             
@@ -146,7 +156,7 @@ class UploadService:
         
         Args:
             file: FastAPI UploadFile object
-            content: File content bytes
+            content: File content bytes (the leading magic header is enough)
             
         Returns:
             Validated content type
@@ -171,10 +181,88 @@ class UploadService:
         
         return actual_type
     
+    async def stream_to_temp_file(
+        self,
+        file: UploadFile,
+        upload_folder: str,
+        chunk_size: int,
+        max_size: int
+    ) -> Tuple[str, int, str, bytes]:
+        """
+        Stream upload into a temp file inside upload folder, hashing on the fly
+        
+        Peak memory is bounded by chunk_size instead of the whole file. The temp
+        file lives in the upload folder so it can be atomically renamed later.
+        
+        Args:
+            file: FastAPI UploadFile object
+            upload_folder: Destination folder (temp file is created here)
+            chunk_size: Number of bytes read per chunk
+            max_size: Maximum allowed file size in bytes
+            
+        Returns:
+            Tuple of (temp_path, file_size, sha256_hex, magic_header)
+            
+        Raises:
+            ValueError: If file is too large or cannot be read
+        """
+        hasher = hashlib.sha256()
+        header = b''
+        file_size = 0
+        
+        fd, temp_path = tempfile.mkstemp(dir=upload_folder, prefix='.upload-', suffix='.part')
+        try:
+            with os.fdopen(fd, 'wb') as out:
+                while True:
+                    try:
+                        chunk = await file.read(chunk_size)
+                    except Exception as e:
+                        logger.error(f"Failed to read file content: {e}")
+                        raise ValueError("Failed to read file content")
+                    
+                    if not chunk:
+                        break
+                    
+                    file_size += len(chunk)
+                    if file_size > max_size:
+                        logger.warning(f"File too large: more than {max_size} bytes received")
+                        raise ValueError(f"File too large. Maximum size: {max_size} bytes")
+                    
+                    if len(header) < MAGIC_HEADER_SIZE:
+                        header += chunk[:MAGIC_HEADER_SIZE - len(header)]
+                    
+                    # Hashing and disk I/O run off the event loop (hashlib releases the GIL)
+                    await asyncio.to_thread(self._hash_and_write_chunk, hasher, out, chunk)
+        except BaseException:
+            self._remove_temp_file(temp_path)
+            raise
+        
+        return temp_path, file_size, hasher.hexdigest(), header
+    
+    @staticmethod
+    def _hash_and_write_chunk(hasher: Any, out: BinaryIO, chunk: bytes) -> None:
+        """Update running hash and append chunk to temp file"""
+        hasher.update(chunk)
+        out.write(chunk)
+    
+    @staticmethod
+    def _remove_temp_file(temp_path: Optional[str]) -> None:
+        """Best-effort cleanup of a partially written temp file"""
+        if not temp_path:
+            return
+        try:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        except OSError as e:
+            logger.error(f"Failed to remove temp file {temp_path}: {e}")
+    
     async def save_uploaded_file(self, file: UploadFile, user_id: str) -> Dict[str, Any]:
         """
         Save uploaded file with validation, processing, and database integration
-        Enhanced with security fixes and performance optimizations
+        Streams the upload in chunks: hash and magic-number sniffing are updated
+        incrementally and the bytes are written to a temp file that is atomically
+        renamed into the content-addressed blob store (skipped if the content is
+        already stored for another user).
         
         Args:
             file: FastAPI UploadFile object
@@ -205,57 +293,7 @@ class UploadService:
             logger.warning(f"File type not allowed: {safe_filename}")
             raise ValueError("File type not allowed")
         
-        # Read and validate file content
-        logger.debug("Reading file content...")
-        try:
-            content = await file.read()
-        except Exception as e:
-            logger.error(f"Failed to read file content: {e}")
-            raise ValueError("Failed to read file content")
-        
-        file_size = len(content)
-        logger.info(f"File size: {file_size} bytes ({round(file_size / 1024 / 1024, 2)} MB)")
-        
-        # Validate file size
-        if file_size > settings["max_upload_size"]:
-            logger.warning(f"File too large: {file_size} > {settings['max_upload_size']}")
-            raise ValueError(f"File too large. Maximum size: {settings['max_upload_size']} bytes")
-        
-        if file_size == 0:
-            logger.warning("Empty file received")
-            raise ValueError("Empty file not allowed")
-        
-        # Validate content type
-        validated_content_type = self.validate_file_content_type(file, content)
-        
-        # Calculate file hash for duplicate detection
-        logger.debug("Calculating file hash...")
-        try:
-            file_hash = self.calculate_file_hash(content)
-            logger.debug(f"File hash: {file_hash}")
-        except Exception as e:
-            logger.error(f"Failed to calculate file hash: {e}")
-            raise ValueError("File processing failed")
-        
-        # Check for duplicate files
-        duplicate_file = await self.check_duplicate_file(file_hash, user_id)
-        if duplicate_file:
-            logger.info(f"Returning existing file instead of duplicate: {duplicate_file.stored_filename}")
-            return {
-                'message': 'File already exists (duplicate detected)',
-                'file_id': duplicate_file.id,
-                'stored_filename': duplicate_file.stored_filename,
-                'original_filename': duplicate_file.original_filename,
-                'size': duplicate_file.size,
-                'size_mb': duplicate_file.size_mb,
-                'content_type': duplicate_file.content_type,
-                'user_id': user_id,
-                'uploaded_at': duplicate_file.created_at.isoformat(),
-                'duplicate': True,
-                'existing_file': True
-            }
-        
-        # Prepare upload directory
+        # Prepare upload directory (temp file must live on the same filesystem)
         upload_folder = settings["upload_folder"]
         try:
             os.makedirs(upload_folder, exist_ok=True)
@@ -263,60 +301,91 @@ class UploadService:
             logger.error(f"Failed to create upload directory: {e}")
             raise Exception("Upload directory setup failed")
         
-        # Generate unique filename
-        file_extension = os.path.splitext(safe_filename)[1]
-        file_uuid = uuid.uuid4().hex
-        stored_filename = f"{user_id[:8]}_{file_uuid}_{safe_filename}"
-        file_path = os.path.join(upload_folder, stored_filename)
-        
-        logger.debug(f"Generated stored filename: {stored_filename}")
-        logger.debug(f"Full save path: {file_path}")
+        # Stream content to temp file, hashing and sniffing as we go
+        logger.debug("Streaming file content...")
+        temp_path, file_size, file_hash, header = await self.stream_to_temp_file(
+            file,
+            upload_folder,
+            chunk_size=settings["upload_chunk_size"],
+            max_size=settings["max_upload_size"]
+        )
+        logger.info(f"File size: {file_size} bytes ({round(file_size / 1024 / 1024, 2)} MB)")
+        logger.debug(f"File hash: {file_hash}")
         
-        # Start database transaction
         try:
-            # Create database record first (with UPLOADING status)
-            file_record = await self.file_repo.create_file_record(
-                original_filename=file.filename,  # Keep original for reference
-                stored_filename=stored_filename,
-                file_path=file_path,
-                size=file_size,
-                content_type=validated_content_type,
-                owner_id=user_id,
-                file_hash=file_hash,
-                upload_status=FileStatus.UPLOADING  # Start with UPLOADING status
-            )
-            logger.info(f"Created database record for file: {file_record.id}")
+            if file_size == 0:
+                logger.warning("Empty file received")
+                raise ValueError("Empty file not allowed")
+            
+            # Validate content type (magic numbers only need the header)
+            validated_content_type = self.validate_file_content_type(file, header)
+            
+            # Check for duplicate files
+            duplicate_file = await self.check_duplicate_file(file_hash, user_id)
+            if duplicate_file:
+                logger.info(f"Returning existing file instead of duplicate: {duplicate_file.stored_filename}")
+                return {
+                    'message': 'File already exists (duplicate detected)',
+                    'file_id': duplicate_file.id,
+                    'stored_filename': duplicate_file.stored_filename,
+                    'original_filename': duplicate_file.original_filename,
+                    'size': duplicate_file.size,
+                    'size_mb': duplicate_file.size_mb,
+                    'content_type': duplicate_file.content_type,
+                    'user_id': user_id,
+                    'uploaded_at': duplicate_file.created_at.isoformat(),
+                    'file_hash': file_hash,
+                    'duplicate': True,
+                    'existing_file': True
+                }
             
-            # Save file to filesystem
+            # Generate unique filename (per-user name; bytes live in the shared blob)
+            file_extension = os.path.splitext(safe_filename)[1]
+            file_uuid = uuid.uuid4().hex
+            stored_filename = f"{user_id[:8]}_{file_uuid}_{safe_filename}"
+            
+            logger.debug(f"Generated stored filename: {stored_filename}")
+            
+            # Reference content-addressed blob (bytes are written only if new)
             try:
-                with open(file_path, 'wb') as f:
-                    f.write(content)
-                logger.info(f"File saved to filesystem: {file_path}")
+                blob = await self.blob_service.store(
+                    temp_path, file_hash, file_size, file_extension, validated_content_type
+                )
+                file_path = blob.file_path
+                storage = self.blob_service.backend_for(blob.storage_type)
+                logger.debug(f"Blob location: {file_path}")
                 
             except Exception as e:
                 logger.error(f"Error saving file to filesystem: {e}")
-                # Cleanup database record on filesystem error
-                try:
-                    await self.file_repo.delete_file_record(file_record.id, user_id)
-                except Exception as cleanup_error:
-                    logger.error(f"Failed to cleanup database record: {cleanup_error}")
                 raise Exception(f"File save failed: {type(e).__name__}") from e
             
-            # Verify file was saved correctly
-            if not os.path.exists(file_path):
-                logger.error("File was not saved successfully")
-                await self.file_repo.update_status(file_record.id, FileStatus.FAILED, "File save verification failed")
-                raise Exception("File save verification failed")
+            # Create database record (with UPLOADING status)
+            try:
+                file_record = await self.file_repo.create_file_record(
+                    original_filename=file.filename,  # Keep original for reference
+                    stored_filename=stored_filename,
+                    file_path=file_path,
+                    size=file_size,
+                    content_type=validated_content_type,
+                    owner_id=user_id,
+                    file_hash=file_hash,
+                    blob_id=blob.id,
+                    storage_type=blob.storage_type,
+                    upload_status=FileStatus.UPLOADING  # Start with UPLOADING status
+                )
+                logger.info(f"Created database record for file: {file_record.id}")
+                get_count_cache().invalidate(("files",), ("files", user_id))
+                
+            except Exception:
+                await self.blob_service.release(blob.id)
+                raise
             
-            saved_size = os.path.getsize(file_path)
-            if saved_size != file_size:
-                logger.error(f"File size mismatch: expected {file_size}, got {saved_size}")
-                # Clean up incorrect file
-                try:
-                    os.remove(file_path)
-                    await self.file_repo.update_status(file_record.id, FileStatus.FAILED, "File size mismatch")
-                except Exception as cleanup_error:
-                    logger.error(f"Failed to cleanup corrupted file: {cleanup_error}")
+            # Verify stored blob matches the upload
+            if await storage.size(file_path) != file_size:
+                logger.error(f"Blob verification failed for {file_path}")
+                await self.file_repo.update_status(file_record.id, FileStatus.FAILED, "File save verification failed")
+                # Drop the failed record's reference; bytes still shared are rewritten by the next store()
+                await self.blob_service.release(blob.id)
                 raise Exception("File save verification failed")
             
             # Update database record to COMPLETED
@@ -354,6 +423,11 @@ class UploadService:
                 }
             }
             
+            # Let the background worker pick the new file up right away
+            worker = get_extraction_worker()
+            if worker.is_running:
+                worker.notify()
+            
             logger.info(f"Upload completed successfully for user {user_id}: {file_record.id}")
             return result
             
@@ -364,6 +438,9 @@ class UploadService:
             logger.error(f"Upload failed for user {user_id}: {e}")
             # Generic error message for security
             raise Exception("File upload failed")
+        finally:
+            # Temp file is only left behind on duplicates or failures
+            self._remove_temp_file(temp_path)
     
     async def delete_file(self, file_id: str, user_id: str) -> Dict[str, Any]:
         """
@@ -386,7 +463,7 @@ class UploadService:
         # Get file record from database
         try:
             file_record = await self.file_repo.get_by_id(file_id)
-            if not file_record:
+            if not file_record or file_record.upload_status == FileStatus.DELETED:
                 raise FileNotFoundError("File not found")
             
             # Check ownership
@@ -402,31 +479,36 @@ class UploadService:
             logger.error(f"Error getting file record for deletion: {e}")
             raise Exception("File deletion failed")
         
-        # Delete from filesystem
-        filesystem_deleted = False
-        if os.path.exists(file_record.file_path):
-            try:
-                os.remove(file_record.file_path)
-                filesystem_deleted = True
-                logger.info(f"File deleted from filesystem: {file_record.file_path}")
-            except Exception as e:
-                logger.error(f"Error deleting file from filesystem: {e}")
-                # Continue with database cleanup even if filesystem deletion fails
-        else:
-            logger.warning(f"File not found in filesystem: {file_record.file_path}")
+        blob_id = file_record.blob_id
         
-        # Update database record (soft delete)
+        # Update database record (soft delete, drops blob reference)
         try:
             success = await self.file_repo.delete_file_record(file_id, user_id)
             if not success:
                 raise Exception("Database deletion failed")
             
             logger.info(f"File record marked as deleted: {file_id}")
+            get_count_cache().invalidate(("files",), ("files", user_id))
             
         except Exception as e:
             logger.error(f"Error updating database record for deletion: {e}")
             raise Exception("File deletion failed")
         
+        # Delete from filesystem - shared blobs only when last reference goes
+        filesystem_deleted = False
+        try:
+            if blob_id:
+                filesystem_deleted = await self.blob_service.release(blob_id)
+            elif os.path.exists(file_record.file_path):
+                os.remove(file_record.file_path)
+                filesystem_deleted = True
+                logger.info(f"File deleted from filesystem: {file_record.file_path}")
+            else:
+                logger.warning(f"File not found in filesystem: {file_record.file_path}")
+        except Exception as e:
+            # Record is already deleted; leftover bytes are harmless
+            logger.error(f"Error deleting file from filesystem: {e}")
+        
         return {
             'message': 'File deleted successfully',
             'file_id': file_id,
@@ -471,10 +553,10 @@ class UploadService:
             logger.error(f"Error getting file record: {e}")
             raise Exception("Failed to get file information")
         
-        # Check filesystem existence
-        file_exists = os.path.exists(file_record.file_path)
+        # Check storage existence
+        file_exists = await get_storage_backend(file_record.storage_type).exists(file_record.file_path)
         if not file_exists:
-            logger.warning(f"File missing from filesystem: {file_record.file_path}")
+            logger.warning(f"File missing from storage: {file_record.file_path}")
         
         return {
             'file_id': file_record.id,
@@ -491,111 +573,153 @@ class UploadService:
             'uploaded_at': file_record.created_at.isoformat(),
             'updated_at': file_record.updated_at.isoformat(),
             'owner_id': file_record.owner_id,
+            'storage_type': file_record.storage_type.value,
             'filesystem_exists': file_exists,
             'database_integrated': True,
             'access_validated': True
         }
     
-    async def list_user_files(self, user_id: str, skip: int = 0, limit: int = 100) -> Dict[str, Any]:
+    async def get_download_target(self, file_id: str, user_id: str) -> Dict[str, Any]:
+        """
+        Resolve where a file's bytes live for download (with ownership validation)
+        
+        Args:
+            file_id: ID of file to download
+            user_id: ID of user requesting download
+            
+        Returns:
+            Dict with storage backend, location and response metadata
+            
+        Raises:
+            FileNotFoundError: If file record or stored bytes don't exist
+            PermissionError: If user doesn't own the file
+        """
+        file_record = await self.file_repo.get_by_id(file_id)
+        if not file_record or file_record.upload_status == FileStatus.DELETED:
+            raise FileNotFoundError("File not found")
+        
+        if file_record.owner_id != user_id:
+            logger.warning(f"Unauthorized download attempt: user {user_id} tried to download file {file_id} owned by {file_record.owner_id}")
+            raise PermissionError("Access denied")
+        
+        storage = get_storage_backend(file_record.storage_type)
+        size = await storage.size(file_record.file_path)
+        if size is None:
+            logger.error(f"File missing from storage: {file_record.file_path}")
+            raise FileNotFoundError("File not found on server")
+        
+        return {
+            'storage': storage,
+            'location': file_record.file_path,
+            'size': size,
+            'original_filename': file_record.original_filename,
+            'content_type': file_record.content_type or 'application/octet-stream'
+        }
+    
+    @staticmethod
+    def _listed_file_exists(file_record: UploadedFile) -> bool:
+        """Cheap existence check for list views (no per-row object store requests)"""
+        if file_record.storage_type == StorageType.LOCAL:
+            return os.path.exists(file_record.file_path)
+        return True
+    
+    async def list_user_files(self, user_id: str, cursor: Optional[str] = None, limit: int = 100) -> Dict[str, Any]:
         """
-        List files owned by specific user (database-driven)
+        List files owned by specific user (database-driven), newest first
         
         Args:
             user_id: ID of user to list files for
-            skip: Number of records to skip
+            cursor: next_cursor of the previous page
             limit: Maximum number of records
             
         Returns:
             Dict with user's files and metadata
+            
+        Raises:
+            ValueError: If the cursor is invalid
         """
-        logger.info(f"Listing files for user: {user_id} (skip={skip}, limit={limit})")
+        logger.info(f"Listing files for user: {user_id} (limit={limit})")
         
         try:
-            # Get files from database
-            files = await self.file_repo.get_user_files(
+            # Get files from database (deleted files are excluded in the repo)
+            page = await self.file_repo.get_user_files(
                 owner_id=user_id,
-                skip=skip,
+                cursor=cursor,
                 limit=limit,
-                status_filter=None  # Include all statuses except deleted (handled in repo)
+                status_filter=None
             )
             
-            # Get total count
-            total_count = await self.file_repo.count_user_files(user_id)
+            # Get total count (cached, not counted per page)
+            total_count = await get_count_cache().get_or_count(
+                ("files", user_id), lambda: self.file_repo.count_user_files(user_id)
+            )
             
             # Format file information
             file_list = []
-            for file_record in files:
-                if file_record.upload_status != FileStatus.DELETED:  # Extra safety check
-                    file_exists = os.path.exists(file_record.file_path)
-                    file_list.append({
-                        "file_id": file_record.id,
-                        "stored_filename": file_record.stored_filename,
-                        "original_filename": file_record.original_filename,
-                        "size": file_record.size,
-                        "size_mb": file_record.size_mb,
-                        "content_type": file_record.content_type,
-                        "upload_status": file_record.upload_status.value,
-                        "is_public": file_record.is_public,
-                        "is_image": file_record.is_image,
-                        "is_pdf": file_record.is_pdf,
-                        "uploaded_at": file_record.created_at.isoformat(),
-                        "filesystem_exists": file_exists,
-                        "user_owned": True
-                    })
+            for file_record in page:
+                file_exists = self._listed_file_exists(file_record)
+                file_list.append({
+                    "file_id": file_record.id,
+                    "stored_filename": file_record.stored_filename,
+                    "original_filename": file_record.original_filename,
+                    "size": file_record.size,
+                    "size_mb": file_record.size_mb,
+                    "content_type": file_record.content_type,
+                    "upload_status": file_record.upload_status.value,
+                    "is_public": file_record.is_public,
+                    "is_image": file_record.is_image,
+                    "is_pdf": file_record.is_pdf,
+                    "uploaded_at": file_record.created_at.isoformat(),
+                    "filesystem_exists": file_exists,
+                    "user_owned": True
+                })
             
             logger.info(f"Found {len(file_list)} files for user {user_id}")
             return {
                 "files": file_list,
                 "count": len(file_list),
                 "total_count": total_count,
-                "skip": skip,
                 "limit": limit,
+                "next_cursor": page.next_cursor,
+                "has_more": page.has_more,
                 "user_id": user_id,
                 "user_scoped": True,
                 "database_integrated": True
             }
             
+        except ValueError:
+            raise
         except Exception as e:
             logger.error(f"Error listing files for user {user_id}: {e}")
             raise Exception("Failed to list user files")
     
-    async def list_all_files_admin(self, skip: int = 0, limit: int = 100) -> Dict[str, Any]:
+    async def list_all_files_admin(self, cursor: Optional[str] = None, limit: int = 100) -> Dict[str, Any]:
         """
-        List ALL files (Admin only) - database-driven
+        List ALL files (Admin only) - database-driven, newest first
         
         Args:
-            skip: Number of records to skip  
+            cursor: next_cursor of the previous page
             limit: Maximum number of records
             
         Returns:
             Dict with all files and metadata
+            
+        Raises:
+            ValueError: If the cursor is invalid
         """
-        logger.info(f"Admin listing all files (skip={skip}, limit={limit})")
+        logger.info(f"Admin listing all files (limit={limit})")
         
         try:
             # Get all files from database (admin access)
-            from sqlalchemy import select, func
-            
-            result = await self.db.execute(
-                select(UploadedFile)
-                .where(UploadedFile.upload_status != FileStatus.DELETED)
-                .offset(skip)
-                .limit(limit)
-                .order_by(UploadedFile.created_at.desc())
-            )
-            files = result.scalars().all()
+            page = await self.file_repo.get_all_files(cursor, limit)
             
-            # Get total count
-            count_result = await self.db.execute(
-                select(func.count(UploadedFile.id))
-                .where(UploadedFile.upload_status != FileStatus.DELETED)
-            )
-            total_count = count_result.scalar() or 0
+            # Get total count (cached, not counted per page)
+            total_count = await get_count_cache().get_or_count(("files",), self.file_repo.count_files)
             
             # Format file information
             file_list = []
-            for file_record in files:
-                file_exists = os.path.exists(file_record.file_path)
+            for file_record in page:
+                file_exists = self._listed_file_exists(file_record)
                 file_list.append({
                     "file_id": file_record.id,
                     "stored_filename": file_record.stored_filename,
@@ -616,12 +740,15 @@ class UploadService:
                 "files": file_list,
                 "count": len(file_list),
                 "total_count": total_count,
-                "skip": skip,
                 "limit": limit,
+                "next_cursor": page.next_cursor,
+                "has_more": page.has_more,
                 "admin_access": True,
                 "database_integrated": True
             }
             
+        except ValueError:
+            raise
         except Exception as e:
             logger.error(f"Error listing all files for admin: {e}")
             raise Exception("Failed to list all files")
@@ -640,6 +767,28 @@ class UploadService:
         try:
             logger.info(f"Manual processing triggered for file {file_id} by user {user_id}")
             
+            # With the background worker running, just make sure the file is queued
+            worker = get_extraction_worker()
+            if worker.is_running:
+                status = await self.document_service.get_processing_status(file_id, user_id)
+                if not status:
+                    return {
+                        "success": False,
+                        "file_id": file_id,
+                        "error": f"File not found: {file_id}"
+                    }
+                
+                worker.notify()
+                return {
+                    "success": True,
+                    "file_id": file_id,
+                    "status": status["processing_status"],
+                    "queued": status["processing_status"] in (
+                        ProcessingStatus.PENDING.value, ProcessingStatus.PROCESSING.value
+                    ),
+                    "message": "File queued for background processing"
+                }
+            
             # Delegate to DocumentService
             result = await self.document_service.process_uploaded_file(file_id, user_id)
             
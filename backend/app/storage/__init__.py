@@ -0,0 +1,81 @@
+"""
+Pluggable storage for uploaded file bytes
+Selects backend by StorageType (LOCAL, S3, GCS via its S3-compatible API)
+"""
+
+import logging
+from typing import Dict, Optional
+
+from app.core.config import settings
+from app.models.file import StorageType
+from .base import StorageBackend
+from .local import LocalStorageBackend
+from .s3 import S3StorageBackend
+
+logger = logging.getLogger(__name__)
+
+# GCS interoperability endpoint (S3 XML API with HMAC keys)
+GCS_ENDPOINT_URL = "https://storage.googleapis.com"
+
+_backends: Dict[StorageType, StorageBackend] = {}
+
+
+def _create_backend(storage_type: StorageType) -> StorageBackend:
+    if storage_type == StorageType.LOCAL:
+        return LocalStorageBackend(settings.upload_folder)
+
+    endpoint_url = settings.s3_endpoint_url
+    if storage_type == StorageType.GCS:
+        endpoint_url = endpoint_url or GCS_ENDPOINT_URL
+
+    return S3StorageBackend(
+        settings.s3_bucket,
+        prefix=settings.s3_prefix,
+        endpoint_url=endpoint_url,
+        region=settings.s3_region,
+        access_key_id=settings.s3_access_key_id,
+        secret_access_key=settings.s3_secret_access_key,
+        multipart_threshold=settings.s3_multipart_threshold,
+        part_size=settings.s3_part_size,
+        presign_expiry=settings.storage_presign_expiry,
+        storage_type=storage_type,
+    )
+
+
+def get_storage_backend(storage_type: Optional[StorageType] = None) -> StorageBackend:
+    """
+    Get backend for storage type (defaults to STORAGE_BACKEND setting)
+
+    Args:
+        storage_type: Storage type recorded on a file/blob
+
+    Returns:
+        Shared backend instance
+    """
+    if storage_type is None:
+        storage_type = StorageType(settings.storage_backend.lower())
+
+    if storage_type not in _backends:
+        _backends[storage_type] = _create_backend(storage_type)
+        logger.info(f"Initialized {storage_type.value} storage backend")
+    return _backends[storage_type]
+
+
+def register_storage_backend(backend: StorageBackend) -> None:
+    """Install a backend instance for its storage type (custom clients, tests)"""
+    _backends[backend.storage_type] = backend
+
+
+def reset_storage_backends() -> None:
+    """Drop cached backends (settings changed, tests)"""
+    _backends.clear()
+
+
+__all__ = [
+    "StorageBackend",
+    "LocalStorageBackend",
+    "S3StorageBackend",
+    "get_storage_backend",
+    "register_storage_backend",
+    "reset_storage_backends",
+]
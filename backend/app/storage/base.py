@@ -0,0 +1,125 @@
+"""
+Storage backend interface
+Backends address stored objects by an opaque location string (local path or object key)
+"""
+
+import os
+import asyncio
+import tempfile
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from app.models.file import StorageType
+
+# Chunk size used when streaming objects out of storage
+READ_CHUNK_SIZE = 256 * 1024
+
+
+class StorageBackend(ABC):
+    """Interface for file byte storage (local disk, S3-compatible object stores)"""
+
+    storage_type: StorageType
+
+    @abstractmethod
+    def location_for(self, key: str) -> str:
+        """Map a logical key (e.g. blobs/ab/cd/<hash>.pdf) to a backend location"""
+        pass
+
+    @abstractmethod
+    async def save_file(self, source_path: str, location: str, content_type: Optional[str] = None) -> None:
+        """
+        Store a fully written local file at location (streamed, never loaded whole)
+
+        Args:
+            source_path: Local temp file to store (may be moved/consumed)
+            location: Target location from location_for
+            content_type: MIME type for object metadata
+        """
+        pass
+
+    @abstractmethod
+    async def read_range(self, location: str, start: int = 0, end: Optional[int] = None) -> bytes:
+        """
+        Read bytes [start, end] (inclusive, like HTTP Range) from stored object
+
+        Args:
+            location: Stored object location
+            start: First byte offset
+            end: Last byte offset (None for end of object)
+        """
+        pass
+
+    @abstractmethod
+    async def size(self, location: str) -> Optional[int]:
+        """Get stored object size in bytes (None if missing)"""
+        pass
+
+    @abstractmethod
+    async def delete(self, location: str) -> bool:
+        """Delete stored object; returns False if it did not exist"""
+        pass
+
+    async def exists(self, location: str) -> bool:
+        """Check whether object exists"""
+        return await self.size(location) is not None
+
+    async def presigned_url(
+        self,
+        location: str,
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+        expires_in: Optional[int] = None,
+    ) -> Optional[str]:
+        """Get a time-limited direct download URL (None if backend serves bytes itself)"""
+        return None
+
+    def local_path(self, location: str) -> Optional[str]:
+        """Get filesystem path for location if bytes live on local disk"""
+        return None
+
+    async def iter_range(
+        self,
+        location: str,
+        start: int = 0,
+        end: Optional[int] = None,
+        chunk_size: int = READ_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Stream bytes [start, end] in chunks"""
+        total = await self.size(location)
+        if total is None:
+            raise FileNotFoundError(location)
+        last = total - 1 if end is None else min(end, total - 1)
+
+        position = start
+        while position <= last:
+            chunk_end = min(position + chunk_size - 1, last)
+            chunk = await self.read_range(location, position, chunk_end)
+            if not chunk:
+                break
+            yield chunk
+            position += len(chunk)
+
+    @asynccontextmanager
+    async def local_copy(self, location: str) -> AsyncIterator[str]:
+        """
+        Yield a local filesystem path with the object's bytes
+
+        Local backends yield the stored path directly; remote backends download
+        to a temp file (keeping the extension so processors can detect type)
+        and remove it afterwards.
+        """
+        path = self.local_path(location)
+        if path is not None:
+            yield path
+            return
+
+        fd, temp_path = tempfile.mkstemp(suffix=os.path.splitext(location)[1])
+        try:
+            with os.fdopen(fd, "wb") as out:
+                async for chunk in self.iter_range(location):
+                    await asyncio.to_thread(out.write, chunk)
+            yield temp_path
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
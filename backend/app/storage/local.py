@@ -0,0 +1,57 @@
+import os
+import asyncio
+import logging
+from typing import Optional
+
+from app.models.file import StorageType
+from .base import StorageBackend
+
+logger = logging.getLogger(__name__)
+
+
+class LocalStorageBackend(StorageBackend):
+    """Store bytes on the local filesystem under a root folder"""
+
+    storage_type = StorageType.LOCAL
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def location_for(self, key: str) -> str:
+        return os.path.join(self.root, *key.split("/"))
+
+    def local_path(self, location: str) -> Optional[str]:
+        return location
+
+    @staticmethod
+    def _move(source_path: str, location: str) -> None:
+        os.makedirs(os.path.dirname(location), exist_ok=True)
+        os.replace(source_path, location)
+
+    async def save_file(self, source_path: str, location: str, content_type: Optional[str] = None) -> None:
+        # Temp files live on the same filesystem - a rename is enough
+        await asyncio.to_thread(self._move, source_path, location)
+
+    @staticmethod
+    def _read(location: str, start: int, end: Optional[int]) -> bytes:
+        with open(location, "rb") as f:
+            f.seek(start)
+            if end is None:
+                return f.read()
+            return f.read(max(0, end - start + 1))
+
+    async def read_range(self, location: str, start: int = 0, end: Optional[int] = None) -> bytes:
+        return await asyncio.to_thread(self._read, location, start, end)
+
+    async def size(self, location: str) -> Optional[int]:
+        try:
+            return (await asyncio.to_thread(os.stat, location)).st_size
+        except FileNotFoundError:
+            return None
+
+    async def delete(self, location: str) -> bool:
+        try:
+            await asyncio.to_thread(os.remove, location)
+            return True
+        except FileNotFoundError:
+            return False
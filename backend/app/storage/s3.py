@@ -0,0 +1,160 @@
+import os
+import asyncio
+import logging
+from typing import Any, Optional
+
+try:
+    import boto3
+except ImportError:
+    boto3 = None
+
+from app.models.file import StorageType
+from .base import StorageBackend
+
+logger = logging.getLogger(__name__)
+
+
+class S3StorageBackend(StorageBackend):
+    """
+    Store bytes in an S3-compatible object store (AWS S3, MinIO, GCS interop)
+
+    Uses a boto3-style client; pass one in for tests or custom endpoints.
+    Blocking client calls run in a thread. Files above multipart_threshold
+    are uploaded part by part so only one part is in memory at a time.
+    """
+
+    storage_type = StorageType.S3
+
+    def __init__(
+        self,
+        bucket: str,
+        client: Any = None,
+        *,
+        prefix: str = "",
+        endpoint_url: Optional[str] = None,
+        region: Optional[str] = None,
+        access_key_id: Optional[str] = None,
+        secret_access_key: Optional[str] = None,
+        multipart_threshold: int = 8 * 1024 * 1024,
+        part_size: int = 8 * 1024 * 1024,
+        presign_expiry: int = 300,
+        storage_type: StorageType = StorageType.S3,
+    ):
+        if not bucket:
+            raise ValueError("S3 storage requires a bucket name")
+
+        self.bucket = bucket
+        self.prefix = prefix.strip("/")
+        self.multipart_threshold = multipart_threshold
+        # S3 requires parts of at least 5MB (except the last one)
+        self.part_size = max(part_size, 5 * 1024 * 1024)
+        self.presign_expiry = presign_expiry
+        self.storage_type = storage_type
+
+        if client is None:
+            if boto3 is None:
+                raise ImportError("boto3 required for S3 storage: pip install boto3")
+            client = boto3.client(
+                "s3",
+                endpoint_url=endpoint_url,
+                region_name=region,
+                aws_access_key_id=access_key_id,
+                aws_secret_access_key=secret_access_key,
+            )
+        self.client = client
+
+    def location_for(self, key: str) -> str:
+        return f"{self.prefix}/{key}" if self.prefix else key
+
+    async def _call(self, method: str, **kwargs) -> Any:
+        return await asyncio.to_thread(getattr(self.client, method), Bucket=self.bucket, **kwargs)
+
+    async def save_file(self, source_path: str, location: str, content_type: Optional[str] = None) -> None:
+        extra = {"ContentType": content_type} if content_type else {}
+        file_size = await asyncio.to_thread(os.path.getsize, source_path)
+
+        if file_size <= self.multipart_threshold:
+            with await asyncio.to_thread(open, source_path, "rb") as body:
+                await self._call("put_object", Key=location, Body=body, **extra)
+        else:
+            await self._multipart_upload(source_path, location, extra)
+
+        # Bytes are in the object store now; the local temp copy is not needed
+        await asyncio.to_thread(os.remove, source_path)
+        logger.info(f"Stored {file_size} bytes at s3://{self.bucket}/{location}")
+
+    async def _multipart_upload(self, source_path: str, location: str, extra: dict) -> None:
+        upload = await self._call("create_multipart_upload", Key=location, **extra)
+        upload_id = upload["UploadId"]
+        parts = []
+        try:
+            with await asyncio.to_thread(open, source_path, "rb") as f:
+                part_number = 1
+                while True:
+                    chunk = await asyncio.to_thread(f.read, self.part_size)
+                    if not chunk:
+                        break
+                    response = await self._call(
+                        "upload_part",
+                        Key=location,
+                        UploadId=upload_id,
+                        PartNumber=part_number,
+                        Body=chunk,
+                    )
+                    parts.append({"PartNumber": part_number, "ETag": response["ETag"]})
+                    part_number += 1
+
+            await self._call(
+                "complete_multipart_upload",
+                Key=location,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except Exception:
+            await self._call("abort_multipart_upload", Key=location, UploadId=upload_id)
+            raise
+
+    async def read_range(self, location: str, start: int = 0, end: Optional[int] = None) -> bytes:
+        byte_range = f"bytes={start}-{'' if end is None else end}"
+        response = await self._call("get_object", Key=location, Range=byte_range)
+        return await asyncio.to_thread(response["Body"].read)
+
+    @staticmethod
+    def _is_not_found(error: Exception) -> bool:
+        code = str(getattr(error, "response", {}).get("Error", {}).get("Code", ""))
+        return code in ("404", "NoSuchKey", "NotFound")
+
+    async def size(self, location: str) -> Optional[int]:
+        try:
+            response = await self._call("head_object", Key=location)
+            return response["ContentLength"]
+        except Exception as e:
+            if self._is_not_found(e):
+                return None
+            raise
+
+    async def delete(self, location: str) -> bool:
+        if not await self.exists(location):
+            return False
+        await self._call("delete_object", Key=location)
+        return True
+
+    async def presigned_url(
+        self,
+        location: str,
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+        expires_in: Optional[int] = None,
+    ) -> Optional[str]:
+        params = {"Bucket": self.bucket, "Key": location}
+        if filename:
+            params["ResponseContentDisposition"] = f"attachment; filename=\"{filename}\""
+        if content_type:
+            params["ResponseContentType"] = content_type
+
+        return await asyncio.to_thread(
+            self.client.generate_presigned_url,
+            "get_object",
+            Params=params,
+            ExpiresIn=expires_in or self.presign_expiry,
+        )
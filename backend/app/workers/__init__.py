@@ -0,0 +1,14 @@
+"""
+Background workers
+Long-running jobs that run alongside the API process
+"""
+
+from .extraction_worker import ExtractionWorker, get_extraction_worker
+from .generation_worker import GenerationWorker, get_generation_worker
+
+__all__ = [
+    "ExtractionWorker",
+    "get_extraction_worker",
+    "GenerationWorker",
+    "get_generation_worker",
+]
@@ -0,0 +1,266 @@
+"""
+Background document extraction worker
+Claims PENDING uploads from the database and extracts their text off the request path
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.config import settings
+from app.database import connection
+from app.models.file import ProcessingStatus, StorageType
+from app.processors import DocumentProcessor, ExtractionCache, ProcessingResult, get_extraction_cache
+from app.repositories.file_repository import FileRepository
+from app.storage import get_storage_backend
+
+logger = logging.getLogger(__name__)
+
+Extractor = Callable[[str], Awaitable[ProcessingResult]]
+
+
+class ExtractionWorker:
+    """
+    Pool of background extraction jobs fed by FileRepository
+
+    Responsibilities:
+    - Claim PENDING files with row-level locking (SKIP LOCKED / conditional update)
+    - Run N jobs at a time (DocumentProcessor sends CPU-bound work to the process pool)
+    - Retry crashed extractions with exponential backoff
+    - Reuse cached results for content that was already extracted
+    - Persist results through save_extracted_content
+    - Report queue depth for monitoring
+    """
+
+    def __init__(
+        self,
+        session_maker: Optional[async_sessionmaker] = None,
+        *,
+        concurrency: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        retry_delay: Optional[float] = None,
+        extractor: Optional[Extractor] = None,
+        cache: Optional[ExtractionCache] = None,
+    ) -> None:
+        self._session_maker = session_maker
+        self.concurrency = max(1, concurrency or settings.extraction_worker_concurrency)
+        self.poll_interval = poll_interval if poll_interval is not None else settings.extraction_poll_interval
+        self.max_retries = max_retries if max_retries is not None else settings.extraction_max_retries
+        self.retry_delay = retry_delay if retry_delay is not None else settings.extraction_retry_delay
+        self._processor = DocumentProcessor()
+        self._extractor = extractor or self._processor.extract_text
+        self._cache = cache or get_extraction_cache()
+
+        self._slots = asyncio.Semaphore(self.concurrency)
+        self._wakeup = asyncio.Event()
+        self._loop_task: Optional[asyncio.Task] = None
+        self._jobs: Set[asyncio.Task] = set()
+
+        # Counters for monitoring
+        self.processed_count = 0
+        self.failed_count = 0
+        self.retried_count = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._loop_task is not None and not self._loop_task.done()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._jobs)
+
+    def _get_session_maker(self) -> async_sessionmaker:
+        if self._session_maker is None:
+            self._session_maker = connection.async_session_maker or connection.create_session_maker()
+        return self._session_maker
+
+    async def start(self) -> None:
+        """Start polling loop (idempotent)"""
+        if self.is_running:
+            return
+
+        # Recover files left in PROCESSING by a crashed worker
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=settings.extraction_stale_after)
+        async with self._get_session_maker()() as session:
+            await FileRepository(session).requeue_stale_processing(cutoff)
+
+        self._loop_task = asyncio.create_task(self._dispatch_loop())
+        logger.info(f"Extraction worker started (concurrency={self.concurrency})")
+
+    async def stop(self) -> None:
+        """Stop polling and wait for in-flight jobs"""
+        if self._loop_task:
+            self._loop_task.cancel()
+            try:
+                await self._loop_task
+            except asyncio.CancelledError:
+                pass
+            self._loop_task = None
+
+        if self._jobs:
+            await asyncio.gather(*self._jobs, return_exceptions=True)
+
+        logger.info("Extraction worker stopped")
+
+    def notify(self) -> None:
+        """Wake the polling loop (e.g. right after an upload)"""
+        self._wakeup.set()
+
+    async def queue_depth(self) -> Dict[str, Any]:
+        """Get queue statistics for monitoring"""
+        async with self._get_session_maker()() as session:
+            pending = await FileRepository(session).count_files_pending_processing()
+
+        return {
+            "running": self.is_running,
+            "pending": pending,
+            "in_flight": self.in_flight,
+            "concurrency": self.concurrency,
+            "processed": self.processed_count,
+            "failed": self.failed_count,
+            "retried": self.retried_count,
+        }
+
+    async def run_once(self) -> int:
+        """
+        Claim up to the number of free slots and schedule jobs
+
+        Returns:
+            Number of jobs scheduled
+        """
+        free_slots = self.concurrency - self.in_flight
+        if free_slots <= 0:
+            return 0
+
+        async with self._get_session_maker()() as session:
+            claimed = await FileRepository(session).claim_files_pending_processing(limit=free_slots)
+
+        for file_record in claimed:
+            task = asyncio.create_task(
+                self._run_job(
+                    file_record.id,
+                    file_record.file_path,
+                    file_record.owner_id,
+                    file_record.file_hash,
+                    file_record.storage_type
+                )
+            )
+            self._jobs.add(task)
+            task.add_done_callback(self._jobs.discard)
+
+        return len(claimed)
+
+    async def _dispatch_loop(self) -> None:
+        while True:
+            try:
+                scheduled = await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Extraction worker poll failed: {e}")
+                scheduled = 0
+
+            # Keep draining while there is work and free capacity
+            if scheduled and self.in_flight < self.concurrency:
+                continue
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _run_job(
+        self,
+        file_id: str,
+        file_path: str,
+        owner_id: str,
+        file_hash: Optional[str] = None,
+        storage_type: StorageType = StorageType.LOCAL
+    ) -> None:
+        async with self._slots:
+            try:
+                result = await self._cache.get_or_extract(
+                    file_hash,
+                    self._processor.get_processor_version(file_path),
+                    lambda: self._extract_with_retry(file_id, file_path, storage_type)
+                )
+                await self._save_result(file_id, owner_id, result)
+            finally:
+                # A slot just freed up - poll again without waiting for the interval
+                self._wakeup.set()
+
+    async def _extract_with_retry(
+        self,
+        file_id: str,
+        file_path: str,
+        storage_type: StorageType = StorageType.LOCAL
+    ) -> ProcessingResult:
+        """Run extraction, retrying crashes with exponential backoff"""
+        storage = get_storage_backend(storage_type)
+        attempt = 0
+        while True:
+            try:
+                if not await storage.exists(file_path):
+                    return ProcessingResult(
+                        success=False,
+                        content="",
+                        error_message=f"File not found in storage: {file_path}"
+                    )
+                # Processors need a filesystem path; remote blobs are fetched to a temp file
+                async with storage.local_copy(file_path) as local_path:
+                    return await self._extractor(local_path)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                attempt += 1
+                if attempt > self.max_retries:
+                    logger.error(f"Extraction failed for file {file_id} after {attempt} attempts: {e}")
+                    return ProcessingResult(
+                        success=False,
+                        content="",
+                        error_message=f"Processing error: {str(e)}"
+                    )
+
+                delay = self.retry_delay * (2 ** (attempt - 1))
+                self.retried_count += 1
+                logger.warning(
+                    f"Extraction attempt {attempt} failed for file {file_id}: {e}. "
+                    f"Retrying in {delay:.1f}s..."
+                )
+                await asyncio.sleep(delay)
+
+    async def _save_result(self, file_id: str, owner_id: str, result: ProcessingResult) -> None:
+        async with self._get_session_maker()() as session:
+            file_repo = FileRepository(session)
+
+            if result.success:
+                saved = await file_repo.save_extracted_content(file_id, result.content, owner_id)
+                if saved:
+                    self.processed_count += 1
+                    logger.info(f"Background extraction completed for file {file_id}")
+                    return
+                error_message = "Failed to save extracted content"
+            else:
+                error_message = result.error_message or "Content extraction failed"
+
+            self.failed_count += 1
+            await file_repo.update_processing_status(file_id, ProcessingStatus.FAILED, error_message)
+            logger.warning(f"Background extraction failed for file {file_id}: {error_message}")
+
+
+# Global worker instance
+_extraction_worker: Optional[ExtractionWorker] = None
+
+
+def get_extraction_worker() -> ExtractionWorker:
+    """Get (or lazily create) the application-wide extraction worker"""
+    global _extraction_worker
+    if _extraction_worker is None:
+        _extraction_worker = ExtractionWorker()
+    return _extraction_worker
@@ -0,0 +1,219 @@
+"""
+Background exam generation worker
+Claims QUEUED generation jobs from the database and runs them off the request path
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.config import settings
+from app.database import connection
+from app.models.generation_job import GenerationJob
+from app.repositories.generation_job_repository import GenerationJobRepository
+
+logger = logging.getLogger(__name__)
+
+Generator = Callable[[GenerationJob], Awaitable[Dict[str, Any]]]
+
+
+class GenerationWorker:
+    """
+    Pool of background generation jobs fed by GenerationJobRepository
+
+    Responsibilities:
+    - Claim QUEUED jobs with row-level locking (SKIP LOCKED / conditional update)
+    - Run N jobs at a time through ExamService.generate_exam_from_text
+    - Persist the result (or error) on the job row
+    - Recover jobs left RUNNING by a crashed worker
+    - Report queue depth for monitoring
+
+    Jobs are not retried on generation errors; GenAIService already retries
+    provider calls, and re-running a failed job would bill it twice.
+    """
+
+    def __init__(
+        self,
+        session_maker: Optional[async_sessionmaker] = None,
+        *,
+        concurrency: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        generator: Optional[Generator] = None,
+    ) -> None:
+        self._session_maker = session_maker
+        self.concurrency = max(1, concurrency or settings.generation_worker_concurrency)
+        self.poll_interval = poll_interval if poll_interval is not None else settings.generation_poll_interval
+        self._generator = generator or self._generate
+
+        self._wakeup = asyncio.Event()
+        self._loop_task: Optional[asyncio.Task] = None
+        self._jobs: Set[asyncio.Task] = set()
+
+        # Counters for monitoring
+        self.completed_count = 0
+        self.failed_count = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._loop_task is not None and not self._loop_task.done()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._jobs)
+
+    def _get_session_maker(self) -> async_sessionmaker:
+        if self._session_maker is None:
+            self._session_maker = connection.async_session_maker or connection.create_session_maker()
+        return self._session_maker
+
+    async def start(self) -> None:
+        """Start polling loop (idempotent)"""
+        if self.is_running:
+            return
+
+        # Recover jobs left in RUNNING by a crashed worker
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=settings.generation_job_stale_after)
+        async with self._get_session_maker()() as session:
+            await GenerationJobRepository(session).requeue_stale_running(
+                cutoff, settings.generation_job_max_attempts
+            )
+
+        self._loop_task = asyncio.create_task(self._dispatch_loop())
+        logger.info(f"Generation worker started (concurrency={self.concurrency})")
+
+    async def stop(self) -> None:
+        """Stop polling and wait for in-flight jobs"""
+        if self._loop_task:
+            self._loop_task.cancel()
+            try:
+                await self._loop_task
+            except asyncio.CancelledError:
+                pass
+            self._loop_task = None
+
+        if self._jobs:
+            await asyncio.gather(*self._jobs, return_exceptions=True)
+
+        logger.info("Generation worker stopped")
+
+    def notify(self) -> None:
+        """Wake the polling loop (e.g. right after a job is queued)"""
+        self._wakeup.set()
+
+    async def queue_depth(self) -> Dict[str, Any]:
+        """Get queue statistics for monitoring"""
+        async with self._get_session_maker()() as session:
+            jobs = await GenerationJobRepository(session).count_jobs_by_status()
+
+        return {
+            "running": self.is_running,
+            "jobs": jobs,
+            "in_flight": self.in_flight,
+            "concurrency": self.concurrency,
+            "completed": self.completed_count,
+            "failed": self.failed_count,
+        }
+
+    async def run_once(self) -> int:
+        """
+        Claim up to the number of free slots and schedule jobs
+
+        Returns:
+            Number of jobs scheduled
+        """
+        free_slots = self.concurrency - self.in_flight
+        if free_slots <= 0:
+            return 0
+
+        async with self._get_session_maker()() as session:
+            claimed = await GenerationJobRepository(session).claim_queued_jobs(limit=free_slots)
+
+        for job in claimed:
+            task = asyncio.create_task(self._run_job(job))
+            self._jobs.add(task)
+            task.add_done_callback(self._jobs.discard)
+
+        return len(claimed)
+
+    async def _dispatch_loop(self) -> None:
+        while True:
+            try:
+                scheduled = await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Generation worker poll failed: {e}")
+                scheduled = 0
+
+            # Keep draining while there is work and free capacity
+            if scheduled and self.in_flight < self.concurrency:
+                continue
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _run_job(self, job: GenerationJob) -> None:
+        try:
+            try:
+                result = await self._generator(job)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Generation job {job.id} failed: {e}")
+                await self._save_failure(job.id, str(e) or "Generation failed")
+                return
+
+            async with self._get_session_maker()() as session:
+                saved = await GenerationJobRepository(session).complete_job(job.id, result)
+            if saved:
+                self.completed_count += 1
+                logger.info(f"Generation job {job.id} completed")
+            else:
+                logger.warning(f"Generation job {job.id} finished but was no longer running")
+        finally:
+            # A slot just freed up - poll again without waiting for the interval
+            self._wakeup.set()
+
+    async def _save_failure(self, job_id: str, error_message: str) -> None:
+        self.failed_count += 1
+        async with self._get_session_maker()() as session:
+            await GenerationJobRepository(session).fail_job(job_id, error_message)
+
+    async def _generate(self, job: GenerationJob) -> Dict[str, Any]:
+        """Run the stored request through ExamService"""
+        # Imported here: app.services imports this package (worker notify)
+        from app.services.exam_service import ExamService
+        from app.schemas.exam_schemas import ExamGenerationRequest
+
+        request = ExamGenerationRequest(**job.request)
+        async with self._get_session_maker()() as session:
+            return await ExamService(session).generate_exam_from_text(
+                file_content=request.content,
+                num_questions=request.question_count,
+                subject=request.subject,
+                file_id=request.file_id,
+                ai_provider=request.ai_provider,
+                temperature=request.temperature,
+                max_tokens=request.max_tokens,
+                language=request.language,
+                difficulty=request.difficulty,
+                user_id=job.user_id,
+            )
+
+
+# Global worker instance
+_generation_worker: Optional[GenerationWorker] = None
+
+
+def get_generation_worker() -> GenerationWorker:
+    """Get (or lazily create) the application-wide generation worker"""
+    global _generation_worker
+    if _generation_worker is None:
+        _generation_worker = GenerationWorker()
+    return _generation_worker
@@ -0,0 +1,179 @@
+"""
+Integration tests for the streaming, batch and async job exam generation endpoints
+"""
+import json
+import pytest
+from httpx import AsyncClient, ASGITransport
+from fastapi import HTTPException
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.main import app
+from app.auth.dependencies import current_user_dependency
+from app.database.connection import get_db_session
+
+
+@pytest.fixture
+async def client():
+    """Test client with authenticated user and no database/Redis"""
+    user = MagicMock(id="user-1", email="student@example.com")
+
+    async def override_get_db():
+        yield MagicMock()
+
+    app.dependency_overrides[current_user_dependency] = lambda: user
+    app.dependency_overrides[get_db_session] = override_get_db
+
+    with patch('fastapi_limiter.FastAPILimiter.redis', new=AsyncMock()):
+        with patch('fastapi_limiter.FastAPILimiter.identifier', new=AsyncMock()):
+            with patch('fastapi_limiter.FastAPILimiter.http_callback', new=AsyncMock()):
+                transport = ASGITransport(app=app)
+                async with AsyncClient(transport=transport, base_url="http://test") as ac:
+                    yield ac
+
+    app.dependency_overrides.clear()
+
+
+class TestGenerateStream:
+    """Test POST /exam/generate/stream"""
+
+    @pytest.mark.asyncio
+    async def test_streams_ndjson_events(self, client):
+        """Questions and a final done event are returned as NDJSON lines"""
+        response = await client.post("/exam/generate/stream", json={
+            "content": "Paris is the capital of France. " * 10,
+            "ai_provider": "mock",
+            "question_count": 1,
+        })
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        events = [json.loads(line) for line in response.text.splitlines()]
+        assert events[0]["type"] == "question"
+        assert events[0]["question"]["question_text"] == "What is the capital of France?"
+        assert events[-1]["type"] == "done"
+
+    @pytest.mark.asyncio
+    async def test_short_content_rejected(self, client):
+        """Insufficient content fails before streaming starts"""
+        response = await client.post("/exam/generate/stream", json={"content": "too short", "ai_provider": "mock"})
+
+        assert response.status_code == 400
+
+
+class TestGenerateBatch:
+    """Test POST /exam/generate/batch"""
+
+    @pytest.mark.asyncio
+    async def test_streams_item_results(self, client):
+        """Each item and a final summary are returned as NDJSON lines"""
+        response = await client.post("/exam/generate/batch", json={"items": [
+            {"content": "Paris is the capital of France. " * 10, "ai_provider": "mock", "question_count": 1},
+            {"content": "too short", "ai_provider": "mock"},
+        ]})
+
+        assert response.status_code == 200
+        events = [json.loads(line) for line in response.text.splitlines()]
+        items = {event["index"]: event for event in events if event["type"] == "item"}
+        assert items[0]["success"] and items[0]["questions"]
+        assert not items[1]["success"]
+        assert events[-1] == {"type": "done", "total": 2, "succeeded": 1, "failed": 1}
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_rejected(self, client):
+        """An empty batch fails before streaming starts"""
+        response = await client.post("/exam/generate/batch", json={"items": []})
+
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_charged_per_item(self, client):
+        """Each batch item spends one generation rate limit slot"""
+        redis = AsyncMock()
+        redis.evalsha.return_value = 0
+        with patch('fastapi_limiter.FastAPILimiter.redis', new=redis):
+            response = await client.post("/exam/generate/batch", json={"items": [
+                {"content": "Paris is the capital of France. " * 10, "ai_provider": "mock", "question_count": 1}
+            ] * 3})
+
+        assert response.status_code == 200
+        assert redis.evalsha.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_over_quota_rejected(self, client):
+        """A batch larger than the remaining quota gets 429 before generating"""
+        calls = []
+
+        async def evalsha(*args):
+            calls.append(args)
+            return 0 if len(calls) <= 10 else 5000
+
+        async def too_many(request, response, pexpire):
+            raise HTTPException(status_code=429, detail="Too Many Requests")
+
+        redis = AsyncMock()
+        redis.evalsha.side_effect = evalsha
+        with patch('fastapi_limiter.FastAPILimiter.redis', new=redis), \
+                patch('fastapi_limiter.FastAPILimiter.http_callback', new=too_many), \
+                patch('app.api.exam.ExamService') as service:
+            response = await client.post("/exam/generate/batch", json={"items": [
+                {"content": "Paris is the capital of France. " * 10, "ai_provider": "mock"}
+            ] * 11})
+
+        assert response.status_code == 429
+        service.assert_not_called()
+
+
+class TestGenerateAsyncJob:
+    """Test POST /exam/generate?async=true and the job status endpoints"""
+
+    JOB = {"job_id": "job-1", "status": "queued", "progress": 0}
+
+    @pytest.mark.asyncio
+    async def test_returns_job_id(self, client):
+        """Async generation is queued and answered with 202 and a job id"""
+        with patch(
+            'app.services.exam_service.ExamService.create_generation_job',
+            new=AsyncMock(return_value=(self.JOB, True)),
+        ) as create_job:
+            response = await client.post(
+                "/exam/generate?async=true",
+                json={"content": "Paris is the capital of France. " * 10, "ai_provider": "mock"},
+                headers={"Idempotency-Key": "retry-1"},
+            )
+
+        assert response.status_code == 202
+        assert response.json()["data"]["job_id"] == "job-1"
+        assert response.headers["location"] == "/exam/jobs/job-1"
+        assert create_job.call_args.kwargs["idempotency_key"] == "retry-1"
+
+    @pytest.mark.asyncio
+    async def test_job_events_stream(self, client):
+        """Status changes are sent as SSE job events"""
+        async def updates():
+            yield self.JOB
+            yield None
+            yield {**self.JOB, "status": "completed", "progress": 100, "result": {}}
+
+        with patch(
+            'app.services.exam_service.ExamService.watch_generation_job',
+            new=AsyncMock(return_value=updates()),
+        ):
+            response = await client.get("/exam/jobs/job-1/events")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        frames = response.text.strip().split("\n\n")
+        assert frames[0].startswith("event: job\ndata: ")
+        assert frames[1] == ": keep-alive"
+        assert json.loads(frames[2].split("data: ", 1)[1])["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_unknown_job_not_found(self, client):
+        """Jobs that do not exist (or belong to others) return 404"""
+        with patch(
+            'app.services.exam_service.ExamService.get_generation_job',
+            new=AsyncMock(return_value=None),
+        ):
+            response = await client.get("/exam/jobs/missing")
+
+        assert response.status_code == 404
@@ -0,0 +1,87 @@
+"""
+Benchmark page-sharded PDF extraction against single-process extraction
+
+Usage:
+    python tests/scripts/benchmark_pdf_extraction.py [--pages 500] [--workers 4] [--runs 3] [--pdf path]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import fitz  # PyMuPDF
+
+from app.processors import ExtractionExecutor
+from app.processors.pdf_processor import PDFProcessor, extract_pdf_text
+
+PARAGRAPH = (
+    "Photosynthesis is the process by which green plants and some other organisms use "
+    "sunlight to synthesize foods from carbon dioxide and water. "
+)
+
+
+def build_textbook(path: str, pages: int) -> None:
+    """Create a text-heavy PDF with the given number of pages"""
+    doc = fitz.open()
+    for number in range(pages):
+        page = doc.new_page()
+        body = f"Chapter {number // 20 + 1}, page {number + 1}\n\n" + PARAGRAPH * 30
+        page.insert_textbox(fitz.Rect(50, 50, 550, 800), body, fontsize=9)
+    doc.save(path)
+    doc.close()
+
+
+async def time_runs(label: str, runs: int, extract) -> float:
+    durations = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = await extract()
+        durations.append(time.perf_counter() - started)
+        assert result.success, result.error_message
+    best = min(durations)
+    print(f"{label:<28} best {best:.3f}s  ({len(result.content)} chars, {len(result.page_offsets)} pages)")
+    return best
+
+
+async def main(args) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pdf_path = args.pdf
+        if not pdf_path:
+            pdf_path = os.path.join(tmp_dir, "textbook.pdf")
+            print(f"📄 Building {args.pages}-page PDF...")
+            build_textbook(pdf_path, args.pages)
+
+        processor = PDFProcessor()
+        single = ExtractionExecutor(max_workers=1, timeout=600)
+        sharded = ExtractionExecutor(max_workers=args.workers, timeout=600)
+        try:
+            # Warm up pools so process start-up is not measured
+            await single.run(os.getpid)
+            await asyncio.gather(*(sharded.run(os.getpid) for _ in range(args.workers)))
+
+            baseline = await time_runs(
+                "single process", args.runs,
+                lambda: single.run(extract_pdf_text, pdf_path),
+            )
+            parallel = await time_runs(
+                f"sharded ({args.workers} workers)", args.runs,
+                lambda: processor.extract_text_sharded(pdf_path, sharded, min_pages_per_shard=1),
+            )
+            print(f"⚡ Speedup: {baseline / parallel:.2f}x")
+        finally:
+            single.shutdown()
+            sharded.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--pdf", help="Benchmark an existing PDF instead of a generated one")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,76 @@
+"""
+Benchmark prompt rendering: cached registry vs reading YAML and compiling per call
+
+Usage:
+    python tests/scripts/benchmark_prompt_render.py [--iterations 2000] [--provider openai] [--locale en]
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import yaml
+from jinja2 import Template
+
+from app.genai.prompts import loader
+from app.genai.prompts.loader import BASE_FILE, PROVIDERS_DIR, PromptRegistry, render
+
+CONTENT = "Photosynthesis converts light energy into chemical energy stored in glucose. " * 120
+
+
+def render_uncached(provider: str, locale: str, variables: dict) -> str:
+    """Previous behaviour: parse both YAML files and compile the template on every call"""
+    with open(BASE_FILE, "r", encoding="utf-8") as f:
+        base_cfg = yaml.safe_load(f)
+    with open(os.path.join(PROVIDERS_DIR, f"{provider}.yaml"), "r", encoding="utf-8") as f:
+        prv_cfg = yaml.safe_load(f)
+    merged = {}
+    merged.update(base_cfg.get("variables") or {})
+    merged.update(prv_cfg.get("variables") or {})
+    merged.update(variables)
+    merged.setdefault("required_fields", base_cfg["templates"]["exam_generation"]["required_fields"])
+    source = base_cfg["templates"]["exam_generation"]["locales"][locale]
+    return Template(source).render(**merged).strip()
+
+
+def time_per_call(label: str, iterations: int, func) -> float:
+    func()  # warm up
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    per_call = (time.perf_counter() - started) / iterations
+    print(f"{label:<34} {per_call * 1e6:10.1f} µs/render")
+    return per_call
+
+
+def main(args) -> None:
+    variables = {"content": CONTENT, "question_count": 10}
+
+    baseline = time_per_call(
+        "uncached (YAML + compile per call)", max(1, args.iterations // 20),
+        lambda: render_uncached(args.provider, args.locale, variables),
+    )
+
+    for auto_reload in (False, True):
+        loader._registry = PromptRegistry(auto_reload=auto_reload)
+        loader._registry.warm_up()
+        cached = time_per_call(
+            f"registry (auto_reload={auto_reload})", args.iterations,
+            lambda: render("exam_generation", args.provider, args.locale, variables),
+        )
+        print(f"⚡ Speedup: {baseline / cached:.0f}x")
+
+    assert render("exam_generation", args.provider, args.locale, variables)[0] == render_uncached(
+        args.provider, args.locale, variables
+    ), "cached render differs from uncached render"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--provider", default="openai")
+    parser.add_argument("--locale", default="en")
+    main(parser.parse_args())
@@ -0,0 +1,44 @@
+"""
+CLI Script to move existing uploads into the content-addressed blob store
+Usage: python migrate_to_blob_store.py [--dry-run] [--batch-size 100]
+
+Run `alembic upgrade head` first so the file_blobs table exists.
+"""
+
+import argparse
+import asyncio
+import sys
+import os
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.database.connection import get_db_session
+from app.services.blob_service import BlobService
+
+
+async def migrate(dry_run: bool, batch_size: int):
+    """Migrate legacy per-upload files to shared blobs"""
+
+    async for session in get_db_session():
+        mode = "DRY RUN" if dry_run else "MIGRATION"
+        print(f"🚀 Starting blob store {mode}...")
+
+        stats = await BlobService(session).migrate_legacy_files(batch_size=batch_size, dry_run=dry_run)
+
+        print(f"✅ Moved to blob store:   {stats['migrated']}")
+        print(f"♻️  Deduplicated:          {stats['deduplicated']}")
+        print(f"💾 Bytes reclaimed:       {stats['bytes_reclaimed']}")
+        print(f"⚠️  Missing on disk:       {stats['missing']}")
+        print(f"❌ Failed:                {stats['failed']}")
+        return stats["failed"] == 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Move existing uploads into the blob store")
+    parser.add_argument("--dry-run", action="store_true", help="Report what would change without moving files")
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args()
+
+    ok = asyncio.run(migrate(args.dry_run, args.batch_size))
+    sys.exit(0 if ok else 1)
@@ -29,7 +29,7 @@ async def test_document_service():
                 file_record = user_files[0]
                 print(f"Testing with file: {file_record.original_filename}")
                 print(f"File ID: {file_record.id}")
-                print(f"Processing status: {file_record.processing_status}")
+                print(f"Upload status: {file_record.upload_status}")
                 
                 # Test 2: Process file
                 print(f"\n🔄 Test 2: Processing file...")
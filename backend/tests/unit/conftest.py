@@ -0,0 +1,100 @@
+"""
+Shared fixtures for unit tests
+"""
+import asyncio
+import pytest
+
+
+class FakePipeline:
+    """Queue commands and run them on execute()"""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+    async def execute(self):
+        return [await getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+
+
+class FakePubSub:
+    """Subscriber fed by FakeRedis.publish"""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.channels = set()
+        self.queue = asyncio.Queue()
+        redis.subscribers.append(self)
+
+    async def subscribe(self, *channels):
+        self.channels.update(channels)
+
+    async def listen(self):
+        while True:
+            yield await self.queue.get()
+
+    async def aclose(self):
+        self.redis.subscribers.remove(self)
+
+
+class FakeRedis:
+    """In-memory subset of redis.asyncio: strings, sorted sets, pipelines and pub/sub"""
+
+    def __init__(self):
+        self.values = {}
+        self.zsets = {}
+        self.subscribers = []
+        self.published = []
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+        return True
+
+    async def delete(self, *keys):
+        return sum(1 for key in keys if self.values.pop(key, None) is not None)
+
+    async def zadd(self, name, mapping):
+        self.zsets.setdefault(name, {}).update(mapping)
+        return len(mapping)
+
+    async def zrem(self, name, *members):
+        return sum(1 for m in members if self.zsets.get(name, {}).pop(m, None) is not None)
+
+    async def zcard(self, name):
+        return len(self.zsets.get(name, {}))
+
+    async def zpopmin(self, name, count=1):
+        items = sorted(self.zsets.get(name, {}).items(), key=lambda item: item[1])[:count]
+        for member, _ in items:
+            del self.zsets[name][member]
+        return items
+
+    async def publish(self, channel, data):
+        self.published.append((channel, data))
+        receivers = [s for s in self.subscribers if channel in s.channels]
+        for subscriber in receivers:
+            subscriber.queue.put_nowait({"type": "message", "channel": channel, "data": data})
+        return len(receivers)
+
+    def pubsub(self):
+        return FakePubSub(self)
+
+
+@pytest.fixture
+def fake_redis():
+    """In-memory Redis stand-in"""
+    return FakeRedis()
@@ -0,0 +1,157 @@
+"""
+Unit tests for the provider circuit breaker and its retry_with_backoff integration
+"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.genai.clients.factory import AIClientFactory
+from app.genai.utils.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+from app.genai.utils.retry import RetryConfig, retry_with_backoff
+
+REDIS_CLIENT = "app.genai.utils.circuit_breaker.RedisManager.get_connected_client"
+
+
+def make_breaker(name="test", **options):
+    defaults = dict(window_seconds=60, min_calls=4, failure_rate=0.5, timeout_threshold=3, open_seconds=0.05, shared=False)
+    defaults.update(options)
+    return CircuitBreaker(name, **defaults)
+
+
+async def fail(breaker, times, timeout=False):
+    for _ in range(times):
+        await breaker.before_call()
+        await breaker.record_failure(timeout=timeout)
+
+
+class TestCircuitBreaker:
+    """Test state transitions"""
+
+    @pytest.mark.asyncio
+    async def test_opens_on_failure_rate(self):
+        """Failure rate over min_calls opens the circuit and rejects calls"""
+        breaker = make_breaker()
+        for _ in range(2):
+            await breaker.before_call()
+            await breaker.record_success()
+        await fail(breaker, 1)
+        assert breaker.state == CLOSED
+
+        await fail(breaker, 1)
+
+        assert breaker.state == OPEN
+        with pytest.raises(CircuitOpenError):
+            await breaker.before_call()
+        assert breaker.stats()["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_opens_on_timeouts(self):
+        """Timeouts trip the circuit before min_calls is reached"""
+        breaker = make_breaker(min_calls=100)
+
+        await fail(breaker, 3, timeout=True)
+
+        assert breaker.state == OPEN
+
+    @pytest.mark.asyncio
+    async def test_half_open_lets_single_probe_through(self):
+        """After open_seconds one probe runs, others fail fast; success closes"""
+        breaker = make_breaker()
+        await fail(breaker, 4)
+        await asyncio.sleep(0.06)
+
+        await breaker.before_call()
+        assert breaker.state == HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            await breaker.before_call()
+
+        await breaker.record_success()
+        assert breaker.state == CLOSED
+        await breaker.before_call()
+
+    @pytest.mark.asyncio
+    async def test_failed_probe_reopens(self):
+        """A failed probe re-opens the circuit for another open period"""
+        breaker = make_breaker()
+        await fail(breaker, 4)
+        await asyncio.sleep(0.06)
+
+        await fail(breaker, 1)
+
+        assert breaker.state == OPEN
+        assert breaker.stats()["opened"] == 2
+
+    @pytest.mark.asyncio
+    async def test_open_state_shared_through_redis(self, fake_redis):
+        """A circuit opened by one worker makes the other fail fast"""
+        redis = fake_redis
+        worker_a = make_breaker("shared", shared=True, open_seconds=5)
+        worker_b = make_breaker("shared", shared=True, open_seconds=5, sync_interval=0)
+
+        with patch(REDIS_CLIENT, return_value=redis):
+            await fail(worker_a, 4)
+            with pytest.raises(CircuitOpenError):
+                await worker_b.before_call()
+
+        assert worker_b.state == OPEN
+
+
+class TestRetryWithBreaker:
+    """Test retry_with_backoff consulting the breaker"""
+
+    @pytest.mark.asyncio
+    async def test_outage_stops_spending_retry_budget(self):
+        """Once open, later requests fail fast without calling the provider"""
+        breaker = make_breaker(min_calls=3, open_seconds=30)
+        provider = AsyncMock(side_effect=ConnectionError("provider down"))
+        config = RetryConfig(max_attempts=3, initial_delay=0.001)
+
+        with pytest.raises(ConnectionError):
+            await retry_with_backoff(provider, config=config, breaker=breaker)
+        assert provider.call_count == 3
+
+        with pytest.raises(CircuitOpenError):
+            await retry_with_backoff(provider, config=config, breaker=breaker)
+        assert provider.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_failure_results_open_the_circuit(self):
+        """Clients that report errors as {"success": False} still trip the breaker"""
+        breaker = make_breaker(min_calls=4, open_seconds=30)
+        provider = AsyncMock(return_value={"success": False, "error": "Gemini API error: 503"})
+        config = RetryConfig(max_attempts=3, initial_delay=0.001)
+
+        for _ in range(4):
+            result = await retry_with_backoff(provider, config=config, breaker=breaker)
+            assert result["success"] is False
+
+        assert provider.call_count == 4  # failure results are returned, not retried
+        assert breaker.state == OPEN
+        assert breaker.stats()["opened"] == 1
+        with pytest.raises(CircuitOpenError):
+            await retry_with_backoff(provider, config=config, breaker=breaker)
+
+    @pytest.mark.asyncio
+    async def test_non_transient_error_does_not_count(self):
+        """Non-retryable errors say nothing about provider health"""
+        breaker = make_breaker(min_calls=1)
+        provider = AsyncMock(side_effect=ValueError("bad request"))
+
+        with pytest.raises(ValueError):
+            await retry_with_backoff(provider, config=RetryConfig(max_attempts=1), breaker=breaker)
+
+        assert breaker.state == CLOSED
+        assert breaker.stats()["calls_in_window"] == 0
+
+
+class TestHealthCheckAll:
+    """Test breaker state in factory health report"""
+
+    @pytest.mark.asyncio
+    async def test_reports_breaker_state(self):
+        """Each provider reports health and circuit state"""
+        health = await AIClientFactory.health_check_all()
+
+        assert health["mock"]["is_healthy"] is True
+        assert health["mock"]["circuit"]["state"] in (CLOSED, OPEN, HALF_OPEN)
+        assert set(health) == {"mock", "openai", "gemini"}
@@ -0,0 +1,83 @@
+"""
+Unit tests for LLMDispatcher (concurrency, token budget, fairness, queue timeout)
+"""
+import asyncio
+import pytest
+
+from app.genai.dispatcher import DispatchTimeoutError, LLMDispatcher
+
+
+async def hold(dispatcher, provider, user_id, log, delay=0.02, max_tokens=10):
+    async with dispatcher.slot(provider, "prompt", max_tokens=max_tokens, user_id=user_id) as waited:
+        log.append(user_id)
+        await asyncio.sleep(delay)
+        return waited
+
+
+class TestLLMDispatcher:
+    """Test admission control in front of provider clients"""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        """No more than max_concurrency calls run at once"""
+        dispatcher = LLMDispatcher(limits={"openai": {"concurrency": 2}}, queue_timeout=5)
+        queue = dispatcher.get_queue("openai")
+        peak = 0
+
+        async def call():
+            nonlocal peak
+            async with dispatcher.slot("openai", "prompt"):
+                peak = max(peak, queue.in_flight)
+                await asyncio.sleep(0.02)
+
+        await asyncio.gather(*(call() for _ in range(6)))
+
+        assert peak == 2
+        stats = dispatcher.stats()["openai"]
+        assert (stats["dispatched"], stats["in_flight"], stats["queued"]) == (6, 0, 0)
+        assert stats["max_wait_seconds"] > 0
+
+    @pytest.mark.asyncio
+    async def test_users_served_round_robin(self):
+        """A user with a backlog does not starve a later user"""
+        dispatcher = LLMDispatcher(limits={"openai": {"concurrency": 1}}, queue_timeout=5)
+        order = []
+
+        heavy = [asyncio.create_task(hold(dispatcher, "openai", "heavy", order)) for _ in range(4)]
+        await asyncio.sleep(0)
+        light = asyncio.create_task(hold(dispatcher, "openai", "light", order))
+        await asyncio.gather(*heavy, light)
+
+        assert order.index("light") <= 2
+        assert order.count("heavy") == 4
+
+    @pytest.mark.asyncio
+    async def test_token_budget_delays_calls(self):
+        """Calls wait for the token bucket to refill instead of being sent"""
+        # 60000 TPM refills 1000 tokens per second
+        dispatcher = LLMDispatcher(limits={"gemini": {"concurrency": 5, "tpm": 60000}}, queue_timeout=5)
+        log = []
+
+        first = await hold(dispatcher, "gemini", "u1", log, delay=0, max_tokens=59800)
+        second = await hold(dispatcher, "gemini", "u1", log, delay=0, max_tokens=300)
+
+        assert first < 0.05
+        assert second >= 0.05
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout(self):
+        """Waiting past queue_timeout raises and leaves the queue usable"""
+        dispatcher = LLMDispatcher(limits={"openai": {"concurrency": 1}}, queue_timeout=0.05)
+        log = []
+        running = asyncio.create_task(hold(dispatcher, "openai", "a", log, delay=0.2))
+        await asyncio.sleep(0)
+
+        with pytest.raises(DispatchTimeoutError):
+            await hold(dispatcher, "openai", "b", log)
+
+        await running
+        await hold(dispatcher, "openai", "b", log)
+        stats = dispatcher.stats()["openai"]
+        assert stats["timeouts"] == 1
+        assert stats["queued"] == 0
+        assert log == ["a", "b"]
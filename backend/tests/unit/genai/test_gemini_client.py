@@ -0,0 +1,98 @@
+"""
+Unit tests for GeminiClient streaming with a fake LangChain model
+"""
+import asyncio
+
+import pytest
+
+from app.genai.clients import gemini_client
+from app.genai.clients.gemini_client import GeminiClient
+
+
+class Chunk:
+    def __init__(self, content):
+        self.content = content
+
+
+class FakeLLM:
+    """Yields the given chunks; ``None`` stalls, an exception is raised."""
+
+    def __init__(self, *chunks):
+        self.chunks = chunks
+        self.closed = False
+
+    async def astream(self, messages):
+        try:
+            for chunk in self.chunks:
+                if chunk is None:
+                    await asyncio.sleep(10)
+                elif isinstance(chunk, Exception):
+                    raise chunk
+                else:
+                    yield Chunk(chunk)
+        finally:
+            self.closed = True
+
+
+@pytest.fixture
+def make_client(monkeypatch):
+    monkeypatch.setattr(gemini_client, "ChatGoogleGenerativeAI", object)
+
+    def make(llm):
+        client = GeminiClient()
+        client.api_key = "test-key"
+        client._get_llm = lambda: llm
+        return client
+
+    return make
+
+
+async def collect(client, **kwargs):
+    return [chunk async for chunk in client.stream_exam("prompt", **kwargs)]
+
+
+class TestGeminiStream:
+    @pytest.mark.asyncio
+    async def test_streams_chunks(self, make_client):
+        client = make_client(FakeLLM("a", "", "b"))
+
+        assert await collect(client, timeout=1.0) == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_stalled_stream_times_out(self, make_client):
+        llm = FakeLLM("a", None)
+        client = make_client(llm)
+
+        with pytest.raises(TimeoutError, match="stalled"):
+            await collect(client, timeout=0.05)
+        assert llm.closed
+
+    @pytest.mark.asyncio
+    async def test_timeout_is_per_chunk(self, make_client):
+        class SlowLLM(FakeLLM):
+            async def astream(self, messages):
+                for chunk in self.chunks:
+                    await asyncio.sleep(0.03)
+                    yield Chunk(chunk)
+
+        client = make_client(SlowLLM("a", "b", "c", "d"))
+
+        assert await collect(client, timeout=0.1) == ["a", "b", "c", "d"]
+
+    @pytest.mark.asyncio
+    async def test_transient_errors_become_connection_errors(self, make_client, monkeypatch):
+        class Unavailable(Exception):
+            pass
+
+        monkeypatch.setattr(gemini_client, "TRANSIENT_ERRORS", (Unavailable,))
+        client = make_client(FakeLLM("a", Unavailable("503")))
+
+        with pytest.raises(ConnectionError, match="transient"):
+            await collect(client, timeout=1.0)
+
+    @pytest.mark.asyncio
+    async def test_other_errors_pass_through(self, make_client):
+        client = make_client(FakeLLM(ValueError("bad request")))
+
+        with pytest.raises(ValueError):
+            await collect(client, timeout=1.0)
@@ -0,0 +1,116 @@
+"""
+Unit tests for GenerationCache and its use in GenAIService
+
+Uses the mock provider; Redis tier uses the fake_redis fixture.
+"""
+import pytest
+from unittest.mock import patch
+
+from app.genai.cache import GenerationCache, LRU_KEY, make_fingerprint
+from app.genai.service import GenAIService
+from app.genai.utils import retry as retry_module
+from app.schemas.exam_schemas import ExamGenerationRequest
+
+REDIS_CLIENT = "app.genai.cache.RedisManager.get_connected_client"
+QUESTIONS = [{"question_text": "Q1", "options": ["a", "b", "c", "d"], "correct_answer": "A"}]
+
+
+def make_request(**overrides):
+    values = {"content": "Photosynthesis converts light into chemical energy.", "ai_provider": "mock", "question_count": 1}
+    values.update(overrides)
+    return ExamGenerationRequest(**values)
+
+
+@pytest.fixture
+def service():
+    with patch(REDIS_CLIENT, return_value=None):
+        yield GenAIService(cache=GenerationCache(max_entries=10, l1_max_entries=2, ttl=60, enabled=True))
+
+
+@pytest.fixture
+def retry_spy():
+    with patch("app.genai.service.retry_with_backoff", wraps=retry_module.retry_with_backoff) as spy:
+        yield spy
+
+
+class TestFingerprint:
+    """Test cache key derivation"""
+
+    def test_params_change_fingerprint(self):
+        """Any sampling param or model change yields a different key"""
+        base = make_fingerprint("prompt", "openai", "gpt-4o-mini", {"temperature": 0.0, "max_tokens": 100})
+
+        assert base == make_fingerprint("prompt", "openai", "gpt-4o-mini", {"max_tokens": 100, "temperature": 0.0})
+        assert base != make_fingerprint("prompt", "openai", "gpt-4o", {"temperature": 0.0, "max_tokens": 100})
+        assert base != make_fingerprint("prompt", "openai", "gpt-4o-mini", {"temperature": 0.0, "max_tokens": 200})
+
+
+class TestGenAIServiceCache:
+    """Test cache integration in generate_exam"""
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_retry_and_api(self, service, retry_spy):
+        """Second identical deterministic request is served from cache"""
+        first = await service.generate_exam(make_request())
+        second = await service.generate_exam(make_request())
+
+        assert first["success"] and second["success"]
+        assert second["questions"] == first["questions"]
+        assert first["metadata"]["cache_hit"] is False
+        assert second["metadata"]["cache_hit"] is True
+        assert retry_spy.call_count == 1
+        assert service.cache.stats()["providers"]["mock"]["hit_ratio"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_nonzero_temperature_not_cached(self, service, retry_spy):
+        """Sampling requests always call the provider"""
+        await service.generate_exam(make_request(temperature=0.7))
+        await service.generate_exam(make_request(temperature=0.7))
+
+        assert retry_spy.call_count == 2
+        assert service.cache.stats()["providers"] == {}
+
+    @pytest.mark.asyncio
+    async def test_hit_returns_independent_copy(self, service):
+        """Mutating a returned result does not corrupt the cached entry"""
+        first = await service.generate_exam(make_request())
+        first["questions"][0]["question_text"] = "changed"
+
+        second = await service.generate_exam(make_request())
+
+        assert second["questions"][0]["question_text"] != "changed"
+
+
+class TestGenerationCacheTiers:
+    """Test L1 bound and Redis tier"""
+
+    @pytest.mark.asyncio
+    async def test_l1_is_lru_bounded(self):
+        """Least recently used fingerprint is dropped from L1"""
+        with patch(REDIS_CLIENT, return_value=None):
+            cache = GenerationCache(l1_max_entries=2, ttl=60, enabled=True)
+            await cache.put("a", "mock", QUESTIONS, {})
+            await cache.put("b", "mock", QUESTIONS, {})
+            assert await cache.get("a", "mock") is not None
+            await cache.put("c", "mock", QUESTIONS, {})
+
+            assert await cache.get("b", "mock") is None
+            assert await cache.get("a", "mock") is not None
+            assert cache.evictions == 1
+
+    @pytest.mark.asyncio
+    async def test_redis_hit_populates_l1(self, fake_redis):
+        """Entry stored by another instance is found in Redis and kept locally"""
+        redis = fake_redis
+        with patch(REDIS_CLIENT, return_value=redis):
+            writer = GenerationCache(max_entries=5, ttl=60, enabled=True)
+            await writer.put("fp", "openai", QUESTIONS, {"model": "gpt-4o-mini"})
+
+            reader = GenerationCache(max_entries=5, ttl=60, enabled=True)
+            entry = await reader.get("fp", "openai")
+            await reader.get("fp", "openai")
+
+            assert entry["questions"] == QUESTIONS
+            assert await redis.zcard(LRU_KEY) == 1
+            counters = reader.stats()["providers"]["openai"]
+            assert (counters["redis_hits"], counters["l1_hits"]) == (1, 1)
@@ -0,0 +1,122 @@
+"""
+Unit tests for long-document (chunked map-reduce) generation
+"""
+import asyncio
+import json
+import pytest
+from unittest.mock import patch
+
+from app.genai.cache import GenerationCache
+from app.genai.dispatcher import LLMDispatcher
+from app.genai.clients.mock_client import MockClient
+from app.genai.service import GenAIService
+from app.genai.utils.chunking import allocate_questions, merge_questions, split_into_chunks
+from app.schemas.exam_schemas import ExamGenerationRequest
+
+
+class SlowEchoClient(MockClient):
+    """Returns one question per chunk naming its first word; tracks concurrency"""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+
+    async def generate_exam(self, prompt, **kwargs):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        topic = prompt.split("CONTENT:")[-1].split()[0]
+        questions = [{
+            "question_text": f"What does section {topic} describe?",
+            "options": ["a", "b", "c", "d"],
+            "correct_answer": "A",
+            "explanation": topic,
+        }]
+        return {"success": True, "raw_response": json.dumps(questions), "metadata": {"ai_provider": "mock"}, "error": None}
+
+
+def make_document(sections, section_chars=1500):
+    return "\n\n".join(f"S{i} " + "word " * (section_chars // 5) for i in range(sections))
+
+
+class TestChunking:
+    """Test splitting, allocation and merging"""
+
+    def test_chunks_respect_limit_and_paragraphs(self):
+        """Chunks fit max_chars and keep paragraphs whole"""
+        text = make_document(6, section_chars=1000)
+
+        chunks = split_into_chunks(text, 2500)
+
+        assert len(chunks) == 3
+        assert all(len(chunk) <= 2500 for chunk in chunks)
+        assert chunks[1].startswith("S2 ")
+
+    def test_oversized_paragraph_is_split(self):
+        """A paragraph longer than max_chars is split by sentences"""
+        text = " ".join(f"Sentence {i} is here." for i in range(200))
+
+        chunks = split_into_chunks(text, 500)
+
+        assert all(len(chunk) <= 500 for chunk in chunks)
+        assert " ".join(chunks) == text
+
+    def test_allocation_is_proportional_and_spread(self):
+        """Allocation sums to total and spreads over many small chunks"""
+        assert allocate_questions([3000, 1000], 8) == [6, 2]
+        spread = allocate_questions([100] * 10, 3)
+        assert sum(spread) == 3
+        assert spread.index(1) > 0
+
+    def test_merge_removes_near_duplicates(self):
+        """Near-identical question texts are kept once"""
+        merged = merge_questions([
+            [{"question_text": "What is the capital of France?"}],
+            [{"question_text": "What is the capital of France ?"}, {"question_text": "Who wrote Hamlet?"}],
+        ])
+
+        assert [q["question_text"] for q in merged] == ["What is the capital of France?", "Who wrote Hamlet?"]
+
+
+class TestLongDocumentGeneration:
+    """Test GenAIService map-reduce mode"""
+
+    @pytest.mark.asyncio
+    async def test_chunks_generated_concurrently_under_limit(self):
+        """Each chunk is generated, bounded by dispatcher concurrency"""
+        client = SlowEchoClient()
+        service = GenAIService(
+            cache=GenerationCache(enabled=False),
+            dispatcher=LLMDispatcher(limits={"mock": {"concurrency": 3}}),
+        )
+        request = ExamGenerationRequest(content=make_document(8, 8000), ai_provider="mock", question_count=8, language="en")
+
+        with patch("app.genai.service.AIClientFactory.create_client", return_value=client):
+            result = await service.generate_exam(request)
+
+        assert result["success"]
+        assert result["metadata"]["long_document"] is True
+        assert result["metadata"]["chunks"] == client.calls == 8
+        assert len(result["questions"]) == 8
+        assert result["questions"][0]["explanation"] == "S0"
+        assert client.max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_short_content_uses_single_call(self):
+        """Content within the prompt budget is not chunked"""
+        client = SlowEchoClient(delay=0)
+        service = GenAIService(cache=GenerationCache(enabled=False))
+        request = ExamGenerationRequest(content="S0 short notes", ai_provider="mock", question_count=1)
+
+        with patch("app.genai.service.AIClientFactory.create_client", return_value=client):
+            result = await service.generate_exam(request)
+
+        assert result["success"]
+        assert client.calls == 1
+        assert "long_document" not in result["metadata"]
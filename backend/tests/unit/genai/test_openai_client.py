@@ -0,0 +1,137 @@
+"""
+Unit tests for OpenAIClient against a local stub of the chat completions API
+
+The stub runs in a background thread and counts TCP connections, so pooling
+and keep-alive are observable without network access.
+"""
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.genai.clients import http_pool
+from app.genai.clients.openai_client import OpenAIClient
+from app.genai.utils.retry import RetryConfig, retry_with_backoff
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        prompt = body["messages"][0]["content"]
+
+        if "slow" in prompt:
+            time.sleep(1.0)
+        if "flaky" in prompt:
+            with self.server.lock:
+                self.server.flaky_calls += 1
+                fail = self.server.flaky_calls == 1
+            if fail:
+                return self._send(500, {"error": {"message": "upstream overloaded", "type": "server_error"}})
+
+        time.sleep(0.05)
+        return self._send(200, {
+            "id": "chatcmpl-stub",
+            "object": "chat.completion",
+            "created": 0,
+            "model": body["model"],
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": json.dumps([{"question_text": prompt}])},
+                "finish_reason": "stop",
+            }],
+        })
+
+    def _send(self, status, payload):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.connections = 0
+    server.flaky_calls = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+async def client(stub_server, monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setattr(http_pool.settings, "genai_http_max_connections", 2)
+    await http_pool.close_http_client()
+
+    openai_client = OpenAIClient(model_name="gpt-stub")
+    openai_client.base_url = f"http://127.0.0.1:{stub_server.server_port}/v1"
+    yield openai_client
+    await http_pool.close_http_client()
+
+
+class TestOpenAIClientPooling:
+    """Test native async client over the shared pool"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_reuse_pooled_connections(self, client, stub_server):
+        """Concurrent calls succeed over at most max_connections sockets"""
+        results = await asyncio.gather(*(client.generate_exam(f"prompt {i}") for i in range(8)))
+
+        assert all(result["success"] for result in results)
+        assert json.loads(results[3]["raw_response"])[0]["question_text"] == "prompt 3"
+        assert stub_server.connections <= 2
+
+        await client.generate_exam("one more")
+        assert stub_server.connections <= 2
+
+    @pytest.mark.asyncio
+    async def test_request_timeout_fits_inside_retry_timeout(self, client):
+        """HTTP timeout is derived from the retry attempt timeout and raised as TimeoutError"""
+        started = time.monotonic()
+
+        with pytest.raises(TimeoutError):
+            await client.generate_exam("slow prompt", timeout=0.3)
+
+        assert time.monotonic() - started < 0.9
+
+    @pytest.mark.asyncio
+    async def test_server_error_is_retried(self, client, stub_server):
+        """5xx is raised as a transient error and succeeds on retry"""
+        result = await retry_with_backoff(
+            client.generate_exam,
+            "flaky prompt",
+            config=RetryConfig(max_attempts=2, initial_delay=0.01, timeout=5),
+            timeout=5,
+        )
+
+        assert result["success"]
+        assert stub_server.flaky_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_pool_shared_between_clients(self, client):
+        """Clients bind to the same pool for the running loop"""
+        other = OpenAIClient()
+        client._get_client()
+        other._get_client()
+
+        assert other._http_client is client._http_client is http_pool.get_http_client()
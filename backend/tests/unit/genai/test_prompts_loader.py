@@ -1,8 +1,12 @@
 import os
+import shutil
 import sys
 import pytest
+from unittest.mock import patch
+from jinja2 import Template
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from app.genai.prompts.loader import render
+from app.genai.prompts import loader
+from app.genai.prompts.loader import PROVIDERS_DIR, PromptRegistry, render
 
 
 def test_render_openai_vi_minimal():
@@ -47,3 +51,48 @@ def test_render_invalid_template_key():
         )
 
 
+
+
+@pytest.fixture
+def prompt_dir(tmp_path):
+    providers = tmp_path / "providers"
+    shutil.copytree(PROVIDERS_DIR, providers)
+    return providers
+
+
+def test_registry_reads_and_compiles_once(prompt_dir, tmp_path):
+    registry = PromptRegistry(str(prompt_dir), auto_reload=False, bytecode_cache_dir=str(tmp_path / "bytecode"))
+
+    with patch("app.genai.prompts.loader._read_yaml", wraps=loader._read_yaml) as read_yaml:
+        for _ in range(5):
+            registry.template("exam_generation", "en")
+            registry.provider("openai")
+
+    assert read_yaml.call_count == 2  # base.yaml + openai.yaml
+    assert registry.compiled == 1
+    assert list((tmp_path / "bytecode").iterdir())
+
+
+def test_registry_hot_reloads_changed_yaml(prompt_dir, tmp_path):
+    registry = PromptRegistry(str(prompt_dir), auto_reload=True, bytecode_cache_dir="")
+    base_file = prompt_dir / "base.yaml"
+    assert "Create" in registry.template("exam_generation", "en").render(question_count=1, content="x", max_content_length=10)
+
+    base_file.write_text(base_file.read_text(encoding="utf-8").replace("Create {{", "Write {{"), encoding="utf-8")
+    stat = os.stat(base_file)
+    os.utime(base_file, (stat.st_atime, stat.st_mtime + 5))
+
+    assert "Write" in registry.template("exam_generation", "en").render(question_count=1, content="x", max_content_length=10)
+    assert registry.compiled == 2
+
+
+def test_render_matches_fresh_template():
+    """Cached render gives the same prompt as compiling the template from YAML"""
+    variables = {"content": "Photosynthesis " * 50, "question_count": 3}
+    prompt, cfg, _ = render(template_key="exam_generation", provider="openai", locale="en", variables=variables)
+
+    base = loader._read_yaml(os.path.join(PROVIDERS_DIR, "base.yaml"))
+    source = base["templates"]["exam_generation"]["locales"]["en"]
+    expected = Template(source).render(**cfg["resolved_variables"]).strip()
+
+    assert prompt == expected
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 from app.genai.utils.response_parser import ResponseParser
 
@@ -88,6 +90,49 @@ class TestResponseParser:
 
         assert result == []
 
+    def test_parse_truncated_array_keeps_complete_objects(self):
+        """Response cắt ngang bởi max_tokens → giữ 9/10 câu hỏi."""
+
+        items = [json.dumps({"question_text": f"Q{i}", "options": ["a", "b", "c", "d"]}) for i in range(10)]
+        json_str = "```json\n[" + ", ".join(items)
+        json_str = json_str[:-20]
+
+        result, dropped = self.parser.parse_json_response_with_report(json_str)
+
+        assert [q["question_text"] for q in result] == [f"Q{i}" for i in range(9)]
+        assert [(d.index, d.reason) for d in dropped] == [(9, "truncated before closing brace")]
+
+    def test_parse_malformed_middle_object_reported(self):
+        """Object lỗi ở giữa bị drop, các object còn lại vẫn được parse."""
+
+        json_str = 'Here you go:\n[{"question_text": "Q0"}, {question_text: "Q1"}, {"question_text": "Q2 {x}"}]'
+
+        result, dropped = self.parser.parse_json_response_with_report(json_str)
+
+        assert [q["question_text"] for q in result] == ["Q0", "Q2 {x}"]
+        assert dropped[0].index == 1
+        assert dropped[0].reason.startswith("invalid JSON")
+        assert dropped[0].snippet.startswith("{question_text")
+
+    def test_parse_fixes_invalid_escapes(self):
+        """Escape không hợp lệ (vd. LaTeX) được sửa, escape hợp lệ giữ nguyên."""
+
+        json_str = '[{"question_text": "Solve \\(x^2\\) \\"now\\"", "explanation": "line1\nline2"}]'
+
+        result = self.parser.parse_json_response(json_str)
+
+        assert result[0]["question_text"] == 'Solve (x^2) "now"'
+        assert result[0]["explanation"] == "line1\nline2"
+
+    def test_parse_skips_brackets_in_prose(self):
+        """Dấu [ trong prose (không theo sau bởi {) bị bỏ qua."""
+
+        json_str = 'Generated [10] questions [see below]:\n[{"question_text": "Q"}]'
+
+        result = self.parser.parse_json_response(json_str)
+
+        assert result == [{"question_text": "Q"}]
+
     # ========== Test Group 2: Question Normalization ==========
 
     def test_normalize_with_string_options(self):
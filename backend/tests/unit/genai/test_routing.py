@@ -0,0 +1,293 @@
+"""
+Unit tests for latency-aware provider routing (ranking, hedging, failover)
+"""
+import asyncio
+import json
+import time
+import pytest
+from unittest.mock import patch
+
+from app.genai.cache import GenerationCache
+from app.genai.clients.mock_client import MockClient
+from app.genai.dispatcher import LLMDispatcher
+from app.genai.routing import ProviderRouter
+from app.genai.service import GenAIService
+from app.genai.utils.circuit_breaker import CircuitBreaker
+from app.genai.utils.retry import RetryConfig
+from app.schemas.exam_schemas import ExamGenerationRequest
+
+
+class TimedClient(MockClient):
+    """Answers after a fixed delay, or fails; records cancellation"""
+
+    def __init__(self, name, delay=0.0, fail=False, raise_first=False):
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.raise_first = raise_first
+        self.calls = 0
+        self.cancelled = False
+
+    async def generate_exam(self, prompt, **kwargs):
+        self.calls += 1
+        if self.raise_first and self.calls == 1:
+            raise ConnectionError(f"{self.name} connection reset")
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.fail:
+            return {"success": False, "raw_response": "", "metadata": {"ai_provider": self.name}, "error": f"{self.name} down"}
+        questions = [{"question_text": f"From {self.name}?", "options": ["a", "b", "c", "d"], "correct_answer": "A"}]
+        return {"success": True, "raw_response": json.dumps(questions), "metadata": {"ai_provider": self.name}, "error": None}
+
+
+def make_service(clients, limits=None, **router_options):
+    router = ProviderRouter(
+        enabled=True,
+        providers=list(clients),
+        min_delay=0.05,
+        default_delay=0.1,
+        **router_options,
+    )
+    service = GenAIService(
+        cache=GenerationCache(enabled=False),
+        dispatcher=LLMDispatcher(limits=limits or {}, queue_timeout=5),
+        router=router,
+    )
+    factory = patch(
+        "app.genai.service.AIClientFactory.create_client",
+        side_effect=lambda provider, **kwargs: clients[provider.value],
+    )
+    return service, router, factory
+
+
+def make_request(provider="gemini"):
+    return ExamGenerationRequest(content="Short notes about photosynthesis", ai_provider=provider, question_count=1)
+
+
+class TestProviderRouter:
+    """Test rolling statistics and ranking"""
+
+    def test_hedge_delay_follows_p95_within_bounds(self):
+        """Default delay until enough samples, then clamped p95"""
+        router = ProviderRouter(
+            enabled=True, providers=["openai"], window=20, min_delay=0.5, max_delay=5, default_delay=3
+        )
+        assert router.hedge_delay("openai") == 3
+
+        for latency in [1.0] * 18 + [2.0, 2.5]:
+            router.record("openai", latency, success=True)
+        assert router.hedge_delay("openai") == 2.0
+
+        for _ in range(20):
+            router.record("openai", 0.1, success=True)
+        assert router.hedge_delay("openai") == 0.5
+
+    def test_rank_prefers_healthy_then_fast(self):
+        """Degraded providers rank last, others by p95"""
+        router = ProviderRouter(enabled=True, providers=["openai", "gemini", "mock"], is_available=lambda p: True)
+        for _ in range(10):
+            router.record("openai", 0.2, success=False)
+            router.record("gemini", 2.0, success=True)
+            router.record("mock", 0.5, success=True)
+
+        assert router.rank(["openai", "gemini", "mock"]) == ["mock", "gemini", "openai"]
+        assert router.plan("openai") == ["gemini", "openai"]
+        assert router.plan("gemini") == ["gemini", "openai"]
+
+    def test_mock_never_hedged(self):
+        """mock is neither hedged away from nor used as a hedge"""
+        router = ProviderRouter(enabled=True, providers=["mock", "openai", "gemini"], is_available=lambda p: True)
+
+        assert router.plan("mock") == ["mock"]
+        assert "mock" not in router.plan("gemini")
+
+    @pytest.mark.asyncio
+    async def test_unavailable_providers_not_hedged(self):
+        """Unconfigured providers and providers with an open circuit are skipped"""
+        breakers = {"openai": CircuitBreaker("openai", timeout_threshold=1, open_seconds=60, shared=False)}
+        configured = {"gemini": MockClient(), "openai": MockClient()}
+
+        def create_client(provider, **kwargs):
+            if provider.value not in configured:
+                raise ValueError(f"{provider.value} client is not properly configured")
+            return configured[provider.value]
+
+        router = ProviderRouter(enabled=True, providers=["gemini", "openai"])
+        with patch("app.genai.routing.AIClientFactory.create_client", side_effect=create_client), \
+                patch("app.genai.routing.get_circuit_breaker", side_effect=breakers.__getitem__):
+            assert router.plan("gemini") == ["gemini", "openai"]
+
+            await breakers["openai"].record_failure(timeout=True)
+            assert router.plan("gemini") == ["gemini"]
+
+            breakers["openai"] = CircuitBreaker("openai", shared=False)
+            del configured["openai"]
+            assert router.plan("gemini") == ["gemini"]
+
+    def test_disabled_router_keeps_requested_provider(self):
+        """Without hedging only the requested provider is planned"""
+        router = ProviderRouter(enabled=False, providers=["openai", "gemini"])
+
+        assert router.plan("gemini") == ["gemini"]
+
+
+class TestHedgedGeneration:
+    """Test GenAIService hedging and failover"""
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged_and_cancelled(self):
+        """Secondary wins when primary exceeds the hedge deadline"""
+        clients = {"gemini": TimedClient("gemini", delay=2.0), "openai": TimedClient("openai", delay=0.05)}
+        service, router, factory = make_service(clients)
+        started = time.monotonic()
+
+        with factory:
+            result = await service.generate_exam(make_request("gemini"))
+
+        assert time.monotonic() - started < 1.0
+        assert result["success"]
+        assert result["questions"][0]["question_text"] == "From openai?"
+        assert result["metadata"]["hedged"] is True
+        assert result["metadata"]["served_by"] == "openai"
+        assert result["metadata"]["requested_provider"] == "gemini"
+        assert clients["gemini"].cancelled
+        assert router.get_stats("openai").hedge_wins == 1
+
+    @pytest.mark.asyncio
+    async def test_loser_latency_counted_from_send(self):
+        """A cancelled loser is recorded as a success lower bound since its request was sent"""
+        clients = {"gemini": TimedClient("gemini", delay=2.0), "openai": TimedClient("openai", delay=0.05)}
+        service, router, factory = make_service(clients, limits={"gemini": {"concurrency": 1}})
+
+        async def hold_slot():
+            async with service.dispatcher.slot("gemini", "other request"):
+                await asyncio.sleep(0.3)
+
+        holder = asyncio.create_task(hold_slot())
+        await asyncio.sleep(0)
+        with factory:
+            result = await service.generate_exam(make_request("gemini"))
+        await holder
+
+        assert result["metadata"]["served_by"] == "openai"
+        stats = router.get_stats("gemini")
+        assert stats.samples == 1 and stats.errors == 0
+        # Queue wait (0.3s) is excluded from the recorded latency
+        latency, = [latency for latency, _ in stats._samples]
+        assert latency < 0.3
+
+    @pytest.mark.asyncio
+    async def test_retrying_loser_not_recorded(self):
+        """A loser cancelled between retries is not recorded as a success"""
+        clients = {
+            "gemini": TimedClient("gemini", delay=2.0, raise_first=True),
+            "openai": TimedClient("openai", delay=0.05),
+        }
+        service, router, factory = make_service(clients)
+
+        with factory, patch.object(service, "_get_retry_config", return_value=RetryConfig(initial_delay=0.01, timeout=None)):
+            result = await service.generate_exam(make_request("gemini"))
+
+        assert result["metadata"]["served_by"] == "openai"
+        assert clients["gemini"].calls == 2
+        assert router.get_stats("gemini").samples == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_request_records_nothing(self):
+        """A caller going away records no outcome for calls still in flight"""
+        clients = {"gemini": TimedClient("gemini", delay=2.0), "openai": TimedClient("openai", delay=2.0)}
+        service, router, factory = make_service(clients)
+
+        with factory:
+            task = asyncio.create_task(service.generate_exam(make_request("gemini")))
+            await asyncio.sleep(0.2)  # past the hedge deadline, both providers in flight
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        assert clients["gemini"].cancelled and clients["openai"].cancelled
+        assert router.get_stats("gemini").samples == 0
+        assert router.get_stats("openai").samples == 0
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_is_not_hedged(self):
+        """No secondary call when the primary answers within the deadline"""
+        clients = {"gemini": TimedClient("gemini", delay=0.01), "openai": TimedClient("openai")}
+        service, router, factory = make_service(clients)
+
+        with factory:
+            result = await service.generate_exam(make_request("gemini"))
+
+        assert result["metadata"]["served_by"] == "gemini"
+        assert result["metadata"]["hedged"] is False
+        assert clients["openai"].calls == 0
+        assert router.get_stats("gemini").samples == 1
+
+    @pytest.mark.asyncio
+    async def test_queue_wait_does_not_trigger_hedge(self):
+        """The hedge timer starts once the primary holds its dispatcher slot"""
+        clients = {"gemini": TimedClient("gemini", delay=0.01), "openai": TimedClient("openai")}
+        service, _, factory = make_service(clients, limits={"gemini": {"concurrency": 1}})
+
+        async def hold_slot():
+            async with service.dispatcher.slot("gemini", "other request"):
+                await asyncio.sleep(0.3)
+
+        holder = asyncio.create_task(hold_slot())
+        await asyncio.sleep(0)
+        with factory:
+            result = await service.generate_exam(make_request("gemini"))
+        await holder
+
+        assert result["metadata"]["served_by"] == "gemini"
+        assert result["metadata"]["hedged"] is False
+        assert clients["openai"].calls == 0
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_while_dispatcher_queue_busy(self):
+        """A slow primary is not hedged onto a provider with queued calls"""
+        clients = {"gemini": TimedClient("gemini", delay=0.3), "openai": TimedClient("openai")}
+        service, _, factory = make_service(clients, limits={"openai": {"concurrency": 1}})
+
+        async def hold_slot():
+            async with service.dispatcher.slot("openai", "other request"):
+                await asyncio.sleep(0.5)
+
+        holders = [asyncio.create_task(hold_slot()) for _ in range(2)]
+        await asyncio.sleep(0)
+        with factory:
+            result = await service.generate_exam(make_request("gemini"))
+        for holder in holders:
+            holder.cancel()
+        await asyncio.gather(*holders, return_exceptions=True)
+
+        assert result["metadata"]["served_by"] == "gemini"
+        assert result["metadata"]["hedged"] is False
+        assert clients["openai"].calls == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_primary_fails_over(self):
+        """A provider error moves on to the next provider immediately"""
+        clients = {"gemini": TimedClient("gemini", fail=True), "openai": TimedClient("openai", delay=0.01)}
+        service, router, factory = make_service(clients)
+
+        with factory:
+            result = await service.generate_exam(make_request("gemini"))
+
+        assert result["success"]
+        assert result["metadata"]["providers_tried"] == ["gemini", "openai"]
+        assert router.get_stats("gemini").errors == 1
+
+    @pytest.mark.asyncio
+    async def test_all_providers_failing_returns_error(self):
+        """Errors from every provider are reported together"""
+        clients = {"gemini": TimedClient("gemini", fail=True), "openai": TimedClient("openai", fail=True)}
+        service, _, factory = make_service(clients)
+
+        with factory:
+            result = await service.generate_exam(make_request("gemini"))
+
+        assert not result["success"]
+        assert "gemini down" in result["error"] and "openai down" in result["error"]
@@ -0,0 +1,162 @@
+"""
+Unit tests for streamed exam generation and the incremental JSON array parser
+"""
+import asyncio
+import json
+import pytest
+from unittest.mock import patch
+
+from app.genai.cache import GenerationCache
+from app.genai.clients.mock_client import MockClient
+from app.genai.dispatcher import LLMDispatcher
+from app.genai.service import GenAIService
+from app.genai.utils.circuit_breaker import CLOSED, OPEN, CircuitBreaker
+from app.genai.utils.stream_parser import IncrementalJSONArrayParser
+from app.schemas.exam_schemas import ExamGenerationRequest
+
+
+def make_question(i):
+    return {
+        "question_text": f"Question {i} about {{braces}} and \"quotes\"?",
+        "options": ["a", "b", "c", "d"],
+        "correct_answer": "B",
+        "explanation": f"Because {i}",
+    }
+
+
+class StreamingClient(MockClient):
+    """Streams a markdown-wrapped JSON array in small pieces"""
+
+    def __init__(self, count=3, piece_size=7, delay=0.01):
+        self.text = "```json\n" + json.dumps([make_question(i) for i in range(count)]) + "\n```"
+        self.piece_size = piece_size
+        self.delay = delay
+        self.pieces_sent = 0
+        self.streams = 0
+
+    async def stream_exam(self, prompt, **kwargs):
+        self.streams += 1
+        for start in range(0, len(self.text), self.piece_size):
+            await asyncio.sleep(self.delay)
+            self.pieces_sent += 1
+            yield self.text[start:start + self.piece_size]
+
+
+def make_service():
+    return GenAIService(cache=GenerationCache(enabled=True, l1_max_entries=10, ttl=60), dispatcher=LLMDispatcher())
+
+
+def make_request():
+    return ExamGenerationRequest(content="Short study notes about cells.", ai_provider="mock", question_count=3)
+
+
+class TestIncrementalJSONArrayParser:
+    """Test object-at-a-time parsing"""
+
+    def test_emits_each_object_when_closed(self):
+        """Objects are emitted as soon as their closing brace arrives"""
+        text = "Here you go:\n```json\n" + json.dumps([make_question(0), make_question(1)]) + "\n```"
+        parser = IncrementalJSONArrayParser()
+        emitted_at = []
+
+        for position, ch in enumerate(text):
+            if parser.feed(ch):
+                emitted_at.append(position)
+
+        assert len(emitted_at) == 2
+        assert emitted_at[0] < text.index("Question 1")
+        assert parser.close() == []
+
+    def test_malformed_object_dropped(self):
+        """An unparseable element is skipped without losing the rest"""
+        parser = IncrementalJSONArrayParser()
+
+        objects = parser.feed('[{"question_text": "ok"}, {"question_text": oops}, {"question_text": "fine"}]')
+
+        assert [o["question_text"] for o in objects] == ["ok", "fine"]
+        assert [d.index for d in parser.dropped] == [1]
+
+
+class TestStreamExam:
+    """Test GenAIService.stream_exam"""
+
+    @pytest.mark.asyncio
+    async def test_first_question_before_stream_ends(self):
+        """First question event is yielded while the provider is still streaming"""
+        client = StreamingClient()
+        total_pieces = -(-len(client.text) // client.piece_size)
+        events = []
+
+        with patch("app.genai.service.AIClientFactory.create_client", return_value=client):
+            async for event in make_service().stream_exam(make_request()):
+                if event["type"] == "question" and not events:
+                    assert client.pieces_sent < total_pieces
+                events.append(event)
+
+        questions = [e for e in events if e["type"] == "question"]
+        assert [q["index"] for q in questions] == [0, 1, 2]
+        assert questions[0]["question"]["correct_answer"] == "B"
+        assert events[-1]["type"] == "done"
+        assert events[-1]["metadata"]["total_questions"] == 3
+
+    @pytest.mark.asyncio
+    async def test_second_stream_served_from_cache(self):
+        """Deterministic streamed results are cached like generate_exam"""
+        client = StreamingClient()
+        service = make_service()
+
+        with patch("app.genai.service.AIClientFactory.create_client", return_value=client):
+            first = [e async for e in service.stream_exam(make_request())]
+            second = [e async for e in service.stream_exam(make_request())]
+
+        assert client.streams == 1
+        assert second[-1]["metadata"]["cache_hit"] is True
+        assert [e["question"] for e in second[:-1]] == [e["question"] for e in first[:-1]]
+
+    @pytest.mark.asyncio
+    async def test_provider_error_yields_error_event(self):
+        """Provider failures end the stream with an error event"""
+        class FailingClient(MockClient):
+            async def stream_exam(self, prompt, **kwargs):
+                raise ConnectionError("provider down")
+                yield  # pragma: no cover
+
+        with patch("app.genai.service.AIClientFactory.create_client", return_value=FailingClient()):
+            events = [e async for e in make_service().stream_exam(make_request())]
+
+        assert events == [{"type": "error", "error": "provider down"}]
+
+    @pytest.mark.asyncio
+    async def test_stream_errors_open_the_circuit(self):
+        """Any provider exception on the streaming path counts as a breaker failure"""
+        class BrokenStreamClient(MockClient):
+            async def stream_exam(self, prompt, **kwargs):
+                raise RuntimeError("stream aborted by provider")
+                yield  # pragma: no cover
+
+        breaker = CircuitBreaker("mock", min_calls=2, failure_rate=0.5, open_seconds=60, shared=False)
+        service = make_service()
+        with patch("app.genai.service.AIClientFactory.create_client", return_value=BrokenStreamClient()), \
+                patch("app.genai.service.get_circuit_breaker", return_value=breaker):
+            for _ in range(2):
+                events = [e async for e in service.stream_exam(make_request())]
+                assert events == [{"type": "error", "error": "stream aborted by provider"}]
+
+            assert breaker.state == OPEN
+            events = [e async for e in service.stream_exam(make_request())]
+
+        assert events[0]["type"] == "error" and "circuit" in events[0]["error"].lower()
+
+    @pytest.mark.asyncio
+    async def test_abandoned_stream_is_not_a_failure(self):
+        """A consumer that stops reading does not count against the provider"""
+        breaker = CircuitBreaker("mock", min_calls=1, failure_rate=0.5, shared=False)
+        with patch("app.genai.service.AIClientFactory.create_client", return_value=StreamingClient(delay=0.01)), \
+                patch("app.genai.service.get_circuit_breaker", return_value=breaker):
+            stream = make_service().stream_exam(make_request())
+            first = await stream.__anext__()
+            await stream.aclose()
+
+        assert first["type"] == "question"
+        assert breaker.state == CLOSED
+        assert breaker.stats()["calls_in_window"] == 0
@@ -0,0 +1,172 @@
+"""
+Unit tests for DocumentProcessor and the extraction process pool
+
+Worker functions live at module level so they can be pickled into pool processes.
+"""
+import time
+import pytest
+
+from app.processors import (
+    DocumentProcessor,
+    ExtractionExecutor,
+    ExtractionTimeoutError,
+)
+from app.processors.pdf_processor import (
+    PDFProcessor,
+    assemble_pages,
+    extract_pdf_text,
+    split_page_ranges,
+)
+
+try:
+    import fitz
+    HAS_FITZ = True
+except ImportError:
+    HAS_FITZ = False
+
+
+def square(value):
+    return value * value
+
+
+def hang(seconds):
+    time.sleep(seconds)
+    return "finished"
+
+
+def build_pdf(path, pages):
+    doc = fitz.open()
+    for number in range(pages):
+        doc.new_page().insert_text((72, 72), f"Page {number} text")
+    doc.save(str(path))
+    doc.close()
+
+
+@pytest.fixture
+def executor():
+    """Small executor, shut down after each test"""
+    pool = ExtractionExecutor(max_workers=1, timeout=10)
+    yield pool
+    pool.shutdown()
+
+
+class TestExtractionExecutor:
+    """Test process pool offload"""
+
+    @pytest.mark.asyncio
+    async def test_runs_function_in_pool(self, executor):
+        """Module-level function runs in a worker process"""
+        assert await executor.run(square, 7) == 49
+
+    @pytest.mark.asyncio
+    async def test_timeout_replaces_workers(self, executor):
+        """Stuck job raises timeout, pool is replaced and keeps serving jobs"""
+        with pytest.raises(ExtractionTimeoutError):
+            await executor.run(hang, 30, timeout=0.5)
+
+        assert executor.timeouts == 1
+        assert executor.pool_replacements == 1
+        assert await executor.run(square, 3) == 9
+
+
+class TestDocumentProcessor:
+    """Test routing between process pool and threads"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
+    async def test_pdf_extracted_in_process_pool(self, executor, tmp_path):
+        """PDF text is extracted through the executor"""
+        pdf_path = tmp_path / "sample.pdf"
+        doc = fitz.open()
+        doc.new_page().insert_text((72, 72), "Photosynthesis converts light")
+        doc.save(str(pdf_path))
+        doc.close()
+
+        result = await DocumentProcessor(executor=executor).extract_text(str(pdf_path))
+
+        assert result.success
+        assert "Photosynthesis" in result.content
+        assert executor._pool is not None
+
+    @pytest.mark.asyncio
+    async def test_txt_does_not_start_pool(self, executor, tmp_path):
+        """TXT extraction stays on a thread"""
+        txt_path = tmp_path / "notes.txt"
+        txt_path.write_text("plain notes", encoding="utf-8")
+
+        result = await DocumentProcessor(executor=executor).extract_text(str(txt_path))
+
+        assert result.success
+        assert result.content == "plain notes"
+        assert executor._pool is None
+
+    @pytest.mark.asyncio
+    async def test_unsupported_extension(self, executor, tmp_path):
+        """Unsupported files fail without touching the pool"""
+        result = await DocumentProcessor(executor=executor).extract_text(str(tmp_path / "a.xls"))
+
+        assert not result.success
+        assert "Unsupported file type" in result.error_message
+
+
+class TestPageShardedPDF:
+    """Test page-range sharding and text assembly"""
+
+    def test_split_page_ranges_covers_all_pages(self):
+        """Ranges are contiguous and near-equal"""
+        assert split_page_ranges(10, 3) == [(0, 4), (4, 7), (7, 10)]
+        assert split_page_ranges(2, 5) == [(0, 1), (1, 2)]
+
+    def test_assemble_pages_offsets(self):
+        """Offsets point at each page start within stripped content"""
+        text, offsets = assemble_pages(["\n  first\n", "second\n", "third  \n"])
+
+        assert text == "first\nsecond\nthird"
+        assert offsets == [0, 6, 13]
+        assert text[offsets[1]:].startswith("second")
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
+    async def test_sharded_matches_single_pass(self, tmp_path):
+        """Sharded extraction returns same text and page offsets as one job"""
+        pdf_path = tmp_path / "book.pdf"
+        build_pdf(pdf_path, 7)
+        pool = ExtractionExecutor(max_workers=3, timeout=30)
+        try:
+            sharded = await PDFProcessor().extract_text_sharded(str(pdf_path), pool, min_pages_per_shard=2)
+        finally:
+            pool.shutdown()
+
+        single = extract_pdf_text(str(pdf_path))
+
+        assert sharded.success
+        assert sharded.content == single.content
+        assert sharded.page_offsets == single.page_offsets
+        assert len(sharded.page_offsets) == 7
+        assert sharded.content[sharded.page_offsets[4]:].startswith("Page 4")
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not HAS_FITZ, reason="PyMuPDF not installed")
+    async def test_pdf_only_opened_in_pool(self, tmp_path, monkeypatch):
+        """Page counting happens in a worker; small PDFs take a single job"""
+        pdf_path = tmp_path / "short.pdf"
+        build_pdf(pdf_path, 3)
+        pool = ExtractionExecutor(max_workers=2, timeout=30)
+        jobs = []
+        run = pool.run
+
+        async def counting_run(fn, *args, **kwargs):
+            jobs.append(fn.__name__)
+            return await run(fn, *args, **kwargs)
+
+        try:
+            await pool.run(square, 2)  # start workers before patching this process
+            monkeypatch.setattr("app.processors.pdf_processor.fitz.open", None)
+            monkeypatch.setattr(pool, "run", counting_run)
+            result = await PDFProcessor().extract_text_sharded(str(pdf_path), pool, min_pages_per_shard=2)
+        finally:
+            pool.shutdown()
+
+        assert result.success
+        assert len(result.page_offsets) == 3
+        assert jobs == ["extract_pdf_head"]
@@ -0,0 +1,110 @@
+"""
+Unit tests for ExtractionCache
+
+Disk tier uses pytest tmp_path; Redis tier uses the fake_redis fixture.
+"""
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.processors import ExtractionCache, ProcessingResult
+from app.processors.cache import LRU_KEY
+
+REDIS_CLIENT = "app.processors.cache.RedisManager.get_connected_client"
+
+
+def make_result(content="extracted text"):
+    return ProcessingResult(success=True, content=content, page_offsets=[0])
+
+
+class TestDiskCache:
+    """Test local disk fallback"""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        with patch(REDIS_CLIENT, return_value=None):
+            yield ExtractionCache(cache_dir=str(tmp_path), max_bytes=10_000, enabled=True)
+
+    @pytest.mark.asyncio
+    async def test_miss_then_hit(self, cache):
+        """Stored result is returned for the same hash and version"""
+        assert await cache.get("abc", "pdf-v2") is None
+        assert await cache.put("abc", "pdf-v2", make_result())
+
+        cached = await cache.get("abc", "pdf-v2")
+
+        assert cached.content == "extracted text"
+        assert cached.page_offsets == [0]
+        assert (cache.hits, cache.misses, cache.stores) == (1, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_version_change_invalidates(self, cache):
+        """A new processor version does not see old entries"""
+        await cache.put("abc", "pdf-v1", make_result())
+
+        assert await cache.get("abc", "pdf-v2") is None
+
+    @pytest.mark.asyncio
+    async def test_failed_results_not_cached(self, cache):
+        """Failed extractions are never stored"""
+        failed = ProcessingResult(success=False, content="", error_message="boom")
+
+        assert not await cache.put("abc", "pdf-v2", failed)
+        assert await cache.get("abc", "pdf-v2") is None
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self, tmp_path):
+        """Oldest entries are removed once max_bytes is exceeded"""
+        with patch(REDIS_CLIENT, return_value=None):
+            cache = ExtractionCache(cache_dir=str(tmp_path), max_bytes=250, enabled=True)
+            for i in range(5):
+                await cache.put(f"hash{i}", "txt-v1", make_result("x" * 60))
+
+            assert cache.evictions > 0
+            assert await cache.get("hash4", "txt-v1") is not None
+            assert await cache.get("hash0", "txt-v1") is None
+            assert sum(p.stat().st_size for p in tmp_path.glob("*.json")) <= 250
+
+    @pytest.mark.asyncio
+    async def test_get_or_extract_skips_extraction_on_hit(self, cache):
+        """Second lookup for the same content does not call the extractor"""
+        extract = AsyncMock(return_value=make_result())
+
+        first = await cache.get_or_extract("abc", "pdf-v2", extract)
+        second = await cache.get_or_extract("abc", "pdf-v2", extract)
+
+        assert first.content == second.content
+        extract.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_no_hash_bypasses_cache(self, cache):
+        """Files without hash are always extracted"""
+        extract = AsyncMock(return_value=make_result())
+
+        await cache.get_or_extract(None, "pdf-v2", extract)
+        await cache.get_or_extract(None, "pdf-v2", extract)
+
+        assert extract.await_count == 2
+        assert cache.stats()["misses"] == 0
+
+
+class TestRedisCache:
+    """Test Redis tier"""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_and_entry_bound(self, tmp_path, fake_redis):
+        """Entries go to Redis and LRU set is bounded by max_entries"""
+        redis = fake_redis
+        with patch(REDIS_CLIENT, return_value=redis):
+            cache = ExtractionCache(cache_dir=str(tmp_path), max_entries=2, enabled=True)
+            await cache.put("a", "txt-v1", make_result("A"))
+            await cache.put("b", "txt-v1", make_result("B"))
+            # Touch "a" so "b" becomes least recently used
+            assert (await cache.get("a", "txt-v1")).content == "A"
+            await cache.put("c", "txt-v1", make_result("C"))
+
+            assert await cache.get("b", "txt-v1") is None
+            assert (await cache.get("a", "txt-v1")).content == "A"
+            assert await redis.zcard(LRU_KEY) == 2
+            assert cache.evictions == 1
+            assert cache.stats()["backend"] == "redis"
+            assert not list(tmp_path.iterdir())
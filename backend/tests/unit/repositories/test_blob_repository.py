@@ -0,0 +1,76 @@
+"""
+Unit tests for BlobRepository reference counting
+
+These tests use in-memory SQLite database and test repository methods in isolation.
+"""
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models.base import Base
+from app.repositories.blob_repository import BlobRepository
+
+
+@pytest.fixture
+async def db_session():
+    """Create in-memory database for testing"""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with async_session() as session:
+        yield session
+
+    await engine.dispose()
+
+
+@pytest.fixture
+def blob_repository(db_session):
+    """Create BlobRepository instance"""
+    return BlobRepository(db_session)
+
+
+class TestBlobReferenceCounting:
+    """Test acquire/release of content-addressed blobs"""
+
+    @pytest.mark.asyncio
+    async def test_first_acquire_creates_blob(self, blob_repository):
+        """First reference creates blob and asks caller to write bytes"""
+        blob, created = await blob_repository.acquire("a" * 64, "/blobs/aa/aa/a.pdf", 10)
+
+        assert created is True
+        assert blob.ref_count == 1
+        assert blob.file_path == "/blobs/aa/aa/a.pdf"
+
+    @pytest.mark.asyncio
+    async def test_second_acquire_increments(self, blob_repository):
+        """Same content reuses the blob and keeps the original path"""
+        first, _ = await blob_repository.acquire("a" * 64, "/blobs/first.pdf", 10)
+        second, created = await blob_repository.acquire("a" * 64, "/blobs/other.pdf", 10)
+
+        assert created is False
+        assert second.id == first.id
+        assert second.ref_count == 2
+        assert second.file_path == "/blobs/first.pdf"
+
+    @pytest.mark.asyncio
+    async def test_release_deletes_only_on_last_reference(self, blob_repository):
+        """Blob row survives until the last reference is released"""
+        blob, _ = await blob_repository.acquire("b" * 64, "/blobs/b.pdf", 10)
+        await blob_repository.acquire("b" * 64, "/blobs/b.pdf", 10)
+
+        assert await blob_repository.release(blob.id) is None
+        assert (await blob_repository.get_by_hash("b" * 64)).ref_count == 1
+
+        released = await blob_repository.release(blob.id)
+
+        assert released is not None
+        assert released.file_path == "/blobs/b.pdf"
+        assert await blob_repository.get_by_hash("b" * 64) is None
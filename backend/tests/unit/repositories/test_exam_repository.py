@@ -0,0 +1,213 @@
+"""
+Unit tests for ExamRepository
+
+Uses in-memory SQLite; statements are counted on the engine.
+"""
+import pytest
+from sqlalchemy import event, select, func
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models.base import Base
+from app.models.exam import EXAM_PAYLOAD_VERSION, Exam, Question
+from app.models.user import User
+from app.repositories.exam_repository import ExamRepository
+
+
+@pytest.fixture
+async def engine():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def db_session(engine):
+    """Create in-memory database for testing"""
+    async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with async_session() as session:
+        yield session
+
+
+@pytest.fixture
+async def creator(db_session):
+    user = User(email="teacher@example.com", hashed_password="pwd", email_verified=True)
+    db_session.add(user)
+    await db_session.commit()
+    return user
+
+
+@pytest.fixture
+def statements(engine):
+    """Record SQL statements sent to the database"""
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+
+def make_questions(count):
+    return [
+        {
+            "question_text": f"Question {i}?",
+            "options": ["A", "B", "C", "D"],
+            "correct_answer": "A",
+        }
+        for i in range(count)
+    ]
+
+
+class TestCreateExamWithQuestions:
+    """Test bulk exam creation"""
+
+    @pytest.mark.asyncio
+    async def test_constant_round_trips(self, db_session, creator, statements):
+        """50 questions are inserted with one statement, without a reload query"""
+        exam = await ExamRepository(db_session).create_exam_with_questions(
+            {"title": "Biology", "creator_id": creator.id}, make_questions(50)
+        )
+
+        inserts = [s for s in statements if s.startswith("INSERT INTO questions")]
+        assert len(inserts) == 1
+        assert not any(s.startswith("SELECT") for s in statements)
+        assert exam.total_questions == 50
+        assert [q.order_index for q in exam.questions] == list(range(1, 51))
+
+    @pytest.mark.asyncio
+    async def test_rows_persisted(self, db_session, creator):
+        """The exam and its questions can be read back"""
+        repo = ExamRepository(db_session)
+        exam = await repo.create_exam_with_questions({"title": "Biology"}, make_questions(3))
+        db_session.expunge_all()
+
+        loaded = await repo.get_by_id(exam.id)
+        assert [q.question_text for q in sorted(loaded.questions, key=lambda q: q.order_index)] == [
+            "Question 0?", "Question 1?", "Question 2?"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failure_leaves_no_partial_exam(self, db_session, creator):
+        """A bad question rolls back the exam and every other question"""
+        questions = make_questions(5)
+        questions[3]["question_text"] = None
+
+        with pytest.raises(Exception):
+            await ExamRepository(db_session).create_exam_with_questions({"title": "Broken"}, questions)
+
+        assert (await db_session.execute(select(func.count(Exam.id)))).scalar() == 0
+        assert (await db_session.execute(select(func.count(Question.id)))).scalar() == 0
+
+    @pytest.mark.asyncio
+    async def test_input_not_mutated(self, db_session, creator):
+        """Question dicts from the caller are left untouched"""
+        questions = make_questions(2)
+
+        await ExamRepository(db_session).create_exam_with_questions({"title": "Biology"}, questions)
+
+        assert "exam_id" not in questions[0] and "order_index" not in questions[0]
+
+
+class TestExamPayload:
+    """Test the denormalized read payload"""
+
+    @pytest.mark.asyncio
+    async def test_payload_written_at_save(self, db_session, creator):
+        """Questions and the answer key are serialized in order when saving"""
+        questions = make_questions(3)
+        questions[1]["correct_answer"] = "C"
+
+        exam = await ExamRepository(db_session).create_exam_with_questions({"title": "Biology"}, questions)
+
+        assert exam.payload_version == EXAM_PAYLOAD_VERSION
+        assert exam.payload["answer_key"] == ["A", "C", "A"]
+        first = exam.payload["questions"][0]
+        assert first["question_text"] == "Question 0?"
+        assert first["options"] == ["A", "B", "C", "D"]
+        assert (first["difficulty"], first["points"], first["order_index"]) == ("medium", 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_read_is_one_row_fetch(self, db_session, creator, statements):
+        """Reading an exam loads neither question rows nor Question objects"""
+        repo = ExamRepository(db_session)
+        exam = await repo.create_exam_with_questions({"title": "Biology"}, make_questions(20))
+        db_session.expunge_all()
+        statements.clear()
+
+        loaded = await repo.get_with_payload(exam.id)
+        await repo.get_with_payload(exam.id)  # identity map, no query
+
+        assert len(statements) == 1
+        assert "FROM exams" in statements[0] and "FROM questions" not in statements[0]
+        assert len(loaded.payload["questions"]) == 20
+        assert not any(isinstance(obj, Question) for obj in db_session.identity_map.values())
+
+    @pytest.mark.asyncio
+    async def test_missing_payload_rebuilt_on_read(self, db_session, creator):
+        """Exams saved without a payload get one built from their questions"""
+        repo = ExamRepository(db_session)
+        exam = await repo.create_exam_with_questions({"title": "Biology"}, make_questions(2))
+        exam.payload, exam.payload_version = None, None
+        await db_session.commit()
+        db_session.expunge_all()
+
+        commits = []
+        event.listen(db_session.sync_session, "after_commit", commits.append)
+
+        loaded = await repo.get_with_payload(exam.id)
+
+        assert loaded.payload_version == EXAM_PAYLOAD_VERSION
+        assert [q["question_text"] for q in loaded.payload["questions"]] == ["Question 0?", "Question 1?"]
+        # Saved in its own transaction; the caller's session is left untouched
+        assert commits == [] and not db_session.dirty
+        async with AsyncSession(db_session.bind) as other:
+            saved = await other.scalar(select(Exam.payload_version).where(Exam.id == exam.id))
+        assert saved == EXAM_PAYLOAD_VERSION
+
+    @pytest.mark.asyncio
+    async def test_rebuild_payload_leaves_commit_to_caller(self, db_session, creator):
+        """rebuild_payload flushes with the caller's edits and does not commit them"""
+        repo = ExamRepository(db_session)
+        exam = await repo.create_exam_with_questions({"title": "Biology"}, make_questions(2))
+        exam_id = exam.id
+        question = await db_session.scalar(select(Question).where(Question.exam_id == exam_id, Question.order_index == 1))
+        question.question_text = "Edited?"
+
+        await repo.rebuild_payload(exam)
+        assert exam.payload["questions"][0]["question_text"] == "Edited?"
+        await db_session.rollback()
+
+        reloaded = await db_session.scalar(select(Exam.payload).where(Exam.id == exam_id))
+        assert reloaded["questions"][0]["question_text"] == "Question 0?"
+
+
+class TestExamSummaries:
+    """Test that list queries load summary columns only"""
+
+    @pytest.mark.asyncio
+    async def test_list_skips_payload_and_questions(self, db_session, creator, statements):
+        """One query, no payload column, and question counts from total_questions"""
+        await ExamRepository(db_session).create_exam_with_questions(
+            {"title": "Biology", "creator_id": creator.id}, make_questions(5)
+        )
+        db_session.expunge_all()
+        statements.clear()
+
+        page = await ExamRepository(db_session).get_exams_by_creator(creator.id)
+
+        assert len(statements) == 1
+        assert "payload" not in statements[0]
+        assert "FROM questions" not in statements[0]
+        exam, = page
+        assert exam.total_questions == 5
+        with pytest.raises(Exception, match="raiseload"):
+            exam.payload
@@ -0,0 +1,211 @@
+"""
+Unit tests for FileRepository
+
+These tests use in-memory SQLite database and test repository methods in isolation.
+"""
+import pytest
+from datetime import datetime, timezone, timedelta
+from sqlalchemy import event, update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models.base import Base
+from app.models.user import User
+from app.models.file import UploadedFile, FileStatus, ProcessingStatus
+from app.repositories.file_repository import FileRepository
+
+
+@pytest.fixture
+async def db_session():
+    """Create in-memory database for testing"""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with async_session() as session:
+        yield session
+
+    await engine.dispose()
+
+
+@pytest.fixture
+async def owner(db_session):
+    """Create file owner"""
+    user = User(email="owner@example.com", hashed_password="pwd", email_verified=True)
+    db_session.add(user)
+    await db_session.commit()
+    return user
+
+
+@pytest.fixture
+def file_repository(db_session):
+    """Create FileRepository instance"""
+    return FileRepository(db_session)
+
+
+async def create_files(file_repository, owner, count):
+    files = []
+    for i in range(count):
+        files.append(await file_repository.create_file_record(
+            original_filename=f"doc{i}.txt",
+            stored_filename=f"stored_{i}.txt",
+            file_path=f"/tmp/stored_{i}.txt",
+            size=10,
+            content_type="text/plain",
+            owner_id=owner.id,
+            file_hash=f"hash{i}",
+        ))
+    return files
+
+
+class TestClaimPendingFiles:
+    """Test background processing claim methods"""
+
+    @pytest.mark.asyncio
+    async def test_claim_moves_files_to_processing(self, file_repository, owner):
+        """Claimed files are marked PROCESSING and not claimed twice"""
+        await create_files(file_repository, owner, 3)
+
+        first = await file_repository.claim_files_pending_processing(limit=2)
+        second = await file_repository.claim_files_pending_processing(limit=5)
+
+        assert len(first) == 2
+        assert all(f.processing_status == ProcessingStatus.PROCESSING for f in first)
+        assert len(second) == 1
+        assert {f.id for f in first}.isdisjoint({f.id for f in second})
+        assert await file_repository.claim_files_pending_processing(limit=5) == []
+
+    @pytest.mark.asyncio
+    async def test_claim_skips_incomplete_uploads(self, file_repository, owner):
+        """Files still uploading are not claimed"""
+        files = await create_files(file_repository, owner, 2)
+        await file_repository.update_status(files[0].id, FileStatus.UPLOADING)
+
+        claimed = await file_repository.claim_files_pending_processing(limit=5)
+
+        assert [f.id for f in claimed] == [files[1].id]
+
+    @pytest.mark.asyncio
+    async def test_claim_single_file(self, file_repository, owner):
+        """A single file is claimed once, only by its owner, and not after the worker took it"""
+        files = await create_files(file_repository, owner, 2)
+
+        assert not await file_repository.claim_file_for_processing(files[0].id, "someone-else")
+        assert await file_repository.claim_file_for_processing(files[0].id, owner.id)
+        assert not await file_repository.claim_file_for_processing(files[0].id, owner.id)
+
+        worker_claimed = await file_repository.claim_files_pending_processing(limit=5)
+        assert [f.id for f in worker_claimed] == [files[1].id]
+        assert not await file_repository.claim_file_for_processing(files[1].id, owner.id)
+
+    @pytest.mark.asyncio
+    async def test_count_pending(self, file_repository, owner):
+        """Pending count drops as files are claimed"""
+        await create_files(file_repository, owner, 3)
+        assert await file_repository.count_files_pending_processing() == 3
+
+        await file_repository.claim_files_pending_processing(limit=1)
+        assert await file_repository.count_files_pending_processing() == 2
+
+    @pytest.mark.asyncio
+    async def test_requeue_stale_processing(self, file_repository, db_session, owner):
+        """Files stuck in PROCESSING are requeued"""
+        await create_files(file_repository, owner, 1)
+        claimed = await file_repository.claim_files_pending_processing(limit=1)
+
+        stale_time = datetime.now(timezone.utc) - timedelta(hours=1)
+        await db_session.execute(
+            update(UploadedFile)
+            .where(UploadedFile.id == claimed[0].id)
+            .values(updated_at=stale_time)
+        )
+        await db_session.commit()
+
+        requeued = await file_repository.requeue_stale_processing(
+            datetime.now(timezone.utc) - timedelta(minutes=5)
+        )
+
+        assert requeued == 1
+        assert await file_repository.count_files_pending_processing() == 1
+
+
+class TestUserFilePages:
+    """Test keyset pagination of a user's files"""
+
+    @pytest.mark.asyncio
+    async def test_pages_cover_every_file_once(self, file_repository, owner):
+        """Files created in the same second are neither repeated nor skipped"""
+        files = await create_files(file_repository, owner, 7)
+
+        seen, cursor = [], None
+        while True:
+            page = await file_repository.get_user_files(owner.id, cursor, limit=3)
+            seen.extend(f.id for f in page)
+            if not page.has_more:
+                break
+            cursor = page.next_cursor
+
+        assert sorted(seen) == sorted(f.id for f in files)
+        assert len(seen) == len(set(seen))
+
+    @pytest.mark.asyncio
+    async def test_deleted_files_excluded(self, file_repository, owner):
+        files = await create_files(file_repository, owner, 3)
+        await file_repository.delete_file_record(files[0].id, owner.id)
+
+        page = await file_repository.get_user_files(owner.id)
+
+        assert {f.id for f in page} == {f.id for f in files[1:]}
+        assert not page.has_more
+        assert await file_repository.count_files() == 2
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor(self, file_repository, owner):
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            await file_repository.get_user_files(owner.id, "not-a-cursor")
+
+
+class TestExtractedContent:
+    """Test that extracted_content is only read where it is needed"""
+
+    @pytest.mark.asyncio
+    async def test_list_does_not_load_content(self, file_repository, db_session, owner):
+        file, = await create_files(file_repository, owner, 1)
+        await file_repository.save_extracted_content(file.id, "x" * 10000, owner.id)
+        db_session.expunge_all()
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db_session.bind.sync_engine, "before_cursor_execute", record)
+        try:
+            listed, = await file_repository.get_user_files(owner.id)
+            assert listed.size_mb == 0.0 and not listed.is_pdf
+            with pytest.raises(Exception, match="raiseload"):
+                listed.processing_status
+            fetched = await file_repository.get_file_by_id(file.id, owner.id)
+        finally:
+            event.remove(db_session.bind.sync_engine, "before_cursor_execute", record)
+
+        assert not any("extracted_content" in s for s in statements)
+        assert fetched.content_length == 10000
+
+    @pytest.mark.asyncio
+    async def test_content_readers(self, file_repository, db_session, owner):
+        file, = await create_files(file_repository, owner, 1)
+        await file_repository.save_extracted_content(file.id, "hello", owner.id)
+        db_session.expunge_all()
+
+        assert await file_repository.get_file_content(file.id, owner.id) == "hello"
+        assert await file_repository.get_file_content(file.id, "someone-else") is None
+        status = await file_repository.get_processing_status(file.id, owner.id)
+        assert status["has_content"] is True
+        assert status["content_length"] == 5
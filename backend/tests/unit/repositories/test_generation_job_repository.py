@@ -0,0 +1,137 @@
+"""
+Unit tests for GenerationJobRepository
+
+Uses in-memory SQLite (conditional-update claim path).
+"""
+import pytest
+from datetime import datetime, timedelta, timezone
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models.base import Base
+from app.models.generation_job import JobStatus
+from app.models.user import User
+from app.repositories.generation_job_repository import GenerationJobRepository
+
+REQUEST = {"content": "text", "question_count": 5, "ai_provider": "mock"}
+
+
+@pytest.fixture
+async def db_session():
+    """Create in-memory database for testing"""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with async_session() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+async def user(db_session):
+    user = User(email="student@example.com", hashed_password="pwd", email_verified=True)
+    db_session.add(user)
+    await db_session.commit()
+    return user
+
+
+@pytest.fixture
+def repo(db_session):
+    return GenerationJobRepository(db_session)
+
+
+class TestCreateOrGetJob:
+    """Test idempotent job creation"""
+
+    @pytest.mark.asyncio
+    async def test_creates_queued_job(self, repo, user):
+        """A new job starts QUEUED with no progress"""
+        job, created = await repo.create_or_get_job(user.id, REQUEST, "h1", "key-1")
+
+        assert created
+        assert job.status == JobStatus.QUEUED
+        assert job.progress == 0
+        assert job.request == REQUEST
+
+    @pytest.mark.asyncio
+    async def test_same_key_returns_existing_job(self, repo, user):
+        """A retry with the same key does not queue a second job"""
+        first, _ = await repo.create_or_get_job(user.id, REQUEST, "h1", "key-1")
+        second, created = await repo.create_or_get_job(user.id, REQUEST, "h1", "key-1")
+
+        assert not created
+        assert second.id == first.id
+
+    @pytest.mark.asyncio
+    async def test_without_key_always_creates(self, repo, user):
+        """Jobs without an idempotency key are never deduplicated"""
+        first, _ = await repo.create_or_get_job(user.id, REQUEST, "h1")
+        second, created = await repo.create_or_get_job(user.id, REQUEST, "h1")
+
+        assert created
+        assert second.id != first.id
+
+    @pytest.mark.asyncio
+    async def test_get_job_is_user_scoped(self, repo, user):
+        """Other users cannot read a job"""
+        job, _ = await repo.create_or_get_job(user.id, REQUEST, "h1")
+
+        assert await repo.get_job_for_user(job.id, user.id) is not None
+        assert await repo.get_job_for_user(job.id, "someone-else") is None
+
+
+class TestJobLifecycle:
+    """Test claim -> complete / fail and stale recovery"""
+
+    @pytest.mark.asyncio
+    async def test_claim_moves_jobs_to_running(self, repo, user):
+        """Claimed jobs are RUNNING and not claimed twice"""
+        await repo.create_or_get_job(user.id, REQUEST, "h1")
+        await repo.create_or_get_job(user.id, REQUEST, "h2")
+
+        claimed = await repo.claim_queued_jobs(limit=5)
+
+        assert len(claimed) == 2
+        assert all(job.status == JobStatus.RUNNING for job in claimed)
+        assert all(job.attempts == 1 and job.started_at for job in claimed)
+        assert await repo.claim_queued_jobs(limit=5) == []
+
+    @pytest.mark.asyncio
+    async def test_complete_and_fail(self, repo, user):
+        """Finishing stores the result or error and sets progress to 100"""
+        await repo.create_or_get_job(user.id, REQUEST, "h1")
+        await repo.create_or_get_job(user.id, REQUEST, "h2")
+        done, failed = await repo.claim_queued_jobs(limit=2)
+
+        assert await repo.complete_job(done.id, {"exam_data": {"questions": []}})
+        assert await repo.fail_job(failed.id, "provider down")
+        # Only RUNNING jobs can be finished
+        assert not await repo.fail_job(done.id, "late failure")
+
+        done = await repo.get_job_for_user(done.id, user.id)
+        failed = await repo.get_job_for_user(failed.id, user.id)
+        assert (done.status, done.progress, done.result) == (JobStatus.COMPLETED, 100, {"exam_data": {"questions": []}})
+        assert (failed.status, failed.error_message) == (JobStatus.FAILED, "provider down")
+        assert await repo.count_jobs_by_status() == {"queued": 0, "running": 0, "completed": 1, "failed": 1}
+
+    @pytest.mark.asyncio
+    async def test_requeue_stale_running(self, repo, user, db_session):
+        """Stale jobs are requeued until they run out of attempts"""
+        await repo.create_or_get_job(user.id, REQUEST, "h1")
+        await repo.create_or_get_job(user.id, REQUEST, "h2")
+        retry, exhausted = await repo.claim_queued_jobs(limit=2)
+        exhausted.attempts = 2
+        await db_session.commit()
+
+        future = datetime.now(timezone.utc) + timedelta(seconds=1)
+        assert await repo.requeue_stale_running(future, max_attempts=2) == 1
+
+        retry = await repo.get_job_for_user(retry.id, user.id)
+        exhausted = await repo.get_job_for_user(exhausted.id, user.id)
+        assert retry.status == JobStatus.QUEUED
+        assert exhausted.status == JobStatus.FAILED
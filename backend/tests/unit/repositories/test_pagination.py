@@ -0,0 +1,156 @@
+"""
+Unit tests for keyset pagination helpers
+
+Uses in-memory SQLite with SQL statement counting.
+"""
+import pytest
+from datetime import datetime
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models.base import Base
+from app.models.exam import Exam
+from app.models.user import User
+from app.repositories.exam_repository import ExamRepository
+from app.repositories.pagination import CountCache, decode_cursor, encode_cursor, keyset_page
+
+
+@pytest.fixture
+async def engine():
+    """Create in-memory database for testing"""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def db_session(engine):
+    async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        yield session
+
+
+@pytest.fixture
+async def creator(db_session):
+    user = User(email="teacher@example.com", hashed_password="pwd", email_verified=True)
+    db_session.add(user)
+    await db_session.commit()
+    return user
+
+
+@pytest.fixture
+def statements(engine):
+    recorded = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        recorded.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    yield recorded
+    event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+
+async def create_exams(db_session, creator, count):
+    db_session.add_all([Exam(title=f"Exam {i}", creator_id=creator.id) for i in range(count)])
+    await db_session.commit()
+
+
+class TestCursor:
+    """Test opaque cursor encoding"""
+
+    def test_round_trip(self):
+        created_at = datetime(2024, 5, 1, 12, 30, 15, 250000)
+
+        assert decode_cursor(encode_cursor(created_at, "exam-1")) == (created_at, "exam-1")
+
+    @pytest.mark.parametrize("cursor", ["", "garbage", encode_cursor(datetime(2024, 1, 1), "x")[:-3]])
+    def test_invalid_cursor(self, cursor):
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor(cursor)
+
+
+class TestKeysetPage:
+    """Test newest-first keyset pages"""
+
+    @pytest.mark.asyncio
+    async def test_pages_are_ordered_and_complete(self, db_session, creator):
+        """Rows sharing a timestamp are split across pages without gaps"""
+        await create_exams(db_session, creator, 10)
+
+        pages, cursor = [], None
+        while True:
+            page = await ExamRepository(db_session).get_exams_by_creator(creator.id, cursor, limit=4)
+            pages.append([exam.id for exam in page])
+            if not page.has_more:
+                break
+            cursor = page.next_cursor
+
+        ids = [exam_id for page in pages for exam_id in page]
+        all_exams = (await db_session.execute(
+            select(Exam).order_by(Exam.created_at.desc(), Exam.id.desc())
+        )).scalars().all()
+        assert [len(page) for page in pages] == [4, 4, 2]
+        assert ids == [exam.id for exam in all_exams]
+
+    @pytest.mark.asyncio
+    async def test_deep_page_is_one_bounded_query(self, db_session, creator, statements):
+        """A later page runs the same single LIMIT query as the first"""
+        await create_exams(db_session, creator, 6)
+        first = await keyset_page(db_session, select(Exam), Exam, limit=5)
+        statements.clear()
+
+        second = await keyset_page(db_session, select(Exam), Exam, first.next_cursor, limit=5)
+
+        assert len(second) == 1 and not second.has_more
+        assert len(statements) == 1
+        assert "exams.created_at < coalesce(" in statements[0]
+        assert "count(" not in statements[0].lower()
+
+    @pytest.mark.asyncio
+    async def test_cursor_survives_deleted_row(self, db_session, creator):
+        """If the cursor's row is gone its encoded timestamp is used"""
+        await create_exams(db_session, creator, 3)
+        first = await keyset_page(db_session, select(Exam), Exam, limit=1)
+        await db_session.delete(first[0])
+        await db_session.commit()
+
+        rest = await keyset_page(db_session, select(Exam), Exam, first.next_cursor, limit=5)
+
+        assert len(rest) == 2
+
+
+class TestCountCache:
+    """Test cached totals"""
+
+    @pytest.mark.asyncio
+    async def test_counts_once_until_invalidated(self):
+        calls = []
+
+        async def count():
+            calls.append(1)
+            return len(calls)
+
+        cache = CountCache(ttl=60)
+
+        assert await cache.get_or_count("files", count) == 1
+        assert await cache.get_or_count("files", count) == 1
+        cache.invalidate("files", "missing")
+        assert await cache.get_or_count("files", count) == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_totals_are_recounted(self):
+        totals = iter([5, 7])
+
+        async def count():
+            return next(totals)
+
+        cache = CountCache(ttl=0)
+
+        assert await cache.get_or_count(("exams", "u1"), count) == 5
+        assert await cache.get_or_count(("exams", "u1"), count) == 7
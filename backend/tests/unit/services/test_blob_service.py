@@ -0,0 +1,139 @@
+"""
+Unit tests for BlobService legacy migration and blob lifecycle
+
+Uses in-memory SQLite and pytest tmp_path as upload folder.
+"""
+import hashlib
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models.base import Base
+from app.models.user import User
+from app.repositories.file_repository import FileRepository
+from app.services.blob_service import BlobService
+from app.storage import LocalStorageBackend
+
+
+@pytest.fixture
+async def db_session():
+    """Create in-memory database for testing"""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with async_session() as session:
+        yield session
+
+    await engine.dispose()
+
+
+@pytest.fixture
+def blob_service(db_session, tmp_path):
+    """BlobService storing blobs under tmp_path"""
+    return BlobService(db_session, storage=LocalStorageBackend(str(tmp_path)))
+
+
+async def create_legacy_file(db_session, tmp_path, email, name, content):
+    """Create user and a file stored the pre-blob way"""
+    user = User(email=email, hashed_password="pwd", email_verified=True)
+    db_session.add(user)
+    await db_session.commit()
+
+    path = tmp_path / f"{user.id[:8]}_{name}"
+    path.write_bytes(content)
+    return await FileRepository(db_session).create_file_record(
+        original_filename=name,
+        stored_filename=path.name,
+        file_path=str(path),
+        size=len(content),
+        content_type="application/pdf",
+        owner_id=user.id,
+        file_hash=hashlib.sha256(content).hexdigest(),
+    )
+
+
+class TestLegacyMigration:
+    """Test migrate_legacy_files"""
+
+    @pytest.mark.asyncio
+    async def test_identical_files_collapse_into_one_blob(self, blob_service, db_session, tmp_path):
+        """Duplicates across users end up sharing one blob with refcount"""
+        content = b"%PDF-1.4 lecture"
+        first = await create_legacy_file(db_session, tmp_path, "a@example.com", "lecture.pdf", content)
+        second = await create_legacy_file(db_session, tmp_path, "b@example.com", "lecture.pdf", content)
+        other = await create_legacy_file(db_session, tmp_path, "c@example.com", "other.pdf", b"%PDF-1.4 other")
+
+        stats = await blob_service.migrate_legacy_files(batch_size=2)
+
+        assert stats["migrated"] == 2
+        assert stats["deduplicated"] == 1
+        assert stats["bytes_reclaimed"] == len(content)
+
+        records = [await FileRepository(db_session).get_by_id(f.id) for f in (first, second, other)]
+        for record in records:
+            await db_session.refresh(record)
+        assert records[0].blob_id == records[1].blob_id != records[2].blob_id
+        assert records[0].file_path == blob_service.blob_path(records[0].file_hash, ".pdf")
+
+        blob = await blob_service.blob_repo.get_by_hash(records[0].file_hash)
+        assert blob.ref_count == 2
+        assert not list(tmp_path.glob("*.pdf"))
+        assert len([p for p in (tmp_path / "blobs").rglob("*") if p.is_file()]) == 2
+
+    @pytest.mark.asyncio
+    async def test_dry_run_changes_nothing(self, blob_service, db_session, tmp_path):
+        """Dry run reports without moving files"""
+        await create_legacy_file(db_session, tmp_path, "a@example.com", "lecture.pdf", b"same")
+        await create_legacy_file(db_session, tmp_path, "b@example.com", "lecture.pdf", b"same")
+
+        stats = await blob_service.migrate_legacy_files(dry_run=True)
+
+        assert (stats["migrated"], stats["deduplicated"]) == (1, 1)
+        assert len(list(tmp_path.glob("*.pdf"))) == 2
+        assert not (tmp_path / "blobs").exists()
+
+    @pytest.mark.asyncio
+    async def test_release_unlinks_after_last_reference(self, blob_service, db_session, tmp_path):
+        """Blob bytes are removed only when the last reference is released"""
+        await create_legacy_file(db_session, tmp_path, "a@example.com", "x.pdf", b"shared")
+        await create_legacy_file(db_session, tmp_path, "b@example.com", "x.pdf", b"shared")
+        await blob_service.migrate_legacy_files()
+
+        blob = await blob_service.blob_repo.get_by_hash(hashlib.sha256(b"shared").hexdigest())
+        blob_path = blob.file_path
+
+        assert await blob_service.release(blob.id) is False
+        assert any((tmp_path / "blobs").rglob("*.pdf"))
+        assert await blob_service.release(blob.id) is True
+        assert not any((tmp_path / "blobs").rglob("*.pdf"))
+        assert blob_path.startswith(str(tmp_path))
+
+    @pytest.mark.asyncio
+    async def test_unlink_happens_before_row_delete_commits(self, db_session, tmp_path):
+        """Bytes are removed while the deleting transaction still holds its lock"""
+        storage = LocalStorageBackend(str(tmp_path))
+        in_transaction = []
+        delete = storage.delete
+
+        async def recording_delete(location):
+            in_transaction.append(db_session.in_transaction())
+            return await delete(location)
+
+        storage.delete = recording_delete
+        blob_service = BlobService(db_session, storage=storage)
+        source = tmp_path / "upload.tmp"
+        source.write_bytes(b"content")
+        blob = await blob_service.store(str(source), hashlib.sha256(b"content").hexdigest(), 7, ".pdf")
+
+        assert await blob_service.release(blob.id) is True
+        assert in_transaction == [True]
+        assert not db_session.in_transaction()
+        assert await blob_service.blob_repo.get_by_hash(blob.file_hash) is None
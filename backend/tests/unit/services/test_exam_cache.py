@@ -0,0 +1,168 @@
+"""
+Unit tests for the exam read cache
+
+Uses in-memory SQLite with SQL statement counting; Redis pub/sub uses the fake_redis fixture.
+"""
+import asyncio
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database.redis import RedisManager
+from app.models.base import Base
+from app.models.exam import Exam
+from app.models.user import User, UserRole
+from app.repositories.exam_repository import ExamRepository
+from app.services.exam_cache import INVALIDATION_CHANNEL, ExamCache
+from app.services.exam_service import ExamService
+
+QUESTIONS = [
+    {"question_text": "Q1", "options": ["A", "B"], "correct_answer": "A", "explanation": "Because"},
+    {"question_text": "Q2", "options": ["A", "B"], "correct_answer": "B"},
+]
+
+
+@pytest.fixture
+async def engine():
+    """Create in-memory database for testing"""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def session_maker(engine):
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.fixture
+async def db_session(session_maker):
+    async with session_maker() as session:
+        yield session
+
+
+@pytest.fixture
+async def exam(db_session):
+    teacher = User(email="teacher@example.com", hashed_password="pwd", email_verified=True)
+    db_session.add(teacher)
+    await db_session.commit()
+    return await ExamRepository(db_session).create_exam_with_questions(
+        {"title": "Quiz", "creator_id": teacher.id, "is_public": True}, QUESTIONS
+    )
+
+
+@pytest.fixture
+def statements(engine):
+    recorded = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        recorded.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    yield recorded
+    event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+
+class TestExamCache:
+    """Test read-through, views and invalidation"""
+
+    @pytest.mark.asyncio
+    async def test_hit_needs_no_queries(self, session_maker, exam, statements):
+        """Only the first lookup reads the database"""
+        cache = ExamCache()
+
+        async with session_maker() as session:
+            first = await cache.get(exam.id, session)
+        queries = len(statements)
+        async with session_maker() as session:
+            second = await cache.get(exam.id, session)
+
+        assert second is first
+        assert queries == 1
+        assert len(statements) == queries
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_student_view_and_answer_key(self, db_session, exam):
+        """Answers are kept out of the student view and in the grading key"""
+        cached = await ExamCache().get(exam.id, db_session)
+
+        questions = cached.student_view["questions"]
+        assert [q["question_text"] for q in questions] == ["Q1", "Q2"]
+        assert all("correct_answer" not in q and "explanation" not in q for q in questions)
+        assert cached.answer_key.grade(["A", "B"]).score == 2
+        assert cached.version
+        assert await ExamCache().get("missing", db_session) is None
+
+    @pytest.mark.asyncio
+    async def test_committed_edit_invalidates(self, db_session, exam, monkeypatch):
+        """Committing an Exam change drops its entry; a rollback does not"""
+        cache = ExamCache()
+        monkeypatch.setattr("app.services.exam_cache._exam_cache", cache)
+        exam_id = exam.id
+        await cache.get(exam_id, db_session)
+
+        exam.title = "Renamed"
+        await db_session.flush()
+        await db_session.rollback()
+        assert cache.stats()["entries"] == 1
+
+        row = await db_session.get(Exam, exam_id)
+        row.is_public = False
+        await db_session.commit()
+
+        assert cache.stats()["entries"] == 0
+        assert (await cache.get(exam_id, db_session)).is_public is False
+
+    @pytest.mark.asyncio
+    async def test_invalidation_reaches_other_instances(self, db_session, exam, monkeypatch, fake_redis):
+        """Invalidations are published and applied by subscribed caches"""
+        redis = fake_redis
+        monkeypatch.setattr(RedisManager, "_redis_client", redis)
+        local, remote = ExamCache(), ExamCache()
+        await remote.start()
+        await asyncio.sleep(0)
+        await remote.get(exam.id, db_session)
+
+        await local.invalidate([exam.id])
+        await asyncio.sleep(0)
+
+        assert redis.published == [(INVALIDATION_CHANNEL, exam.id)]
+        assert remote.stats()["entries"] == 0
+        assert remote.stats()["subscribed"]
+        await remote.stop()
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_always_loads(self, session_maker, exam, statements):
+        cache = ExamCache(enabled=False)
+
+        for _ in range(2):
+            async with session_maker() as session:
+                await cache.get(exam.id, session)
+
+        assert cache.stats()["entries"] == 0
+        assert len(statements) == 2
+
+
+class TestExamForUser:
+    """Test ExamService.get_exam_for_user"""
+
+    @pytest.mark.asyncio
+    async def test_students_get_view_without_answers(self, db_session, exam):
+        service = ExamService(db_session)
+        student = User(id="student-1", email="s@example.com", role=UserRole.USER)
+        owner = User(id=exam.creator_id, email="t@example.com", role=UserRole.USER)
+
+        student_view = await service.get_exam_for_user(exam.id, student)
+        owner_view = await service.get_exam_for_user(exam.id, owner)
+
+        assert "correct_answer" not in student_view["questions"][0]
+        assert owner_view["questions"][0]["correct_answer"] == "A"
+        assert await service.get_exam_for_user("missing", student) is None
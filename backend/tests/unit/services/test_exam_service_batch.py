@@ -0,0 +1,190 @@
+"""
+Unit tests for ExamService.generate_exams_batch
+
+Files live in an in-memory SQLite database; GenAIService is mocked.
+"""
+import asyncio
+import pytest
+from unittest.mock import MagicMock, patch
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.config import settings
+from app.models.base import Base
+from app.models.file import ProcessingStatus, UploadedFile
+from app.models.user import User
+from app.schemas.exam_schemas import BatchGenerationItem
+from app.services.exam_service import ExamService
+
+CONTENT = "Photosynthesis converts light energy into chemical energy. " * 5
+
+
+@pytest.fixture
+async def db_session():
+    """Create in-memory database for testing"""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with async_session() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+async def owner(db_session):
+    user = User(email="teacher@example.com", hashed_password="pwd", email_verified=True)
+    db_session.add(user)
+    await db_session.commit()
+    return user
+
+
+async def add_file(db_session, owner, name, status=ProcessingStatus.COMPLETED, content=CONTENT):
+    record = UploadedFile(
+        original_filename=f"{name}.pdf",
+        stored_filename=f"{name}-stored.pdf",
+        file_path=f"/tmp/{name}.pdf",
+        size=10,
+        owner_id=owner.id,
+        processing_status=status,
+        extracted_content=content,
+    )
+    db_session.add(record)
+    await db_session.commit()
+    return record
+
+
+class FakeGenAI:
+    """Answers after a delay taken from the subject; 'boom' raises"""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate_exam(self, request, user_id=None):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if request.subject == "boom":
+                raise RuntimeError("provider exploded")
+            await asyncio.sleep(float(request.subject or 0))
+            return {
+                "success": True,
+                "questions": [{"question_text": request.content[:10]}],
+                "metadata": {"user_id": user_id},
+            }
+        finally:
+            self.in_flight -= 1
+
+
+async def collect(events):
+    return [event async for event in events]
+
+
+class TestGenerateExamsBatch:
+    """Test batch fan-out and per-item isolation"""
+
+    @pytest.mark.asyncio
+    async def test_items_run_concurrently_and_stream_in_completion_order(self, db_session, owner):
+        """All items run at once; faster items are reported first"""
+        genai = FakeGenAI()
+        service = ExamService(db_session, genai_service=genai)
+        stored = await add_file(db_session, owner, "chapter1")
+        items = [
+            BatchGenerationItem(file_id=stored.id, subject="0.05", ai_provider="mock"),
+            BatchGenerationItem(content=CONTENT, subject="0", ai_provider="mock"),
+        ]
+
+        events = await collect(await service.generate_exams_batch(items, user_id=owner.id))
+
+        assert [e["index"] for e in events[:2]] == [1, 0]
+        assert all(e["success"] for e in events[:2])
+        assert events[1]["file_id"] == stored.id
+        assert events[1]["metadata"]["user_id"] == owner.id
+        assert events[-1] == {"type": "done", "total": 2, "succeeded": 2, "failed": 0}
+        assert genai.max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_failures_are_isolated_per_item(self, db_session, owner):
+        """Missing, unprocessed, short and failing items do not affect others"""
+        service = ExamService(db_session, genai_service=FakeGenAI())
+        # PENDING is extracted on demand; its path does not exist, so extraction fails
+        pending = await add_file(db_session, owner, "pending", status=ProcessingStatus.PENDING, content=None)
+        items = [
+            BatchGenerationItem(file_id="missing-id", ai_provider="mock"),
+            BatchGenerationItem(file_id=pending.id, ai_provider="mock"),
+            BatchGenerationItem(content="too short", ai_provider="mock"),
+            BatchGenerationItem(content=CONTENT, subject="boom", ai_provider="mock"),
+            BatchGenerationItem(content=CONTENT, ai_provider="mock"),
+        ]
+
+        events = await collect(await service.generate_exams_batch(items, user_id=owner.id))
+        by_index = {e["index"]: e for e in events if e["type"] == "item"}
+
+        assert "not found" in by_index[0]["error"]
+        assert "extraction failed" in by_index[1]["error"]
+        assert "Insufficient content" in by_index[2]["error"]
+        assert by_index[3]["error"] == "provider exploded"
+        assert by_index[4]["success"]
+        assert events[-1]["failed"] == 4
+
+    @pytest.mark.asyncio
+    async def test_pending_files_extracted_concurrently(self, db_session, owner):
+        """PENDING files are claimed and extracted (in parallel) like on /generate"""
+        files = [await add_file(db_session, owner, f"pending{i}", status=ProcessingStatus.PENDING, content=None) for i in range(2)]
+        extracting = []
+        overlap = []
+
+        async def extract(self, file_record):
+            extracting.append(file_record.id)
+            overlap.append(len(extracting))
+            await asyncio.sleep(0.05)
+            extracting.remove(file_record.id)
+            return {"success": True, "content": f"{file_record.id} " + CONTENT}
+
+        service = ExamService(db_session, genai_service=FakeGenAI())
+        with patch("app.services.document_service.DocumentService._extract_file_content", extract):
+            events = await collect(await service.generate_exams_batch(
+                [BatchGenerationItem(file_id=f.id, ai_provider="mock") for f in files], user_id=owner.id
+            ))
+
+        assert events[-1] == {"type": "done", "total": 2, "succeeded": 2, "failed": 0}
+        assert max(overlap) == 2
+        for f in files:
+            await db_session.refresh(f)
+            assert f.processing_status == ProcessingStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_other_users_files_are_not_readable(self, db_session, owner):
+        """file_id is resolved only among the caller's files"""
+        service = ExamService(db_session, genai_service=FakeGenAI())
+        stored = await add_file(db_session, owner, "private")
+
+        events = await collect(await service.generate_exams_batch(
+            [BatchGenerationItem(file_id=stored.id, ai_provider="mock")], user_id="someone-else"
+        ))
+
+        assert not events[0]["success"]
+
+    @pytest.mark.asyncio
+    async def test_batch_size_validated(self):
+        """Empty or oversized batches are rejected before streaming"""
+        service = ExamService(MagicMock(), genai_service=FakeGenAI())
+
+        with pytest.raises(ValueError):
+            await service.generate_exams_batch([], user_id="u1")
+        with pytest.raises(ValueError):
+            await service.generate_exams_batch(
+                [BatchGenerationItem(content=CONTENT)] * (settings.exam_batch_max_items + 1), user_id="u1"
+            )
+
+    def test_item_requires_exactly_one_source(self):
+        """An item names either content or file_id"""
+        with pytest.raises(ValueError):
+            BatchGenerationItem(ai_provider="mock")
+        with pytest.raises(ValueError):
+            BatchGenerationItem(content=CONTENT, file_id="abc")
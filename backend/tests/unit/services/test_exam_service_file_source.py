@@ -0,0 +1,233 @@
+"""
+Unit tests for generating an exam from an uploaded file_id
+
+Files live in an in-memory SQLite database and on local disk; GenAIService is faked.
+"""
+import asyncio
+import pytest
+from unittest.mock import patch
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models.base import Base
+from app.models.file import ProcessingStatus, UploadedFile
+from app.models.user import User
+from app.processors import ProcessingResult
+from app.schemas.exam_schemas import ExamGenerationRequest
+from app.services.exam_service import ExamService, _stripped_length
+
+CONTENT = "Photosynthesis converts light energy into chemical energy. " * 5
+
+
+@pytest.fixture
+async def db_session():
+    """Create in-memory database for testing"""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with async_session() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+async def owner(db_session):
+    user = User(email="teacher@example.com", hashed_password="pwd", email_verified=True)
+    db_session.add(user)
+    await db_session.commit()
+    return user
+
+
+async def add_file(db_session, owner, path, status=ProcessingStatus.COMPLETED, content=CONTENT, file_hash=None):
+    record = UploadedFile(
+        original_filename="notes.txt",
+        stored_filename=f"{path.name}-stored",
+        file_path=str(path),
+        size=10,
+        owner_id=owner.id,
+        file_hash=file_hash,
+        processing_status=status,
+        extracted_content=content,
+    )
+    db_session.add(record)
+    await db_session.commit()
+    return record
+
+
+class FakeGenAI:
+    """Records the content each request was generated from"""
+
+    def __init__(self):
+        self.contents = []
+
+    async def generate_exam(self, request, user_id=None):
+        self.contents.append(request.content)
+        return {"success": True, "questions": [{"question_text": "Q?"}], "metadata": {}}
+
+    async def stream_exam(self, request, user_id=None):
+        self.contents.append(request.content)
+        yield {"type": "done", "metadata": {}}
+
+
+class FakeCache:
+    """Extraction cache holding a single result"""
+
+    def __init__(self, result=None):
+        self.result = result
+        self.lookups = []
+
+    async def get(self, file_hash, processor_version):
+        self.lookups.append(file_hash)
+        return self.result
+
+
+class TestGenerateFromFile:
+    """Test server-side content loading by file_id"""
+
+    @pytest.mark.asyncio
+    async def test_uses_extracted_content(self, db_session, owner, tmp_path):
+        """Completed files are generated from their stored text"""
+        genai = FakeGenAI()
+        service = ExamService(db_session, genai_service=genai)
+        service.extraction_cache = FakeCache()
+        stored = await add_file(db_session, owner, tmp_path / "notes.txt", file_hash="abc")
+
+        result = await service.generate_exam_from_text(file_id=stored.id, num_questions=1, user_id=owner.id)
+
+        assert genai.contents == [CONTENT]
+        assert result["metadata"]["source_type"] == "file"
+        assert result["metadata"]["file_id"] == stored.id
+
+    @pytest.mark.asyncio
+    async def test_served_from_extraction_cache(self, db_session, owner, tmp_path):
+        """A cache hit is used instead of the stored text"""
+        genai = FakeGenAI()
+        service = ExamService(db_session, genai_service=genai)
+        service.extraction_cache = FakeCache(ProcessingResult(success=True, content="cached " + CONTENT))
+        stored = await add_file(db_session, owner, tmp_path / "notes.txt", file_hash="abc")
+
+        await service.generate_exam_from_text(file_id=stored.id, user_id=owner.id)
+
+        assert service.extraction_cache.lookups == ["abc"]
+        assert genai.contents == ["cached " + CONTENT]
+
+    @pytest.mark.asyncio
+    async def test_pending_file_is_extracted_on_demand(self, db_session, owner, tmp_path):
+        """A PENDING file is extracted before generation and saved"""
+        path = tmp_path / "notes.txt"
+        path.write_text(CONTENT)
+        genai = FakeGenAI()
+        service = ExamService(db_session, genai_service=genai)
+        stored = await add_file(db_session, owner, path, status=ProcessingStatus.PENDING, content=None)
+
+        await service.generate_exam_from_text(file_id=stored.id, user_id=owner.id)
+
+        assert genai.contents[0].strip() == CONTENT.strip()
+        await db_session.refresh(stored)
+        assert stored.processing_status == ProcessingStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_extract_once(self, db_session, owner, tmp_path):
+        """Only the request that claims a PENDING file extracts it; the other waits for it"""
+        path = tmp_path / "notes.txt"
+        path.write_text(CONTENT)
+        stored = await add_file(db_session, owner, path, status=ProcessingStatus.PENDING, content=None)
+        extractions = []
+
+        async def slow_extract(self, file_record):
+            extractions.append(file_record.id)
+            await asyncio.sleep(0.05)
+            return {"success": True, "content": CONTENT}
+
+        session_maker = async_sessionmaker(db_session.bind, class_=AsyncSession, expire_on_commit=False)
+        async with session_maker() as other_session:
+            services = [ExamService(db_session, genai_service=FakeGenAI()), ExamService(other_session, genai_service=FakeGenAI())]
+            for service in services:
+                service.extraction_cache = FakeCache()
+            with patch("app.services.document_service.DocumentService._extract_file_content", slow_extract):
+                contents = await asyncio.gather(*(
+                    service.load_file_content(stored.id, owner.id, poll_interval=0.01) for service in services
+                ))
+
+        assert extractions == [stored.id]
+        assert contents == [CONTENT, CONTENT]
+
+    @pytest.mark.asyncio
+    async def test_waits_for_worker_extraction(self, db_session, owner, tmp_path):
+        """A file the worker is processing is polled until it completes"""
+        service = ExamService(db_session, genai_service=FakeGenAI())
+        service.extraction_cache = FakeCache()
+        running = await add_file(db_session, owner, tmp_path / "a.txt", status=ProcessingStatus.PROCESSING, content=None)
+        file_id, owner_id = running.id, owner.id
+
+        reads = []
+        get_content_source = service.file_repository.get_content_source
+
+        async def worker_finishes_on_third_poll(*args):
+            # Runs between polls on the same session (sessions are not concurrency-safe)
+            reads.append(args)
+            if len(reads) == 3:
+                await db_session.execute(
+                    update(UploadedFile)
+                    .where(UploadedFile.id == file_id)
+                    .values(extracted_content=CONTENT, processing_status=ProcessingStatus.COMPLETED)
+                )
+                await db_session.commit()
+            return await get_content_source(*args)
+
+        with patch.object(service.file_repository, "get_content_source", worker_finishes_on_third_poll):
+            content = await service.load_file_content(file_id, owner_id, poll_interval=0.01)
+
+        assert len(reads) == 3
+        assert content == CONTENT
+
+    @pytest.mark.asyncio
+    async def test_unusable_files_rejected(self, db_session, owner, tmp_path):
+        """Missing, foreign, failed and in-progress files raise ValueError"""
+        service = ExamService(db_session, genai_service=FakeGenAI())
+        failed = await add_file(db_session, owner, tmp_path / "a.txt", status=ProcessingStatus.FAILED, content=None)
+        running = await add_file(db_session, owner, tmp_path / "b.txt", status=ProcessingStatus.PROCESSING, content=None)
+
+        with pytest.raises(ValueError, match="not found"):
+            await service.load_file_content("missing-id", owner.id)
+        with pytest.raises(ValueError, match="not found"):
+            await service.load_file_content(failed.id, "someone-else")
+        with pytest.raises(ValueError, match="extraction failed"):
+            await service.load_file_content(failed.id, owner.id)
+        with pytest.raises(ValueError, match="still being processed"):
+            await service.load_file_content(running.id, owner.id, wait_timeout=0)
+
+    @pytest.mark.asyncio
+    async def test_stream_from_file(self, db_session, owner, tmp_path):
+        """Streaming resolves file_id before the first event"""
+        genai = FakeGenAI()
+        service = ExamService(db_session, genai_service=genai)
+        service.extraction_cache = FakeCache()
+        stored = await add_file(db_session, owner, tmp_path / "notes.txt")
+        request = ExamGenerationRequest(file_id=stored.id, ai_provider="mock")
+
+        events = [event async for event in await service.stream_exam_from_text(request, user_id=owner.id)]
+
+        assert events[-1]["type"] == "done"
+        assert genai.contents == [CONTENT]
+
+
+class TestRequestSource:
+    """Test content / file_id validation"""
+
+    def test_exactly_one_source_required(self):
+        with pytest.raises(ValueError):
+            ExamGenerationRequest(ai_provider="mock")
+        with pytest.raises(ValueError):
+            ExamGenerationRequest(content=CONTENT, file_id="f1", ai_provider="mock")
+
+    def test_stripped_length(self):
+        assert _stripped_length("  \n abc \t") == 3
+        assert _stripped_length("   ") == 0
+        assert _stripped_length(CONTENT) == len(CONTENT.strip())
@@ -0,0 +1,251 @@
+"""
+Unit tests for attempt grading: AnswerKey, SubmissionBatcher and GradingService
+
+Uses in-memory SQLite; SQL statements are counted to check bulk saving.
+"""
+import asyncio
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models.base import Base
+from app.models.exam import AttemptStatus, ExamAttempt
+from app.models.user import User
+from app.repositories.exam_repository import ExamRepository
+from app.services.answer_key import AnswerKey
+from app.services.grading_service import GradingService, SubmissionBatcher
+
+QUESTIONS = [
+    {"question_text": "Q1", "options": ["A", "B", "C", "D"], "correct_answer": "A"},
+    {"question_text": "Q2", "options": ["A", "B", "C", "D"], "correct_answer": "C", "points": 2},
+    {"question_text": "Q3", "options": ["A", "B", "C", "D"], "correct_answer": "B"},
+]
+
+
+@pytest.fixture
+async def engine():
+    """Create in-memory database for testing"""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def session_maker(engine):
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.fixture
+async def exam(session_maker):
+    async with session_maker() as session:
+        teacher = User(email="teacher@example.com", hashed_password="pwd", email_verified=True)
+        session.add(teacher)
+        await session.commit()
+        return await ExamRepository(session).create_exam_with_questions(
+            {"title": "Quiz", "creator_id": teacher.id, "passing_score": 60}, QUESTIONS
+        )
+
+
+async def add_students(session_maker, count):
+    async with session_maker() as session:
+        students = [
+            User(email=f"student{i}@example.com", hashed_password="pwd", email_verified=True)
+            for i in range(count)
+        ]
+        session.add_all(students)
+        await session.commit()
+        return students
+
+
+def service(session, session_maker):
+    return GradingService(session, batcher=SubmissionBatcher(session_maker, window=0.01))
+
+
+class TestAnswerKey:
+    """Test compact answer key encoding and grading"""
+
+    def make_key(self, passing_score=None):
+        payload = {
+            "questions": [{"id": "q1", "points": 1}, {"id": "q2", "points": 2}, {"id": "q3", "points": 1}],
+            "answer_key": ["A", "C", "A"],
+        }
+        return AnswerKey.from_payload("exam-1", payload, passing_score)
+
+    def test_repeated_answers_share_a_code(self):
+        key = self.make_key()
+
+        assert key.max_score == 4
+        assert list(key.answers) == [1, 2, 1]
+
+    def test_grades_answers_by_question_id(self):
+        """Answers are matched by ID, case-insensitively, with points applied"""
+        result = self.make_key(passing_score=50).grade({"q1": "a", "q2": " C ", "q3": "B"})
+
+        assert result.results == [True, True, False]
+        assert (result.score, result.max_score, result.percentage, result.passed) == (3, 4, 75.0, True)
+        assert result.correct_count == 2
+
+    def test_grades_positional_answers(self):
+        """Lists are graded in question order; missing and unknown answers are wrong"""
+        key = self.make_key(passing_score=80)
+
+        assert key.grade(["A", "Z"]).results == [True, False, False]
+        assert key.grade(["A", "C", "A", "extra"]).score == 4
+        assert key.grade([None, None, None]).passed is False
+
+    def test_no_passing_score(self):
+        assert self.make_key().grade({}).passed is None
+
+    def test_grade_many(self):
+        results = self.make_key().grade_many([["A", "C", "A"], ["B", "B", "B"], {"q2": "C"}])
+
+        assert [result.score for result in results] == [4, 0, 2]
+
+
+class TestAttempts:
+    """Test starting, submitting and listing attempts"""
+
+    @pytest.mark.asyncio
+    async def test_start_and_submit(self, session_maker, exam):
+        """A submitted attempt is graded and stored"""
+        student, = await add_students(session_maker, 1)
+        async with session_maker() as session:
+            grading = service(session, session_maker)
+            attempt = await grading.start_attempt(exam.id, student.id)
+            assert attempt["status"] == AttemptStatus.IN_PROGRESS.value
+            assert attempt["max_score"] == 4
+
+            result = await grading.submit_attempt(exam.id, attempt["attempt_id"], student.id, ["A", "C", "D"])
+
+        assert (result["score"], result["percentage"], result["passed"]) == (3, 75.0, True)
+        assert result["results"] == [True, True, False]
+
+        async with session_maker() as session:
+            stored = await session.get(ExamAttempt, attempt["attempt_id"])
+            assert stored.status == AttemptStatus.SUBMITTED.value
+            assert stored.score == 3 and stored.passed
+            assert stored.end_time is not None
+            assert list(stored.answers.values()) == ["A", "C", "D"]
+
+            attempts = await GradingService(session).list_attempts(exam.id, student.id)
+            assert [a["attempt_id"] for a in attempts] == [attempt["attempt_id"]]
+
+    @pytest.mark.asyncio
+    async def test_submission_errors(self, session_maker, exam):
+        """Foreign, unknown and already submitted attempts are rejected"""
+        student, other = await add_students(session_maker, 2)
+        async with session_maker() as session:
+            grading = service(session, session_maker)
+            attempt = await grading.start_attempt(exam.id, student.id)
+
+            with pytest.raises(ValueError, match="not found"):
+                await grading.submit_attempt(exam.id, attempt["attempt_id"], other.id, ["A"])
+            with pytest.raises(ValueError, match="not found"):
+                await grading.submit_attempt(exam.id, "missing", student.id, ["A"])
+
+            await grading.submit_attempt(exam.id, attempt["attempt_id"], student.id, ["A"])
+            with pytest.raises(ValueError, match="already been submitted"):
+                await grading.submit_attempt(exam.id, attempt["attempt_id"], student.id, ["C"])
+
+    @pytest.mark.asyncio
+    async def test_unknown_exam(self, session_maker, exam):
+        async with session_maker() as session:
+            with pytest.raises(ValueError, match="Exam not found"):
+                await service(session, session_maker).start_attempt("missing", "user-1")
+
+
+class TestSubmissionBatcher:
+    """Test that concurrent submissions are graded and saved together"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_submissions_share_one_update(self, engine, session_maker, exam):
+        """A class submitting at once costs one attempt query and one UPDATE"""
+        students = await add_students(session_maker, 30)
+        async with session_maker() as session:
+            grading = GradingService(session)
+            attempts = [await grading.start_attempt(exam.id, s.id) for s in students]
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        batcher = SubmissionBatcher(session_maker, window=0.05)
+        event.listen(engine.sync_engine, "before_cursor_execute", record)
+        try:
+            results = await asyncio.gather(*[
+                batcher.submit(exam.id, attempt["attempt_id"], student.id, ["A", "C", "B"] if i % 2 else ["B"])
+                for i, (attempt, student) in enumerate(zip(attempts, students))
+            ])
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+        assert [r["score"] for r in results] == [0, 4] * 15
+        assert batcher.batches_flushed == 1
+        assert batcher.submissions_graded == 30
+        assert sum(s.startswith("UPDATE exam_attempts") for s in statements) == 1
+        assert sum("FROM exam_attempts" in s for s in statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_early(self, session_maker, exam):
+        """Reaching max_batch flushes without waiting for the window"""
+        students = await add_students(session_maker, 4)
+        async with session_maker() as session:
+            grading = GradingService(session)
+            attempts = [await grading.start_attempt(exam.id, s.id) for s in students]
+
+        batcher = SubmissionBatcher(session_maker, window=60, max_batch=2)
+        results = await asyncio.wait_for(asyncio.gather(*[
+            batcher.submit(exam.id, attempt["attempt_id"], student.id, ["A", "C", "B"])
+            for attempt, student in zip(attempts, students)
+        ]), timeout=5)
+
+        assert all(r["score"] == 4 for r in results)
+        assert batcher.batches_flushed == 2
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_duplicate_in_batch_graded_once(self, session_maker, exam):
+        """The same attempt twice in one batch is only accepted once"""
+        student, = await add_students(session_maker, 1)
+        async with session_maker() as session:
+            attempt = await GradingService(session).start_attempt(exam.id, student.id)
+
+        batcher = SubmissionBatcher(session_maker, window=0.01)
+        first, second = await asyncio.gather(
+            batcher.submit(exam.id, attempt["attempt_id"], student.id, ["A"]),
+            batcher.submit(exam.id, attempt["attempt_id"], student.id, ["A", "C", "B"]),
+            return_exceptions=True,
+        )
+
+        assert first["score"] == 1
+        assert isinstance(second, ValueError)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_batches_submit_attempt_once(self, session_maker, exam):
+        """Two flushes racing on one attempt: only the one whose UPDATE claims it succeeds"""
+        student, = await add_students(session_maker, 1)
+        async with session_maker() as session:
+            attempt = await GradingService(session).start_attempt(exam.id, student.id)
+
+        batcher = SubmissionBatcher(session_maker, window=60, max_batch=1)
+        results = await asyncio.gather(
+            batcher.submit(exam.id, attempt["attempt_id"], student.id, ["A"]),
+            batcher.submit(exam.id, attempt["attempt_id"], student.id, ["A", "C", "B"]),
+            return_exceptions=True,
+        )
+
+        errors = [r for r in results if isinstance(r, ValueError)]
+        assert len(errors) == 1 and "already been submitted" in str(errors[0])
+        assert batcher.submissions_graded == 1
+        async with session_maker() as session:
+            saved, = await GradingService(session).list_attempts(exam.id, student.id)
+        graded, = [r for r in results if isinstance(r, dict)]
+        assert saved["score"] == graded["score"]
@@ -0,0 +1,185 @@
+"""
+Unit tests for UploadService streaming upload pipeline
+
+Repository calls are mocked; files are written to a pytest tmp_path.
+"""
+import hashlib
+import io
+import os
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from starlette.datastructures import UploadFile, Headers
+
+from app.models.file import StorageType
+from app.services.upload_service import UploadService
+from app.storage import LocalStorageBackend
+
+
+CHUNK_SIZE = 1024
+
+
+def make_upload(content: bytes, filename: str = "notes.pdf", content_type: str = "application/pdf") -> UploadFile:
+    """Build a starlette UploadFile backed by an in-memory buffer"""
+    return UploadFile(
+        file=io.BytesIO(content),
+        filename=filename,
+        headers=Headers({"content-type": content_type}),
+    )
+
+
+@pytest.fixture
+def settings(tmp_path):
+    """Settings dict pointing the upload folder at tmp_path"""
+    return {
+        "upload_folder": str(tmp_path),
+        "allowed_extensions": {"pdf", "docx", "txt"},
+        "max_upload_size": 64 * 1024,
+        "upload_chunk_size": CHUNK_SIZE,
+    }
+
+
+@pytest.fixture
+def upload_service(settings):
+    """UploadService with mocked repository"""
+    with patch("app.services.upload_service.get_settings", return_value=settings):
+        service = UploadService(MagicMock())
+        service.file_repo = MagicMock()
+        service.file_repo.get_by_hash = AsyncMock(return_value=None)
+        service.file_repo.update_status = AsyncMock()
+        service.file_repo.delete_file_record = AsyncMock()
+
+        async def create_file_record(**kwargs):
+            record = MagicMock()
+            record.id = "file-1"
+            record.created_at = datetime.now(timezone.utc)
+            record.is_image = False
+            record.is_pdf = kwargs["content_type"] == "application/pdf"
+            return record
+
+        service.file_repo.create_file_record = AsyncMock(side_effect=create_file_record)
+
+        blobs = {}
+
+        async def acquire(file_hash, file_path, size, storage_type=StorageType.LOCAL):
+            created = file_hash not in blobs
+            blob = blobs.setdefault(file_hash, MagicMock(
+                id=f"blob-{file_hash[:8]}", file_path=file_path, storage_type=storage_type, ref_count=0
+            ))
+            blob.ref_count += 1
+            return blob, created
+
+        service.blob_service.storage = LocalStorageBackend(settings["upload_folder"])
+        service.blob_service.blob_repo = MagicMock()
+        service.blob_service.blob_repo.acquire = AsyncMock(side_effect=acquire)
+        service.blob_service.blob_repo.release = AsyncMock(return_value=None)
+        yield service
+
+
+class TestStreamingUpload:
+    """Test chunked save_uploaded_file"""
+
+    @pytest.mark.asyncio
+    async def test_reads_in_chunks_and_hashes_incrementally(self, upload_service, tmp_path):
+        """File is read chunk by chunk and hash matches the full content"""
+        content = b"%PDF-1.4\n" + os.urandom(5 * CHUNK_SIZE + 17)
+        upload = make_upload(content)
+        upload.read = AsyncMock(side_effect=io.BytesIO(content).read)
+
+        result = await upload_service.save_uploaded_file(upload, "user-1234567890")
+
+        assert result["file_hash"] == hashlib.sha256(content).hexdigest()
+        assert result["size"] == len(content)
+        assert result["content_type"] == "application/pdf"
+        # Every read asked for at most one chunk
+        assert all(call.args == (CHUNK_SIZE,) for call in upload.read.call_args_list)
+
+        stored = upload_service.blob_service.blob_path(result["file_hash"], ".pdf")
+        assert open(stored, "rb").read() == content
+        assert not list(tmp_path.glob("*.part"))
+
+    @pytest.mark.asyncio
+    async def test_too_large_file_rejected_without_leftover(self, upload_service, settings, tmp_path):
+        """Oversized upload fails early and temp file is removed"""
+        content = b"x" * (settings["max_upload_size"] + 1)
+
+        with pytest.raises(ValueError, match="File too large"):
+            await upload_service.save_uploaded_file(make_upload(content, "big.txt", "text/plain"), "user-1")
+
+        assert list(tmp_path.iterdir()) == []
+        upload_service.file_repo.create_file_record.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_empty_file_rejected(self, upload_service, tmp_path):
+        """Empty upload raises ValueError and leaves nothing behind"""
+        with pytest.raises(ValueError, match="Empty file"):
+            await upload_service.save_uploaded_file(make_upload(b"", "empty.txt", "text/plain"), "user-1")
+
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_duplicate_discards_temp_file(self, upload_service, tmp_path):
+        """Duplicate upload returns existing record and removes streamed temp file"""
+        existing = MagicMock()
+        existing.id = "existing-id"
+        existing.owner_id = "user-1"
+        existing.stored_filename = "stored.txt"
+        existing.original_filename = "notes.txt"
+        existing.size = 5
+        existing.size_mb = 0.0
+        existing.content_type = "text/plain"
+        existing.created_at = datetime.now(timezone.utc)
+        upload_service.file_repo.get_by_hash = AsyncMock(return_value=existing)
+
+        result = await upload_service.save_uploaded_file(make_upload(b"hello", "notes.txt", "text/plain"), "user-1")
+
+        assert result["duplicate"] is True
+        assert result["file_id"] == "existing-id"
+        assert result["file_hash"] == hashlib.sha256(b"hello").hexdigest()
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_same_content_from_two_users_stored_once(self, upload_service, tmp_path):
+        """Second user's upload references the existing blob instead of writing bytes again"""
+        content = b"shared lecture notes"
+
+        first = await upload_service.save_uploaded_file(make_upload(content, "a.txt", "text/plain"), "user-1")
+        second = await upload_service.save_uploaded_file(make_upload(content, "b.txt", "text/plain"), "user-2")
+
+        assert first["file_hash"] == second["file_hash"]
+        blob_files = [p for p in (tmp_path / "blobs").rglob("*") if p.is_file()]
+        assert len(blob_files) == 1
+        assert blob_files[0].read_bytes() == content
+        assert not list(tmp_path.glob("*.part"))
+
+        calls = upload_service.file_repo.create_file_record.call_args_list
+        assert calls[0].kwargs["blob_id"] == calls[1].kwargs["blob_id"]
+        assert calls[0].kwargs["file_path"] == calls[1].kwargs["file_path"]
+
+    @pytest.mark.asyncio
+    async def test_truncated_blob_rewritten_on_next_upload(self, upload_service, tmp_path):
+        """A blob stored with the wrong size is rewritten instead of reused"""
+        content = b"shared lecture notes"
+        first = await upload_service.save_uploaded_file(make_upload(content, "a.txt", "text/plain"), "user-1")
+        blob_file = next(p for p in (tmp_path / "blobs").rglob("*") if p.is_file())
+        blob_file.write_bytes(content[:5])
+
+        second = await upload_service.save_uploaded_file(make_upload(content, "b.txt", "text/plain"), "user-2")
+
+        assert second["file_hash"] == first["file_hash"]
+        assert blob_file.read_bytes() == content
+        assert not list(tmp_path.glob("*.part"))
+
+    @pytest.mark.asyncio
+    async def test_failed_verification_releases_blob(self, upload_service):
+        """Upload whose stored size does not match drops its blob reference"""
+        upload_service.blob_service.storage.size = AsyncMock(return_value=1)
+
+        with pytest.raises(Exception):
+            await upload_service.save_uploaded_file(make_upload(b"hello world", "a.txt", "text/plain"), "user-1")
+
+        blob_id = upload_service.file_repo.create_file_record.call_args.kwargs["blob_id"]
+        upload_service.blob_service.blob_repo.release.assert_awaited_once()
+        assert upload_service.blob_service.blob_repo.release.call_args.args[0] == blob_id
+        upload_service.file_repo.update_status.assert_awaited_once()
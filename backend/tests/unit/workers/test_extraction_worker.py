@@ -0,0 +1,130 @@
+"""
+Unit tests for ExtractionWorker
+
+Uses in-memory SQLite and an injected extractor instead of DocumentProcessor.
+"""
+import asyncio
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.orm import undefer
+from sqlalchemy.pool import StaticPool
+
+from app.models.base import Base
+from app.models.user import User
+from app.models.file import UploadedFile, ProcessingStatus
+from app.processors import ProcessingResult
+from app.repositories.file_repository import FileRepository
+from app.workers.extraction_worker import ExtractionWorker
+
+
+@pytest.fixture
+async def session_maker():
+    """Create in-memory database and session maker"""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    await engine.dispose()
+
+
+@pytest.fixture
+async def pending_files(session_maker, tmp_path):
+    """Create owner and two PENDING files that exist on disk"""
+    async with session_maker() as session:
+        user = User(email="owner@example.com", hashed_password="pwd", email_verified=True)
+        session.add(user)
+        await session.commit()
+
+        repo = FileRepository(session)
+        files = []
+        for i in range(2):
+            path = tmp_path / f"doc{i}.txt"
+            path.write_text(f"content {i}")
+            files.append(await repo.create_file_record(
+                original_filename=path.name,
+                stored_filename=path.name,
+                file_path=str(path),
+                size=9,
+                content_type="text/plain",
+                owner_id=user.id,
+            ))
+        return files
+
+
+async def get_file(session_maker, file_id):
+    async with session_maker() as session:
+        return await session.get(
+            UploadedFile, file_id, options=[undefer(UploadedFile.extracted_content)]
+        )
+
+
+async def drain(worker):
+    await worker.run_once()
+    while worker.in_flight:
+        await asyncio.sleep(0.01)
+
+
+class TestExtractionWorker:
+    """Test claim -> extract -> save flow"""
+
+    @pytest.mark.asyncio
+    async def test_processes_pending_files(self, session_maker, pending_files):
+        """Claimed files are extracted and saved as COMPLETED"""
+        async def extractor(path):
+            return ProcessingResult(success=True, content=f"text of {path}")
+
+        worker = ExtractionWorker(session_maker, concurrency=2, extractor=extractor)
+        await drain(worker)
+
+        for f in pending_files:
+            saved = await get_file(session_maker, f.id)
+            assert saved.processing_status == ProcessingStatus.COMPLETED
+            assert saved.extracted_content == f"text of {f.file_path}"
+        assert worker.processed_count == 2
+        assert (await worker.queue_depth())["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_retries_crashes_with_backoff(self, session_maker, pending_files):
+        """Extractor exceptions are retried before succeeding"""
+        calls = {}
+
+        async def flaky_extractor(path):
+            calls[path] = calls.get(path, 0) + 1
+            if calls[path] < 3:
+                raise RuntimeError("worker crashed")
+            return ProcessingResult(success=True, content="ok")
+
+        worker = ExtractionWorker(
+            session_maker, concurrency=2, max_retries=3, retry_delay=0.001, extractor=flaky_extractor
+        )
+        await drain(worker)
+
+        assert all(count == 3 for count in calls.values())
+        assert worker.retried_count == 4
+        saved = await get_file(session_maker, pending_files[0].id)
+        assert saved.processing_status == ProcessingStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_marks_failed_after_retries_exhausted(self, session_maker, pending_files):
+        """Persistent crashes end in FAILED with an error message"""
+        async def broken_extractor(path):
+            raise RuntimeError("corrupt document")
+
+        worker = ExtractionWorker(
+            session_maker, concurrency=1, max_retries=1, retry_delay=0.001, extractor=broken_extractor
+        )
+        await drain(worker)
+
+        # Both files share a created_at second, so either may be claimed first
+        saved = [await get_file(session_maker, f.id) for f in pending_files]
+        failed, = [f for f in saved if f.processing_status == ProcessingStatus.FAILED]
+        assert "corrupt document" in failed.processing_error
+        # Concurrency 1 -> second file still queued
+        assert (await worker.queue_depth())["pending"] == 1
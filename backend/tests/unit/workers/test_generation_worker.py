@@ -0,0 +1,155 @@
+"""
+Unit tests for GenerationWorker and the ExamService job API
+
+Uses in-memory SQLite; generation goes through the mock provider or an
+injected generator.
+"""
+import asyncio
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models.base import Base
+from app.models.user import User
+from app.schemas.exam_schemas import ExamGenerationRequest
+from app.services.exam_service import ExamService
+from app.workers.generation_worker import GenerationWorker
+
+CONTENT = "Paris is the capital of France. " * 10
+
+
+@pytest.fixture
+async def session_maker():
+    """Create in-memory database and session maker"""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    await engine.dispose()
+
+
+@pytest.fixture
+async def user(session_maker):
+    async with session_maker() as session:
+        user = User(email="student@example.com", hashed_password="pwd", email_verified=True)
+        session.add(user)
+        await session.commit()
+        return user
+
+
+async def queue_job(session_maker, user, key=None, **overrides):
+    fields = {"content": CONTENT, "ai_provider": "mock", "question_count": 1, **overrides}
+    request = ExamGenerationRequest(**fields)
+    async with session_maker() as session:
+        return await ExamService(session).create_generation_job(request, user_id=user.id, idempotency_key=key)
+
+
+async def get_job(session_maker, user, job_id):
+    async with session_maker() as session:
+        return await ExamService(session).get_generation_job(job_id, user.id)
+
+
+async def drain(worker):
+    await worker.run_once()
+    while worker.in_flight:
+        await asyncio.sleep(0.01)
+
+
+class TestGenerationWorker:
+    """Test queue -> claim -> generate -> save flow"""
+
+    @pytest.mark.asyncio
+    async def test_runs_job_through_exam_service(self, session_maker, user):
+        """The default generator runs ExamService and stores its result"""
+        job, created = await queue_job(session_maker, user)
+        assert created and job["status"] == "queued"
+
+        worker = GenerationWorker(session_maker, concurrency=2)
+        await drain(worker)
+
+        job = await get_job(session_maker, user, job["job_id"])
+        assert job["status"] == "completed"
+        assert job["progress"] == 100
+        assert job["result"]["exam_data"]["questions"]
+        assert worker.completed_count == 1
+
+    @pytest.mark.asyncio
+    async def test_generation_error_fails_job(self, session_maker, user):
+        """Generator exceptions mark the job FAILED without retrying"""
+        calls = []
+
+        async def broken_generator(job):
+            calls.append(job.id)
+            raise RuntimeError("provider down")
+
+        job, _ = await queue_job(session_maker, user)
+        worker = GenerationWorker(session_maker, generator=broken_generator)
+        await drain(worker)
+        await drain(worker)
+
+        job = await get_job(session_maker, user, job["job_id"])
+        assert job["status"] == "failed"
+        assert job["error"] == "provider down"
+        assert len(calls) == 1
+        assert (await worker.queue_depth())["jobs"]["failed"] == 1
+
+
+class TestGenerationJobService:
+    """Test ExamService job creation and watching"""
+
+    @pytest.mark.asyncio
+    async def test_idempotency_key_replays_job(self, session_maker, user):
+        """A retry with the same key returns the original job"""
+        first, _ = await queue_job(session_maker, user, key="retry-1")
+        second, created = await queue_job(session_maker, user, key="retry-1")
+
+        assert not created
+        assert second["job_id"] == first["job_id"]
+
+    @pytest.mark.asyncio
+    async def test_idempotency_key_reused_for_other_request(self, session_maker, user):
+        """Reusing a key with a different body is rejected"""
+        await queue_job(session_maker, user, key="retry-1")
+
+        with pytest.raises(ValueError, match="different request"):
+            await queue_job(session_maker, user, key="retry-1", question_count=2)
+
+    @pytest.mark.asyncio
+    async def test_short_content_rejected(self, session_maker, user):
+        """Insufficient content fails before a job is queued"""
+        async with session_maker() as session:
+            with pytest.raises(ValueError, match="Insufficient content"):
+                await ExamService(session).create_generation_job(
+                    ExamGenerationRequest(content="too short"), user_id=user.id
+                )
+
+    @pytest.mark.asyncio
+    async def test_watch_yields_until_finished(self, session_maker, user):
+        """Watching yields each status change and stops at the terminal one"""
+        job, _ = await queue_job(session_maker, user)
+        worker = GenerationWorker(session_maker)
+
+        async with session_maker() as session:
+            updates = await ExamService(session).watch_generation_job(
+                job["job_id"], user.id, poll_interval=0.01
+            )
+            statuses = []
+            async for update in updates:
+                statuses.append(update["status"])
+                if update["status"] == "queued":
+                    await drain(worker)
+
+        assert statuses == ["queued", "completed"]
+
+    @pytest.mark.asyncio
+    async def test_watch_unknown_job(self, session_maker, user):
+        """Unknown jobs return None instead of an iterator"""
+        async with session_maker() as session:
+            assert await ExamService(session).watch_generation_job("missing", user.id) is None